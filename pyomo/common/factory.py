@@ -21,12 +21,17 @@ class Factory(object):
     A class that is used to define a factory for objects.
 
     Factory objects may be cached for future use.
+
+    Names can also be declared with :py:meth:`register_lazy`, along
+    with a function that imports the module that registers them.  The
+    module is only imported when the name is first used.
     """
 
     def __init__(self, description=None):
         self._description = description
         self._cls = {}
         self._doc = {}
+        self._lazy = {}
 
     def __call__(self, name, **kwds):
         if 'exception' in kwds:
@@ -35,6 +40,8 @@ class Factory(object):
         else:
             exception = False
         name = str(name)
+        if name in self._lazy:
+            self._load(name)
         if not name in self._cls:
             if not exception:
                 return None
@@ -46,25 +53,46 @@ class Factory(object):
     def __iter__(self):
         for name in self._cls:
             yield name
+        for name in list(self._lazy):
+            if name not in self._cls:
+                yield name
 
     def __contains__(self, name):
-        return str(name) in self._cls
+        name = str(name)
+        return name in self._cls or name in self._lazy
 
     def get_class(self, name):
+        if name in self._lazy:
+            self._load(name)
         return self._cls[name]
 
     def doc(self, name):
-        return self._doc[name]
+        if name in self._doc:
+            return self._doc[name]
+        return self._lazy[name][1]
 
     def unregister(self, name):
         name = str(name)
+        self._lazy.pop(name, None)
         if name in self._cls:
             del self._cls[name]
             del self._doc[name]
     
     def register(self, name, doc=None):
         def fn(cls):
+            self._lazy.pop(name, None)
             self._cls[name] = cls
             self._doc[name] = doc
             return cls
         return fn
+
+    def register_lazy(self, name, load, doc=None):
+        """Declare a name that is registered by calling load()"""
+        if name not in self._cls:
+            self._lazy[name] = (load, doc)
+
+    def _load(self, name):
+        # Note that load() may import a module that registers other
+        # lazy names (which removes them from _lazy)
+        load = self._lazy.pop(name)[0]
+        load()
@@ -83,6 +83,21 @@ class TempfileManagerClass:
         self._tempfiles[-1].append(fname)
         return fname
 
+    def create_tempfifo(self, suffix=None, prefix=None, dir=None):
+        """Create a unique named pipe
+
+        Returns the absolute path of a named pipe (FIFO) that is
+        guaranteed to be unique.  Named pipes are only available on
+        POSIX platforms.
+
+        """
+        if not hasattr(os, 'mkfifo'):
+            raise OSError("Named pipes are not supported on this platform")
+        fname = self.create_tempfile(suffix=suffix, prefix=prefix, dir=dir)
+        os.remove(fname)
+        os.mkfifo(fname)
+        return fname
+
     def create_tempdir(self, suffix=None, prefix=None, dir=None):
         """Create a unique temporary directory
 
@@ -157,6 +172,7 @@ class TempfileManagerClass:
         self.pop(remove=True)
 
     def pop(self, remove=True):
+        """Pop the current context, returning the list of its files"""
         files = self._tempfiles.pop()
         if remove:
             for filename in files:
@@ -188,5 +204,6 @@ class TempfileManagerClass:
 
         if len(self._tempfiles) == 0:
             self._tempfiles = [[]]
+        return files
 
 TempfileManager = TempfileManagerClass()
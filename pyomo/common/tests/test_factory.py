@@ -0,0 +1,84 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+
+from pyomo.common.factory import Factory
+
+
+class TestFactory(unittest.TestCase):
+
+    def test_register(self):
+        f = Factory('test')
+
+        @f.register('a', 'The a class')
+        class A(object):
+            pass
+
+        self.assertIn('a', f)
+        self.assertNotIn('b', f)
+        self.assertEqual(list(f), ['a'])
+        self.assertEqual(f.doc('a'), 'The a class')
+        self.assertIsInstance(f('a'), A)
+        self.assertIs(f.get_class('a'), A)
+        self.assertIsNone(f('b'))
+        f.unregister('a')
+        self.assertNotIn('a', f)
+
+    def test_register_lazy(self):
+        f = Factory('test')
+        loaded = []
+
+        def load():
+            loaded.append(1)
+
+            @f.register('a', 'The a class')
+            class A(object):
+                pass
+
+            @f.register('b', 'The b class')
+            class B(object):
+                pass
+
+        f.register_lazy('a', load, 'The a class')
+        f.register_lazy('b', load, 'The b class')
+        self.assertIn('a', f)
+        self.assertEqual(sorted(f), ['a', 'b'])
+        self.assertEqual(f.doc('b'), 'The b class')
+        self.assertEqual(loaded, [])
+
+        self.assertEqual(type(f('a')).__name__, 'A')
+        self.assertEqual(loaded, [1])
+        self.assertEqual(f._lazy, {})
+        self.assertEqual(f.get_class('b').__name__, 'B')
+        self.assertEqual(sorted(f), ['a', 'b'])
+        self.assertEqual(loaded, [1])
+
+    def test_register_lazy_registered(self):
+        f = Factory('test')
+
+        @f.register('a')
+        class A(object):
+            pass
+
+        f.register_lazy('a', None)
+        self.assertEqual(f._lazy, {})
+        self.assertIs(f.get_class('a'), A)
+
+    def test_unregister_lazy(self):
+        f = Factory('test')
+        f.register_lazy('a', None)
+        f.unregister('a')
+        self.assertNotIn('a', f)
+        self.assertIsNone(f('a'))
+
+
+if __name__ == "__main__":
+    unittest.main()
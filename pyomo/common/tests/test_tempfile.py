@@ -19,6 +19,7 @@
 import glob
 import os
 import shutil
+import stat
 import sys
 from six import StringIO
 
@@ -289,6 +290,18 @@ class Test(unittest.TestCase):
         self.assertNotEqual(fname, 'tmp3')
         self.assertTrue(fname.startswith('tmp'))
 
+    @unittest.skipIf(not hasattr(os, 'mkfifo'),
+                     "test only applies to platforms with named pipes")
+    def test_create_fifo(self):
+        """Test create logic - named pipes"""
+        TempfileManager.push()
+        fname = TempfileManager.create_tempfifo(suffix='bar')
+        self.assertEqual(len(list(glob.glob(tempdir + '*'))), 1)
+        self.assertTrue(stat.S_ISFIFO(os.stat(fname).st_mode))
+        self.assertTrue(os.path.basename(fname).endswith('bar'))
+        TempfileManager.pop()
+        self.assertFalse(os.path.exists(fname))
+
     @unittest.skipIf(not sys.platform.lower().startswith('win'),
                      "test only applies to Windows platforms")
     def test_open_tempfile_windows(self):
@@ -0,0 +1,652 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Binary snapshots of constructed models.
+
+A snapshot stores a constructed model so that it can be restored
+without rebuilding it.  The bulk of a large model (the data of the
+indexed Var, Param, Constraint and Expression components) is stored
+column by column in arrays, and the expressions are stored in postfix
+form, so that restoring it does not go through the per-object
+``__getstate__`` / ``__setstate__`` chain of pickle.  Everything else
+(the blocks, sets, scalar components, suffixes, ...) is pickled.
+
+Expression nodes that are shared by several expressions in the arrays
+are stored once, and are shared by the restored expressions.  The
+pickled expressions (e.g., of scalar constraints) do not share their
+nodes with the expressions in the arrays.
+
+The file layout is::
+
+    magic | arrays | pickle stream | header | header offset | magic
+
+where each array starts on a 64-byte boundary so that it can be
+memory mapped.
+"""
+
+import pickle
+import struct
+from collections import deque
+from weakref import ref as weakref_ref
+
+from six import itervalues, integer_types
+from six.moves import xrange, zip
+
+from pyomo.common.dependencies import numpy as np
+from pyomo.common.gc_manager import PauseGC
+from pyomo.core.base.constraint import Constraint, _GeneralConstraintData
+from pyomo.core.base.expression import Expression, _GeneralExpressionData
+from pyomo.core.base.param import Param, _ParamData
+from pyomo.core.base.var import Var, _GeneralVarData
+from pyomo.core.expr.numeric_expr import (
+    ExpressionBase, LinearExpression, _MutableLinearExpression, _clone_args,
+)
+from pyomo.core.expr.numvalue import native_types, nonpyomo_leaf_types
+
+_MAGIC = b'PYOMOSNP'
+_VERSION = 2
+_ALIGN = 64
+_TRAILER = struct.Struct('<Q8s')
+
+# The data slots that are stored in arrays, for each data class.  The
+# slot kinds are:
+#   'b': booleans
+#   'v': values (None, floats, ints or other objects)
+#   'r': references to (a few distinct) objects
+#   'e': expressions
+_data_slots = {
+    _GeneralVarData: (('_value', 'v'), ('_lb', 'v'), ('_ub', 'v'),
+                      ('_domain', 'r'), ('fixed', 'b'), ('stale', 'b')),
+    _ParamData: (('_value', 'v'),),
+    _GeneralConstraintData: (('_active', 'b'), ('_body', 'e'),
+                             ('_lower', 'e'), ('_upper', 'e'),
+                             ('_equality', 'b')),
+    _GeneralExpressionData: (('_expr', 'e'), ('_is_owned', 'b')),
+}
+_ctypes = (Var, Param, Constraint, Expression)
+
+# Expression tokens (_REF refers to the _NODE token of a shared node)
+_FLOAT, _INT, _DATA, _OBJECT, _NODE, _REF = range(6)
+# Integers that are stored exactly in a float64
+_MAX_INT = 2**53
+
+_float_types = (float,)
+_int_types = set(integer_types)
+_linear_types = (LinearExpression, _MutableLinearExpression)
+# Node slots that hold the node arguments
+_arg_slots = {'_args_', '_nargs', '_shared_args', 'constant',
+              'linear_coefs', 'linear_vars', '_if', '_then', '_else',
+              '__weakref__'}
+
+# Cache of {class: True if expressions of the class are stored as nodes}
+_node_classes = {}
+# Cache of {class: names of the slots that hold the local node data}
+_local_slots = {}
+
+
+def _is_node(cls, obj):
+    ans = _node_classes.get(cls, None)
+    if ans is None:
+        # Nodes with a special deepcopy (e.g., external functions and
+        # templates) are pickled
+        ans = _node_classes[cls] = (
+            isinstance(obj, ExpressionBase)
+            and not obj.is_named_expression_type()
+            and cls.__deepcopy__ is ExpressionBase.__deepcopy__)
+    return ans
+
+
+def _node_local_slots(cls):
+    ans = _local_slots.get(cls, None)
+    if ans is None:
+        ans = []
+        for c in cls.__mro__:
+            for s in getattr(c, '__slots__', ()):
+                if s not in _arg_slots and s not in ans:
+                    ans.append(s)
+        ans = _local_slots[cls] = tuple(ans)
+    return ans
+
+
+def _plain_key(key):
+    if key.__class__ is tuple:
+        for k in key:
+            if k.__class__ not in native_types:
+                return False
+        return True
+    return key.__class__ in native_types
+
+
+class _ObjectTable(object):
+    """The objects that are pickled and referred to from the arrays"""
+
+    def __init__(self):
+        self.objects = []
+        self._ids = {}
+
+    def add(self, obj):
+        ans = self._ids.get(id(obj), None)
+        if ans is None:
+            ans = self._ids[id(obj)] = len(self.objects)
+            self.objects.append(obj)
+        return ans
+
+
+class _ExpressionEncoder(object):
+    """Store expression trees as postfix token arrays
+
+    Each token has a kind (_FLOAT, _INT, _DATA, _OBJECT, _NODE or
+    _REF), an integer (the index of the component data, object or node
+    prototype, or the position of the token of a shared node), a float
+    (the value of numeric constants) and, for nodes, the number of
+    arguments.
+    """
+
+    def __init__(self, data_ids, objects):
+        self.data_ids = data_ids
+        self.objects = objects
+        self.kinds = []
+        self.ints = []
+        self.floats = []
+        self.nargs = []
+        self.prototypes = []
+        self._prototype_ids = {}
+        # {id(node): position of its token} (the nodes are all part of
+        # the model, so their ids are not reused while it is written)
+        self._node_pos = {}
+
+    def _leaf(self, obj):
+        # Most leaves are component data, so check for those first
+        idx = self.data_ids.get(id(obj), None)
+        if idx is not None:
+            self.kinds.append(_DATA)
+            self.ints.append(idx)
+            self.floats.append(0)
+        else:
+            cls = obj.__class__
+            if cls in _float_types:
+                self.kinds.append(_FLOAT)
+                self.ints.append(0)
+                self.floats.append(obj)
+            elif cls in _int_types and -_MAX_INT <= obj <= _MAX_INT:
+                self.kinds.append(_INT)
+                self.ints.append(0)
+                self.floats.append(obj)
+            else:
+                self.kinds.append(_OBJECT)
+                self.ints.append(self.objects.add(obj))
+                self.floats.append(0)
+        self.nargs.append(0)
+
+    def _node(self, node, nargs):
+        cls = node.__class__
+        slots = _node_local_slots(cls)
+        if slots:
+            key = (cls,) + tuple(id(getattr(node, s)) for s in slots)
+        else:
+            key = cls
+        idx = self._prototype_ids.get(key, None)
+        if idx is None:
+            idx = self._prototype_ids[key] = len(self.prototypes)
+            self.prototypes.append(
+                (cls, tuple((s, getattr(node, s)) for s in slots)))
+        self._node_pos[id(node)] = len(self.kinds)
+        self.kinds.append(_NODE)
+        self.ints.append(idx)
+        self.floats.append(0)
+        self.nargs.append(nargs)
+
+    def _ref(self, pos):
+        self.kinds.append(_REF)
+        self.ints.append(pos)
+        self.floats.append(0)
+        self.nargs.append(0)
+
+    def encode(self, expr):
+        if expr.__class__ in nonpyomo_leaf_types \
+           or not _is_node(expr.__class__, expr):
+            self._leaf(expr)
+            return
+        node_pos = self._node_pos
+        pos = node_pos.get(id(expr), None)
+        if pos is not None:
+            self._ref(pos)
+            return
+        _stack = []
+        node, args, idx = expr, _clone_args(expr), 0
+        while 1:
+            if idx < len(args):
+                child = args[idx]
+                idx += 1
+                if child.__class__ not in nonpyomo_leaf_types \
+                   and _is_node(child.__class__, child):
+                    pos = node_pos.get(id(child), None)
+                    if pos is None:
+                        _stack.append((node, args, idx))
+                        node, args, idx = child, _clone_args(child), 0
+                    else:
+                        self._ref(pos)
+                else:
+                    self._leaf(child)
+                continue
+            self._node(node, len(args))
+            if not _stack:
+                return
+            node, args, idx = _stack.pop()
+
+
+def _node_builder(cls, state):
+    # Returns a function that creates a node from a tuple of arguments
+    if cls in _linear_types:
+        def build(args):
+            n = (len(args) - 1) // 2
+            return cls(constant=args[0], linear_coefs=list(args[1:n+1]),
+                       linear_vars=list(args[n+1:]))
+        return build
+    if not state and cls.create_node_with_local_data \
+       is ExpressionBase.create_node_with_local_data:
+        return cls
+    proto = cls.__new__(cls)
+    for slot, val in state:
+        object.__setattr__(proto, slot, val)
+    return proto.create_node_with_local_data
+
+
+def _decode_expressions(kinds, ints, floats, nargs, data, objects, builders,
+                        start=0, shared=None):
+    """Return the list of expressions in the token arrays
+
+    Each expression leaves its root on the stack, so the stack holds
+    the expressions (in order) once all of the tokens are processed.
+    The arrays are the slice of the token arrays that begins at
+    position `start`.  If the token arrays contain shared nodes,
+    `shared` is a tuple of the set of the positions of the shared nodes
+    and of a dict that maps them to the decoded nodes.
+    """
+    vals = floats.tolist()
+    for kind, table in ((_DATA, data), (_OBJECT, objects)):
+        pos = np.flatnonzero(kinds == kind)
+        for i, obj in zip(pos.tolist(),
+                          map(table.__getitem__, ints[pos].tolist())):
+            vals[i] = obj
+    for i in np.flatnonzero(kinds == _INT).tolist():
+        vals[i] = int(vals[i])
+
+    _stack = []
+    last = 0
+    if shared is None:
+        nodes = np.flatnonzero(kinds == _NODE)
+        for i, build, n in zip(nodes.tolist(),
+                               map(builders.__getitem__,
+                                   ints[nodes].tolist()),
+                               nargs[nodes].tolist()):
+            _stack.extend(vals[last:i])
+            last = i + 1
+            n = len(_stack) - n
+            args = tuple(_stack[n:])
+            del _stack[n:]
+            _stack.append(build(args))
+        _stack.extend(vals[last:])
+        return _stack
+
+    targets, decoded = shared
+    nodes = np.flatnonzero(kinds >= _NODE)
+    for i, kind, j, n in zip(nodes.tolist(), kinds[nodes].tolist(),
+                             ints[nodes].tolist(), nargs[nodes].tolist()):
+        _stack.extend(vals[last:i])
+        last = i + 1
+        if kind == _REF:
+            _stack.append(decoded[j])
+            continue
+        n = len(_stack) - n
+        args = tuple(_stack[n:])
+        del _stack[n:]
+        node = builders[j](args)
+        if start + i in targets:
+            decoded[start + i] = node
+        _stack.append(node)
+    _stack.extend(vals[last:])
+    return _stack
+
+
+def _columnar_components(model):
+    """Return [(component, data class or None)] for the components whose
+    data is stored in arrays (the class is None for immutable Params,
+    whose data are the values themselves)"""
+    ans = []
+    for comp in model.component_objects(_ctypes, descend_into=True):
+        if not comp.is_indexed() or type(comp._data) is not dict:
+            continue
+        if not all(_plain_key(k) for k in comp._data):
+            continue
+        if comp.ctype is Param and not comp._mutable:
+            ans.append((comp, None))
+            continue
+        classes = set(type(obj) for obj in itervalues(comp._data))
+        if len(classes) > 1:
+            continue
+        cls = classes.pop() if classes else None
+        if cls in _data_slots:
+            ans.append((comp, cls))
+    return ans
+
+
+class _SnapshotPickler(pickle.Pickler):
+
+    def __init__(self, ostream, ids):
+        pickle.Pickler.__init__(self, ostream, pickle.HIGHEST_PROTOCOL)
+        self._ids = ids
+
+    def persistent_id(self, obj):
+        return self._ids.get(id(obj), None)
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+
+    def __init__(self, istream):
+        pickle.Unpickler.__init__(self, istream)
+        self.data = None
+        self.dicts = None
+
+    def persistent_load(self, pid):
+        if pid.__class__ is tuple:
+            return self.dicts[pid[1]]
+        return self.data[pid]
+
+
+class _SnapshotWriter(object):
+
+    def __init__(self, ostream):
+        self.ostream = ostream
+        self.arrays = {}
+
+    def _pad(self):
+        pad = -self.ostream.tell() % _ALIGN
+        if pad:
+            self.ostream.write(b'\0' * pad)
+
+    def add_array(self, name, array):
+        self._pad()
+        array = np.ascontiguousarray(array)
+        self.arrays[name] = (self.ostream.tell(), array.dtype.str,
+                             array.shape)
+        self.ostream.write(array.tobytes())
+
+    def add_values(self, name, values, objects):
+        # Returns the column description: None if all values are None
+        kinds = []
+        nums = []
+        for v in values:
+            cls = v.__class__
+            if cls in _float_types:
+                kinds.append(_FLOAT)
+                nums.append(v)
+            elif cls in _int_types and -_MAX_INT <= v <= _MAX_INT:
+                kinds.append(_INT)
+                nums.append(v)
+            else:
+                kinds.append(_OBJECT)
+                nums.append(objects.add(v))
+        if all(v is None for v in values):
+            return None
+        self.add_array(name+'.values', np.array(nums, dtype=np.float64))
+        if any(k != _FLOAT for k in kinds):
+            self.add_array(name+'.kinds', np.array(kinds, dtype=np.uint8))
+        return name
+
+    def add_refs(self, name, values, objects):
+        # Returns the index of the object if all values are the same
+        # object, otherwise the column name
+        refs = [objects.add(v) for v in values]
+        if refs and all(r == refs[0] for r in refs):
+            return refs[0]
+        self.add_array(name, np.array(refs, dtype=np.int64))
+        return name
+
+
+class _SnapshotReader(object):
+
+    def __init__(self, filename, istream, header, mmap):
+        self.filename = filename
+        self.istream = istream
+        self.arrays = header['arrays']
+        self.mmap = mmap
+
+    def array(self, name):
+        offset, dtype, shape = self.arrays[name]
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape))
+        if not count:
+            return np.empty(shape, dtype=dtype)
+        if self.mmap:
+            return np.memmap(self.filename, dtype=dtype, mode='r',
+                             offset=offset, shape=shape)
+        # The arrays are read while the pickle stream is being read
+        pos = self.istream.tell()
+        self.istream.seek(offset)
+        ans = np.fromfile(self.istream, dtype=dtype, count=count)
+        self.istream.seek(pos)
+        return ans.reshape(shape)
+
+    def values(self, name, n, objects):
+        if name is None:
+            return [None] * n
+        nums = self.array(name+'.values')
+        if name+'.kinds' not in self.arrays:
+            return nums.tolist()
+        kinds = self.array(name+'.kinds').tolist()
+        ans = nums.tolist()
+        for i, kind in enumerate(kinds):
+            if kind == _INT:
+                ans[i] = int(ans[i])
+            elif kind == _OBJECT:
+                # Object 0 is None, which is not pickled for the
+                # immutable Params that are read before the model
+                ans[i] = objects[int(ans[i])] if ans[i] else None
+        return ans
+
+    def refs(self, name, n, objects):
+        if name.__class__ is not str:
+            return [objects[name]] * n
+        return [objects[i] for i in self.array(name).tolist()]
+
+
+def write_snapshot(model, filename):
+    """Write a snapshot of a constructed model to a file
+
+    The snapshot can be restored with :py:func:`read_snapshot`.  As
+    with pickle, the rules and other functions referenced by the model
+    must be importable (module-level) functions.
+
+    Args:
+        model (Block): the model to store
+        filename (str): the name of the snapshot file
+    """
+    columnar = _columnar_components(model)
+
+    # Number the component data stored in arrays, and the dicts that
+    # hold them; these are not pickled (see _SnapshotPickler)
+    ids = {}
+    data_ids = {}
+    catalog = []
+    keys = []
+    n_data = 0
+    for i, (comp, cls) in enumerate(columnar):
+        ids[id(comp._data)] = ('D', i)
+        n = len(comp._data)
+        if cls is not None:
+            for j, obj in enumerate(itervalues(comp._data)):
+                data_ids[id(obj)] = n_data + j
+            n_data += n
+        keys.append(list(comp._data))
+    ids.update(data_ids)
+
+    objects = _ObjectTable()
+    # Object 0 is None (see _SnapshotReader.values())
+    objects.add(None)
+    exprs = _ExpressionEncoder(data_ids, objects)
+    with open(filename, 'wb') as ostream, PauseGC():
+        ostream.write(_MAGIC)
+        writer = _SnapshotWriter(ostream)
+        for i, (comp, cls) in enumerate(columnar):
+            name = str(i)
+            if cls is None:
+                catalog.append((None, len(comp._data), (
+                    writer.add_values(name, list(itervalues(comp._data)),
+                                      objects),)))
+                continue
+            columns = []
+            data = list(itervalues(comp._data))
+            for slot, kind in _data_slots[cls]:
+                col = name + '.' + slot
+                if kind == 'e':
+                    start = len(exprs.kinds)
+                    for obj in data:
+                        exprs.encode(getattr(obj, slot))
+                    columns.append((start, len(exprs.kinds)))
+                    continue
+                values = [getattr(obj, slot) for obj in data]
+                if kind == 'b':
+                    writer.add_array(col, np.array(values, dtype=np.bool_))
+                elif kind == 'r':
+                    col = writer.add_refs(col, values, objects)
+                else:
+                    col = writer.add_values(col, values, objects)
+                columns.append(col)
+            catalog.append((cls, len(data), tuple(columns)))
+        writer.add_array('expr.kinds', np.array(exprs.kinds, dtype=np.uint8))
+        writer.add_array('expr.ints', np.array(exprs.ints, dtype=np.int64))
+        writer.add_array('expr.floats',
+                         np.array(exprs.floats, dtype=np.float64))
+        writer.add_array('expr.nargs', np.array(exprs.nargs, dtype=np.int32))
+
+        # Both pickles share the memo of the pickler.  The catalog and
+        # keys are read first, so that the component data can be
+        # created before the model is unpickled.
+        pickle_offset = ostream.tell()
+        pickler = _SnapshotPickler(ostream, ids)
+        pickler.dump((catalog, keys))
+        pickler.dump((model, [comp for comp, cls in columnar],
+                      objects.objects, exprs.prototypes))
+
+        header_offset = ostream.tell()
+        pickle.dump({'version': _VERSION,
+                     'arrays': writer.arrays,
+                     'pickle': pickle_offset}, ostream,
+                    pickle.HIGHEST_PROTOCOL)
+        ostream.write(_TRAILER.pack(header_offset, _MAGIC))
+
+
+def read_snapshot(filename, mmap=True):
+    """Restore a model from a snapshot written by :py:func:`write_snapshot`
+
+    Args:
+        filename (str): the name of the snapshot file
+        mmap (bool): memory map the arrays in the file instead of
+            reading them
+
+    Returns:
+        The restored model
+    """
+    # Creating the component data and expressions creates many objects,
+    # which would otherwise trigger many (slow) garbage collections
+    with open(filename, 'rb') as istream, PauseGC():
+        if istream.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError("File '%s' is not a Pyomo model snapshot"
+                             % (filename,))
+        istream.seek(-_TRAILER.size, 2)
+        header_offset, magic = _TRAILER.unpack(istream.read(_TRAILER.size))
+        if magic != _MAGIC:
+            raise ValueError("Pyomo model snapshot '%s' is truncated"
+                             % (filename,))
+        istream.seek(header_offset)
+        header = pickle.load(istream)
+        if header['version'] != _VERSION:
+            raise ValueError(
+                "Pyomo model snapshot '%s' has an unsupported format "
+                "version (%s)" % (filename, header['version']))
+        reader = _SnapshotReader(filename, istream, header, mmap)
+
+        istream.seek(header['pickle'])
+        unpickler = _SnapshotUnpickler(istream)
+        catalog, keys = unpickler.load()
+
+        # Create the (empty) component data and the dicts that hold them
+        data = []
+        dicts = []
+        values = []
+        for (cls, n, columns), comp_keys in zip(catalog, keys):
+            if cls is None:
+                values.append(None)
+                dicts.append(columns)
+                continue
+            comp_data = [cls.__new__(cls) for i in xrange(n)]
+            data.extend(comp_data)
+            values.append(comp_data)
+            dicts.append(dict(zip(comp_keys, comp_data)))
+        unpickler.data = data
+        unpickler.dicts = dicts
+
+        # For immutable Params, the dict must be complete before the
+        # model is unpickled; only Params with object values (which are
+        # pickled with the model) are filled in later.
+        deferred = []
+        for i, (cls, n, columns) in enumerate(catalog):
+            if cls is not None:
+                continue
+            name = columns[0]
+            if name is not None and name+'.kinds' in reader.arrays \
+               and ((reader.array(name+'.kinds') == _OBJECT)
+                    & (reader.array(name+'.values') != 0)).any():
+                deferred.append(i)
+                dicts[i] = {}
+            else:
+                dicts[i] = dict(zip(keys[i], reader.values(name, n, None)))
+
+        model, components, objects, prototypes = unpickler.load()
+
+        for i in deferred:
+            dicts[i].update(zip(
+                keys[i], reader.values(catalog[i][2][0], catalog[i][1],
+                                       objects)))
+
+        builders = [_node_builder(cls, state) for cls, state in prototypes]
+        expr_arrays = tuple(reader.array('expr.' + name) for name in
+                            ('kinds', 'ints', 'floats', 'nargs'))
+        refs = np.flatnonzero(expr_arrays[0] == _REF)
+        if len(refs):
+            shared = (set(expr_arrays[1][refs].tolist()), {})
+        else:
+            shared = None
+        for comp, (cls, n, columns), comp_data in zip(
+                components, catalog, values):
+            if cls is None:
+                continue
+            _set = _slot_setter(cls, '_component')
+            deque(map(_set, comp_data, [weakref_ref(comp)] * n), maxlen=0)
+            for (slot, kind), col in zip(_data_slots[cls], columns):
+                if kind == 'e':
+                    start, stop = col
+                    vals = _decode_expressions(*(
+                        tuple(a[start:stop] for a in expr_arrays)
+                        + (data, objects, builders, start, shared)))
+                elif kind == 'b':
+                    vals = reader.array(col).tolist()
+                elif kind == 'r':
+                    vals = reader.refs(col, n, objects)
+                else:
+                    vals = reader.values(col, n, objects)
+                deque(map(_slot_setter(cls, slot), comp_data, vals),
+                      maxlen=0)
+    return model
+
+
+def _slot_setter(cls, slot):
+    return getattr(cls, slot).__set__
@@ -0,0 +1,211 @@
+"""Tests for model snapshots."""
+import os
+import tempfile
+
+from six import StringIO
+
+import pyutilib.th as unittest
+from pyomo.common.dependencies import numpy_available
+from pyomo.contrib.snapshot import read_snapshot, write_snapshot
+from pyomo.environ import (
+    AbstractModel, Any, Binary, Block, ConcreteModel, Constraint,
+    ConstraintList, Expr_if, Expression, NonNegativeReals, Objective, Param, RangeSet, Set, Suffix,
+    Var, inequality, sin, value,
+)
+from pyomo.core.expr.numeric_expr import LinearExpression
+
+
+def _block_c_rule(b, j):
+    return b.v[j] >= b.model().w
+
+
+def _pprint(model):
+    buf = StringIO()
+    model.pprint(ostream=buf)
+    return buf.getvalue()
+
+
+def _model():
+    m = ConcreteModel()
+    m.I = RangeSet(4)
+    m.J = Set(initialize=['a', 'b'])
+    m.D = Set(initialize=[0, 1, 2, 3])
+    m.p = Param(m.I, initialize={1: 1.5, 2: 2, 3: 'three'}, default=0,
+                within=Any)
+    m.q = Param(m.I, m.J, mutable=True, initialize=2.5)
+    m.r = Param(initialize=3, mutable=True)
+    m.x = Var(m.I, m.J, bounds=(0, 10), initialize=1)
+    m.x[2, 'b'].setub(m.r)
+    m.x[3, 'a'].fix(2)
+    m.y = Var(m.I, domain=Binary)
+    m.y[2].domain = NonNegativeReals
+    m.z = Var(m.I, within=m.D)
+    m.w = Var()
+    m.e = Expression(m.I)
+    m.c = Constraint(m.I)
+    m.d = Constraint(m.I)
+    for i in m.I:
+        m.e[i] = m.q[i, 'a'] * m.x[i, 'a']**2
+        m.c[i] = m.e[i] + m.y[i] - m.w <= m.r
+        m.d[i] = inequality(
+            -1, sin(m.x[i, 'b']) / (1 + m.y[i]), 2 * m.q[i, 'b'])
+    m.d[3].deactivate()
+    m.l = ConstraintList()
+    m.l.add(m.x[1, 'a'] == m.x[2, 'a'])
+    m.l.add(sum(m.x[i, j] for i in m.I for j in m.J) >= -2**60)
+    m.l.add(LinearExpression(constant=1, linear_coefs=[2, m.q[1, 'a']],
+                             linear_vars=[m.x[1, 'a'], m.y[1]]) <= 4)
+    m.l.add(Expr_if(IF=m.w >= 1, THEN=m.x[1, 'a'], ELSE=0) == 0)
+    m.b = Block()
+    m.b.v = Var(m.J, initialize={'a': 7})
+    m.b.c = Constraint(m.J, rule=_block_c_rule)
+    m.o = Objective(expr=sum(m.y[i] for i in m.I) + m.w)
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    m.dual[m.c[1]] = 4
+    m.dual[m.x[1, 'b']] = 5
+    return m
+
+
+def _abstract_c_rule(m, i):
+    return m.x[i] >= m.p[i]
+
+
+def _abstract_o_rule(m):
+    return sum(m.x[i] for i in m.I)
+
+
+@unittest.skipUnless(numpy_available, "NumPy is not available")
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.fname = tempfile.mkstemp(suffix='.snapshot')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.fname)
+
+    def test_roundtrip(self):
+        m = _model()
+        write_snapshot(m, self.fname)
+        for mmap in (True, False):
+            i = read_snapshot(self.fname, mmap=mmap)
+            self.assertEqual(_pprint(i), _pprint(m))
+
+    def test_references(self):
+        m = _model()
+        write_snapshot(m, self.fname)
+        i = read_snapshot(self.fname)
+        self.assertIs(i.x[1, 'a'].parent_component(), i.x)
+        self.assertIs(i.x[1, 'a'].parent_block(), i)
+        self.assertIs(i.b.v['a'].parent_block(), i.b)
+        self.assertIs(i.c[1].body.arg(0), i.e[1])
+        self.assertIs(i.e[1].expr.arg(1).arg(0), i.x[1, 'a'])
+        self.assertIs(i.o.expr.arg(0), i.y[1])
+        self.assertIs(i.x[2, 'b']._ub, i.r)
+        self.assertIs(i.z[1].domain, i.D)
+        self.assertEqual(i.dual[i.c[1]], 4)
+        self.assertEqual(i.dual[i.x[1, 'b']], 5)
+        self.assertEqual(i.c[2].name, 'c[2]')
+
+        # The restored model is independent of the original
+        i.r = 6
+        self.assertEqual(value(i.c[1].upper), 6)
+        self.assertEqual(i.x[2, 'b'].ub, 6)
+        self.assertEqual(m.x[2, 'b'].ub, 3)
+        i.x[1, 'a'].value = 3
+        self.assertEqual(value(i.e[1]), 22.5)
+        self.assertEqual(m.x[1, 'a'].value, 1)
+
+    def test_values(self):
+        m = _model()
+        write_snapshot(m, self.fname)
+        i = read_snapshot(self.fname)
+        self.assertEqual(i.p[1], 1.5)
+        self.assertIs(type(i.p[2]), int)
+        self.assertEqual(i.p[3], 'three')
+        self.assertEqual(i.p[4], 0)
+        self.assertIs(type(i.x[1, 'a'].value), int)
+        self.assertTrue(i.x[3, 'a'].fixed)
+        self.assertIsNone(i.y[1].value)
+        self.assertFalse(i.d[3].active)
+        self.assertTrue(i.l[1].equality)
+        self.assertEqual(i.l[2].lower, -2**60)
+        self.assertIs(type(i.l[3].body), LinearExpression)
+        self.assertEqual(i.l[3].body.linear_coefs, [2, i.q[1, 'a']])
+        self.assertIs(i.l[4].body.arg(1), i.x[1, 'a'])
+        self.assertEqual(i.y[2].domain, NonNegativeReals)
+        self.assertEqual(i.b.v['a'].value, 7)
+        self.assertIsNone(i.b.v['b'].value)
+
+    def test_shared_expressions(self):
+        m = _model()
+        shared = m.x[1, 'a'] * m.x[2, 'a']
+        m.l.add(shared <= 1)
+        m.l.add(2 * shared + m.w >= -1)
+        m.c[1] = shared + m.y[1] <= m.r
+        self.assertIs(m.l[6].body.arg(0).arg(1), m.l[5].body)
+        write_snapshot(m, self.fname)
+        for mmap in (True, False):
+            i = read_snapshot(self.fname, mmap=mmap)
+            self.assertEqual(_pprint(i), _pprint(m))
+            self.assertIs(i.l[6].body.arg(0).arg(1), i.l[5].body)
+            self.assertIs(i.c[1].body.arg(0), i.l[5].body)
+            i.x[1, 'a'].value = 3
+            i.x[2, 'a'].value = 4
+            i.w.value = 1
+            self.assertEqual(value(i.l[6].body), 25)
+
+    def test_modify_restored(self):
+        m = _model()
+        write_snapshot(m, self.fname)
+        i = read_snapshot(self.fname)
+        i.l.add(i.x[4, 'a'] <= 1)
+        self.assertEqual(len(i.l), 5)
+        i.x[4, 'b'] = 3
+        self.assertEqual(i.x[4, 'b'].value, 3)
+        del i.c[4]
+        self.assertEqual(len(i.c), 3)
+        i.d[3].activate()
+        self.assertEqual(len(list(i.component_data_objects(
+            Constraint, active=True))), 14)
+
+    def test_abstract_instance(self):
+        m = AbstractModel()
+        m.I = Set()
+        m.p = Param(m.I)
+        m.x = Var(m.I)
+        m.c = Constraint(m.I, rule=_abstract_c_rule)
+        m.o = Objective(rule=_abstract_o_rule)
+        inst = m.create_instance(data={None: {
+            'I': {None: [1, 2, 3]}, 'p': {1: 10, 2: 20, 3: 30}}})
+        write_snapshot(inst, self.fname)
+        i = read_snapshot(self.fname)
+        self.assertEqual(_pprint(i), _pprint(inst))
+        self.assertEqual(value(i.c[2].lower), 20)
+
+    def test_empty_components(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[])
+        m.x = Var(m.I)
+        m.c = Constraint(m.I)
+        m.p = Param(m.I, mutable=True)
+        write_snapshot(m, self.fname)
+        i = read_snapshot(self.fname)
+        self.assertEqual(len(i.x), 0)
+        self.assertEqual(len(i.c), 0)
+        self.assertEqual(_pprint(i), _pprint(m))
+
+    def test_not_a_snapshot(self):
+        with open(self.fname, 'wb') as f:
+            f.write(b'not a model')
+        with self.assertRaisesRegexp(ValueError, "not a Pyomo model snapshot"):
+            read_snapshot(self.fname)
+        write_snapshot(_model(), self.fname)
+        with open(self.fname, 'rb+') as f:
+            f.truncate(1000)
+        with self.assertRaisesRegexp(ValueError, "is truncated"):
+            read_snapshot(self.fname)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,293 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Reuse the results of solves of identical models.
+
+The cache is keyed on a fingerprint of the active model: the standard
+representations of the active objectives and constraints (with the
+values of parameters and fixed variables substituted), the constraint
+and variable bounds, the variable domains, the import suffixes and the
+solver with its options.
+"""
+
+import copy
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+import six
+
+from pyomo.common.collections import ComponentMap
+from pyomo.common.config import (
+    ConfigBlock, ConfigValue, NonNegativeInt, add_docstring_list
+)
+from pyomo.core import Constraint, Objective, value
+from pyomo.core.base.suffix import active_import_suffix_generator
+from pyomo.core.expr.visitor import expression_to_string
+from pyomo.opt import SolverFactory, OptSolver
+from pyomo.opt import TerminationCondition as tc
+from pyomo.repn import generate_standard_repn
+
+logger = logging.getLogger('pyomo.contrib.solve_cache')
+
+# Solver keywords that do not change the results
+_ignored_solver_args = {
+    'tee', 'logfile', 'keepfiles', 'report_timing', 'symbolic_solver_labels',
+}
+
+# Results that are cached, and those that come with a solution
+_cached_conditions = {
+    tc.optimal, tc.locallyOptimal, tc.globallyOptimal, tc.feasible,
+    tc.infeasible, tc.unbounded, tc.infeasibleOrUnbounded,
+}
+_solution_conditions = {
+    tc.optimal, tc.locallyOptimal, tc.globallyOptimal, tc.feasible,
+}
+
+
+def model_fingerprint(model, extra=(), initial_values=False):
+    """Return a canonical hash (a hex string) of the active model
+
+    Two models with the same fingerprint define the same optimization
+    problem (with the same variable names).  The items in ``extra``
+    (e.g., the solver name and options) are included in the hash, as
+    are the values of the free variables if ``initial_values`` is True.
+    """
+    return _model_fingerprint(model, extra, initial_values)[0]
+
+
+def _model_fingerprint(model, extra, initial_values):
+    # Returns the fingerprint, and the variables and constraints in
+    # the order in which they were hashed
+    h = hashlib.sha256()
+
+    def _update(item):
+        h.update(repr(item).encode('utf-8'))
+
+    var_ids = ComponentMap()
+    variables = []
+
+    def _var_ids(vlist):
+        ans = []
+        for v in vlist:
+            if v not in var_ids:
+                var_ids[v] = len(variables)
+                variables.append(v)
+            ans.append(var_ids[v])
+        return tuple(ans)
+
+    def _update_repn(repn):
+        _update((repn.constant,
+                 _var_ids(repn.linear_vars),
+                 tuple(repn.linear_coefs),
+                 tuple(_var_ids(pair) for pair in repn.quadratic_vars),
+                 tuple(repn.quadratic_coefs)))
+        if repn.nonlinear_expr is not None:
+            _update((_var_ids(repn.nonlinear_vars),
+                     expression_to_string(repn.nonlinear_expr, verbose=True,
+                                          compute_values=True)))
+
+    _update(tuple(extra))
+    for obj in model.component_data_objects(Objective, active=True,
+                                            descend_into=True):
+        _update(('obj', obj.sense))
+        _update_repn(generate_standard_repn(obj.expr, compute_values=True))
+
+    constraints = []
+    for con in model.component_data_objects(Constraint, active=True,
+                                            descend_into=True):
+        constraints.append(con)
+        _update(('con',
+                 None if con.lower is None else value(con.lower),
+                 None if con.upper is None else value(con.upper)))
+        _update_repn(generate_standard_repn(con.body, compute_values=True))
+
+    for v in variables:
+        _update((v.name, v.lb, v.ub, v.is_continuous(), v.is_binary(),
+                 v.is_integer()))
+        if initial_values:
+            _update(v.value)
+
+    return h.hexdigest(), variables, constraints
+
+
+@SolverFactory.register('solve_cache',
+                        doc='Solver wrapper that reuses the results '
+                        'of identical solves')
+class SolveCache(object):
+    """Solver wrapper that reuses the results of identical solves.
+
+    Before calling the solver, the fingerprint of the active model
+    (see :py:func:`model_fingerprint`) is looked up in a cache of
+    recent results.  If it is found, the cached variable values (and
+    import suffix values, e.g., duals) are loaded into the model and a
+    copy of the cached results is returned; otherwise the solver is
+    called and its results are added to the cache.  The cache belongs
+    to the SolveCache object, so the same object should be used for
+    all of the solves.
+
+    Only results with a definite termination condition (e.g., optimal
+    or infeasible) are cached, and solves with ``load_solutions=False``
+    are passed to the solver unchanged.
+
+    Keyword arguments below can be specified either when creating the
+    SolveCache or for the ``solve`` function.
+
+    """
+
+    CONFIG = ConfigBlock("SolveCache")
+    CONFIG.declare("solver", ConfigValue(
+        default=None,
+        description="The solver to use (a solver name or object)"
+    ))
+    CONFIG.declare("solver_args", ConfigValue(
+        default={},
+        description="Dictionary of keyword arguments to pass to the solver."
+    ))
+    CONFIG.declare("maxsize", ConfigValue(
+        default=128, domain=NonNegativeInt,
+        description="Maximum number of results kept in memory "
+        "(the least recently used results are discarded first)"
+    ))
+    CONFIG.declare("cache_dir", ConfigValue(
+        default=None,
+        description="Directory in which results are also stored, so that "
+        "they can be reused by other processes"
+    ))
+    CONFIG.declare("initial_values", ConfigValue(
+        default=False, domain=bool,
+        description="Include the values of the free variables in the "
+        "fingerprint (for solvers whose results depend on the starting "
+        "point)"
+    ))
+
+    __doc__ = add_docstring_list(__doc__, CONFIG)
+
+    def __init__(self, **kwds):
+        self.config = self.CONFIG(kwds.pop('options', {}))
+        self.config.set_value(kwds)
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def available(self, exception_flag=True):
+        """Check if solver is available."""
+        return True
+
+    def license_is_valid(self):
+        return True
+
+    def set_options(self, istr):
+        self.config.set_value(OptSolver._options_string_to_dict(istr))
+
+    def clear(self):
+        """Discard the results held in memory"""
+        self._cache.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, t, v, traceback):
+        pass
+
+    def solve(self, model, **kwds):
+        config = self.config(kwds.pop('options', {}))
+        config.set_value(kwds)
+
+        solver = config.solver
+        if solver is None:
+            raise ValueError(
+                "SolveCache: no solver specified; use the 'solver' option")
+        if isinstance(solver, six.string_types):
+            solver_name = solver
+            solver = SolverFactory(solver)
+        else:
+            solver_name = getattr(solver, 'name', type(solver).__name__)
+        solver_args = dict(config.solver_args)
+
+        if not solver_args.get('load_solutions', True):
+            return solver.solve(model, **solver_args)
+
+        suffixes = list(active_import_suffix_generator(model))
+        extra = (
+            solver_name,
+            sorted((str(k), repr(v)) for k, v in
+                   six.iteritems(getattr(solver, 'options', {}))),
+            sorted((k, repr(v)) for k, v in six.iteritems(solver_args)
+                   if k not in _ignored_solver_args),
+            [name for name, suffix in suffixes],
+        )
+        key, variables, constraints = _model_fingerprint(
+            model, extra, config.initial_values)
+
+        entry = self._lookup(key, config)
+        if entry is not None:
+            self.hits += 1
+            return self._load(entry, variables, constraints, suffixes)
+        self.misses += 1
+
+        results = solver.solve(model, **solver_args)
+        if results.solver.termination_condition in _cached_conditions:
+            self._store(key, self._entry(results, variables, constraints,
+                                         suffixes), config)
+        return results
+
+    def _lookup(self, key, config):
+        entry = self._cache.pop(key, None)
+        if entry is None and config.cache_dir is not None:
+            fname = os.path.join(config.cache_dir, key + '.pickle')
+            if os.path.exists(fname):
+                with open(fname, 'rb') as f:
+                    entry = pickle.load(f)
+        if entry is not None:
+            self._store(key, entry, config, write=False)
+        return entry
+
+    def _store(self, key, entry, config, write=True):
+        # The most recently used results are at the end
+        self._cache[key] = entry
+        while len(self._cache) > config.maxsize:
+            self._cache.popitem(last=False)
+        if write and config.cache_dir is not None:
+            if not os.path.isdir(config.cache_dir):
+                os.makedirs(config.cache_dir)
+            with open(os.path.join(config.cache_dir, key+'.pickle'),
+                      'wb') as f:
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+
+    def _entry(self, results, variables, constraints, suffixes):
+        if results.solver.termination_condition in _solution_conditions:
+            values = [v.value for v in variables]
+        else:
+            values = None
+        components = variables + constraints
+        suffix_values = {}
+        for name, suffix in suffixes:
+            suffix_values[name] = [suffix.get(c) for c in components]
+        return (copy.deepcopy(results), values, suffix_values)
+
+    def _load(self, entry, variables, constraints, suffixes):
+        results, values, suffix_values = entry
+        if values is not None:
+            for v, val in zip(variables, values):
+                v.set_value(val, valid=True)
+        components = variables + constraints
+        for name, suffix in suffixes:
+            suffix.clear_all_values()
+            for c, val in zip(components, suffix_values[name]):
+                if val is not None:
+                    suffix[c] = val
+        return copy.deepcopy(results)
@@ -0,0 +1,196 @@
+"""Tests for the solve_cache solver wrapper."""
+import shutil
+import tempfile
+
+import pyutilib.th as unittest
+from pyomo.contrib.solve_cache import SolveCache, model_fingerprint
+from pyomo.environ import (
+    ConcreteModel, Constraint, Objective, Param, SolverFactory, Suffix, Var,
+    exp, value
+)
+from pyomo.opt import SolverResults, TerminationCondition
+
+
+class CountingSolver(object):
+    """Solver that sets x = y = c.lower/3 and counts its calls"""
+
+    name = 'counting'
+
+    def __init__(self, termination=TerminationCondition.optimal):
+        self.calls = 0
+        self.options = {}
+        self.termination = termination
+
+    def solve(self, model, **kwds):
+        self.calls += 1
+        results = SolverResults()
+        results.solver.termination_condition = self.termination
+        if self.termination == TerminationCondition.optimal:
+            model.x.set_value(value(model.c.lower) / 3.0)
+            model.y.set_value(value(model.c.lower) / 3.0)
+            if hasattr(model, 'dual'):
+                model.dual[model.c] = 1.0 / 3
+        return results
+
+
+def _model(rhs=3):
+    m = ConcreteModel()
+    m.p = Param(initialize=rhs, mutable=True)
+    m.x = Var(bounds=(0, 10))
+    m.y = Var(bounds=(0, 10))
+    m.c = Constraint(expr=m.x + 2*m.y >= m.p)
+    m.o = Objective(expr=m.x + m.y)
+    return m
+
+
+class TestFingerprint(unittest.TestCase):
+
+    def test_identical_models(self):
+        self.assertEqual(model_fingerprint(_model()),
+                         model_fingerprint(_model()))
+        m = _model()
+        self.assertEqual(model_fingerprint(m),
+                         model_fingerprint(m.clone()))
+
+    def test_changes(self):
+        ref = model_fingerprint(_model())
+        m = _model()
+        m.p = 4
+        self.assertNotEqual(model_fingerprint(m), ref)
+        m = _model()
+        m.x.setub(5)
+        self.assertNotEqual(model_fingerprint(m), ref)
+        m = _model()
+        m.y.fix(1)
+        self.assertNotEqual(model_fingerprint(m), ref)
+        m = _model()
+        m.c.deactivate()
+        self.assertNotEqual(model_fingerprint(m), ref)
+        self.assertNotEqual(model_fingerprint(_model(), extra=('glpk',)),
+                            ref)
+
+    def test_fixed_values(self):
+        m1 = _model()
+        m1.y.fix(1)
+        m2 = _model()
+        m2.y.fix(2)
+        self.assertNotEqual(model_fingerprint(m1), model_fingerprint(m2))
+        m2.y.fix(1)
+        self.assertEqual(model_fingerprint(m1), model_fingerprint(m2))
+
+    def test_nonlinear(self):
+        m1 = _model()
+        m1.c2 = Constraint(expr=exp(m1.x*m1.p) <= 4)
+        m2 = _model()
+        m2.c2 = Constraint(expr=exp(m2.x*m2.p) <= 4)
+        self.assertEqual(model_fingerprint(m1), model_fingerprint(m2))
+        m2.p = 2
+        self.assertNotEqual(model_fingerprint(m1), model_fingerprint(m2))
+
+    def test_initial_values(self):
+        m1 = _model()
+        m2 = _model()
+        m2.x = 1
+        self.assertEqual(model_fingerprint(m1), model_fingerprint(m2))
+        self.assertNotEqual(model_fingerprint(m1, initial_values=True),
+                            model_fingerprint(m2, initial_values=True))
+
+
+class TestSolveCache(unittest.TestCase):
+
+    def test_registered(self):
+        self.assertIsInstance(SolverFactory('solve_cache'), SolveCache)
+
+    def test_no_solver(self):
+        with self.assertRaisesRegexp(ValueError, "no solver specified"):
+            SolveCache().solve(_model())
+
+    def test_hit(self):
+        solver = CountingSolver()
+        cache = SolveCache(solver=solver)
+        m = _model()
+        cache.solve(m)
+        self.assertEqual(solver.calls, 1)
+        m2 = _model()
+        results = cache.solve(m2)
+        self.assertEqual(solver.calls, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertAlmostEqual(m2.x.value, 1)
+        self.assertAlmostEqual(m2.y.value, 1)
+        self.assertFalse(m2.x.stale)
+
+        m2.p = 6
+        cache.solve(m2)
+        self.assertEqual(solver.calls, 2)
+        self.assertAlmostEqual(m2.x.value, 2)
+
+    def test_suffixes(self):
+        solver = CountingSolver()
+        cache = SolveCache(solver=solver)
+        m = _model()
+        cache.solve(m)
+        m2 = _model()
+        m2.dual = Suffix(direction=Suffix.IMPORT)
+        cache.solve(m2)
+        # A new suffix was requested
+        self.assertEqual(solver.calls, 2)
+        m3 = _model()
+        m3.dual = Suffix(direction=Suffix.IMPORT)
+        cache.solve(m3)
+        self.assertEqual(solver.calls, 2)
+        self.assertAlmostEqual(m3.dual[m3.c], 1.0/3)
+
+    def test_infeasible(self):
+        solver = CountingSolver(TerminationCondition.infeasible)
+        cache = SolveCache(solver=solver)
+        m = _model()
+        cache.solve(m)
+        results = cache.solve(m)
+        self.assertEqual(solver.calls, 1)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.infeasible)
+        self.assertIsNone(m.x.value)
+
+    def test_not_cached(self):
+        solver = CountingSolver(TerminationCondition.maxTimeLimit)
+        cache = SolveCache(solver=solver)
+        cache.solve(_model())
+        cache.solve(_model())
+        self.assertEqual(solver.calls, 2)
+
+        solver = CountingSolver()
+        cache = SolveCache(solver=solver,
+                           solver_args={'load_solutions': False})
+        cache.solve(_model())
+        cache.solve(_model())
+        self.assertEqual(solver.calls, 2)
+
+    def test_lru(self):
+        solver = CountingSolver()
+        cache = SolveCache(solver=solver, maxsize=2)
+        for rhs in (3, 6, 3, 9, 6):
+            cache.solve(_model(rhs))
+        # 3 was used more recently than 6 when 9 was added
+        self.assertEqual(solver.calls, 4)
+        cache.solve(_model(3))
+        self.assertEqual(solver.calls, 5)
+
+    def test_cache_dir(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            solver = CountingSolver()
+            SolveCache(solver=solver, cache_dir=tmpdir).solve(_model())
+            m = _model()
+            cache = SolveCache(solver=solver, cache_dir=tmpdir)
+            cache.solve(m)
+            self.assertEqual(solver.calls, 1)
+            self.assertEqual(cache.hits, 1)
+            self.assertAlmostEqual(m.x.value, 1)
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -77,6 +77,7 @@ from pyomo.core.base.check import BuildCheck
 from pyomo.core.base.set import (
     Set, SetOf, simple_set_rule, RangeSet,
 )
+from pyomo.core.base.sparse_set import SparseSet
 from pyomo.core.base.param import Param
 from pyomo.core.base.var import (Var, SimpleVar, VarList)
 from pyomo.core.base.boolean_var import (
@@ -49,6 +49,7 @@ from pyomo.core.base.plugin import ModelComponentFactory, TransformationFactory
 from pyomo.core.base.label import CNameLabeler, CuidLabeler
 
 from pyomo.opt.results import SolverResults, Solution, SolverStatus, UndefinedData
+from pyomo.opt.results.columnar import SolutionColumns
 
 from six import itervalues, iteritems, StringIO, string_types
 try:
@@ -99,6 +100,15 @@ class PyomoConfig(Container):
             d[item[-1]] = PyomoConfig._option[item]
 
 
+def _solution_entries(solution, name):
+    """Iterate over the (symbol, values) pairs of a Solution attribute
+    (without building the nested dicts of columnar entries)"""
+    entries = getattr(solution, name)
+    if isinstance(entries, SolutionColumns):
+        return entries.iter_entries()
+    return iteritems(entries)
+
+
 class ModelSolution(object):
 
     def __init__(self):
@@ -376,7 +386,7 @@ class ModelSolutions(object):
 
                 for name in ['problem', 'objective', 'variable', 'constraint']:
                     tmp = soln._entry[name]
-                    for cuid, val in iteritems(getattr(solution, name)):
+                    for cuid, val in _solution_entries(solution, name):
                         obj = cache.get(cuid, None)
                         if obj is None:
                             if ignore_invalid_labels:
@@ -398,7 +408,7 @@ class ModelSolutions(object):
 
                 for name in ['problem', 'objective', 'variable', 'constraint']:
                     tmp = soln._entry[name]
-                    for symb, val in iteritems(getattr(solution, name)):
+                    for symb, val in _solution_entries(solution, name):
                         obj = cache.get(symb, None)
                         if obj is None:
                             if ignore_invalid_labels:
@@ -413,7 +423,7 @@ class ModelSolutions(object):
             smap = self.symbol_map[smap_id]
             for name in ['problem', 'objective', 'variable', 'constraint']:
                 tmp = soln._entry[name]
-                for symb, val in iteritems(getattr(solution, name)):
+                for symb, val in _solution_entries(solution, name):
                     if symb in smap.bySymbol:
                         obj = smap.bySymbol[symb]
                     elif symb in smap.aliases:
@@ -71,9 +71,10 @@ from pyomo.core.base.check import BuildCheck
 from pyomo.core.base.set import (
     Set, SetOf, simple_set_rule, RangeSet,
 )
+from pyomo.core.base.sparse_set import SparseSet
 from pyomo.core.base.param import Param
 from pyomo.core.base.var import (Var, _VarData, _GeneralVarData,
-                                 SimpleVar, VarList)
+                                 _ArrayVarData, SimpleVar, VarList)
 from pyomo.core.base.boolean_var import (
     BooleanVar,  _BooleanVarData,  _GeneralBooleanVarData,
     BooleanVarList, SimpleBooleanVar)
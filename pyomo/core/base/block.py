@@ -31,7 +31,7 @@ from pyomo.common.deprecation import deprecated, deprecation_warning
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.component import (
-    Component, ActiveComponentData,
+    Component, ActiveComponentData, _ModelStructure,
 )
 from pyomo.core.base.componentuid import ComponentUID
 from pyomo.core.base.set import GlobalSetBase, _SetDataBase
@@ -226,6 +226,45 @@ class _BlockConstruction(object):
     data = {}
 
 
+class _CtypeIndex(object):
+    """
+    This class holds the cached results of component_data_objects()
+    for a block with the ctype index enabled (see
+    _BlockData.enable_ctype_index()).  The cached lists are valid as
+    long as the _ModelStructure version does not change.
+    """
+    def __init__(self):
+        self.version = -1
+        self.data = {}
+
+    def lookup(self, key, generator):
+        if self.version != _ModelStructure.version:
+            self.data = {}
+            self.version = _ModelStructure.version
+        ans = self.data.get(key, None)
+        if ans is None:
+            ans = list(generator)
+            # Only keep the list if generating it did not change the
+            # model (e.g., by implicitly constructing block data)
+            if self.version == _ModelStructure.version:
+                self.data[key] = ans
+        return ans
+
+
+def _ctype_index_key(ctypes):
+    """Return the ctype (or descend_into) argument and its cache key
+
+    Iterables of types (which may be generators) are converted to
+    tuples, with frozensets as the cache keys.
+    """
+    if ctypes in (None, True, False) or isclass(ctypes):
+        return ctypes, ctypes
+    if isinstance(ctypes, SubclassOf):
+        return ctypes, (SubclassOf,) + ctypes.ctype
+    ctypes = tuple(ctypes)
+    return ctypes, frozenset(ctypes)
+
+
 class PseudoMap(object):
     """
     This class presents a "mock" dict interface to the internal
@@ -449,6 +488,7 @@ class _BlockData(ActiveComponentData):
     This class holds the fundamental block data.
     """
     _Block_reserved_words = set()
+    _ctype_index = None
 
     def __init__(self, component):
         #
@@ -505,6 +545,9 @@ class _BlockData(ActiveComponentData):
         # Note sure why we are deleting these...
         if '_repn' in ans:
             del ans['_repn']
+        # The cached component lists are rebuilt on demand
+        if ans.get('_ctype_index', None) is not None:
+            ans['_ctype_index'] = _CtypeIndex()
         return ans
 
     #
@@ -989,6 +1032,7 @@ component, use the block del_component() and add_component() methods.
         _new_idx = len(self._decl_order)
         self._decl[name] = _new_idx
         self._decl_order.append((val, None))
+        _ModelStructure.version += 1
         #
         # Add the component as an attribute.  Note that
         #
@@ -1092,6 +1136,8 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                     str(val.name), str(data).strip(),
                     type(err).__name__, err)
                 raise
+            finally:
+                _ModelStructure.version += 1
             if __debug__ and logger.isEnabledFor(logging.DEBUG):
                 if _blockName[-1] == "'":
                     _blockName = _blockName[:-1] + '.' + val.name + "'"
@@ -1130,6 +1176,7 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
 
         # Clear the _parent attribute
         obj._parent = None
+        _ModelStructure.version += 1
 
         # Now that this component is not in the _decl map, we can call
         # delattr as usual.
@@ -1186,6 +1233,7 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                 ctype_info[1] = prev
 
         obj._ctype = new_ctype
+        _ModelStructure.version += 1
 
         # Insert into the new ctype list
         if new_ctype not in self._ctypes:
@@ -1212,9 +1260,18 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             self._decl_order[prev] = (self._decl_order[prev][0], idx)
             self._decl_order[idx] = (obj, tmp)
 
-    def clone(self):
+    def clone(self, share_expressions=False):
         """
-        TODO
+        Return a copy of this block and everything beneath it.
+
+        Components outside of this block that are referenced by its
+        expressions are not copied.  If share_expressions is True,
+        expressions are rebuilt from their copied leaves instead of
+        being deep-copied node by node: subtrees that do not refer to
+        any component in this block (e.g., subtrees of constants and
+        external variables) are shared with the original, and the
+        state of component data is copied in bulk.  This is
+        considerably faster for large models.
         """
         # FYI: we used to remove all _parent() weakrefs before
         # deepcopying and then restore them on the original and cloned
@@ -1231,18 +1288,17 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         # should be preserved as singletons.
         #
         save_parent, self._parent = self._parent, None
+        memo = {}
+        if share_expressions:
+            memo['__share_expressions__'] = True
         try:
-            new_block = copy.deepcopy(
-                self, {
-                    '__block_scope__': {id(self): True, id(None): False},
-                    '__paranoid__': False,
-                    })
+            memo['__block_scope__'] = {id(self): True, id(None): False}
+            memo['__paranoid__'] = False
+            new_block = copy.deepcopy(self, dict(memo))
         except:
-            new_block = copy.deepcopy(
-                self, {
-                    '__block_scope__': {id(self): True, id(None): False},
-                    '__paranoid__': True,
-                    })
+            memo['__block_scope__'] = {id(self): True, id(None): False}
+            memo['__paranoid__'] = True
+            new_block = copy.deepcopy(self, memo)
         finally:
             self._parent = save_parent
 
@@ -1408,6 +1464,28 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             for x in _block.component_map(ctype, active, sort).itervalues():
                 yield x
 
+    def enable_ctype_index(self):
+        """
+        Cache the results of component_data_objects() on this block.
+
+        Repeated queries with the same arguments are served from a
+        flat list (in the same order as the uncached generator) until
+        the structure of any model changes: components or component
+        data are added or deleted, or components are activated or
+        deactivated.  Note that the cached iterator returns a snapshot
+        of the block: components added while iterating over it are
+        not returned.
+        """
+        if self._ctype_index is None:
+            super(_BlockData, self).__setattr__('_ctype_index', _CtypeIndex())
+
+    def disable_ctype_index(self):
+        """
+        Stop caching the results of component_data_objects() on this
+        block.
+        """
+        super(_BlockData, self).__setattr__('_ctype_index', None)
+
     def component_data_objects(self,
                                ctype=None,
                                active=None,
@@ -1420,6 +1498,22 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         block.  By default, this generator recursively
         descends into sub-blocks.
         """
+        if self._ctype_index is None:
+            return self._component_data_objects(
+                ctype, active, sort, descend_into, descent_order)
+        ctype, ctype_key = _ctype_index_key(ctype)
+        descend_into, descend_key = _ctype_index_key(descend_into)
+        if sort.__class__ is set:
+            sort_key = frozenset(sort)
+        else:
+            sort_key = sort
+        return iter(self._ctype_index.lookup(
+            (ctype_key, active, sort_key, descend_key, descent_order),
+            self._component_data_objects(
+                ctype, active, sort, descend_into, descent_order)))
+
+    def _component_data_objects(self, ctype, active, sort, descend_into,
+                                descent_order):
         if descend_into:
             block_generator = self.block_data_objects(
                 active=active,
@@ -1978,6 +2072,7 @@ class Block(ActiveIndexedComponent):
             # BlockData and the Block component are the same object)
             if data is not None:
                 _BlockConstruction.data.pop(id(self), None)
+            _ModelStructure.version += 1
             timer.report()
 
     def _pprint_callback(self, ostream, idx, data):
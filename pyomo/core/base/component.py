@@ -21,6 +21,7 @@ from pyutilib.misc.indent_io import StreamIndenter
 import pyomo.common
 from pyomo.common.deprecation import deprecated, relocated_module_attribute
 from pyomo.core.pyomoobject import PyomoObject
+from pyomo.core.expr.numvalue import native_types
 from pyomo.core.base.misc import tabular_writer, sorted_robust
 
 logger = logging.getLogger('pyomo.core')
@@ -29,6 +30,18 @@ relocated_module_attribute(
     'ComponentUID', 'pyomo.core.base.componentuid.ComponentUID',
     version='5.7.2')
 
+class _ModelStructure(object):
+    """Global counter of structural changes to Pyomo models
+
+    The version is incremented whenever components or component data
+    are added to or removed from a block, and whenever a component is
+    activated or deactivated.  Caches derived from the block structure
+    (see :py:meth:`_BlockData.enable_ctype_index`) record the version
+    when they are built and are discarded as soon as it changes.
+    """
+    version = 0
+
+
 def _name_index_generator(idx):
     """
     Return a string representation of an index.
@@ -190,7 +203,14 @@ class _ComponentBase(PyomoObject):
         try:
             if paranoid:
                 saved_memo = dict(memo)
-            new_state = deepcopy(state, memo)
+            if '__share_expressions__' in memo:
+                # Most of the state of component data is atomic: only
+                # deepcopy the values that need it
+                new_state = {
+                    k: v if v.__class__ in native_types else deepcopy(v, memo)
+                    for k, v in iteritems(state)}
+            else:
+                new_state = deepcopy(state, memo)
         except:
             if paranoid:
                 # Note: memo is intentionally pass-by-reference.  We
@@ -666,10 +686,12 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active=True
+        _ModelStructure.version += 1
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active=False
+        _ModelStructure.version += 1
 
 
 class ComponentData(_ComponentBase):
@@ -1007,8 +1029,10 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        _ModelStructure.version += 1
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        _ModelStructure.version += 1
 
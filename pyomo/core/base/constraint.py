@@ -20,13 +20,16 @@ from weakref import ref as weakref_ref
 import pyutilib.math
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.expr import logical_expr
+from pyomo.core.expr.template_expr import template_rule_values
 from pyomo.core.expr.numvalue import (ZeroConstant,
                                       value,
                                       as_numeric,
                                       is_constant,
                                       native_numeric_types)
 from pyomo.core.base.plugin import ModelComponentFactory
-from pyomo.core.base.component import ActiveComponentData
+from pyomo.core.base.component import (
+    ActiveComponentData, _ModelStructure,
+)
 from pyomo.core.base.indexed_component import \
     ( ActiveIndexedComponent,
       UnindexedComponent_set,
@@ -723,6 +726,12 @@ class Constraint(ActiveIndexedComponent):
             A Pyomo expression for this constraint
         rule
             A function that is used to construct constraint expressions
+        templatize
+            If True, an indexed rule is called once with template
+            indices and the resulting template expression is used to
+            generate the constraint expressions for all indices.  Rules
+            that cannot be templatized (e.g., because they branch on
+            the index value) are called once per index.
         doc
             A text string describing this component
         name
@@ -782,6 +791,7 @@ class Constraint(ActiveIndexedComponent):
         else:
             raise ValueError("Duplicate initialization: Constraint() only "
                              "accepts one of 'rule=' and 'expr='")
+        self._templatize = kwargs.pop('templatize', False)
 
         kwargs.setdefault('ctype', Constraint)
         ActiveIndexedComponent.__init__(self, *args, **kwargs)
@@ -828,6 +838,12 @@ class Constraint(ActiveIndexedComponent):
                 # assumption is that the user will trigger specific
                 # indices to be created at a later time).
                 pass
+            elif self._templatize and self.is_indexed() \
+                 and type(self.rule) is IndexedCallInitializer:
+                # Generate all members from a single template expression
+                for index, expr in template_rule_values(
+                        block, self.rule, self.index_set()):
+                    self._setitem_when_not_present(index, expr)
             else:
                 # Bypass the index validation and create the member directly
                 for index in self.index_set():
@@ -1001,6 +1017,7 @@ class SimpleConstraint(_GeneralConstraintData, Constraint):
         """Set the expression on this constraint."""
         if not self._data:
             self._data[None] = self
+            _ModelStructure.version += 1
         return super(SimpleConstraint, self).set_value(expr)
 
     #
@@ -26,6 +26,7 @@ from pyomo.core.base.misc import (apply_indexed_rule,
 from pyomo.core.base.numvalue import (NumericValue,
                                       as_numeric)
 from pyomo.core.base.util import is_functor
+from pyomo.core.expr.template_expr import template_rule_values
 
 from six import iteritems
 
@@ -256,6 +257,12 @@ class Expression(IndexedComponent):
                         used to initialize this object.
         expr        A synonym for initialize.
         rule        A rule function used to initialize this object.
+        templatize  If True, an indexed rule is called once with
+                        template indices and the resulting template
+                        expression is used to generate the expressions
+                        for all indices (falling back on calling the
+                        rule for each index if the rule cannot be
+                        templatized).
     """
 
     _ComponentDataClass = _GeneralExpressionData
@@ -274,6 +281,7 @@ class Expression(IndexedComponent):
         self._init_rule = kwds.pop('rule', None)
         self._init_expr = kwds.pop('initialize', None)
         self._init_expr = kwds.pop('expr', self._init_expr)
+        self._templatize = kwds.pop('templatize', False)
         if is_functor(self._init_expr) and \
            (not isinstance(self._init_expr, NumericValue)):
             raise TypeError(
@@ -385,7 +393,14 @@ class Expression(IndexedComponent):
         #
         if _init_rule is not None:
             # construct and initialize with a rule
-            if self.is_indexed():
+            if self.is_indexed() and self._templatize:
+                # Generate all members from a single template expression
+                _rule = lambda block, key: apply_indexed_rule(
+                    self, _init_rule, block, key)
+                for key, expr in template_rule_values(
+                        self._parent(), _rule, self._index):
+                    self.add(key, expr)
+            elif self.is_indexed():
                 for key in self._index:
                     self.add(key,
                              apply_indexed_rule(
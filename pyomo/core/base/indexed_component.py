@@ -15,7 +15,9 @@ import logging
 from pyomo.core.expr.expr_errors import TemplateExpressionError
 from pyomo.core.expr.numvalue import native_types
 from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
-from pyomo.core.base.component import Component, ActiveComponent
+from pyomo.core.base.component import (
+    Component, ActiveComponent, _ModelStructure,
+)
 from pyomo.core.base.config import PyomoOptions
 from pyomo.core.base.global_set import UnindexedComponent_set
 from pyomo.common import DeveloperError
@@ -237,6 +239,7 @@ class IndexedComponent(Component):
 
     def to_dense_data(self):
         """TODO"""
+        _ModelStructure.version += 1
         for idx in self._index:
             if idx not in self._data:
                 self._getitem_when_not_present(idx)
@@ -245,6 +248,7 @@ class IndexedComponent(Component):
         """Clear the data in this component"""
         if self.is_indexed():
             self._data = {}
+            _ModelStructure.version += 1
         else:
             raise DeveloperError(
                 "Derived scalar component %s failed to define clear()."
@@ -350,10 +354,14 @@ You can silence this warning by one of three ways:
 
     def values(self):
         """Return a list of the component data objects in the dictionary"""
+        if self.is_reference():
+            return list(itervalues(self._data))
         return [ self[x] for x in self ]
 
     def items(self):
         """Return a list (index,data) tuples from the dictionary"""
+        if self.is_reference():
+            return list(iteritems(self._data))
         return [ (x, self[x]) for x in self ]
 
     def iterkeys(self):
@@ -362,11 +370,22 @@ You can silence this warning by one of three ways:
 
     def itervalues(self):
         """Return an iterator of the component data objects in the dictionary"""
+        if self.is_reference():
+            # Reference components iterate over the referenced data
+            # directly (looking up each key in the _ReferenceDict can
+            # be much slower than walking the underlying slice)
+            for val in itervalues(self._data):
+                yield val
+            return
         for key in self:
             yield self[key]
 
     def iteritems(self):
         """Return an iterator of (index,data) tuples from the dictionary"""
+        if self.is_reference():
+            for key, val in iteritems(self._data):
+                yield key, val
+            return
         for key in self:
             yield key, self[key]
 
@@ -422,7 +441,11 @@ You can silence this warning by one of three ways:
             # the default value
             #
             if obj is _NotFound:
-                return self._getitem_when_not_present(index)
+                obj = self._getitem_when_not_present(index)
+                # Components like Var and Block create their data
+                # implicitly; Params with defaults do not
+                if index in self._data:
+                    _ModelStructure.version += 1
 
         return obj
 
@@ -478,6 +501,7 @@ You can silence this warning by one of three ways:
         else:
             obj = self._data.get(index, _NotFound)
             if obj is _NotFound:
+                _ModelStructure.version += 1
                 return self._setitem_when_not_present(index, val)
             else:
                 return self._setitem_impl(index, obj, val)
@@ -510,6 +534,7 @@ You can silence this warning by one of three ways:
                 # Remove reference to this object
                 self._data[index]._component = None
             del self._data[index]
+            _ModelStructure.version += 1
 
     def _not_constructed_error(self, idx):
         # Generate an error because the component is not constructed
@@ -8,6 +8,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 import copy
+from pyutilib.misc import flatten_tuple
 from six import iteritems, iterkeys, advance_iterator
 from pyomo.common import DeveloperError
 
@@ -303,6 +304,204 @@ def _freeze(info):
         return info
 
 
+# A dummy class that we can use as a named entity below
+class _NotFound(object): pass
+
+class _DictLookupClasses(dict):
+    """Cache of the classes that use the IndexedComponent __contains__
+    and __getitem__ (i.e., whose members can be retrieved directly from
+    the _data dict)"""
+    def __missing__(self, cls):
+        # We have to defer this import to here to resolve circular
+        # imports
+        from .indexed_component import IndexedComponent
+        ans = True
+        for name in ('__contains__', '__getitem__'):
+            for base in cls.__mro__:
+                if name in base.__dict__:
+                    ans &= base is IndexedComponent
+                    break
+            else:
+                ans = False
+        self[cls] = ans
+        return ans
+
+_dict_lookup_classes = _DictLookupClasses()
+
+
+class _SlicePlan(object):
+    """A "compiled" form of an IndexedComponent_slice for keyed lookups
+
+    Looking up a single member of a slice (e.g., in a
+    :py:class:`_ReferenceDict <pyomo.core.base.reference._ReferenceDict>`)
+    through :py:class:`_IndexedComponent_slice_iter` rebuilds the
+    iterator stack (and a :py:class:`_slice_generator` for every sliced
+    level) for every key.  The plan resolves the slice call stack once
+    into a list of levels.  Each level is an (operation, argument,
+    wildcards) tuple.  For sliced levels, the operation is
+    ``slice_info``, the argument is a template of the (flattened) index
+    with the fixed values filled in, and wildcards is the list of the
+    template positions that are filled in from the key.  Lookups can
+    then walk directly down the component hierarchy.
+
+    The plan is compiled on the first lookup (the slice should not be
+    modified after that).  Only slices without ellipses (except for a
+    bare ``component[...]``) whose call stack holds get_attribute /
+    get_item / call operations can be compiled.  :py:meth:`lookup`
+    returns :py:class:`_NotFound` if the slice could not be compiled or
+    the key could not be resolved; callers should then fall back on the
+    (general) slice iterator, which also generates the appropriate
+    exceptions.
+    """
+    __slots__ = ('slice', 'root', 'levels', 'wildcard_count')
+
+    def __init__(self, component_slice):
+        self.slice = component_slice
+        self.root = None
+        # None if the plan has not been compiled, and () if the slice
+        # could not be compiled
+        self.levels = None
+        self.wildcard_count = 0
+
+    def compile(self):
+        call_stack = self.slice._call_stack
+        self.root = call_stack[0][1][0]
+        self.levels = ()
+        self.wildcard_count = 0
+        levels = []
+        for i in range(self.slice._len):
+            _call = call_stack[i]
+            if _call[0] == IndexedComponent_slice.slice_info:
+                if i:
+                    return self.levels
+                level = self._compile_slice_info(*_call[1])
+            elif _call[0] == IndexedComponent_slice.get_item:
+                level = self._compile_get_item(_call[1])
+            elif _call[0] == IndexedComponent_slice.get_attribute:
+                level = (_call[0], _call[1], None)
+            elif _call[0] == IndexedComponent_slice.call:
+                level = (_call[0], _call[1:], None)
+            else:
+                return self.levels
+            if level is None:
+                return self.levels
+            if level[2] is not None:
+                self.wildcard_count += len(level[2])
+            levels.append(level)
+        self.levels = tuple(levels)
+        return self.levels
+
+    def _compile_slice_info(self, component, fixed, sliced, ellipsis):
+        if ellipsis is not None:
+            # We can only resolve an ellipsis that covers the entire
+            # index of a component with a known dimension
+            if fixed or sliced:
+                return None
+            if component.is_indexed():
+                n = component.index_set().dimen
+                if n.__class__ is not int:
+                    # Jagged (dimen=None) or unknown dimensions
+                    return None
+            else:
+                n = 1
+            template = [None]*n
+        else:
+            n = len(fixed) + len(sliced)
+            if set(fixed).union(sliced) != set(range(n)):
+                return None
+            template = [None]*n
+            for i, val in iteritems(fixed):
+                template[i] = val
+        return self._sliced_level(template, fixed, ellipsis)
+
+    def _compile_get_item(self, index):
+        idx = index if index.__class__ is tuple else (index,)
+        if not any(x.__class__ is slice for x in idx):
+            # This level is explicitly indexed
+            return (IndexedComponent_slice.get_item, index, None)
+        # Only compile "simple" templates, where each position is either
+        # a plain slice or a hashable, non-tuple value that
+        # _processUnhashableIndex would not transform
+        fixed = {}
+        for i, val in enumerate(idx):
+            if val.__class__ is slice:
+                if val.start is not None or val.stop is not None \
+                   or val.step is not None:
+                    return None
+            elif val is Ellipsis or val.__class__ is tuple \
+                 or hasattr(val, 'is_expression_type'):
+                return None
+            else:
+                try:
+                    hash(val)
+                except TypeError:
+                    return None
+                fixed[i] = val
+        return self._sliced_level(list(idx), fixed, None)
+
+    def _sliced_level(self, template, fixed, ellipsis):
+        if not template:
+            return None
+        wildcards = [i for i in range(len(template))
+                     if ellipsis is not None or i not in fixed]
+        if wildcards == [0] and len(template) == 1:
+            # Special case: a single wildcard (no template needed)
+            return (IndexedComponent_slice.slice_info, None, wildcards)
+        return (IndexedComponent_slice.slice_info, tuple(template), wildcards)
+
+    def lookup(self, key):
+        """Return the slice member for an index of wildcard values
+
+        Returns :py:class:`_NotFound` if the member could not be
+        resolved.  Sliced levels only return existing component data.
+        """
+        levels = self.levels
+        if levels is None:
+            levels = self.compile()
+        if not levels:
+            return _NotFound
+        if key.__class__ is tuple:
+            key = flatten_tuple(key)
+        else:
+            key = (key,)
+        if len(key) != self.wildcard_count:
+            return _NotFound
+        _comp = self.root
+        pos = 0
+        try:
+            for op, arg, wildcards in levels:
+                if op == IndexedComponent_slice.slice_info:
+                    if arg is None:
+                        idx = key[pos]
+                        pos += 1
+                    else:
+                        idx = list(arg)
+                        for i in wildcards:
+                            idx[i] = key[pos]
+                            pos += 1
+                        idx = idx[0] if len(idx) == 1 else tuple(idx)
+                    if _dict_lookup_classes[_comp.__class__] \
+                       and _comp._data.__class__ is dict:
+                        _comp = _comp._data.get(idx, _NotFound)
+                        if _comp is _NotFound:
+                            return _NotFound
+                    elif idx in _comp:
+                        _comp = _comp[idx]
+                    else:
+                        return _NotFound
+                elif op == IndexedComponent_slice.get_attribute:
+                    _comp = getattr(_comp, arg)
+                elif op == IndexedComponent_slice.get_item:
+                    _comp = _comp[arg]
+                    if _comp.__class__ is IndexedComponent_slice:
+                        return _NotFound
+                else:
+                    _comp = _comp(*arg[0], **arg[1])
+        except Exception:
+            # Defer to the slice iterator to generate the exception
+            return _NotFound
+        return _comp
+
 
 class _slice_generator(object):
     """Utility (iterator) for generating the elements of one slice
@@ -311,17 +510,31 @@ class _slice_generator(object):
     values that match the slice template.
     """
     def __init__(self, component, fixed, sliced, ellipsis, iter_over_index):
+        # We have to defer this import to here to resolve circular
+        # imports.  Ideally, we would move normalize_index to another
+        # module to resolve this.
+        from .indexed_component import normalize_index
+
         self.component = component
         self.fixed = fixed
         self.sliced = sliced
         self.ellipsis = ellipsis
         self.iter_over_index = iter_over_index
 
+        self.flatten = normalize_index.flatten
         self.tuplize_unflattened_index = (
             self.component._implicit_subsets is None
             or len(self.component._implicit_subsets) == 1 )
 
         self.explicit_index_count = len(fixed) + len(sliced)
+        self.fixed_items = tuple(iteritems(fixed))
+        # The positions of the wildcards in the (flattened) index.  With
+        # an ellipsis, the positions depend on the length of the index.
+        if ellipsis is None:
+            self.wildcards = tuple(
+                i for i in range(self.explicit_index_count) if i not in fixed)
+        else:
+            self.wildcards = None
         if iter_over_index:
             # This should be used to iterate over all the potential
             # indices of a sparse IndexedComponent.
@@ -329,6 +542,13 @@ class _slice_generator(object):
         else:
             # The default behavior is to iterate over the component.
             self.component_iter = component.__iter__()
+        # If the component uses the IndexedComponent __getitem__, we can
+        # retrieve the component data directly from the _data dict
+        if not iter_over_index and _dict_lookup_classes[component.__class__] \
+           and component._data.__class__ is dict:
+            self.component_data = component._data
+        else:
+            self.component_data = None
 
         # Cache for the most recent index returned. This is used to
         # iterate over keys of the slice (for instance, in a
@@ -340,11 +560,6 @@ class _slice_generator(object):
         return self.__next__()
 
     def __next__(self):
-        # We have to defer this import to here to resolve circular
-        # imports.  Ideally, we would move normalize_index to another
-        # module to resolve this.
-        from .indexed_component import normalize_index
-
         while 1:
             # Note: running off the end of the underlying iterator will
             # generate a StopIteration exception that will propagate up
@@ -352,7 +567,7 @@ class _slice_generator(object):
             index = advance_iterator(self.component_iter)
 
             # We want a tuple of indices, so convert scalars to tuples
-            if normalize_index.flatten:
+            if self.flatten:
                 _idx = index if type(index) is tuple else (index,)
             elif self.tuplize_unflattened_index:
                 _idx = (index,)
@@ -370,7 +585,7 @@ class _slice_generator(object):
                 continue
 
             valid = True
-            for key, val in iteritems(self.fixed):
+            for key, val in self.fixed_items:
                 # If this index of the component does not match all
                 # the specified fixed indices, don't return anything.
                 if not val == _idx[key]:
@@ -389,6 +604,10 @@ class _slice_generator(object):
                 # Note: it is important to use __getitem__, as the
                 # derived class may implement a non-standard storage
                 # mechanism (e.g., Param)
+                if self.component_data is not None:
+                    obj = self.component_data.get(index, _NotFound)
+                    if obj is not _NotFound:
+                        return obj
                 if (not self.iter_over_index) or index in self.component:
                     # If iter_over_index is False, we are iterating over
                     # the component ("filled-in" indices only).  Since
@@ -425,6 +644,12 @@ class _IndexedComponent_slice_iter(object):
         # attribute, method, or is explicitly indexed).
         self._slice = component_slice
         self.advance_iter = advance_iter
+        # The default advance_iter is a wrapper around next() with a
+        # trivial check_complete(): call next() directly
+        if advance_iter is _advance_iter:
+            self._advance = advance_iterator
+        else:
+            self._advance = advance_iter
         self._iter_over_index = iter_over_index
         call_stack = self._slice._call_stack
         call_stack_len = self._slice._len
@@ -498,7 +723,7 @@ class _IndexedComponent_slice_iter(object):
                     # of the call stack
                 else:
                     # Advance the "deepest active iterator"
-                    _comp = self.advance_iter(self._iter_stack[idx])
+                    _comp = self._advance(self._iter_stack[idx])
                     # Note that if we are looking for a specific
                     # wildcard index, that data is stored in
                     # advance_iter() and will be automatically inserted.
@@ -587,7 +812,7 @@ class _IndexedComponent_slice_iter(object):
                             # by this slice (so that we have a concrete
                             # context that we can use to decend further
                             # down the model hierarchy):
-                            _comp = self.advance_iter(self._iter_stack[idx])
+                            _comp = self._advance(self._iter_stack[idx])
                             # Note that the iterator will remained
                             # cached for subsequent calls to __next__()
                             # (when it will eventually be exhausted).
@@ -771,7 +996,8 @@ class _IndexedComponent_slice_iter(object):
             if idx == self._slice._len:
                 # Check to make sure the custom iterator
                 # (i.e._fill_in_known_wildcards) is complete
-                self.advance_iter.check_complete()
+                if self._advance is not advance_iterator:
+                    self.advance_iter.check_complete()
                 # We have a concrete object at the end of the chain. Return it
                 return _comp
 
@@ -797,13 +1023,19 @@ class _IndexedComponent_slice_iter(object):
         # component data returned by the corresponding _slice_generator.
         # Extract the indices corresponding to the wildcard positions
         # for that slice.
-        ans = sum(
-            ( tuple( x.last_index[i]
-                     for i in range(len(x.last_index))
-                     if i not in x.fixed )
-              for x in self._iter_stack if x is not None ),
-            ()
-        )
+        ans = ()
+        for x in self._iter_stack:
+            if x is None:
+                continue
+            last_index = x.last_index
+            if x.wildcards is None:
+                ans += tuple( last_index[i]
+                              for i in range(len(last_index))
+                              if i not in x.fixed )
+            elif len(x.wildcards) == 1:
+                ans += (last_index[x.wildcards[0]],)
+            else:
+                ans += tuple( last_index[i] for i in x.wildcards )
         if len(ans) == 1:
             return ans[0]
         else:
@@ -24,7 +24,9 @@ import inspect
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.expr.numvalue import value
 from pyomo.core.base.plugin import ModelComponentFactory
-from pyomo.core.base.component import ActiveComponentData
+from pyomo.core.base.component import (
+    ActiveComponentData, _ModelStructure,
+)
 from pyomo.core.base.indexed_component import (ActiveIndexedComponent,
                                                UnindexedComponent_set,
                                                _get_indexed_component_data_name)
@@ -557,6 +559,7 @@ class SimpleObjective(_GeneralObjectiveData, Objective):
 
         if len(self._data) == 0:
             self._data[None] = self
+            _ModelStructure.version += 1
         if self._check_skip_add(None, expr) is None:
             del self[None]
             return None
@@ -567,6 +570,7 @@ class SimpleObjective(_GeneralObjectiveData, Objective):
         if self._constructed:
             if len(self._data) == 0:
                 self._data[None] = self
+                _ModelStructure.version += 1
             return _GeneralObjectiveData.set_sense(self, sense)
         raise ValueError(
             "Setting the sense of objective '%s' "
@@ -15,6 +15,8 @@ import types
 import logging
 from weakref import ref as weakref_ref
 
+from pyomo.common.collections import MutableMapping
+from pyomo.common.dependencies import numpy, numpy_available
 from pyomo.common.deprecation import deprecation_warning
 from pyomo.common.modeling import NoArgumentGiven
 from pyomo.common.timing import ConstructionTimer
@@ -23,7 +25,8 @@ from pyomo.core.base.component import ComponentData
 from pyomo.core.base.indexed_component import IndexedComponent, \
     UnindexedComponent_set
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
-from pyomo.core.base.numvalue import NumericValue, native_types, value
+from pyomo.core.base.numvalue import (
+    NumericValue, native_types, native_numeric_types, value)
 from pyomo.core.base.set_types import Any, Reals
 
 from six import iteritems, iterkeys, next, itervalues
@@ -201,6 +204,141 @@ class _ParamData(ComponentData, NumericValue):
     __bool__ = __nonzero__
 
 
+class _ArrayParamData(_ParamData):
+    """
+    This class defines the data for a mutable parameter in an
+    IndexedParam declared with storage='array'.  The value is stored in
+    the array owned by the IndexedParam (see :class:`_ArrayParamDict`),
+    so this object only holds its offset into that array.
+    """
+
+    __slots__ = ('_offset',)
+
+    def __init__(self, component, offset):
+        self._component = weakref_ref(component)
+        self._offset = offset
+
+    def __getstate__(self):
+        # The value is stored in (and pickled with) the owning
+        # component, so we bypass _ParamData.__getstate__()
+        state = super(_ParamData, self).__getstate__()
+        state['_offset'] = self._offset
+        return state
+
+    # Note: this property overrides the _value slot declared by
+    # _ParamData, so that the _ParamData methods operate on the array.
+    @property
+    def _value(self):
+        val = self._component()._data._values[self._offset]
+        if val != val:
+            return _NotValid
+        return float(val)
+    @_value.setter
+    def _value(self, val):
+        self._component()._data._set_value(self._offset, val)
+
+
+class _ArrayParamDict(MutableMapping):
+    """The _data dictionary of an IndexedParam declared with storage='array'.
+
+    The values are stored in a NumPy float array in the order of the
+    (finite, ordered) index set, so that the offset of an index is its
+    position in the index set.  A second array records which indices
+    are defined.  Mutable Params store a _ArrayParamData for each
+    offset, which is only created when that index is first accessed.
+    """
+
+    def __init__(self, component):
+        self._component = component
+        self._index = component._index
+        n = len(self._index)
+        self._values = numpy.full(n, numpy.nan)
+        self._defined = numpy.zeros(n, dtype=bool)
+        self._len = 0
+        self._param_data = {}
+
+    def offset(self, index):
+        """Return the offset of an index (raises KeyError if not found)"""
+        # Unhashable indices (e.g., slices) must raise TypeError (as
+        # they would for a dict)
+        hash(index)
+        try:
+            return self._index.offset(index)
+        except (IndexError, TypeError, ValueError):
+            raise KeyError(index)
+
+    def _set_value(self, offset, val):
+        if val is _NotValid or val is None:
+            val = numpy.nan
+        elif val.__class__ not in native_numeric_types:
+            raise ValueError(
+                "Invalid parameter value: %s[%s] = '%s', value type=%s.\n"
+                "\tParams declared with storage='array' can only hold "
+                "numeric values" % (self._component.name,
+                                    self._index[offset+1], val, type(val)))
+        self._values[offset] = val
+
+    def store(self, values):
+        """Set all of the values from an array
+
+        NaN entries leave the corresponding index undefined, so that
+        looking it up returns the Param default (or raises ValueError).
+        """
+        self._values[:] = values
+        numpy.logical_not(numpy.isnan(self._values), out=self._defined)
+        self._len = int(self._defined.sum())
+
+    def __getitem__(self, index):
+        offset = self.offset(index)
+        if not self._defined[offset]:
+            raise KeyError(index)
+        if self._component._mutable:
+            obj = self._param_data.get(offset, None)
+            if obj is None:
+                obj = self._param_data[offset] = _ArrayParamData(
+                    self._component, offset)
+            return obj
+        val = self._values[offset]
+        if val != val:
+            return _NotValid
+        return float(val)
+
+    def __setitem__(self, index, val):
+        offset = self.offset(index)
+        if not self._defined[offset]:
+            self._defined[offset] = True
+            self._len += 1
+        if self._component._mutable:
+            # val is the _ArrayParamData for this offset
+            self._param_data[offset] = val
+        else:
+            self._set_value(offset, val)
+
+    def __delitem__(self, index):
+        offset = self.offset(index)
+        if not self._defined[offset]:
+            raise KeyError(index)
+        self._defined[offset] = False
+        self._len -= 1
+        self._values[offset] = numpy.nan
+        self._param_data.pop(offset, None)
+
+    def __contains__(self, index):
+        try:
+            return bool(self._defined[self.offset(index)])
+        except (KeyError, TypeError):
+            return False
+
+    def __iter__(self):
+        if self._len == len(self._defined):
+            return iter(self._index)
+        return (idx for idx, defined in zip(self._index, self._defined)
+                if defined)
+
+    def __len__(self):
+        return self._len
+
+
 @ModelComponentFactory.register("Parameter data that is used to define a model instance.")
 class Param(IndexedComponent):
     """
@@ -230,6 +368,14 @@ class Param(IndexedComponent):
         mutable: `boolean`
             Flag indicating if the value of the parameter may change between
             calls to a solver. Defaults to `False`
+        storage: `str`
+            How the values of an indexed parameter are stored.  With
+            'dict' (the default), the values are stored in a
+            dictionary.  With 'array', the values are stored (as floats)
+            in a NumPy array in the order of the index set, which must
+            be finite and ordered (e.g., a product of ordered sets).
+            The array can be set with :py:meth:`store_values` and
+            retrieved without copying with :py:meth:`get_value_array`.
     """
 
     DefaultMutable = False
@@ -254,6 +400,15 @@ class Param(IndexedComponent):
         self._units         = kwd.pop('units', None)
         if self._units is not None:
             self._mutable = True
+        storage             = kwd.pop('storage', 'dict')
+        if storage not in ('dict', 'array'):
+            raise ValueError(
+                "Param 'storage' keyword must be 'dict' or 'array' (got '%s')"
+                % (storage,))
+        if storage == 'array' and not numpy_available:
+            raise ValueError(
+                "Param storage='array' requires NumPy, which is not available")
+        self._array_storage = storage == 'array'
         #
         if 'repn' in kwd:
             logger.error(
@@ -297,6 +452,45 @@ class Param(IndexedComponent):
     def mutable(self):
         return self._mutable
 
+    def is_reference(self):
+        if self._data.__class__ is _ArrayParamDict:
+            return False
+        return super(Param, self).is_reference()
+
+    def _create_data(self, index):
+        # Create the _ParamData for a (new) index of a mutable Param
+        if self._data.__class__ is _ArrayParamDict:
+            # Reuse the data object of an index that was undefined by
+            # storing NaN, as expressions may still reference it
+            offset = self._data.offset(index)
+            obj = self._data._param_data.get(offset, None)
+            if obj is None:
+                obj = _ArrayParamData(self, offset)
+            return obj
+        return _ParamData(self)
+
+    def get_value_array(self):
+        """
+        Return the NumPy array that stores the values of a Param
+        declared with storage='array'.
+
+        The array is not copied: it holds the values in the order of
+        the index set (so for a product of sets it can be reshaped to
+        the sizes of the sets), with NaN for undefined values.  The
+        array is read-only unless the Param is mutable, in which case
+        assignments to the array change the parameter values (without
+        validation).
+        """
+        if self._data.__class__ is not _ArrayParamDict:
+            raise ValueError(
+                "Param %s was not declared with storage='array'"
+                % (self.name,))
+        if self._mutable:
+            return self._data._values
+        ans = self._data._values.view()
+        ans.flags.writeable = False
+        return ans
+
     #
     # These are "sparse equivalent" access / iteration methods that
     # only loop over the defined data.
@@ -398,6 +592,11 @@ class Param(IndexedComponent):
         if not self._mutable:
             _raise_modifying_immutable_error(self, '*')
         #
+        if self._data.__class__ is _ArrayParamDict \
+           and type(new_values) is numpy.ndarray:
+            self._store_array(new_values, check)
+            return
+        #
         _srcType = type(new_values)
         _isDict = _srcType is dict or ( \
             hasattr(_srcType, '__getitem__')
@@ -423,12 +622,14 @@ class Param(IndexedComponent):
                 # instead of incurring the penalty of checking.
                 for index, new_value in iteritems(new_values):
                     if index not in self._data:
-                        self._data[index] = _ParamData(self)
+                        self._data[index] = self._create_data(index)
                     self._data[index]._value = new_value
             else:
                 # For scalars, we will choose an approach based on
                 # how "dense" the Param is
-                if not self._data: # empty
+                if self._data.__class__ is _ArrayParamDict:
+                    self._data.store(new_values)
+                elif not self._data: # empty
                     for index in self._index:
                         p = self._data[index] = _ParamData(self)
                         p._value = new_values
@@ -438,7 +639,7 @@ class Param(IndexedComponent):
                 else:
                     for index in self._index:
                         if index not in self._data:
-                            self._data[index] = _ParamData(self)
+                            self._data[index] = self._create_data(index)
                         self._data[index]._value = new_values
         else:
             #
@@ -454,6 +655,39 @@ class Param(IndexedComponent):
             # scalars have to be handled differently
             self[None] = new_values
 
+    def _store_array(self, new_values, check=True):
+        """Set all the values of a storage='array' Param from an array"""
+        if new_values.size != len(self._index):
+            raise ValueError(
+                "Cannot store an array of %d values in Param %s "
+                "(the index set has %d members)"
+                % (new_values.size, self.name, len(self._index)))
+        new_values = new_values.reshape(-1)
+        if check:
+            # NaN entries leave their index undefined, so they are not
+            # checked
+            try:
+                defined = ~numpy.isnan(new_values)
+            except TypeError:
+                defined = numpy.ones(new_values.size, dtype=bool)
+            if not isinstance(self.domain, Any.__class__):
+                # Checking the distinct values is much cheaper than
+                # checking every value for integer or binary domains
+                for val in numpy.unique(new_values[defined]).tolist():
+                    if val not in self.domain:
+                        i = int(numpy.flatnonzero(new_values == val)[0])
+                        self._validate_value(self._index[i+1], val)
+            if self._validate:
+                vals = new_values.tolist()
+                for i in numpy.flatnonzero(defined).tolist():
+                    self._validate_value(self._index[i+1], vals[i], False)
+        try:
+            self._data.store(new_values)
+        except (TypeError, ValueError):
+            raise ValueError(
+                "Cannot store the values of Param %s: storage='array' "
+                "Params can only hold numeric values" % (self.name,))
+
     def set_default(self, val):
         """
         Perform error checks and then set the default value for this parameter.
@@ -499,7 +733,7 @@ class Param(IndexedComponent):
             # reasonable values produces an informative error.
             if self._mutable:
                 # Note: _ParamData defaults to _NotValid
-                ans = self._data[index] = _ParamData(self)
+                ans = self._data[index] = self._create_data(index)
                 return ans
             if self.is_indexed():
                 idx_str = '%s[%s]' % (self.name, index,)
@@ -623,7 +857,7 @@ class Param(IndexedComponent):
                 self.set_value(value, index)
                 return self
             elif self._mutable:
-                obj = self._data[index] = _ParamData(self)
+                obj = self._data[index] = self._create_data(index)
                 obj.set_value(value, index)
                 return obj
             else:
@@ -765,6 +999,14 @@ class Param(IndexedComponent):
                     #
                     return
 
+        elif self._data.__class__ is _ArrayParamDict \
+                and _init_type is numpy.ndarray:
+            #
+            # Bulk initialization of a storage='array' Param
+            #
+            self._store_array(_init)
+            return
+
         elif isinstance(_init, NumericValue):
             #
             # Reduce NumericValues to scalars.  This allows us to treat
@@ -840,7 +1082,11 @@ This has resulted in the conversion of the source to dense form.
                 # idx (above) will be None, and the for-loop below
                 # will NOT be called.
                 #
-                if self._mutable:
+                if self._data.__class__ is _ArrayParamDict \
+                   and not self._validate:
+                    # The value has been validated for the first index
+                    self._data.store(self._data._values[0])
+                elif self._mutable:
                     _init = self[idx]._value
                     for idx in _iter:
                         self._setitem_when_not_present(idx, _init)
@@ -892,6 +1138,12 @@ This has resulted in the conversion of the source to dense form.
         # Flag that we are in the "during construction" phase
         #
         self._constructed = None
+        if self._array_storage and self.is_indexed():
+            if not (self._index.isfinite() and self._index.isordered()):
+                raise ValueError(
+                    "Param %s declared with storage='array' must be "
+                    "indexed by a finite, ordered set" % (self.name,))
+            self._data = _ArrayParamDict(self)
         #
         # Step #1: initialize data from rule value
         #
@@ -20,7 +20,8 @@ from pyomo.core.base.indexed_component import (
     IndexedComponent, UnindexedComponent_set
 )
 from pyomo.core.base.indexed_component_slice import (
-    IndexedComponent_slice, _IndexedComponent_slice_iter
+    IndexedComponent_slice, _IndexedComponent_slice_iter, _SlicePlan,
+    _NotFound,
 )
 
 import six
@@ -179,8 +180,18 @@ class _ReferenceDict(MutableMapping):
     """
     def __init__(self, component_slice):
         self._slice = component_slice
+        self._plan = _SlicePlan(component_slice)
+
+    def __getstate__(self):
+        # The plan is rebuilt on demand (and should not be copied)
+        return {'_slice': self._slice}
+
+    def __setstate__(self, state):
+        self.__init__(state['_slice'])
 
     def __contains__(self, key):
+        if self._plan.lookup(key) is not _NotFound:
+            return True
         try:
             advance_iterator(self._get_iter(self._slice, key))
             # This calls IC_slice_iter.__next__, which calls
@@ -204,6 +215,9 @@ class _ReferenceDict(MutableMapping):
             return False
 
     def __getitem__(self, key):
+        ans = self._plan.lookup(key)
+        if ans is not _NotFound:
+            return ans
         try:
             # This calls IC_slice_iter.__next__, which calls
             # _fill_in_known_wildcards.
@@ -222,6 +236,17 @@ class _ReferenceDict(MutableMapping):
         except (StopIteration, LookupError):
             raise KeyError("KeyError: %s" % (key,))
 
+    def get(self, key, default=None):
+        # Overridden so that the (common) lookup of existing members
+        # does not go through the MutableMapping.get() wrapper
+        ans = self._plan.lookup(key)
+        if ans is not _NotFound:
+            return ans
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
     def __setitem__(self, key, val):
         tmp = self._slice.duplicate()
         op = tmp._call_stack[-1][0]
@@ -641,6 +666,9 @@ def Reference(reference, ctype=_NotSpecified):
         # subsets).
         ctypes = set((1,2))
 
+    # The slice generators in the _iter_stack for the previous object
+    # (the wildcard sets only change when the generators change)
+    _prev_stack = None
     for obj in _iter:
         ctypes.add(obj.ctype)
         if not isinstance(obj, ComponentData):
@@ -660,7 +688,11 @@ def Reference(reference, ctype=_NotSpecified):
             # wildcard sets, then we will use _identify_wildcard_sets to
             # identify the wilcards for this obj and check compatibility
             # of the wildcards with any previously-identified wildcards.
-            slice_idx = _identify_wildcard_sets(_iter._iter_stack, slice_idx)
+            if _prev_stack is None or any(
+                    a is not b for a, b in zip(_iter._iter_stack, _prev_stack)):
+                slice_idx = _identify_wildcard_sets(
+                    _iter._iter_stack, slice_idx)
+                _prev_stack = list(_iter._iter_stack)
         elif len(ctypes) > 1:
             break
 
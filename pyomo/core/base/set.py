@@ -1396,6 +1396,15 @@ class _OrderedSetMixin(object):
         raise DeveloperError("Derived ordered set class (%s) failed to "
                              "implement ord" % (type(self).__name__,))
 
+    def offset(self, val):
+        """
+        Return the (0-based) offset of the input value.
+
+        This is ord(val)-1: the offset of val in arrays that store data
+        in the order of this Set.
+        """
+        return self.ord(val) - 1
+
     def isordered(self):
         """Returns True if this is an ordered finite discrete (iterable) Set"""
         return True
@@ -3827,6 +3836,31 @@ class SetProduct_OrderedSet(_OrderedSetMixin, SetProduct_FiniteSet):
 
         If the search item is not in the Set, then an IndexError is raised.
         """
+        return self.offset(item) + 1
+
+    def offset(self, item):
+        """
+        Return the (0-based) offset of the input value.
+
+        The offset is computed from the positions of the value's
+        components in the subsets (in mixed radix, with the last subset
+        varying fastest), so members of the product are never
+        generated.  See also :py:meth:`strides`.
+
+        If the search item is not in the Set, then an IndexError is raised.
+        """
+        _sets = self._sets
+        if item.__class__ is tuple and len(item) == len(_sets):
+            # Most lookups have one value for each subset, which we can
+            # locate directly (falling back on the general search,
+            # e.g., for members of multidimensional subsets)
+            try:
+                ans = 0
+                for s, v in zip(_sets, item):
+                    ans = ans*len(s) + s.ord(v) - 1
+                return ans
+            except (IndexError, KeyError, TypeError, ValueError):
+                pass
         found = self._find_val(item)
         if found is None:
             raise IndexError(
@@ -3835,15 +3869,24 @@ class SetProduct_OrderedSet(_OrderedSetMixin, SetProduct_FiniteSet):
         val, cutPoints = found
         if cutPoints is not None:
             val = tuple( val[cutPoints[i]:cutPoints[i+1]]
-                          for i in xrange(len(self._sets)) )
-        _idx = tuple(s.ord(val[i])-1 for i,s in enumerate(self._sets))
-        _len = list(len(_) for _ in self._sets)
-        _len.append(1)
+                          for i in xrange(len(_sets)) )
         ans = 0
-        for pos, n in zip(_idx, _len[1:]):
-            ans += pos
-            ans *= n
-        return ans+1
+        for s, v in zip(_sets, val):
+            ans = ans*len(s) + s.ord(v) - 1
+        return ans
+
+    def strides(self):
+        """
+        Return the change in offset for a step in each subset.
+
+        The offset of a member of the product is the sum over the
+        subsets of the (0-based) position of the member's component in
+        that subset times the corresponding stride.
+        """
+        ans = [1]*len(self._sets)
+        for i in xrange(len(self._sets)-1, 0, -1):
+            ans[i-1] = ans[i]*len(self._sets[i])
+        return tuple(ans)
 
 ############################################################################
 
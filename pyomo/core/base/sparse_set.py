@@ -0,0 +1,429 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['SparseSet']
+
+import logging
+
+from pyomo.common.dependencies import numpy, numpy_available
+from pyomo.common.timing import ConstructionTimer
+from pyomo.core.base.component import Component
+from pyomo.core.base.plugin import ModelComponentFactory
+from pyomo.core.base.set import (
+    _FiniteSetMixin, _OrderedSetMixin, _SetData, Any,
+)
+from pyomo.core.base.util import Initializer
+
+from six import iteritems
+from six.moves import xrange, zip
+
+logger = logging.getLogger('pyomo.core')
+
+
+def _as_array(values):
+    """Return values as a NumPy array of numbers or strings (or None)
+
+    Only columns of Python objects that all have the same type are
+    converted (so that, e.g., 1 and '1' are not both converted to '1').
+    """
+    if isinstance(values, numpy.ndarray) and values.dtype.kind != 'O':
+        ans = values
+    else:
+        values = list(values)
+        if not values or not all(
+                v.__class__ is values[0].__class__
+                and v.__class__ in (int, float, str) for v in values):
+            return None
+        ans = numpy.array(values)
+    if ans.dtype.kind in 'biufUS':
+        return ans
+    return None
+
+
+def _factorize(values):
+    """Return (levels, codes, level_array) for a sequence of values
+
+    levels is the list of distinct values and codes is the array of the
+    positions of the values in levels.  When NumPy can sort the values,
+    levels is sorted and level_array is levels as a NumPy array (so that
+    values can be encoded with a binary search); otherwise levels is in
+    the order of first appearance and level_array is None.
+    """
+    array = _as_array(values)
+    if array is not None:
+        levels, codes = numpy.unique(array, return_inverse=True)
+        return levels.tolist(), codes.reshape(-1), levels
+    values = list(values)
+    lookup = {}
+    codes = numpy.empty(len(values), dtype=numpy.int64)
+    for i, v in enumerate(values):
+        codes[i] = lookup.setdefault(v, len(lookup))
+    return list(lookup), codes, None
+
+
+@ModelComponentFactory.register(
+    "A finite, ordered set of tuples stored as integer-coded columns.")
+class SparseSet(_OrderedSetMixin, _FiniteSetMixin, _SetData, Component):
+    """A finite, ordered set of tuples stored in columns
+
+    SparseSet is intended for sparse subsets of large products (e.g.,
+    the valid (plant, product, period) combinations).  Instead of
+    storing a Python tuple for each member, each column (dimension) is
+    stored as an array of integer codes into the list of the distinct
+    values in that column, so the memory per member is a few integers.
+    Members are ordered as they were given (duplicates are dropped), and
+    a sorted index supports membership tests, ord() and slicing by
+    leading values in logarithmic time, e.g.::
+
+        m.S = SparseSet(initialize=df[['plant', 'product', 'period']])
+        m.S['p1', :, :]   # the members with plant 'p1'
+
+    The members cannot be changed after the set is constructed.
+
+    Args:
+        initialize: The members of the set, as a pandas DataFrame (one
+            column per dimension), a two-dimensional NumPy array (one
+            row per member), a sequence of tuples, or a rule that
+            returns one of these.
+        dimen (int, optional): The dimension of the members.  Required
+            if the set can be empty.
+        name (str, optional): The name of the set.
+        doc (str, optional): A text string describing this component.
+    """
+
+    def __init__(self, **kwds):
+        _SetData.__init__(self, component=self)
+        kwds.setdefault('ctype', SparseSet)
+        self._init_values = Initializer(
+            kwds.pop('initialize', None), treat_sequences_as_mappings=False)
+        self._dimen = kwds.pop('dimen', None)
+        Component.__init__(self, **kwds)
+        # The distinct values in each column
+        self._levels = ()
+        # Sorted arrays of the levels (for vectorized encoding), or
+        # None if the column values are not sortable by NumPy
+        self._level_arrays = ()
+        self._level_lookup = ()
+        # The codes of the members (one array per column), the number of
+        # members, the mixed-radix weights that combine the codes into a
+        # single key, and the positions of the members sorted by key
+        self._codes = ()
+        self._len = 0
+        self._radix = ()
+        self._order = None
+        self._sorted_keys = None
+
+    def __str__(self):
+        if self.parent_block() is not None:
+            return self.name
+        return type(self).__name__
+
+    def construct(self, data=None):
+        if self._constructed:
+            return
+        timer = ConstructionTimer(self)
+        if __debug__ and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Constructing SparseSet, name=%s, from data=%r"
+                         % (self.name, data))
+        if not numpy_available:
+            raise ValueError(
+                "SparseSet %s requires NumPy, which is not available"
+                % (self.name,))
+        self._constructed = True
+        if data is not None:
+            values = data
+        elif self._init_values is not None:
+            values = self._init_values(self.parent_block(), None)
+        else:
+            values = ()
+        self._set_members(self._columns(values))
+        timer.report()
+
+    def _columns(self, values):
+        # Split the initialization data into columns
+        if hasattr(values, 'columns') and hasattr(values, 'iloc'):
+            # pandas DataFrame
+            return [values[c].values for c in values.columns]
+        if isinstance(values, numpy.ndarray):
+            if values.ndim == 1:
+                values = values.reshape(-1, 1)
+            return [values[:, j] for j in xrange(values.shape[1])]
+        values = list(values)
+        if not values:
+            if self._dimen is None:
+                raise ValueError(
+                    "SparseSet %s: the dimen argument is required to "
+                    "construct an empty set" % (self.name,))
+            return [[] for _ in xrange(self._dimen)]
+        if values[0].__class__ is not tuple:
+            values = [(v,) for v in values]
+        dimen = len(values[0])
+        if any(len(v) != dimen for v in values):
+            raise ValueError(
+                "SparseSet %s: all members must have the same dimension"
+                % (self.name,))
+        return list(zip(*values))
+
+    def _set_members(self, columns):
+        if self._dimen is not None and len(columns) != self._dimen:
+            raise ValueError(
+                "SparseSet %s: the members have dimension %d (expected %d)"
+                % (self.name, len(columns), self._dimen))
+        self._dimen = len(columns)
+        levels, codes, level_arrays = [], [], []
+        for col in columns:
+            _levels, _codes, _array = _factorize(col)
+            levels.append(_levels)
+            codes.append(_codes)
+            level_arrays.append(_array)
+        self._levels = tuple(levels)
+        self._level_arrays = tuple(level_arrays)
+        self._level_lookup = tuple(
+            {v: i for i, v in enumerate(_levels)} for _levels in levels)
+
+        # The key of a member is its codes in mixed radix (with the
+        # first column varying slowest), so that the sorted keys group
+        # the members by their leading values
+        radix = [1]*self._dimen
+        for i in xrange(self._dimen-1, 0, -1):
+            radix[i-1] = radix[i]*max(1, len(levels[i]))
+        if self._dimen and radix[0]*max(1, len(levels[0])) >= 2**63:
+            raise ValueError(
+                "SparseSet %s: too many distinct values to index the "
+                "members" % (self.name,))
+        self._radix = tuple(radix)
+        keys = self._keys(codes)
+
+        # Drop duplicates (keeping the first occurrence)
+        _, first = numpy.unique(keys, return_index=True)
+        if len(first) < len(keys):
+            first.sort()
+            keys = keys[first]
+            codes = [c[first] for c in codes]
+        self._codes = tuple(codes)
+        self._len = len(keys)
+        self._order = numpy.argsort(keys, kind='mergesort')
+        self._sorted_keys = keys[self._order]
+
+    def _keys(self, codes):
+        keys = numpy.zeros(len(codes[0]) if codes else 0, dtype=numpy.int64)
+        for c, r in zip(codes, self._radix):
+            keys += c.astype(numpy.int64) * r
+        return keys
+
+    def _encode(self, value):
+        # Return the key for a member (or None if it is not a member)
+        if self._dimen == 1:
+            if value.__class__ is tuple and len(value) == 1:
+                value = value[0]
+            value = (value,)
+        elif value.__class__ is not tuple or len(value) != self._dimen:
+            return None
+        key = 0
+        for v, lookup, r in zip(value, self._level_lookup, self._radix):
+            code = lookup.get(v, None)
+            if code is None:
+                return None
+            key += code*r
+        return key
+
+    def _position(self, value):
+        # Return the (0-based) position of a member (or None)
+        try:
+            key = self._encode(value)
+        except TypeError:
+            # unhashable values are not members
+            return None
+        if key is None:
+            return None
+        i = numpy.searchsorted(self._sorted_keys, key)
+        if i < self._len and self._sorted_keys[i] == key:
+            return int(self._order[i])
+        return None
+
+    def _member(self, i):
+        ans = tuple(levels[c[i]] for levels, c in zip(self._levels,
+                                                       self._codes))
+        if self._dimen == 1:
+            return ans[0]
+        return ans
+
+    #
+    # Set API
+    #
+
+    def get(self, value, default=None):
+        if self._position(value) is None:
+            return default
+        if self._dimen == 1 and value.__class__ is tuple:
+            return value[0]
+        return value
+
+    def __len__(self):
+        return self._len
+
+    def _iter_impl(self):
+        columns = [[levels[c] for c in codes.tolist()]
+                   for levels, codes in zip(self._levels, self._codes)]
+        if self._dimen == 1:
+            return iter(columns[0])
+        return zip(*columns)
+
+    def __getitem__(self, index):
+        """
+        Return the specified member of the set (the public Set API is
+        1-based), or, if the index is a tuple containing slices (e.g.,
+        S['p1', :, :]), the list of members that match the sliced index.
+        """
+        if index.__class__ is tuple and any(
+                i.__class__ is slice or i is Ellipsis for i in index):
+            return [self._member(i) for i in self._match(index).tolist()]
+        i = self._to_0_based_index(index)
+        if i >= self._len:
+            raise IndexError("%s index out of range" % (self.name,))
+        return self._member(i)
+
+    def ord(self, item):
+        """
+        Return the position index of the input value.
+
+        Note that Pyomo Set objects have positions starting at 1 (not 0).
+
+        If the search item is not in the Set, then a ValueError is raised.
+        """
+        i = self._position(item)
+        if i is None:
+            raise ValueError(
+                "%s.ord(x): x not in %s" % (self.name, self.name))
+        return i + 1
+
+    @property
+    def dimen(self):
+        return self._dimen
+
+    @property
+    def domain(self):
+        return Any
+
+    def _pprint(self):
+        """
+        Return data that will be printed for this component.
+        """
+        return (
+            [("Dimen", self.dimen),
+             ("Size", len(self)),
+             ("Bounds", self.bounds())],
+            iteritems( {None: self} ),
+            ("Ordered", "Members",),
+            lambda k, v: [
+                True,
+                "{" + ", ".join(str(x) for x in v) + "}",
+            ])
+
+    #
+    # Columnar API
+    #
+
+    def _match(self, index):
+        """Return the (sorted) positions of the members matching a
+        sliced index"""
+        if Ellipsis in index:
+            i = index.index(Ellipsis)
+            fill = (slice(None),)*(self._dimen - len(index) + 1)
+            index = index[:i] + fill + index[i+1:]
+        if len(index) != self._dimen:
+            raise IndexError(
+                "SparseSet %s: index %s does not have %d dimensions"
+                % (self.name, index, self._dimen))
+        codes = []
+        for v, lookup in zip(index, self._level_lookup):
+            if v.__class__ is slice:
+                if v != slice(None):
+                    raise IndexError(
+                        "SparseSet %s only supports ':' slices" % (self.name,))
+                codes.append(None)
+            else:
+                code = lookup.get(v, None)
+                if code is None:
+                    return numpy.empty(0, dtype=numpy.int64)
+                codes.append(code)
+        # The leading fixed values select a contiguous range of the
+        # sorted keys
+        n_lead = 0
+        lo = 0
+        while n_lead < self._dimen and codes[n_lead] is not None:
+            lo += codes[n_lead]*self._radix[n_lead]
+            n_lead += 1
+        if n_lead:
+            hi = lo + self._radix[n_lead-1]
+            start, end = numpy.searchsorted(self._sorted_keys, [lo, hi])
+            ans = self._order[start:end]
+        else:
+            ans = self._order
+        # Any remaining fixed values are filtered
+        for d in xrange(n_lead, self._dimen):
+            if codes[d] is not None:
+                ans = ans[self._codes[d][ans] == codes[d]]
+        return numpy.sort(ans)
+
+    def _encode_column(self, d, values):
+        # Vectorized lookup of the codes of values in column d (-1 for
+        # values that are not in the column)
+        levels = self._level_arrays[d]
+        array = _as_array(values)
+        if levels is not None and len(levels) and array is not None:
+            try:
+                pos = numpy.searchsorted(levels, array)
+                pos[pos >= len(levels)] = 0
+                found = levels[pos] == array
+                return numpy.where(found, pos, -1)
+            except (TypeError, ValueError):
+                pass
+        lookup = self._level_lookup[d]
+        return numpy.array([lookup.get(v, -1) for v in values],
+                           dtype=numpy.int64)
+
+    def isin(self, values):
+        """Test the membership of many values at once
+
+        Args:
+            values: The values to test, in any of the forms accepted by
+                the ``initialize`` argument.
+
+        Returns:
+            A NumPy boolean array (one entry for each value).
+        """
+        columns = self._columns(values)
+        if len(columns) != self._dimen:
+            raise ValueError(
+                "SparseSet %s: the values have dimension %d (expected %d)"
+                % (self.name, len(columns), self._dimen))
+        codes = [self._encode_column(d, col) for d, col in enumerate(columns)]
+        found = numpy.ones(len(codes[0]), dtype=bool)
+        for c in codes:
+            found &= c >= 0
+        keys = self._keys([numpy.where(found, c, 0) for c in codes])
+        pos = numpy.searchsorted(self._sorted_keys, keys)
+        pos[pos >= self._len] = 0
+        if self._len:
+            found &= self._sorted_keys[pos] == keys
+        else:
+            found[:] = False
+        return found
+
+    def columns(self):
+        """Return the members as a list of arrays (one for each
+        dimension)"""
+        ans = []
+        for levels, codes in zip(self._levels, self._codes):
+            levels = numpy.array(levels, dtype=object) \
+                     if levels else numpy.empty(0, dtype=object)
+            ans.append(levels[codes])
+        return ans
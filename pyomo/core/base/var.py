@@ -8,14 +8,17 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-__all__ = ['Var', '_VarData', '_GeneralVarData', 'VarList', 'SimpleVar']
+__all__ = ['Var', '_VarData', '_GeneralVarData', '_ArrayVarData', 'VarList',
+           'SimpleVar']
 
 import logging
 from weakref import ref as weakref_ref
 
+from pyomo.common.dependencies import numpy, numpy_available
 from pyomo.common.modeling import NoArgumentGiven
 from pyomo.common.timing import ConstructionTimer
-from pyomo.core.base.numvalue import NumericValue, value, is_fixed
+from pyomo.core.base.numvalue import (NumericValue, value, is_fixed,
+                                      native_numeric_types)
 from pyomo.core.base.set_types import Reals, Binary
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.component import ComponentData
@@ -472,6 +475,250 @@ class _GeneralVarData(_VarData):
     free = unfix
 
 
+class _VarArrays(object):
+    """The values, bounds and flags of the variables in an IndexedVar
+    declared with storage='array'.
+
+    Each variable is assigned an offset into the arrays.  A value or
+    bound of None is stored as NaN.  Bounds that are not numeric
+    constants (e.g., mutable Params) and domains that differ from the
+    default domain are kept in dictionaries keyed by offset.
+    """
+
+    def __init__(self, size, domain):
+        self.size = 0
+        self.value = numpy.empty(0)
+        self.lb = numpy.empty(0)
+        self.ub = numpy.empty(0)
+        self.fixed = numpy.empty(0, dtype=bool)
+        self.stale = numpy.empty(0, dtype=bool)
+        self.lb_expr = {}
+        self.ub_expr = {}
+        self.domain = {}
+        self.default_domain = domain
+        self._resize(size)
+        self.size = size
+        # True while the offsets follow the order of the index set
+        self.ordered = True
+
+    def _resize(self, capacity):
+        n = self.size
+        for name, fill in (('value', numpy.nan), ('lb', numpy.nan),
+                           ('ub', numpy.nan), ('fixed', False),
+                           ('stale', True)):
+            old = getattr(self, name)
+            new = numpy.full(capacity, fill, dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, name, new)
+
+    def append(self):
+        """Add a variable, returning its offset"""
+        n = self.size
+        if n == len(self.value):
+            self._resize(max(2*n, 8))
+        self.size = n + 1
+        self.ordered = False
+        return n
+
+
+class _ArrayVarData(_VarData):
+    """
+    This class defines a single variable in an IndexedVar declared with
+    storage='array'.  The variable's value, bounds, domain and flags are
+    stored in arrays owned by the IndexedVar (see :class:`_VarArrays`),
+    so this object only holds its offset into those arrays.
+
+    Public Class Attributes:
+        See :class:`_GeneralVarData`.
+    """
+
+    __slots__ = ('_offset',)
+
+    def __init__(self, offset, component=None):
+        #
+        # These lines represent in-lining of the
+        # following constructors:
+        #   - _VarData
+        #   - ComponentData
+        #   - NumericValue
+        self._component = weakref_ref(component) if (component is not None) \
+                          else None
+        self._offset = offset
+
+    def __getstate__(self):
+        state = super(_ArrayVarData, self).__getstate__()
+        for i in _ArrayVarData.__slots__:
+            state[i] = getattr(self, i)
+        return state
+
+    #
+    # Abstract Interface
+    #
+
+    @property
+    def value(self):
+        """Return the value for this variable."""
+        val = self._component()._arrays.value[self._offset]
+        if val != val:
+            return None
+        return float(val)
+    @value.setter
+    def value(self, val):
+        """Set the value for this variable."""
+        if val is None:
+            val = numpy.nan
+        elif val.__class__ not in native_numeric_types:
+            val = value(val)
+        self._component()._arrays.value[self._offset] = val
+
+    @property
+    def domain(self):
+        """Return the domain for this variable."""
+        arrays = self._component()._arrays
+        return arrays.domain.get(self._offset, arrays.default_domain)
+    @domain.setter
+    def domain(self, domain):
+        """Set the domain for this variable."""
+        if not isinstance(domain, _SetDataBase):
+            raise ValueError(
+                "%s is not a valid domain. Variable domains must be an "
+                "instance of a Pyomo Set.  Examples: NonNegativeReals, "
+                "Integers, Binary" % (domain,))
+        arrays = self._component()._arrays
+        if domain is arrays.default_domain:
+            arrays.domain.pop(self._offset, None)
+        else:
+            arrays.domain[self._offset] = domain
+
+    @property
+    def lb(self):
+        """Return the lower bound for this variable."""
+        arrays = self._component()._arrays
+        dlb, _ = arrays.domain.get(
+            self._offset, arrays.default_domain).bounds()
+        if self._offset in arrays.lb_expr:
+            lb = value(arrays.lb_expr[self._offset])
+        else:
+            lb = arrays.lb[self._offset]
+            if lb != lb:
+                return dlb
+            lb = float(lb)
+        if dlb is None:
+            return lb
+        return max(lb, dlb)
+    @lb.setter
+    def lb(self, val):
+        raise AttributeError("Assignment not allowed. Use the setlb method")
+
+    @property
+    def ub(self):
+        """Return the upper bound for this variable."""
+        arrays = self._component()._arrays
+        _, dub = arrays.domain.get(
+            self._offset, arrays.default_domain).bounds()
+        if self._offset in arrays.ub_expr:
+            ub = value(arrays.ub_expr[self._offset])
+        else:
+            ub = arrays.ub[self._offset]
+            if ub != ub:
+                return dub
+            ub = float(ub)
+        if dub is None:
+            return ub
+        return min(ub, dub)
+    @ub.setter
+    def ub(self, val):
+        raise AttributeError("Assignment not allowed. Use the setub method")
+
+    @property
+    def fixed(self):
+        """Return the fixed indicator for this variable."""
+        return bool(self._component()._arrays.fixed[self._offset])
+    @fixed.setter
+    def fixed(self, val):
+        """Set the fixed indicator for this variable."""
+        self._component()._arrays.fixed[self._offset] = val
+
+    @property
+    def stale(self):
+        """Return the stale indicator for this variable."""
+        return bool(self._component()._arrays.stale[self._offset])
+    @stale.setter
+    def stale(self, val):
+        """Set the stale indicator for this variable."""
+        self._component()._arrays.stale[self._offset] = val
+
+    def get_units(self):
+        """Return the units for this variable entry."""
+        return self.parent_component()._units
+
+    def setlb(self, val):
+        """
+        Set the lower bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        arrays = self._component()._arrays
+        if val is None or val.__class__ in native_numeric_types:
+            arrays.lb_expr.pop(self._offset, None)
+            arrays.lb[self._offset] = numpy.nan if val is None else val
+        elif is_fixed(val):
+            arrays.lb_expr[self._offset] = val
+        else:
+            raise ValueError(
+                "Non-fixed input of type '%s' supplied as variable lower "
+                "bound - legal types must be fixed expressions or variables."
+                % (type(val),))
+
+    def setub(self, val):
+        """
+        Set the upper bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        arrays = self._component()._arrays
+        if val is None or val.__class__ in native_numeric_types:
+            arrays.ub_expr.pop(self._offset, None)
+            arrays.ub[self._offset] = numpy.nan if val is None else val
+        elif is_fixed(val):
+            arrays.ub_expr[self._offset] = val
+        else:
+            raise ValueError(
+                "Non-fixed input of type '%s' supplied as variable upper "
+                "bound - legal types are fixed expressions or variables."
+                "parameters"
+                % (type(val),))
+
+    def fix(self, value=NoArgumentGiven):
+        """
+        Set the fixed indicator to True. Value argument is optional,
+        indicating the variable should be fixed at its current value.
+        """
+        self.fixed = True
+        if value is not NoArgumentGiven:
+            self.value = value
+
+    def unfix(self):
+        """Sets the fixed indicator to False."""
+        self.fixed = False
+
+    free = unfix
+
+
+def _is_numeric_or_none(val):
+    return val is None or val.__class__ in native_numeric_types
+
+
+def _discard_offsets(exprs, offsets):
+    # Remove the entries for the given offsets (an array or a slice)
+    # from a dictionary of non-constant bounds
+    if not exprs:
+        return
+    if offsets.__class__ is slice:
+        exprs.clear()
+        return
+    for offset in offsets.tolist():
+        exprs.pop(offset, None)
+
+
 @ModelComponentFactory.register("Decision variables.")
 class Var(IndexedComponent):
     """A numeric variable, which may be defined over an index.
@@ -493,6 +740,15 @@ class Var(IndexedComponent):
             to True.
         units (pyomo units expression, optional): Set the units corresponding                                                  
             to the entries in this variable.
+        storage (str, optional): How the variable data are stored.
+            With 'dict' (the default), each variable is a separate
+            object holding its own value, bounds and flags.  With
+            'array', the values, bounds and flags of an indexed Var
+            are stored in NumPy arrays owned by the Var (so that they
+            can be updated in bulk; see :py:meth:`get_value_array`
+            and :py:meth:`set_values`), and the variables are
+            lightweight views into those arrays.  Values and bounds
+            are stored as floats.
     """
 
     _ComponentDataClass = _GeneralVarData
@@ -516,6 +772,16 @@ class Var(IndexedComponent):
         bounds = kwd.pop('bounds', None)
         self._dense = kwd.pop('dense', True)
         self._units = kwd.pop('units', None)
+        storage = kwd.pop('storage', 'dict')
+        if storage not in ('dict', 'array'):
+            raise ValueError(
+                "Var 'storage' keyword must be 'dict' or 'array' (got '%s')"
+                % (storage,))
+        if storage == 'array' and not numpy_available:
+            raise ValueError(
+                "Var storage='array' requires NumPy, which is not available")
+        self._array_storage = storage == 'array'
+        self._arrays = None
         
         #
         # Initialize the base class
@@ -557,6 +823,9 @@ class Var(IndexedComponent):
         """
         Set the 'stale' attribute of every variable data object to True.
         """
+        if self._arrays is not None:
+            self._arrays.stale[:self._arrays.size] = True
+            return
         for var_data in itervalues(self._data):
             var_data.stale = True
 
@@ -564,6 +833,16 @@ class Var(IndexedComponent):
         """
         Return a dictionary of index-value pairs.
         """
+        if self._arrays is not None:
+            keys = list(self.keys())
+            offsets = self._array_offsets(keys)
+            values = [None if val != val else val
+                      for val in self._arrays.value[offsets].tolist()]
+            if include_fixed_values:
+                return dict(zip(keys, values))
+            return {idx: val for idx, val, fixed in zip(
+                keys, values, self._arrays.fixed[offsets].tolist())
+                    if not fixed}
         if include_fixed_values:
             return {idx:vardata.value for idx,vardata in iteritems(self._data)}
         return {idx:vardata.value
@@ -572,15 +851,68 @@ class Var(IndexedComponent):
 
     extract_values = get_values
 
+    def get_value_array(self):
+        """
+        Return a NumPy array of the variable values (in the order of
+        the keys, with NaN for variables that have no value).
+        """
+        if self._arrays is not None:
+            return self._arrays.value[self._array_offsets()].copy()
+        return numpy.array(
+            [numpy.nan if vardata.value is None else vardata.value
+             for vardata in itervalues(self)], dtype=float)
+
     def set_values(self, new_values, valid=False):
         """
         Set the values of a dictionary.
 
         The default behavior is to validate the values in the
-        dictionary.
+        dictionary.  The values can also be given as a sequence (e.g.,
+        a NumPy array) with one value for each variable, in the order
+        of the keys (NaN or None for no value).
         """
-        for index, new_value in iteritems(new_values):
-            self[index].set_value(new_value, valid)
+        if hasattr(new_values, 'items'):
+            for index, new_value in iteritems(new_values):
+                self[index].set_value(new_value, valid)
+            return
+        if len(new_values) != len(self):
+            raise ValueError(
+                "Cannot set the values of Var '%s' from a sequence of %d "
+                "values (the Var has %d variables)"
+                % (self.name, len(new_values), len(self)))
+        if self._arrays is None:
+            for vardata, new_value in zip(itervalues(self), new_values):
+                if new_value is not None and new_value != new_value:
+                    new_value = None
+                vardata.set_value(new_value, valid)
+            return
+        keys = list(self.keys())
+        offsets = self._array_offsets(keys)
+        arrays = self._arrays
+        new_values = numpy.array(
+            [numpy.nan if val is None else val for val in new_values]
+            if type(new_values) is not numpy.ndarray else new_values,
+            dtype=float)
+        if not valid:
+            if arrays.domain or arrays.default_domain is not Reals:
+                for index, new_value in zip(keys, new_values.tolist()):
+                    if new_value == new_value:
+                        self._data[index]._valid_value(new_value)
+        arrays.value[offsets] = new_values
+        arrays.stale[offsets] = False
+
+    def _array_offsets(self, keys=None):
+        # Return the offsets of the variables in the arrays (in the
+        # order of the keys).  If the keys are given, they must be the
+        # keys of this Var (in order).
+        arrays = self._arrays
+        if arrays.ordered and arrays.size == len(self._data):
+            return slice(0, arrays.size)
+        if keys is None:
+            keys = self.keys()
+        _data = self._data
+        return numpy.array([_data[k]._offset for k in keys],
+                                 dtype=int)
 
     def get_units(self):
         """Return the units expression for this Var."""
@@ -611,6 +943,18 @@ class Var(IndexedComponent):
         if not self.is_indexed():
             self._data[None] = self
             self._initialize_members((None,))
+        elif self._array_storage:
+            self_weakref = weakref_ref(self)
+            if self._dense:
+                self._arrays = _VarArrays(len(self._index),
+                                          self._domain_init_value)
+                for offset, ndx in enumerate(self._index):
+                    cdata = _ArrayVarData(offset, component=None)
+                    cdata._component = self_weakref
+                    self._data[ndx] = cdata
+                self._initialize_members(self._index)
+            else:
+                self._arrays = _VarArrays(0, self._domain_init_value)
         elif self._dense:
             # This loop is optimized for speed with pypy.
             # Calling dict.update((...) for ...) is roughly
@@ -637,6 +981,9 @@ class Var(IndexedComponent):
         """Returns the default component data value."""
         if index is None and not self.is_indexed():
             obj = self._data[index] = self
+        elif self._arrays is not None:
+            obj = self._data[index] = _ArrayVarData(self._arrays.append(),
+                                                    component=self)
         else:
             obj = self._data[index] = self._ComponentDataClass(
                 self._domain_init_value, component=self)
@@ -732,9 +1079,18 @@ class Var(IndexedComponent):
                     vardata.set_value(val)
             else:
                 val = value(self._value_init_value)
-                for key in init_set:
-                    vardata = self._data[key]
-                    vardata.set_value(val)
+                if self._arrays is not None and init_set is self._index \
+                   and self._domain_init_rule is None:
+                    # Dense construction of an array-backed Var: all
+                    # variables share the domain and are in order
+                    if len(self._arrays.value):
+                        self._data[next(iter(init_set))]._valid_value(val)
+                    self._arrays.value[:self._arrays.size] = val
+                    self._arrays.stale[:self._arrays.size] = False
+                else:
+                    for key in init_set:
+                        vardata = self._data[key]
+                        vardata.set_value(val)
 
         #
         # Initialize bounds
@@ -761,10 +1117,16 @@ class Var(IndexedComponent):
             # Initialize bounds with a value
             #
             (lb, ub) = self._bounds_init_value
-            for key in init_set:
-                vardata = self._data[key]
-                vardata.setlb(lb)
-                vardata.setub(ub)
+            if self._arrays is not None and init_set is self._index \
+               and _is_numeric_or_none(lb) and _is_numeric_or_none(ub):
+                n = self._arrays.size
+                self._arrays.lb[:n] = numpy.nan if lb is None else lb
+                self._arrays.ub[:n] = numpy.nan if ub is None else ub
+            else:
+                for key in init_set:
+                    vardata = self._data[key]
+                    vardata.setlb(lb)
+                    vardata.setub(ub)
 
     def _pprint(self):
         """Print component information."""
@@ -939,6 +1301,11 @@ class IndexedVar(Var):
         """
         Set the lower bound for this variable.
         """
+        if self._arrays is not None and _is_numeric_or_none(val):
+            offsets = self._array_offsets()
+            self._arrays.lb[offsets] = numpy.nan if val is None else val
+            _discard_offsets(self._arrays.lb_expr, offsets)
+            return
         for vardata in itervalues(self):
             vardata.setlb(val)
 
@@ -946,6 +1313,11 @@ class IndexedVar(Var):
         """
         Set the upper bound for this variable.
         """
+        if self._arrays is not None and _is_numeric_or_none(val):
+            offsets = self._array_offsets()
+            self._arrays.ub[offsets] = numpy.nan if val is None else val
+            _discard_offsets(self._arrays.ub_expr, offsets)
+            return
         for vardata in itervalues(self):
             vardata.setub(val)
 
@@ -954,11 +1326,22 @@ class IndexedVar(Var):
         Set the fixed indicator to True. Value argument is optional,
         indicating the variable should be fixed at its current value.
         """
+        if self._arrays is not None and (
+                value is NoArgumentGiven or _is_numeric_or_none(value)):
+            offsets = self._array_offsets()
+            self._arrays.fixed[offsets] = True
+            if value is not NoArgumentGiven:
+                self._arrays.value[offsets] = \
+                    numpy.nan if value is None else value
+            return
         for vardata in itervalues(self):
             vardata.fix(value=value)
 
     def unfix(self):
         """Sets the fixed indicator to False."""
+        if self._arrays is not None:
+            self._arrays.fixed[self._array_offsets()] = False
+            return
         for vardata in itervalues(self):
             vardata.unfix()
 
@@ -971,6 +1354,11 @@ class IndexedVar(Var):
     @domain.setter
     def domain(self, domain):
         """Sets the domain for all variables in this container."""
+        if self._arrays is not None and isinstance(domain, _SetDataBase) \
+           and len(self._data) == self._arrays.size:
+            self._arrays.domain.clear()
+            self._arrays.default_domain = domain
+            return
         for vardata in itervalues(self):
             vardata.domain = domain
 
@@ -0,0 +1,479 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""
+Whole-model first and second derivatives.
+
+Differentiating constraints one at a time with reverse_ad (which walks
+the expression tree and builds dictionaries for every call) is
+prohibitively slow for large models.  The ModelDerivatives class
+compiles all active constraint bodies (and the active objective) of a
+block into a single ExpressionTape once.  The constraint Jacobian and
+the Hessian of the Lagrangian are then computed by sweeping over the
+tape (reverse mode for the Jacobian, forward-over-reverse for the
+Hessian) and returned as SciPy sparse matrices.  The tape can be
+re-evaluated at new points without rebuilding anything.
+"""
+
+import math
+
+from pyomo.common.dependencies import numpy as np, scipy
+from pyomo.core.expr.numvalue import value
+from pyomo.core.expr.tape import (
+    compile_expressions,
+    _SUM, _NEG, _MUL, _DIV, _RECIP, _POW, _UNARY, _LINEAR, _IF, _LE, _LT,
+    _EQ, _RANGED, _EXTERNAL,
+)
+from pyomo.core.expr.calculus.diff_with_pyomo import DifferentiationException
+
+_relational_ops = {_LE, _LT, _EQ, _RANGED}
+
+_log10_e = math.log10(math.e)
+
+#
+# First and second derivatives of the intrinsic functions, as functions
+# of the argument (x) and the function value (v)
+#
+_unary_derivs = {
+    'exp': (lambda x, v: v,
+            lambda x, v: v),
+    'log': (lambda x, v: 1/x,
+            lambda x, v: -1/x**2),
+    'log10': (lambda x, v: _log10_e/x,
+              lambda x, v: -_log10_e/x**2),
+    'sqrt': (lambda x, v: 0.5/v,
+             lambda x, v: -0.25/v**3),
+    'sin': (lambda x, v: math.cos(x),
+            lambda x, v: -v),
+    'cos': (lambda x, v: -math.sin(x),
+            lambda x, v: -v),
+    'tan': (lambda x, v: 1 + v**2,
+            lambda x, v: 2*v*(1 + v**2)),
+    'asin': (lambda x, v: (1 - x**2)**-0.5,
+             lambda x, v: x*(1 - x**2)**-1.5),
+    'acos': (lambda x, v: -(1 - x**2)**-0.5,
+             lambda x, v: -x*(1 - x**2)**-1.5),
+    'atan': (lambda x, v: 1/(1 + x**2),
+             lambda x, v: -2*x/(1 + x**2)**2),
+    'sinh': (lambda x, v: math.cosh(x),
+             lambda x, v: v),
+    'cosh': (lambda x, v: math.sinh(x),
+             lambda x, v: v),
+    'tanh': (lambda x, v: 1 - v**2,
+             lambda x, v: -2*v*(1 - v**2)),
+    'asinh': (lambda x, v: (x**2 + 1)**-0.5,
+              lambda x, v: -x*(x**2 + 1)**-1.5),
+    'acosh': (lambda x, v: (x**2 - 1)**-0.5,
+              lambda x, v: -x*(x**2 - 1)**-1.5),
+    'atanh': (lambda x, v: 1/(1 - x**2),
+              lambda x, v: 2*x/(1 - x**2)**2),
+    'abs': (lambda x, v: math.copysign(1, x) if x else 0,
+            lambda x, v: 0),
+}
+
+
+def _unary_fcn(data, order):
+    try:
+        return _unary_derivs[data[0]][order]
+    except KeyError:
+        raise DifferentiationException(
+            'Unsupported expression type for differentiation: '
+            'unary function %s' % (data[0],))
+
+
+def _first_partials(op, a, v, d, dep):
+    """Return the partial derivatives of an instruction w.r.t. its args"""
+    if op == _SUM:
+        return [1]*len(a)
+    elif op == _LINEAR:
+        return [1] + a[d+1:] + a[1:d+1]
+    elif op == _MUL:
+        return [a[1], a[0]]
+    elif op == _NEG:
+        return [-1]
+    elif op == _DIV:
+        return [1/a[1], -a[0]/a[1]**2]
+    elif op == _RECIP:
+        return [-1/a[0]**2]
+    elif op == _POW:
+        # x**0 is constant (avoid evaluating 0**-1 at x == 0)
+        return [a[1]*a[0]**(a[1]-1) if a[1] else 0,
+                v*math.log(a[0]) if dep[1] else 0]
+    elif op == _UNARY:
+        return [_unary_fcn(d, 0)(a[0], v)]
+    elif op == _IF:
+        return [0, 1, 0] if a[0] else [0, 0, 1]
+    elif op == _EXTERNAL:
+        return list(d.evaluate_fgh(a)[1])
+    # relational operators
+    return [0]*len(a)
+
+
+def _second_partials(op, a, v, d, dep):
+    """Return the structurally nonzero second partial derivatives of an
+    instruction as a list of (i, j, value) tuples (with i <= j)"""
+    if op == _MUL:
+        if dep[0] and dep[1]:
+            return [(0, 1, 1)]
+    elif op == _DIV:
+        if dep[1]:
+            ans = [(1, 1, 2*a[0]/a[1]**3)]
+            if dep[0]:
+                ans.append((0, 1, -1/a[1]**2))
+            return ans
+    elif op == _RECIP:
+        return [(0, 0, 2/a[0]**3)]
+    elif op == _POW:
+        x, y = a
+        ans = []
+        if dep[0]:
+            # The second partial is 0 if y is 0 or 1 (avoid evaluating
+            # x**(y-2) at x == 0)
+            coef = y*(y - 1)
+            ans.append((0, 0, coef*x**(y - 2) if coef else 0))
+        if dep[1]:
+            _log = math.log(x)
+            ans.append((1, 1, v*_log**2))
+            if dep[0]:
+                ans.append((0, 1, x**(y - 1)*(1 + y*_log)))
+        return ans
+    elif op == _UNARY:
+        return [(0, 0, _unary_fcn(d, 1)(a[0], v))]
+    elif op == _LINEAR:
+        return [(i, i+d, 1) for i in range(1, d+1) if dep[i] and dep[i+d]]
+    elif op == _EXTERNAL:
+        h = d.evaluate_fgh(a)[2]
+        # AMPL external functions return the packed upper triangle
+        return [(i, j, h[i + j*(j+1)//2])
+                for j in range(len(a)) for i in range(j+1)
+                if dep[i] and dep[j]]
+    return []
+
+
+class ModelDerivatives(object):
+    """Sparse first and second derivatives of all constraints on a block
+
+    Parameters
+    ----------
+    block: pyomo.core.base.block._BlockData
+        The block whose constraints (and objective) are differentiated
+    active: bool
+        Only consider active constraints and objectives (default=True)
+    descend_into: bool
+        Include constraints on sub-blocks (default=True)
+    variables: list of pyomo.core.base.var._GeneralVarData
+        The variables defining the columns of the Jacobian (and the
+        rows/columns of the Hessian).  If not specified, all unfixed
+        variables appearing in the constraints and objective are used,
+        in the order in which they are first encountered.  Any other
+        leaves (parameters, fixed variables and variables that are not
+        in this list) are treated as constants whose values are read
+        each time the derivatives are evaluated.
+
+    Notes
+    -----
+    The structure of the model (the constraint expressions, which
+    variables are fixed, and which constraints / objectives are active)
+    is captured when the object is created.  Changing the structure
+    requires creating a new ModelDerivatives object.
+    """
+
+    def __init__(self, block, active=True, descend_into=True,
+                 variables=None):
+        from pyomo.core.base.constraint import Constraint
+        from pyomo.core.base.objective import Objective
+
+        self.constraints = list(block.component_data_objects(
+            Constraint, active=active, descend_into=descend_into))
+        objectives = list(block.component_data_objects(
+            Objective, active=active, descend_into=descend_into))
+        if len(objectives) > 1:
+            raise ValueError(
+                "ModelDerivatives: block '%s' has %s active objectives; "
+                "at most one objective is supported"
+                % (block.name, len(objectives)))
+        self.objective = objectives[0] if objectives else None
+
+        exprs = [c.body for c in self.constraints]
+        if self.objective is not None:
+            exprs.append(self.objective.expr)
+        # Each output gets its own instructions, so that every interior
+        # slot belongs to exactly one output (only leaves are shared)
+        self._tape = tape = compile_expressions(
+            exprs, share_subexpressions=False)
+
+        if variables is None:
+            variables = [v for v in tape.leaves
+                         if v.is_variable_type() and not v.fixed]
+        self.variables = list(variables)
+        _col = {id(v): i for i, v in enumerate(self.variables)}
+        # slot -> column for every leaf slot that is a variable
+        self._slot_col = slot_col = {}
+        # leaf index -> column (or None)
+        self._leaf_col = []
+        for leaf, s in zip(tape.leaves, tape.leaf_slots):
+            col = _col.get(id(leaf), None)
+            self._leaf_col.append(col)
+            if col is not None:
+                slot_col[s] = col
+
+        # Determine which slots depend on the variables
+        dep = [False]*tape.n_slots
+        for s in slot_col:
+            dep[s] = True
+        self._instructions = []
+        for k in range(len(exprs)):
+            instr = []
+            for op, out, args, d in tape.output_instructions(k):
+                if op in _relational_ops:
+                    arg_dep = (False,)*len(args)
+                elif op == _IF:
+                    arg_dep = (False, dep[args[1]], dep[args[2]])
+                else:
+                    arg_dep = tuple(dep[i] for i in args)
+                dep[out] = any(arg_dep)
+                if dep[out]:
+                    instr.append((op, out, args, d, arg_dep))
+            self._instructions.append(instr)
+        self._dep = dep
+
+    @property
+    def n_constraints(self):
+        return len(self.constraints)
+
+    @property
+    def n_variables(self):
+        return len(self.variables)
+
+    def _forward(self, x):
+        tape = self._tape
+        if x is None:
+            values = tape.leaf_values()
+        else:
+            if len(x) != len(self.variables):
+                raise ValueError(
+                    "ModelDerivatives: expected %s variable values, but "
+                    "received %s" % (len(self.variables), len(x)))
+            values = [value(leaf) if col is None else x[col]
+                      for leaf, col in zip(tape.leaves, self._leaf_col)]
+        return tape.evaluate_slots(values)
+
+    def _reverse(self, k, vals):
+        """First-order reverse sweep over output k.
+
+        Returns the gradient entries as a list of (column, value)
+        tuples (possibly with repeated columns), the adjoints of the
+        interior slots, and the partial derivatives of each
+        instruction.
+        """
+        out = self._tape.outputs[k]
+        slot_col = self._slot_col
+        grad = []
+        if out in slot_col:
+            grad.append((slot_col[out], 1.))
+        instr = self._instructions[k]
+        adj = {out: 1.}
+        partials = [None]*len(instr)
+        for n in range(len(instr)-1, -1, -1):
+            op, o, args, d, arg_dep = instr[n]
+            g = adj.get(o, 0)
+            partials[n] = f = _first_partials(
+                op, [vals[i] for i in args], vals[o], d, arg_dep)
+            for i, a in enumerate(args):
+                if not arg_dep[i]:
+                    continue
+                if a in slot_col:
+                    grad.append((slot_col[a], g*f[i]))
+                else:
+                    adj[a] = adj.get(a, 0) + g*f[i]
+        return grad, adj, partials
+
+    def evaluate_constraints(self, x=None):
+        """Return the constraint body values as a numpy array
+
+        Args:
+            x: values for :attr:`variables`.  If None, the current
+                variable values are used.
+        """
+        vals = self._forward(x)
+        outputs = self._tape.outputs
+        return np.array([vals[outputs[k]]
+                         for k in range(len(self.constraints))], dtype=float)
+
+    def evaluate_objective(self, x=None):
+        """Return the value of the active objective"""
+        if self.objective is None:
+            raise ValueError("ModelDerivatives: no active objective")
+        return self._forward(x)[self._tape.outputs[-1]]
+
+    def evaluate_objective_gradient(self, x=None):
+        """Return the gradient of the active objective as a numpy array"""
+        if self.objective is None:
+            raise ValueError("ModelDerivatives: no active objective")
+        vals = self._forward(x)
+        ans = np.zeros(len(self.variables))
+        for col, val in self._reverse(len(self.constraints), vals)[0]:
+            ans[col] += val
+        return ans
+
+    def evaluate_jacobian(self, x=None, format='csr'):
+        """Return the constraint Jacobian as a SciPy sparse matrix
+
+        Rows are ordered as :attr:`constraints` and columns as
+        :attr:`variables`.
+
+        Args:
+            x: values for :attr:`variables`.  If None, the current
+                variable values are used.
+            format (str): the sparse matrix format ('csr' or 'coo')
+        """
+        vals = self._forward(x)
+        rows = []
+        cols = []
+        data = []
+        for k in range(len(self.constraints)):
+            for col, val in self._reverse(k, vals)[0]:
+                rows.append(k)
+                cols.append(col)
+                data.append(val)
+        shape = (len(self.constraints), len(self.variables))
+        return self._build_matrix(rows, cols, data, shape, format)
+
+    def evaluate_hessian_lag(self, duals, x=None, obj_factor=1.,
+                             format='csr'):
+        """Return the Hessian of the Lagrangian as a SciPy sparse matrix
+
+        The Lagrangian is ``obj_factor*f(x) + sum_k duals[k]*c_k(x)``.
+        The returned matrix is symmetric (both triangles are stored),
+        with rows and columns ordered as :attr:`variables`.
+
+        Args:
+            duals: multipliers for :attr:`constraints`
+            x: values for :attr:`variables`.  If None, the current
+                variable values are used.
+            obj_factor (float): multiplier for the objective
+            format (str): the sparse matrix format ('csr' or 'coo')
+        """
+        if len(duals) != len(self.constraints):
+            raise ValueError(
+                "ModelDerivatives: expected %s constraint multipliers, but "
+                "received %s" % (len(self.constraints), len(duals)))
+        vals = self._forward(x)
+        weights = list(duals)
+        if self.objective is not None:
+            weights.append(obj_factor)
+        rows = []
+        cols = []
+        data = []
+        for k, w in enumerate(weights):
+            if not w:
+                continue
+            for i, j, val in self._hessian(k, vals):
+                rows.append(i)
+                cols.append(j)
+                data.append(w*val)
+        shape = (len(self.variables), len(self.variables))
+        return self._build_matrix(rows, cols, data, shape, format)
+
+    def _hessian(self, k, vals):
+        """Forward-over-reverse sweeps computing the Hessian of output k
+
+        Returns a list of (row, column, value) entries (possibly with
+        repeated indices).
+        """
+        instr = self._instructions[k]
+        slot_col = self._slot_col
+        # second partials, indexed by instruction and argument position
+        seconds = []
+        nonlinear = False
+        for op, o, args, d, arg_dep in instr:
+            by_arg = {}
+            for i, j, h in _second_partials(
+                    op, [vals[a] for a in args], vals[o], d, arg_dep):
+                by_arg.setdefault(i, []).append((j, h))
+                if i != j:
+                    by_arg.setdefault(j, []).append((i, h))
+            if by_arg:
+                nonlinear = True
+            seconds.append(by_arg)
+        if not nonlinear:
+            return []
+
+        grad, adj, partials = self._reverse(k, vals)
+        ans = []
+        for j_slot in _unique(a for _, _, args, _, arg_dep in instr
+                              for a, dep in zip(args, arg_dep)
+                              if dep and a in slot_col):
+            # forward tangent sweep in the direction of variable j
+            tdot = {j_slot: 1.}
+            for n, (op, o, args, d, arg_dep) in enumerate(instr):
+                f = partials[n]
+                t = None
+                for i, a in enumerate(args):
+                    if arg_dep[i] and a in tdot:
+                        if t is None:
+                            t = f[i]*tdot[a]
+                        else:
+                            t += f[i]*tdot[a]
+                if t is not None:
+                    tdot[o] = t
+            # reverse sweep for the directional derivative of the adjoints
+            adjdot = {}
+            col = {}
+            for n in range(len(instr)-1, -1, -1):
+                op, o, args, d, arg_dep = instr[n]
+                f = partials[n]
+                bdot = adjdot.get(o, None)
+                g = adj.get(o, 0)
+                by_arg = seconds[n]
+                for i, a in enumerate(args):
+                    if not arg_dep[i]:
+                        continue
+                    contrib = None
+                    if bdot is not None:
+                        contrib = bdot*f[i]
+                    for jj, h in by_arg.get(i, ()):
+                        if args[jj] in tdot:
+                            term = g*h*tdot[args[jj]]
+                            contrib = term if contrib is None \
+                                else contrib + term
+                    if contrib is None:
+                        continue
+                    if a in slot_col:
+                        c = slot_col[a]
+                        col[c] = col.get(c, 0) + contrib
+                    else:
+                        adjdot[a] = adjdot.get(a, 0) + contrib
+            j_col = slot_col[j_slot]
+            for c, val in col.items():
+                ans.append((c, j_col, val))
+        return ans
+
+    def _build_matrix(self, rows, cols, data, shape, format):
+        mat = scipy.sparse.coo_matrix(
+            (np.array(data, dtype=float),
+             (np.array(rows, dtype=int), np.array(cols, dtype=int))),
+            shape=shape)
+        if format == 'coo':
+            mat.sum_duplicates()
+            return mat
+        elif format == 'csr':
+            return mat.tocsr()
+        raise ValueError(
+            "ModelDerivatives: unrecognized sparse matrix format '%s'"
+            % (format,))
+
+
+def _unique(iterable):
+    seen = set()
+    for x in iterable:
+        if x not in seen:
+            seen.add(x)
+            yield x
@@ -0,0 +1,198 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Common subexpression detection.
+
+Models built from rules frequently contain structurally identical
+subtrees in many different expressions (e.g., the same
+``sum(m.x[i]*m.c[i] for i in m.I)`` appearing in dozens of
+constraints).  The :class:`CommonSubexpressions` object "hash-conses"
+expression trees: every subtree is mapped to a canonical integer id
+based on its structure (operator, operator data, and the canonical ids
+of its arguments), so that identical subtrees share the same id even
+when they are different Python objects.  Subtrees that are referenced
+more than once can then be computed (or written) only once.
+"""
+
+from pyomo.core.expr.numvalue import native_types, value
+from pyomo.core.expr.tape import _get_node_handler
+
+
+class CommonSubexpressions(object):
+    """Hash-consing table for detecting structurally identical subtrees
+
+    Expressions are registered with :meth:`add`.  Leaves (variables
+    and mutable parameters) are identified by object identity and
+    constants by value.  Named expressions (e.g., :class:`Expression`
+    components) are transparent: they are given the same canonical id
+    as the expression they wrap.
+
+    Canonical ids are assigned in post-order, so the arguments of a
+    subexpression always have smaller ids than the subexpression
+    itself.
+    """
+
+    def __init__(self):
+        # structural key -> canonical id
+        self._keys = {}
+        # id(node) -> canonical id, for every expression node visited
+        self._node_id = {}
+        # canonical id -> representative (non-named) node
+        self._nodes = []
+        # canonical id -> canonical ids of the subexpression arguments
+        self._children = []
+        # canonical id -> number of references in the hash-consed DAG
+        self._refs = []
+        # Hold on to the registered expressions so that the ids in
+        # _node_id cannot be reused by other objects
+        self._exprs = []
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def add(self, expr):
+        """Register an expression tree
+
+        Returns the canonical id of the expression, or None if the
+        expression is a leaf or constant.
+        """
+        ans = self._walk(expr)
+        if ans is not None:
+            self._refs[ans] += 1
+            self._exprs.append(expr)
+        return ans
+
+    def canonical_id(self, node):
+        """Return the canonical id of a (registered) expression node
+
+        Returns None for leaves, constants, and unregistered nodes.
+        """
+        return self._node_id.get(id(node), None)
+
+    def representative(self, cid):
+        """Return an expression node with the given canonical id"""
+        return self._nodes[cid]
+
+    def reference_count(self, cid):
+        """Return the number of times a canonical subexpression is
+        referenced (by registered roots or other canonical
+        subexpressions)"""
+        return self._refs[cid]
+
+    def shared(self):
+        """Return the canonical ids of all subexpressions referenced more
+        than once, in increasing (i.e., post-) order.
+
+        Subexpressions that cannot vary (i.e., that do not contain
+        variables) are not reported.
+        """
+        return [cid for cid, n in enumerate(self._refs)
+                if n > 1 and self._nodes[cid].is_potentially_variable()]
+
+    def propagate(self, root_flags):
+        """Propagate integer bit flags from roots to all subexpressions
+
+        Args:
+            root_flags: iterable of ``(canonical_id, flags)`` tuples
+
+        Returns:
+            A list (indexed by canonical id) of the bitwise OR of the
+            flags of every root that (transitively) uses each
+            subexpression.
+        """
+        flags = [0]*len(self._nodes)
+        for cid, f in root_flags:
+            if cid is not None:
+                flags[cid] |= f
+        # Parents always have larger ids than their children
+        for cid in range(len(self._nodes)-1, -1, -1):
+            f = flags[cid]
+            if f:
+                for child in self._children[cid]:
+                    flags[child] |= f
+        return flags
+
+    def _leaf_key(self, node):
+        if node.__class__ in native_types:
+            return (None, node)
+        if node.is_expression_type():
+            return None
+        if node.is_constant():
+            return (None, value(node))
+        return (id(node),)
+
+    def _walk(self, expr):
+        key = self._leaf_key(expr)
+        if key is not None:
+            return None
+        _id = id(expr)
+        if _id in self._node_id:
+            return self._node_id[_id]
+        # Iterative post-order walk: each stack entry is
+        # [node, op, args, data, arg_keys, arg_cids]
+        stack = [self._enter(expr)]
+        while 1:
+            node, op, args, data, arg_keys, arg_cids = stack[-1]
+            if len(arg_keys) < len(args):
+                child = args[len(arg_keys)]
+                key = self._leaf_key(child)
+                if key is not None:
+                    arg_keys.append(key)
+                    continue
+                cid = self._node_id.get(id(child), None)
+                if cid is not None:
+                    arg_keys.append(cid)
+                    arg_cids.append(cid)
+                    continue
+                stack.append(self._enter(child))
+                continue
+            stack.pop()
+            if op is None:
+                # Named expressions are transparent
+                cid = arg_cids[0] if arg_cids else None
+            else:
+                key = (op, data, tuple(arg_keys))
+                cid = self._keys.get(key, None)
+                if cid is None:
+                    cid = len(self._nodes)
+                    self._keys[key] = cid
+                    self._nodes.append(node)
+                    self._children.append(tuple(arg_cids))
+                    self._refs.append(0)
+                    for child in arg_cids:
+                        self._refs[child] += 1
+            if cid is not None:
+                self._node_id[id(node)] = cid
+            if not stack:
+                return cid
+            if cid is None:
+                # a named expression wrapping a leaf / constant
+                stack[-1][4].append(arg_keys[0])
+            else:
+                stack[-1][4].append(cid)
+                stack[-1][5].append(cid)
+
+    def _enter(self, node):
+        if node.is_named_expression_type():
+            return [node, None, node.args, None, [], []]
+        op, args, data = _get_node_handler(node)(node)
+        return [node, op, args, data, [], []]
+
+
+def find_common_subexpressions(exprs):
+    """Build a :class:`CommonSubexpressions` table for a set of expressions
+
+    Returns:
+        A tuple ``(cse, roots)`` of the table and the list of canonical
+        ids of the expressions (None for leaves and constants).
+    """
+    cse = CommonSubexpressions()
+    roots = [cse.add(e) for e in exprs]
+    return cse, roots
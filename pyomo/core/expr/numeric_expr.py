@@ -12,6 +12,7 @@ from __future__ import division
 
 import math
 import logging
+from copy import deepcopy
 from itertools import islice
 
 logger = logging.getLogger('pyomo.core')
@@ -190,6 +191,20 @@ class ExpressionBase(NumericValue):
            state[i] = getattr(self,i)
         return state
 
+    def __deepcopy__(self, memo):
+        # Block.clone(share_expressions=True) flags the memo so that
+        # expression trees are rebuilt from their (copied) leaves,
+        # sharing any subtree that does not change
+        if '__share_expressions__' in memo:
+            return _share_clone(self, memo)
+        return self._deepcopy_state(memo)
+
+    def _deepcopy_state(self, memo):
+        # This is what deepcopy() does for classes without __deepcopy__
+        ans = memo[id(self)] = self.__class__.__new__(self.__class__)
+        ans.__setstate__(deepcopy(self.__getstate__(), memo))
+        return ans
+
     def __nonzero__(self):      #pragma: no cover
         """
         Compute the value of the expression and convert it to
@@ -620,6 +635,11 @@ class ExternalFunctionExpression(ExpressionBase):
             state[i] = getattr(self, i)
         return state
 
+    def __deepcopy__(self, memo):
+        # The external function is a component that may need to be
+        # cloned, so always copy the full state
+        return self._deepcopy_state(memo)
+
     def getname(self, *args, **kwds):           #pragma: no cover
         return self._fcn.getname(*args, **kwds)
 
@@ -1474,6 +1494,82 @@ class _MutableLinearExpression(LinearExpression):
 #
 #-------------------------------------------------------
 
+_NotCopied = object()
+_mutable_clone_types = {_MutableSumExpression, _MutableLinearExpression}
+# Cache of {class: True if _share_clone() walks into nodes of the class}
+_share_clone_walk = {}
+
+
+def _clone_args(node):
+    if node.__class__ is LinearExpression \
+       or node.__class__ is _MutableLinearExpression:
+        return [node.constant] + node.linear_coefs + node.linear_vars
+    return node.args
+
+
+def _share_clone(expr, memo):
+    """Clone an expression tree, sharing the subtrees that do not change
+
+    Leaves and named expressions are copied with deepcopy(), which
+    (within Block.clone()) replaces the components in the scope of the
+    clone and keeps all other components.  Interior nodes are only
+    rebuilt when one of their arguments changed; mutable sums are
+    always rebuilt.
+    """
+    # Each frame is [node, args, new args, changed]
+    _frame = [expr, _clone_args(expr), [], False]
+    _stack = []
+    while 1:
+        node, args, result, changed = _frame
+        _idx = len(result)
+        _len = len(args)
+        while _idx < _len:
+            child = args[_idx]
+            if child.__class__ in nonpyomo_leaf_types:
+                result.append(child)
+            else:
+                ans = memo.get(id(child), _NotCopied)
+                if ans is _NotCopied:
+                    walk = _share_clone_walk.get(child.__class__, None)
+                    if walk is None:
+                        walk = _share_clone_walk[child.__class__] = (
+                            child.is_expression_type()
+                            and not child.is_named_expression_type()
+                            and child.__class__.__deepcopy__
+                            is ExpressionBase.__deepcopy__)
+                    if walk:
+                        break
+                    ans = deepcopy(child, memo)
+                result.append(ans)
+                if ans is not child:
+                    changed = True
+            _idx += 1
+        if _idx < _len:
+            _frame[3] = changed
+            _stack.append(_frame)
+            _frame = [child, _clone_args(child), [], False]
+            continue
+
+        if changed or node.__class__ in _mutable_clone_types:
+            if node.__class__ is LinearExpression \
+               or node.__class__ is _MutableLinearExpression:
+                n = (_len - 1) // 2
+                ans = node.__class__(constant=result[0],
+                                     linear_coefs=result[1:n+1],
+                                     linear_vars=result[n+1:])
+            else:
+                ans = node.create_node_with_local_data(tuple(result))
+        else:
+            ans = node
+        memo[id(node)] = ans
+        if not _stack:
+            return ans
+        _frame = _stack.pop()
+        _frame[2].append(ans)
+        if ans is not node:
+            _frame[3] = True
+
+
 def decompose_term(expr):
     """
     A function that returns a tuple consisting of (1) a flag indicated
@@ -0,0 +1,457 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Compiled expression tapes.
+
+This module "compiles" one or more Pyomo expression trees into a flat
+list of instructions (a *tape*) that operate on numbered slots.  The
+leaves of the expressions (variables and mutable parameters) are
+collected into an ordered list, so that the whole tape can be
+re-evaluated for new leaf values without walking the Python expression
+objects again.  The tape can be evaluated either for a single point
+(using Python floats) or for a batch of points at once (using NumPy
+arrays, one row per leaf).
+"""
+
+from six.moves import xrange
+
+from pyomo.common.dependencies import numpy as np
+from pyomo.core.expr import numeric_expr as _numeric_expr
+from pyomo.core.expr import logical_expr as _logical_expr
+from pyomo.core.expr.numvalue import (
+    native_types, value,
+)
+
+#
+# Tape opcodes
+#
+_SUM = 0
+_NEG = 1
+_MUL = 2
+_DIV = 3
+_RECIP = 4
+_POW = 5
+_UNARY = 6
+_LINEAR = 7
+_IF = 8
+_LE = 9
+_LT = 10
+_EQ = 11
+_RANGED = 12
+_EXTERNAL = 13
+
+
+def _ranged(a, strict):
+    _l, _b, _r = a
+    if strict[0]:
+        lower = _l < _b
+    else:
+        lower = _l <= _b
+    if strict[1]:
+        upper = _b < _r
+    else:
+        upper = _b <= _r
+    return lower and upper
+
+def _ranged_batch(a, strict):
+    _l, _b, _r = a
+    if strict[0]:
+        lower = np.less(_l, _b)
+    else:
+        lower = np.less_equal(_l, _b)
+    if strict[1]:
+        upper = np.less(_b, _r)
+    else:
+        upper = np.less_equal(_b, _r)
+    return np.logical_and(lower, upper)
+
+def _linear(a, n):
+    ans = a[0]
+    for i in xrange(1, n+1):
+        ans = ans + a[i] * a[i+n]
+    return ans
+
+def _unary_batch(a, data):
+    name, fcn = data
+    f = _numpy_unary_functions().get(name, None)
+    if f is None:
+        f = np.vectorize(fcn, otypes=[float])
+    return f(a[0])
+
+def _external_batch(a, fcn):
+    # External functions can only be evaluated one point at a time
+    n = max(np.size(x) for x in a)
+    args = [np.broadcast_to(x, (n,)) for x in a]
+    return np.array([fcn.evaluate(tuple(x[i] for x in args))
+                     for i in xrange(n)], dtype=float)
+
+_scalar_ops = {
+    _SUM: lambda a, d: sum(a),
+    _NEG: lambda a, d: -a[0],
+    _MUL: lambda a, d: a[0] * a[1],
+    _DIV: lambda a, d: a[0] / a[1],
+    _RECIP: lambda a, d: 1 / a[0],
+    _POW: lambda a, d: a[0] ** a[1],
+    _UNARY: lambda a, d: d[1](a[0]),
+    _LINEAR: _linear,
+    _IF: lambda a, d: a[1] if a[0] else a[2],
+    _LE: lambda a, d: a[0] <= a[1],
+    _LT: lambda a, d: a[0] < a[1],
+    _EQ: lambda a, d: a[0] == a[1],
+    _RANGED: _ranged,
+    _EXTERNAL: lambda a, d: d.evaluate(tuple(a)),
+}
+
+_batch_ops = dict(_scalar_ops)
+_batch_ops.update({
+    _UNARY: _unary_batch,
+    _IF: lambda a, d: np.where(a[0], a[1], a[2]),
+    _LE: lambda a, d: np.less_equal(a[0], a[1]),
+    _LT: lambda a, d: np.less(a[0], a[1]),
+    _EQ: lambda a, d: np.equal(a[0], a[1]),
+    _RANGED: _ranged_batch,
+    _EXTERNAL: _external_batch,
+})
+
+_numpy_unary_map = None
+
+def _numpy_unary_functions():
+    # Deferred so that importing this module does not import numpy
+    global _numpy_unary_map
+    if _numpy_unary_map is None:
+        _numpy_unary_map = {
+            'log': np.log, 'log10': np.log10, 'exp': np.exp,
+            'sqrt': np.sqrt, 'sin': np.sin, 'cos': np.cos, 'tan': np.tan,
+            'asin': np.arcsin, 'acos': np.arccos, 'atan': np.arctan,
+            'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+            'asinh': np.arcsinh, 'acosh': np.arccosh, 'atanh': np.arctanh,
+            'ceil': np.ceil, 'floor': np.floor, 'abs': np.abs,
+        }
+    return _numpy_unary_map
+
+
+def _sum_node(node):
+    return _SUM, node.args, None
+
+def _linear_node(node):
+    n = len(node.linear_vars)
+    return (_LINEAR,
+            [node.constant] + list(node.linear_coefs) + list(node.linear_vars),
+            n)
+
+def _inequality_node(node):
+    return (_LT if node._strict else _LE), node.args, None
+
+_node_handlers = {
+    _numeric_expr.SumExpressionBase: _sum_node,
+    _numeric_expr.NegationExpression: lambda node: (_NEG, node.args, None),
+    _numeric_expr.ProductExpression: lambda node: (_MUL, node.args, None),
+    _numeric_expr.DivisionExpression: lambda node: (_DIV, node.args, None),
+    _numeric_expr.ReciprocalExpression:
+        lambda node: (_RECIP, node.args, None),
+    _numeric_expr.PowExpression: lambda node: (_POW, node.args, None),
+    _numeric_expr.UnaryFunctionExpression:
+        lambda node: (_UNARY, node.args, (node._name, node._fcn)),
+    _numeric_expr.LinearExpression: _linear_node,
+    _numeric_expr.Expr_ifExpression: lambda node: (_IF, node.args, None),
+    _numeric_expr.ExternalFunctionExpression:
+        lambda node: (_EXTERNAL, node.args, node._fcn),
+    _logical_expr.InequalityExpression: _inequality_node,
+    _logical_expr.EqualityExpression: lambda node: (_EQ, node.args, None),
+    _logical_expr.RangedExpression:
+        lambda node: (_RANGED, node.args, node._strict),
+}
+
+def _get_node_handler(node):
+    cls = node.__class__
+    try:
+        return _node_handlers[cls]
+    except KeyError:
+        pass
+    for base in cls.__mro__:
+        if base in _node_handlers:
+            _node_handlers[cls] = _node_handlers[base]
+            return _node_handlers[cls]
+    raise TypeError(
+        "Expressions of type '%s' cannot be compiled into an "
+        "ExpressionTape" % (cls.__name__,))
+
+
+class ExpressionTape(object):
+    """A flat, re-evaluable representation of one or more expressions.
+
+    Every expression node is assigned a *slot*.  Leaves (variables and
+    mutable parameters) and constants are loaded into their slots
+    before evaluation; each instruction then computes one slot from
+    the values of previously computed slots.  The tape has one output
+    slot for each compiled expression.
+
+    Attributes
+    ----------
+    leaves: list
+        The ordered list of leaf components (variables and mutable
+        parameters) referenced by the compiled expressions.
+    expressions: list
+        The compiled expressions, in output order.
+    instructions: list
+        The tape instructions, as ``(opcode, out_slot, in_slots, data)``
+        tuples.
+    outputs: list
+        The slot holding the value of each compiled expression.
+    """
+
+    def __init__(self, share_subexpressions=True):
+        self.leaves = []
+        self.expressions = []
+        self.instructions = []
+        self.outputs = []
+        self.leaf_slots = []
+        self.constants = []
+        self.n_slots = 0
+        self._share = share_subexpressions
+        if share_subexpressions == 'structural':
+            from pyomo.core.expr.cse import CommonSubexpressions
+            self._cse = CommonSubexpressions()
+        else:
+            self._cse = None
+        self._output_ranges = []
+        self._leaf_map = {}
+        self._const_map = {}
+        self._memo = {}
+
+    def __len__(self):
+        return len(self.outputs)
+
+    @property
+    def n_leaves(self):
+        return len(self.leaves)
+
+    def add_expression(self, expr):
+        """Compile an expression and append it to the tape outputs.
+
+        Returns the index of the new output.
+        """
+        if not self._share:
+            self._memo = {}
+        elif self._cse is not None:
+            self._cse.add(expr)
+        start = len(self.instructions)
+        self.outputs.append(self._compile(expr))
+        self.expressions.append(expr)
+        self._output_ranges.append((start, len(self.instructions)))
+        return len(self.outputs) - 1
+
+    def output_instructions(self, i):
+        """Return the instructions that were added when compiling output i.
+
+        If the tape was built with ``share_subexpressions=False``, this
+        is exactly the set of instructions that output ``i`` depends on.
+        """
+        start, end = self._output_ranges[i]
+        return self.instructions[start:end]
+
+    def index_of(self, leaf):
+        """Return the position of a leaf component in :attr:`leaves`"""
+        return self._leaf_map[id(leaf)]
+
+    def leaf_values(self):
+        """Return the current values of all leaves as a list"""
+        return [value(leaf) for leaf in self.leaves]
+
+    def evaluate(self, values=None):
+        """Evaluate all outputs for a single point.
+
+        Args:
+            values: sequence of leaf values, ordered as :attr:`leaves`.
+                If None, the current values of the leaf components
+                are used.
+
+        Returns:
+            A list of output values.
+        """
+        slots = self.evaluate_slots(values)
+        return [slots[i] for i in self.outputs]
+
+    def evaluate_batch(self, values):
+        """Evaluate all outputs for a batch of points.
+
+        Args:
+            values: 2-D array-like with one row per leaf (ordered as
+                :attr:`leaves`) and one column per point.
+
+        Returns:
+            A ``numpy.ndarray`` with one row per output and one column
+            per point.
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2 or values.shape[0] != len(self.leaves):
+            raise ValueError(
+                "ExpressionTape.evaluate_batch: expected an array of shape "
+                "(%s, N), but received shape %s"
+                % (len(self.leaves), values.shape))
+        n = values.shape[1]
+        slots = self._load(values)
+        self._run(slots, _batch_ops)
+        ans = np.empty((len(self.outputs), n))
+        for i, s in enumerate(self.outputs):
+            ans[i, :] = slots[s]
+        return ans
+
+    def evaluate_slots(self, values=None):
+        """Evaluate the tape for a single point and return all slot values
+
+        This is primarily intended for tools (e.g., automatic
+        differentiation) that need the intermediate values computed
+        by every instruction.
+        """
+        if values is None:
+            values = self.leaf_values()
+        slots = self._load(values)
+        self._run(slots, _scalar_ops)
+        return slots
+
+    def _load(self, values):
+        slots = [None]*self.n_slots
+        for s, val in self.constants:
+            slots[s] = val
+        for s, val in zip(self.leaf_slots, values):
+            slots[s] = val
+        return slots
+
+    def _run(self, slots, ops):
+        for op, out, args, data in self.instructions:
+            slots[out] = ops[op]([slots[i] for i in args], data)
+
+    def _new_slot(self):
+        self.n_slots += 1
+        return self.n_slots - 1
+
+    def _terminal_slot(self, node):
+        """Return the slot for a leaf, constant or previously compiled node
+
+        Returns None if the node is an expression that still needs to
+        be compiled.
+        """
+        if node.__class__ in native_types:
+            return self._constant_slot(node)
+        _id = id(node)
+        if _id in self._leaf_map:
+            return self.leaf_slots[self._leaf_map[_id]]
+        if node.is_expression_type():
+            return self._memo.get(self._memo_key(node), None)
+        if not node.is_numeric_type():
+            raise TypeError(
+                "Non-numeric component '%s' cannot be compiled into an "
+                "ExpressionTape" % (node,))
+        if node.is_constant():
+            return self._constant_slot(value(node))
+        s = self._new_slot()
+        self._leaf_map[_id] = len(self.leaves)
+        self.leaves.append(node)
+        self.leaf_slots.append(s)
+        return s
+
+    def _constant_slot(self, val):
+        try:
+            return self._const_map[val]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable "constants" are not shared
+            s = self._new_slot()
+            self.constants.append((s, val))
+            return s
+        s = self._new_slot()
+        self.constants.append((s, val))
+        self._const_map[val] = s
+        return s
+
+    def _memo_key(self, node):
+        if self._cse is not None:
+            cid = self._cse.canonical_id(node)
+            if cid is not None:
+                return cid, None
+        return id(node)
+
+    def _children(self, node):
+        if node.is_named_expression_type():
+            return None, node.args, None
+        return _get_node_handler(node)(node)
+
+    def _compile(self, expr):
+        ans = self._terminal_slot(expr)
+        if ans is not None:
+            return ans
+        # Iterative post-order walk (expression trees can be deeper
+        # than the Python recursion limit)
+        stack = [(expr,) + self._children(expr) + ([],)]
+        while 1:
+            node, op, args, data, slots = stack[-1]
+            if len(slots) < len(args):
+                child = args[len(slots)]
+                s = self._terminal_slot(child)
+                if s is None:
+                    stack.append((child,) + self._children(child) + ([],))
+                else:
+                    slots.append(s)
+                continue
+            stack.pop()
+            if op is None:
+                # Named expressions simply pass their value through
+                s = slots[0]
+            else:
+                s = self._new_slot()
+                self.instructions.append((op, s, tuple(slots), data))
+            self._memo[self._memo_key(node)] = s
+            if not stack:
+                return s
+            stack[-1][4].append(s)
+
+
+def compile_expressions(exprs, share_subexpressions=True):
+    """Compile a sequence of expressions into an :class:`ExpressionTape`
+
+    Args:
+        exprs: an iterable of expressions (or leaf components / constants)
+        share_subexpressions (bool or str): if True (the default),
+            expression nodes (including named Expression components)
+            that appear in more than one output are computed only once.
+            If 'structural', all structurally identical subexpressions
+            (see :class:`~pyomo.core.expr.cse.CommonSubexpressions`)
+            are computed only once, even when they are different
+            objects.  If False, every output gets its own copy of the
+            instructions it depends on (leaves and constants are always
+            shared).
+
+    Returns:
+        ExpressionTape
+    """
+    tape = ExpressionTape(share_subexpressions)
+    for expr in exprs:
+        tape.add_expression(expr)
+    return tape
+
+
+def compile_constraint_bodies(block, active=True, descend_into=True,
+                              share_subexpressions=True):
+    """Compile the bodies of all constraints on a block
+
+    Returns:
+        A tuple ``(constraints, tape)``, where ``constraints`` is the
+        list of constraint data objects (in the order returned by
+        ``component_data_objects``) and ``tape`` is the
+        :class:`ExpressionTape` whose outputs are the constraint bodies.
+    """
+    from pyomo.core.base.constraint import Constraint
+    constraints = list(block.component_data_objects(
+        Constraint, active=active, descend_into=descend_into))
+    tape = compile_expressions((c.body for c in constraints),
+                               share_subexpressions=share_subexpressions)
+    return constraints, tape
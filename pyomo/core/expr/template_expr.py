@@ -9,24 +9,60 @@
 #  ___________________________________________________________________________
 
 import copy
+import functools
 import itertools
 import logging
+import operator
 import sys
+from contextlib import contextmanager
+from itertools import islice
 from six import itervalues
 from six.moves import builtins
 
 from pyomo.core.expr.expr_errors import TemplateExpressionError
 from pyomo.core.expr.numvalue import (
-    NumericValue, native_types, nonpyomo_leaf_types,
+    NumericValue, native_types, native_numeric_types, nonpyomo_leaf_types,
     as_numeric, value,
 )
-from pyomo.core.expr.numeric_expr import ExpressionBase, SumExpression
+from pyomo.core.expr.numeric_expr import (
+    ExpressionBase, SumExpression, NPV_SumExpression, ProductExpression,
+    NPV_ProductExpression, MonomialTermExpression, DivisionExpression,
+    NPV_DivisionExpression, ReciprocalExpression, NPV_ReciprocalExpression,
+    PowExpression, NPV_PowExpression, NegationExpression,
+    NPV_NegationExpression, UnaryFunctionExpression,
+    NPV_UnaryFunctionExpression, AbsExpression, NPV_AbsExpression,
+    _MutableSumExpression, _balanced_parens, _process_arg,
+    _generate_intrinsic_function_expression,
+)
+from pyomo.core.expr.logical_expr import (
+    EqualityExpression, InequalityExpression, RangedExpression,
+    _chainedInequality,
+)
 from pyomo.core.expr.visitor import (
     ExpressionReplacementVisitor, StreamBasedExpressionVisitor
 )
 
 logger = logging.getLogger(__name__)
 
+
+@contextmanager
+def _suppress_core_logging():
+    # Evaluating template expressions generates (expected) errors
+    # that are logged by pyomo.core (e.g., by value()).  Silence them by
+    # raising the level of the 'pyomo.core' logger (instead of disabling
+    # logging for the whole process).
+    core_logger = logging.getLogger('pyomo.core')
+    level = core_logger.level
+    core_logger.setLevel(logging.CRITICAL + 1)
+    try:
+        yield
+    finally:
+        core_logger.setLevel(level)
+
+_relational_expr_types = (
+    EqualityExpression, InequalityExpression, RangedExpression,
+)
+
 class _NotSpecified(object): pass
 
 class GetItemExpression(ExpressionBase):
@@ -311,6 +347,11 @@ class TemplateSumExpression(ExpressionBase):
             state[i] = getattr(self, i)
         return state
 
+    def __deepcopy__(self, memo):
+        # The args are generated from the iterators, so the node
+        # cannot be rebuilt from them; always copy the full state
+        return self._deepcopy_state(memo)
+
     def getname(self, *args, **kwds):
         return "SUM"
 
@@ -571,8 +612,8 @@ class _GetItemIndexer(object):
         _hash = [ id(self._base) ]
         for x in expr.args[1:]:
             try:
-                logging.disable(logging.CRITICAL)
-                val = value(x)
+                with _suppress_core_logging():
+                    val = value(x)
                 self._args.append(val)
                 _hash.append(val)
             except TemplateExpressionError as e:
@@ -584,8 +625,6 @@ class _GetItemIndexer(object):
                         % ( expr, ))
                 self._args.append(e.template)
                 _hash.append(id(e.template._set))
-            finally:
-                logging.disable(logging.NOTSET)
 
         self._hash = tuple(_hash)
 
@@ -786,3 +825,376 @@ def templatize_rule(block, rule, index_set):
 
 def templatize_constraint(con):
     return templatize_rule(con.parent_block(), con.rule, con.index_set())
+
+
+def _replay_sum(node, args):
+    if len(args) < 2:
+        return functools.reduce(operator.add, args)
+    ans = args[0] + args[1]
+    if ans.__class__ is not SumExpression or ans._shared_args:
+        return functools.reduce(operator.add, args[2:], ans)
+    # Adding to an (unshared) SumExpression simply appends the new
+    # argument (see SumExpression.add): build the argument list
+    # directly instead of generating (and discarding) a new
+    # SumExpression for every term.
+    terms = ans._args_[:ans._nargs]
+    for arg in args[2:]:
+        if arg.__class__ in native_numeric_types:
+            if arg == 0:
+                continue
+        elif not (arg.__class__ in native_types or arg.is_expression_type()):
+            arg = _process_arg(arg)
+        if arg.__class__ is SumExpression \
+           or arg.__class__ is _MutableSumExpression:
+            terms.extend(islice(arg._args_, arg._nargs))
+        else:
+            terms.append(arg)
+    return SumExpression(terms)
+
+def _replay_unary(node, args):
+    return _generate_intrinsic_function_expression(
+        args[0], node._name, node._fcn)
+
+def _replay_inequality(node, args):
+    if node._strict:
+        return args[0] < args[1]
+    return args[0] <= args[1]
+
+def _template_sum(terms):
+    # Equivalent to calling the builtin sum() on the list of terms
+    return _replay_sum(None, [0] + terms)
+
+# Functions that rebuild an expression node by re-applying the operator
+# (so that the result is identical to what operator overloading would
+# have generated when the rule was called for a concrete index)
+_template_replay = {
+    SumExpression: _replay_sum,
+    NPV_SumExpression: _replay_sum,
+    ProductExpression: lambda node, args: args[0] * args[1],
+    NPV_ProductExpression: lambda node, args: args[0] * args[1],
+    MonomialTermExpression: lambda node, args: args[0] * args[1],
+    DivisionExpression: lambda node, args: args[0] / args[1],
+    NPV_DivisionExpression: lambda node, args: args[0] / args[1],
+    ReciprocalExpression: lambda node, args: 1 / args[0],
+    NPV_ReciprocalExpression: lambda node, args: 1 / args[0],
+    PowExpression: lambda node, args: args[0] ** args[1],
+    NPV_PowExpression: lambda node, args: args[0] ** args[1],
+    NegationExpression: lambda node, args: -args[0],
+    NPV_NegationExpression: lambda node, args: -args[0],
+    UnaryFunctionExpression: _replay_unary,
+    NPV_UnaryFunctionExpression: _replay_unary,
+    AbsExpression: lambda node, args: abs(args[0]),
+    NPV_AbsExpression: lambda node, args: abs(args[0]),
+    InequalityExpression: _replay_inequality,
+    EqualityExpression: lambda node, args: args[0] == args[1],
+}
+
+
+class _ExpressionInstantiator(object):
+    """Instantiate a general expression node from its argument values
+
+    Operator overloading generates different nodes depending on the
+    types of the arguments (e.g., "2*x[i]" is a MonomialTermExpression
+    and "0 + x[i]" is simply "x[i]").  If the type of any argument
+    differs from the corresponding template argument (e.g., a
+    GetItemExpression that resolved to a Var), we re-apply the operator.
+    Otherwise, the node is created directly.
+
+    The first call records whether the node can be created directly
+    for every index (see :py:attr:`direct`): this is the case if all
+    index-dependent arguments always resolve to objects of the same
+    type (i.e., are "stable") and re-applying the operator simply
+    created a node from the arguments.
+    """
+    __slots__ = ('node', 'dynamic', 'types', 'replay', 'relational',
+                 'stable_args', 'direct', 'stable', 'first')
+
+    def __init__(self, node, dynamic, arg_stability):
+        self.node = node
+        self.dynamic = dynamic
+        self.types = [arg.__class__ for arg in node.args]
+        self.replay = _template_replay.get(node.__class__, None)
+        self.relational = isinstance(node, _relational_expr_types)
+        # For each index-dependent argument, either a bool or the
+        # _ExpressionInstantiator that creates the argument
+        self.stable_args = arg_stability
+        # The function that creates the node directly from the
+        # argument values (or None)
+        self.direct = None
+        # True if the resulting node is always of the same type
+        self.stable = False
+        self.first = True
+
+    def __call__(self, args):
+        types = self.types
+        changed = False
+        for i in self.dynamic:
+            if args[i].__class__ is not types[i]:
+                changed = True
+                break
+        if changed and self.replay is not None:
+            ans = self.replay(self.node, args)
+            if self.first:
+                self.first = False
+                if self._stable_args() \
+                   and ans.__class__ not in native_types \
+                   and ans.is_expression_type() \
+                   and ans.nargs() == len(args) \
+                   and all(a is b for a, b in zip(ans.args, args)):
+                    self.direct = ans.create_node_with_local_data
+                    self.stable = True
+            return ans
+        if self.first:
+            self.first = False
+            if self._stable_args():
+                self.direct = self.node.create_node_with_local_data
+                self.stable = True
+        if self.relational:
+            args = [as_numeric(a) if a.__class__ in native_types else a
+                    for a in args]
+        return self.node.create_node_with_local_data(tuple(args))
+
+    def _stable_args(self):
+        return all(x if x.__class__ is bool else x.stable
+                   for x in self.stable_args)
+
+
+class _TemplateCompiler(object):
+    """Generate the Python source for instantiating a template expression
+
+    The generated function takes the values of the (component)
+    IndexTemplates as arguments and returns the concrete expression.
+    Subtrees that do not depend on any IndexTemplate are shared by all
+    instantiated expressions.
+    """
+
+    def __init__(self, template, indices):
+        self.template = template
+        self.indices = indices
+        self.env = {'_template_sum': _template_sum}
+        self.names = {}
+        self.n_iters = 0
+        # id(node) -> bool (for GetItemExpression, IndexTemplate, and
+        # TemplateSumExpression nodes) or the _ExpressionInstantiator
+        # (for general expression nodes)
+        self.stable = {}
+        for i, idx in enumerate(indices):
+            self.names[id(idx)] = '_i%d' % (i,)
+        dynamic, self.body = self._emit(template)
+        self.dynamic = dynamic
+
+    def generate(self):
+        """Return the function that instantiates the template"""
+        src = "def _instantiate(%s):\n    return %s\n" % (
+            ', '.join(self.names[id(idx)] for idx in self.indices),
+            self._emit(self.template)[1])
+        env = dict(self.env)
+        exec(src, env)
+        return env['_instantiate']
+
+    def _const(self, obj):
+        name = '_c%d' % (len(self.env),)
+        self.env[name] = obj
+        return name
+
+    def _emit(self, node):
+        """Return ``(dynamic, code)`` for a node"""
+        if node.__class__ in native_types:
+            return False, self._const(node)
+        if node.__class__ is IndexTemplate:
+            if id(node) not in self.names:
+                raise TemplateExpressionError(
+                    node, "IndexTemplate %s is not defined in this "
+                    "context" % (node,))
+            self.stable[id(node)] = False
+            return True, self.names[id(node)]
+        if not node.is_expression_type():
+            return False, self._const(node)
+        if node.__class__ is TemplateSumExpression:
+            return True, self._emit_sum(node)
+        if node.__class__ is GetAttrExpression:
+            dynamic, base = self._emit(node.arg(0))
+            if not dynamic:
+                return False, self._const(node)
+            self.stable[id(node)] = False
+            return True, "getattr(%s, %s)" % (base, self._const(node.arg(1)))
+        if not node.nargs():
+            # Nodes that store their "arguments" as local data (e.g.,
+            # LinearExpression) cannot be instantiated by substituting
+            # their arguments
+            if any(x.__class__ not in native_types and x.is_expression_type()
+                   for x in getattr(node, 'linear_vars', ())):
+                raise TemplateExpressionError(
+                    None, "Cannot instantiate template node %s"
+                    % (type(node).__name__,))
+            return False, self._const(node)
+
+        args = node.args
+        children = [self._emit(arg) for arg in args]
+        dynamic = [i for i, c in enumerate(children) if c[0]]
+        if not dynamic:
+            return False, self._const(node)
+        code = [c[1] for c in children]
+
+        if node.__class__ is GetItemExpression:
+            base = args[0]
+            if 0 in dynamic:
+                stable = False
+            else:
+                from pyomo.core.base.var import IndexedVar
+                from pyomo.core.base.param import IndexedParam
+                stable = isinstance(base, IndexedVar) or (
+                    isinstance(base, IndexedParam) and base.mutable)
+            self.stable[id(node)] = stable
+            return True, "%s[%s]" % (code[0], ', '.join(code[1:]))
+
+        inst = self.stable.get(id(node), None)
+        if inst is None:
+            inst = self.stable[id(node)] = _ExpressionInstantiator(
+                node, dynamic, [self.stable[id(args[i])] for i in dynamic])
+        if inst.direct is not None:
+            name = self._const(inst.direct)
+            return True, "%s((%s,))" % (name, ', '.join(code))
+        name = self._const(inst)
+        return True, "%s([%s])" % (name, ', '.join(code))
+
+    def _emit_sum(self, node):
+        # Note: by definition, all _set pointers within an itergroup
+        # point to the same Set
+        loops = []
+        for iterGroup in node._iters:
+            names = []
+            for it in iterGroup:
+                self.n_iters += 1
+                self.names[id(it)] = '_s%d' % (self.n_iters,)
+                names.append(self.names[id(it)])
+            _set = iterGroup[0]._set
+            if _set.__class__ in native_types or \
+               not _set.is_expression_type():
+                set_code = self._const(_set)
+            else:
+                set_code = self._emit(_set)[1]
+            if len(names) == 1:
+                loops.append("for %s in %s" % (names[0], set_code))
+            else:
+                loops.append("for (%s) in %s" % (', '.join(names), set_code))
+        dynamic, term = self._emit(node._local_args_[0])
+        self.stable[id(node)] = False
+        return "_template_sum([%s %s])" % (term, ' '.join(loops))
+
+
+def compile_template(template, indices):
+    """Compile a template expression into an instantiation function
+
+    This takes a template expression (and the IndexTemplates for the
+    component index), as returned by :py:func:`templatize_rule`, and
+    returns a function that maps a concrete index to the concrete
+    expression for that index.  This is equivalent to (but much faster
+    than) setting the IndexTemplate values and calling
+    :py:func:`resolve_template`: subtrees that do not depend on the
+    index are shared by all instantiated expressions, and the remaining
+    nodes are created by a generated Python function that (after the
+    first index) bypasses operator overloading wherever the node types
+    do not depend on the index values.
+
+    """
+    if type(template) is tuple:
+        parts = [compile_template(x, indices) for x in template]
+        return lambda index: tuple(f(index) for f in parts)
+    compiler = _TemplateCompiler(template, indices)
+    if not compiler.dynamic:
+        return lambda index: template
+    state = [None]
+    def _instantiate(index):
+        fcn = state[0]
+        if fcn is None:
+            # The first call determines which nodes can be created
+            # directly; regenerate the function afterwards
+            ans = _call(compiler.generate(), index)
+            state[0] = compiler.generate()
+            return ans
+        return _call(fcn, index)
+    if len(indices) == 1:
+        _call = lambda f, index: f(index)
+    else:
+        _call = lambda f, index: f(*index)
+    return _instantiate
+
+
+def _template_rule_str(val):
+    if type(val) is tuple:
+        return tuple(str(x) for x in val)
+    return str(val)
+
+
+def template_rule_values(block, rule, index_set, verify=True):
+    """Generate the values of an indexed rule using a template expression
+
+    This generator calls `rule` once with IndexTemplate arguments to
+    create a template expression, and then yields ``(index, value)``
+    tuples for every index in `index_set` by instantiating the template
+    (see :py:func:`compile_template`).  If the rule cannot be
+    templatized (for example, because it branches on the index value
+    or explicitly loops over a Set), this falls back to calling the
+    rule for every index.
+
+    If `verify` is True, the instantiated expressions for the first and
+    last index are compared against the result of calling the rule
+    directly, and the rule is called for every index if they differ
+    (this catches rules whose control flow depends on the index in
+    ways that do not raise exceptions, e.g., ``if i in some_list``).
+
+    """
+    instantiate = None
+    error = None
+    _indices = list(index_set)
+    if _indices:
+        try:
+            with _suppress_core_logging():
+                template, indices = templatize_rule(block, rule, index_set)
+                if _chainedInequality.prev is not None:
+                    # The rule evaluated a relational expression involving
+                    # the IndexTemplates in a Boolean context (i.e., it
+                    # branched on the index value)
+                    raise TemplateExpressionError(
+                        None, "Rule branches on the index value")
+                if not (type(template) is tuple or (
+                        hasattr(template, 'is_expression_type')
+                        and template.is_expression_type())):
+                    # e.g., rules returning Constraint.Skip
+                    raise TemplateExpressionError(
+                        None, "Rule did not return an expression")
+                instantiate = compile_template(template, indices)
+        except Exception:
+            error = sys.exc_info()[1]
+            instantiate = None
+        finally:
+            _chainedInequality.prev = None
+            _chainedInequality.call_info = None
+        if error is not None:
+            logger.debug(
+                "Rule '%s' could not be converted to a template "
+                "expression: falling back on calling the rule for each "
+                "index\n\t%s" % (getattr(rule, '__name__', rule), error))
+
+    if instantiate is not None and verify:
+        for index in _indices[:1] + _indices[1:][-1:]:
+            try:
+                ans = _template_rule_str(instantiate(index))
+            except Exception:
+                ans = None
+            if ans != _template_rule_str(rule(block, index)):
+                logger.debug(
+                    "The template expression for rule '%s' does not "
+                    "match the rule for index %s: falling back on "
+                    "calling the rule for each index"
+                    % (getattr(rule, '__name__', rule), index))
+                instantiate = None
+                break
+
+    if instantiate is None:
+        for index in _indices:
+            yield index, rule(block, index)
+    else:
+        for index in _indices:
+            yield index, instantiate(index)
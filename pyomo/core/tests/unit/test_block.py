@@ -1931,6 +1931,73 @@ class TestBlock(unittest.TestCase):
             sorted(id(x) for x in (n.x, n.y[1], n.b.x, n.b.y[1])),
         )
 
+    def test_ctype_index(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.c = Constraint([1, 2, 3], rule=lambda m, i: m.x[1] >= i)
+        m.b = Block([1, 2])
+        m.b[1].c = Constraint(expr=m.x[2] <= 5)
+        m.b[2].c = Constraint(expr=m.x[2] <= 6)
+
+        def _check(*args, **kwds):
+            m.disable_ctype_index()
+            ref = list(m.component_data_objects(*args, **kwds))
+            m.enable_ctype_index()
+            self.assertEqual(
+                [id(_) for _ in m.component_data_objects(*args, **kwds)],
+                [id(_) for _ in ref])
+            return ref
+
+        m.enable_ctype_index()
+        ans = list(m.component_data_objects(Constraint, active=True))
+        self.assertEqual(ans, [m.c[1], m.c[2], m.c[3], m.b[1].c, m.b[2].c])
+        # Repeated queries are served from the cache
+        self.assertIs(
+            m._ctype_index.data[(Constraint, True, False, True, None)],
+            m._ctype_index.lookup(
+                (Constraint, True, False, True, None), None))
+
+        m.c[2].deactivate()
+        self.assertEqual(_check(Constraint, active=True),
+                         [m.c[1], m.c[3], m.b[1].c, m.b[2].c])
+        m.b[2].deactivate()
+        self.assertEqual(_check(Constraint, active=True),
+                         [m.c[1], m.c[3], m.b[1].c])
+        m.b[2].activate()
+        del m.c[3]
+        self.assertEqual(_check(Constraint, active=True),
+                         [m.c[1], m.b[1].c, m.b[2].c])
+        m.b[1].d = Constraint(expr=m.x[1] <= 1)
+        self.assertEqual(_check([Constraint], active=True, sort=True),
+                         [m.c[1], m.b[1].c, m.b[1].d, m.b[2].c])
+        m.b[1].del_component(m.b[1].c)
+        self.assertEqual(_check((Constraint, Var), descend_into=False),
+                         [m.x[1], m.x[2], m.c[1], m.c[2]])
+        m.y = Var([3], dense=False)
+        self.assertEqual(_check(Var), [m.x[1], m.x[2]])
+        m.y.add(3)
+        self.assertEqual(_check(Var), [m.x[1], m.x[2], m.y[3]])
+        m.b[2].c.set_value(Constraint.Skip)
+        self.assertEqual(_check(Constraint), [m.c[1], m.c[2], m.b[1].d])
+        self.assertEqual(
+            _check(Constraint, sort=SortComponents.deterministic,
+                   descend_into=[Block]),
+            [m.c[1], m.c[2], m.b[1].d])
+
+        m.disable_ctype_index()
+        self.assertIsNone(m._ctype_index)
+
+    def test_ctype_index_clone(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.enable_ctype_index()
+        self.assertEqual(list(m.component_data_objects(Var)),
+                         [m.x[1], m.x[2]])
+        n = m.clone()
+        self.assertEqual(n._ctype_index.data, {})
+        self.assertEqual(list(n.component_data_objects(Var)),
+                         [n.x[1], n.x[2]])
+
     def test_clone_model(self):
         m = ConcreteModel()
         m.x = Var()
@@ -2002,6 +2069,44 @@ class TestBlock(unittest.TestCase):
             sorted(id(x) for x in (n.x, n.y[1], n.b.x, n.b.y[1])),
         )
 
+    def test_clone_share_expressions(self):
+        m = ConcreteModel()
+        m.z = Var(initialize=1)
+        m.b = Block()
+        m.b.x = Var([1, 2], initialize=2)
+        m.b.p = Param([1, 2], mutable=True, initialize=3)
+        m.b.e = Expression(expr=m.b.x[1] + m.b.x[2])
+        external = (m.z + 1)**2
+        m.b.c = Constraint(
+            expr=m.b.p[1]*m.b.x[1] + external + m.b.e <= 10)
+        m.b.o = Objective(expr=sum_product(m.b.p, m.b.x))
+        with EXPR.linear_expression() as e:
+            e += 2*m.b.x[1] + m.b.x[2] + m.z
+        m.b.l = Constraint(expr=e >= 1)
+        m.b.body = m.b.c.body
+
+        n = m.b.clone(share_expressions=True)
+        for b in (m.b, n):
+            self.assertEqual(value(b.c.body), 6 + 4 + 4)
+            self.assertEqual(value(b.o), 12)
+            self.assertEqual(value(b.l.body), 7)
+        # Only the external subtree is shared
+        self.assertIs(n.c.body.arg(1), external)
+        self.assertIsNot(n.c.body, m.b.c.body)
+        self.assertIs(n.body, n.c.body)
+        self.assertEqual(
+            sorted(id(v) for v in EXPR.identify_variables(n.c.body)),
+            sorted(id(v) for v in (n.x[1], n.x[2], m.z)))
+        self.assertIs(n.c.body.arg(2), n.e)
+        self.assertIs(n.l.body.__class__, m.b.l.body.__class__)
+        self.assertEqual([id(v) for v in n.l.body.linear_vars],
+                         [id(n.x[1]), id(n.x[2]), id(m.z)])
+
+        n.p[1] = 4
+        n.x[2] = 0
+        self.assertEqual(value(n.c.body), 8 + 4 + 2)
+        self.assertEqual(value(m.b.c.body), 6 + 4 + 4)
+
     def test_clone_subblock(self):
         m = ConcreteModel()
         m.x = Var()
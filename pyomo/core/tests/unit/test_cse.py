@@ -0,0 +1,100 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+
+from pyomo.environ import (
+    ConcreteModel, Var, Param, Expression, exp, log, sin,
+)
+from pyomo.core.expr.cse import (
+    CommonSubexpressions, find_common_subexpressions,
+)
+
+
+class TestCommonSubexpressions(unittest.TestCase):
+
+    def test_structural_identity(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        m.p = Param(mutable=True, initialize=2)
+        e1 = exp(sum(m.p*m.x[i] for i in m.x)) + m.x[1]
+        e2 = log(sum(m.p*m.x[i] for i in m.x)) - m.x[2]
+        cse, roots = find_common_subexpressions([e1, e2])
+        self.assertNotEqual(roots[0], roots[1])
+        s1 = e1.arg(0).arg(0)
+        s2 = e2.arg(0).arg(0)
+        self.assertIsNot(s1, s2)
+        self.assertEqual(cse.canonical_id(s1), cse.canonical_id(s2))
+        self.assertEqual(cse.reference_count(cse.canonical_id(s1)), 2)
+        # Only the sum is shared: the products within it are
+        # referenced once in the hash-consed DAG
+        self.assertEqual(cse.shared(), [cse.canonical_id(s1)])
+
+    def test_leaves_and_constants(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.q = Param(initialize=3)
+        cse = CommonSubexpressions()
+        self.assertIsNone(cse.add(m.x[1]))
+        self.assertIsNone(cse.add(5))
+        # Immutable params are compared by value
+        a = cse.add(m.q*m.x[1])
+        self.assertEqual(cse.add(3*m.x[1]), a)
+        self.assertNotEqual(cse.add(3*m.x[2]), a)
+        self.assertNotEqual(cse.add(m.x[1]/3), a)
+        # Different unary functions are different subexpressions
+        self.assertNotEqual(cse.add(exp(m.x[1])), cse.add(log(m.x[1])))
+
+    def test_named_expressions(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.e = Expression(expr=m.x[1]*m.x[2])
+        m.f = Expression(expr=m.x[1])
+        cse = CommonSubexpressions()
+        a = cse.add(sin(m.e))
+        b = cse.add(sin(m.x[1]*m.x[2]))
+        self.assertEqual(a, b)
+        self.assertEqual(cse.canonical_id(m.e),
+                         cse.canonical_id(m.e.expr))
+        self.assertFalse(
+            cse.representative(cse.canonical_id(m.e)).is_named_expression_type())
+        # A named expression wrapping a leaf is the leaf
+        self.assertEqual(cse.add(sin(m.f)), cse.add(sin(m.x[1])))
+
+    def test_propagate(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        shared = m.x[1]*m.x[2]
+        cse = CommonSubexpressions()
+        c = cse.add(exp(shared))
+        s = sin(m.x[1])
+        cse.add(s)
+        o = cse.add(log(m.x[1]*m.x[2]) + s)
+        flags = cse.propagate([(c, 1), (o, 2)])
+        self.assertEqual(flags[cse.canonical_id(shared)], 3)
+        self.assertEqual(flags[c], 1)
+        self.assertEqual(flags[o], 2)
+        self.assertEqual(flags[cse.canonical_id(s)], 2)
+
+    def test_deep_expression(self):
+        m = ConcreteModel()
+        m.x = Var()
+        e1 = m.x
+        e2 = m.x
+        for i in range(5000):
+            e1 = 1 + e1*2
+            e2 = 1 + e2*2
+        cse, roots = find_common_subexpressions([e1, e2])
+        self.assertEqual(roots[0], roots[1])
+        self.assertEqual(len(cse), 10000)
+
+
+if __name__ == "__main__":
+    unittest.main()
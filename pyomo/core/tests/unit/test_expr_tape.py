@@ -0,0 +1,162 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.environ import (
+    ConcreteModel, Var, Param, Expression, Constraint, BooleanVar, Block,
+    value, exp, log, sin, sqrt, Expr_if, inequality,
+)
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.core.expr.tape import (
+    ExpressionTape, compile_expressions, compile_constraint_bodies,
+)
+
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3], initialize=lambda m, i: 0.5*i)
+    m.p = Param(mutable=True, initialize=2)
+    m.q = Param(initialize=3)
+    m.e = Expression(expr=sum(m.p*m.x[i] for i in m.x))
+    m.c1 = Constraint(expr=exp(m.e) + m.x[1]**2 <= 10)
+    m.c2 = Constraint(
+        expr=Expr_if(IF=m.x[1] <= 1, THEN=m.e, ELSE=-m.e/m.x[2]) == 0)
+    m.c3 = Constraint(expr=LinearExpression(
+        constant=1, linear_coefs=[m.p, m.q],
+        linear_vars=[m.x[1], m.x[3]]) >= 0)
+    m.b = Block()
+    m.b.c4 = Constraint(expr=inequality(0, log(m.x[3]) + sin(m.x[2])
+                                           - sqrt(m.x[1])/m.q, 5))
+    return m
+
+
+class TestExpressionTape(unittest.TestCase):
+
+    def test_evaluate_current_values(self):
+        m = _model()
+        cons, tape = compile_constraint_bodies(m)
+        self.assertEqual(cons, [m.c1, m.c2, m.c3, m.b.c4])
+        self.assertEqual(len(tape), 4)
+        for c, v in zip(cons, tape.evaluate()):
+            self.assertAlmostEqual(v, value(c.body))
+
+    def test_leaves(self):
+        m = _model()
+        tape = compile_expressions([m.c1.body, m.c3.body])
+        # leaves are ordered by first appearance; immutable params
+        # are treated as constants
+        self.assertEqual(tape.leaves, [m.p, m.x[1], m.x[2], m.x[3]])
+        self.assertEqual(tape.n_leaves, 4)
+        self.assertEqual(tape.index_of(m.x[2]), 2)
+        self.assertEqual(tape.leaf_values(), [2, 0.5, 1, 1.5])
+
+    def test_evaluate_new_values(self):
+        m = _model()
+        cons, tape = compile_constraint_bodies(m)
+        vals = [3, 1.5, 0.25, 2]
+        ans = tape.evaluate(vals)
+        for leaf, v in zip(tape.leaves, vals):
+            leaf.value = v
+        # The Expr_if in c2 switches branches
+        for c, v in zip(cons, ans):
+            self.assertAlmostEqual(v, value(c.body))
+
+    def test_shared_named_expression(self):
+        m = _model()
+        tape = compile_expressions([m.e, m.c1.body, m.c2.body])
+        n_shared = len(tape.instructions)
+        tape = compile_expressions([m.e, m.c1.body, m.c2.body],
+                                   share_subexpressions=False)
+        self.assertGreater(len(tape.instructions), n_shared)
+        # Without sharing, each output carries all of its instructions
+        self.assertEqual(
+            sum(len(tape.output_instructions(i)) for i in range(3)),
+            len(tape.instructions))
+        self.assertAlmostEqual(tape.evaluate()[0], value(m.e))
+
+    def test_structural_sharing(self):
+        m = _model()
+        exprs = [exp(sum(m.p*m.x[i] for i in m.x)) + m.x[1],
+                 sin(sum(m.p*m.x[i] for i in m.x)) - m.x[2]]
+        n_identity = len(compile_expressions(exprs).instructions)
+        tape = compile_expressions(exprs, share_subexpressions='structural')
+        # The sum (and the three products) are only computed once
+        self.assertEqual(len(tape.instructions), n_identity - 4)
+        for e, v in zip(exprs, tape.evaluate()):
+            self.assertAlmostEqual(v, value(e))
+
+    def test_leaf_and_constant_outputs(self):
+        m = _model()
+        tape = compile_expressions([m.x[1], 5, m.q])
+        self.assertEqual(tape.evaluate(), [0.5, 5, 3])
+        self.assertEqual(tape.instructions, [])
+
+    def test_deep_expression(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=1)
+        e = m.x
+        for i in range(5000):
+            e = 1 + e*1
+        tape = compile_expressions([e])
+        self.assertEqual(tape.evaluate(), [5001])
+
+    def test_unsupported(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.y = BooleanVar()
+        from pyomo.core.expr.logical_expr import AndExpression
+        with self.assertRaisesRegex(
+                TypeError, "Expressions of type 'AndExpression' cannot be "
+                "compiled into an ExpressionTape"):
+            compile_expressions([AndExpression([m.x[1], m.x[2]])])
+        with self.assertRaisesRegex(
+                TypeError, "Non-numeric component 'y' cannot be compiled"):
+            compile_expressions([m.y])
+
+    def test_evaluate_uninitialized(self):
+        m = ConcreteModel()
+        m.x = Var()
+        tape = compile_expressions([m.x + 1])
+        with self.assertRaisesRegex(ValueError, "No value for uninit"):
+            tape.evaluate()
+        self.assertEqual(tape.evaluate([2]), [3])
+
+    @unittest.skipUnless(numpy_available, "NumPy is not available")
+    def test_evaluate_batch(self):
+        m = _model()
+        cons, tape = compile_constraint_bodies(m)
+        points = np.array([[2, 3, 1, 0.5],
+                           [0.5, 1.5, 0.2, 2],
+                           [1, 0.25, 2, 1.5],
+                           [1.5, 2, 3, 0.75]])
+        ans = tape.evaluate_batch(points)
+        self.assertEqual(ans.shape, (4, 4))
+        for j in range(points.shape[1]):
+            for leaf, v in zip(tape.leaves, points[:, j]):
+                leaf.value = float(v)
+            for i, c in enumerate(cons):
+                self.assertAlmostEqual(ans[i, j], value(c.body))
+        # The input array is not modified
+        self.assertEqual(points[0].tolist(), [2, 3, 1, 0.5])
+
+    @unittest.skipUnless(numpy_available, "NumPy is not available")
+    def test_evaluate_batch_bad_shape(self):
+        m = _model()
+        cons, tape = compile_constraint_bodies(m)
+        with self.assertRaisesRegex(ValueError, r"expected an array of "
+                                    r"shape \(4, N\), but received "
+                                    r"shape \(3, 2\)"):
+            tape.evaluate_batch(np.ones((3, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+
+from pyomo.common.dependencies import (
+    numpy as np, numpy_available, scipy_available,
+)
+import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.core.expr.calculus.diff_with_pyomo import (
+    reverse_ad, DifferentiationException,
+)
+from pyomo.core.expr.calculus.model_derivatives import ModelDerivatives
+
+
+def _model():
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var([1, 2, 3], initialize=lambda m, i: 0.5*i + 0.3)
+    m.y = pyo.Var(initialize=4)
+    m.y.fix()
+    m.p = pyo.Param(mutable=True, initialize=2)
+    m.e = pyo.Expression(expr=sum(m.p*m.x[i]*m.x[1] for i in m.x))
+    m.c1 = pyo.Constraint(
+        expr=pyo.exp(m.e)/m.x[2] + m.x[1]**m.x[3] - m.y*m.x[2] <= 10)
+    m.c2 = pyo.Constraint(
+        expr=pyo.log(m.x[2])*pyo.sin(m.x[3]) + 1/m.x[1] + m.x[2]**2.5 == 0)
+    m.c3 = pyo.Constraint(expr=LinearExpression(
+        constant=1, linear_coefs=[m.p, 3], linear_vars=[m.x[1], m.x[3]]) >= 0)
+    m.c4 = pyo.Constraint(expr=m.x[3] >= 0)
+    m.o = pyo.Objective(
+        expr=pyo.sqrt(m.x[1]*m.x[2]) + pyo.atan(m.x[3])*pyo.exp(m.x[1]))
+    return m
+
+
+@unittest.skipUnless(numpy_available and scipy_available,
+                     "ModelDerivatives requires numpy and scipy")
+class TestModelDerivatives(unittest.TestCase):
+
+    def _fd_jacobian(self, fcn, x0, h=1e-6):
+        cols = []
+        for j in range(len(x0)):
+            dx = np.zeros(len(x0))
+            dx[j] = h
+            cols.append((fcn(x0 + dx) - fcn(x0 - dx))/(2*h))
+        return np.array(cols).T
+
+    def test_structure(self):
+        m = _model()
+        md = ModelDerivatives(m)
+        self.assertEqual(md.constraints, [m.c1, m.c2, m.c3, m.c4])
+        # fixed variables and params are not columns
+        self.assertEqual(md.variables, [m.x[1], m.x[2], m.x[3]])
+        self.assertIs(md.objective, m.o)
+        self.assertEqual(md.n_constraints, 4)
+        self.assertEqual(md.n_variables, 3)
+
+    def test_jacobian_matches_reverse_ad(self):
+        m = _model()
+        md = ModelDerivatives(m)
+        J = md.evaluate_jacobian()
+        self.assertEqual(J.shape, (4, 3))
+        J = J.toarray()
+        for i, c in enumerate(md.constraints):
+            derivs = reverse_ad(c.body)
+            for j, v in enumerate(md.variables):
+                self.assertAlmostEqual(J[i, j], derivs.get(v, 0), 8)
+        # c4 only depends on x[3]; c3 does not depend on x[2]
+        self.assertEqual(J[3].tolist(), [0, 0, 1])
+        self.assertEqual(md.evaluate_jacobian(format='coo').nnz, 9)
+
+        g = md.evaluate_objective_gradient()
+        derivs = reverse_ad(m.o.expr)
+        for j, v in enumerate(md.variables):
+            self.assertAlmostEqual(g[j], derivs[v], 8)
+
+    def test_reevaluate(self):
+        m = _model()
+        md = ModelDerivatives(m)
+        x = np.array([0.6, 1.1, 1.4])
+        J = md.evaluate_jacobian(x).toarray()
+        m.p = 3
+        J_p = md.evaluate_jacobian(x).toarray()
+        c = md.evaluate_constraints(x)
+        for v, val in zip(md.variables, x):
+            v.value = val
+        for i, con in enumerate(md.constraints):
+            self.assertAlmostEqual(pyo.value(con.body), c[i])
+            derivs = reverse_ad(con.body)
+            for j, v in enumerate(md.variables):
+                self.assertAlmostEqual(J_p[i, j], derivs.get(v, 0), 8)
+        # the params are read when evaluating
+        self.assertNotAlmostEqual(J[2, 0], J_p[2, 0])
+        with self.assertRaisesRegex(
+                ValueError, "expected 3 variable values, but received 2"):
+            md.evaluate_jacobian([1, 2])
+
+    def test_hessian_lag(self):
+        m = _model()
+        md = ModelDerivatives(m)
+        x0 = np.array([v.value for v in md.variables])
+        duals = np.array([0.3, -1.2, 2.0, 5.0])
+
+        def grad_lag(x):
+            return duals.dot(md.evaluate_jacobian(x).toarray()) \
+                + 1.5*md.evaluate_objective_gradient(x)
+
+        H = md.evaluate_hessian_lag(duals, obj_factor=1.5)
+        self.assertEqual(H.shape, (3, 3))
+        H = H.toarray()
+        H_fd = self._fd_jacobian(grad_lag, x0)
+        self.assertTrue(np.allclose(H, H_fd, rtol=1e-6, atol=1e-5))
+        self.assertTrue(np.allclose(H, H.T))
+
+        # Only the linear constraints: no Hessian entries
+        H = md.evaluate_hessian_lag([0, 0, 1, 1], obj_factor=0)
+        self.assertEqual(H.nnz, 0)
+
+        with self.assertRaisesRegex(
+                ValueError, "expected 4 constraint multipliers"):
+            md.evaluate_hessian_lag([1])
+
+    def test_hessian_sparsity(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(range(5), initialize=2)
+        m.c = pyo.Constraint(expr=sum(m.x[i]**2 for i in m.x) <= 1)
+        m.d = pyo.Constraint(expr=m.x[0]*m.x[1] + m.x[4] == 1)
+        md = ModelDerivatives(m)
+        H = md.evaluate_hessian_lag([1, 1])
+        self.assertEqual(H.nnz, 7)
+        self.assertEqual(H.diagonal().tolist(), [2, 2, 2, 2, 2])
+        self.assertEqual(H[0, 1], 1)
+        self.assertEqual(H[1, 0], 1)
+
+    def test_pow_at_zero(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(initialize=0)
+        # Params keep Pyomo from simplifying x**1 and x**0
+        m.p = pyo.Param(mutable=True, initialize=1)
+        m.q = pyo.Param(mutable=True, initialize=0)
+        m.c = pyo.Constraint(expr=m.x**m.p + m.x**m.q <= 1)
+        md = ModelDerivatives(m)
+        self.assertEqual(md.evaluate_jacobian().toarray().tolist(), [[1]])
+        H = md.evaluate_hessian_lag([1])
+        self.assertEqual(H.toarray().tolist(), [[0]])
+
+    def test_user_variables(self):
+        m = _model()
+        md = ModelDerivatives(m, variables=[m.x[3], m.x[1]])
+        J = md.evaluate_jacobian().toarray()
+        self.assertEqual(J.shape, (4, 2))
+        derivs = reverse_ad(m.c2.body)
+        self.assertAlmostEqual(J[1, 0], derivs[m.x[3]])
+        self.assertAlmostEqual(J[1, 1], derivs[m.x[1]])
+
+    def test_errors(self):
+        m = _model()
+        m.o2 = pyo.Objective(expr=m.x[1])
+        with self.assertRaisesRegex(
+                ValueError, "has 2 active objectives"):
+            ModelDerivatives(m)
+        m.o.deactivate()
+        m.o2.deactivate()
+        md = ModelDerivatives(m)
+        with self.assertRaisesRegex(ValueError, "no active objective"):
+            md.evaluate_objective_gradient()
+
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(initialize=1)
+        m.c = pyo.Constraint(expr=pyo.floor(m.x) <= 1)
+        md = ModelDerivatives(m)
+        with self.assertRaisesRegex(
+                DifferentiationException, "unary function floor"):
+            md.evaluate_jacobian()
+
+
+if __name__ == "__main__":
+    unittest.main()
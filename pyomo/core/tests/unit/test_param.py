@@ -31,6 +31,7 @@ from pyomo.environ import (Set, RangeSet, Param, ConcreteModel,
                            value, set_options, sin, cos, tan, log, log10,
                            exp, sqrt, ceil, floor, asin, acos, atan, sinh,
                            cosh, tanh, asinh, acosh, atanh)
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.log import LoggingIntercept
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.core.base.param import _NotValid, _ParamData 
@@ -2024,5 +2025,158 @@ class MiscIndexedParamBehaviorTests(unittest.TestCase):
 assignTestsIndexedParamTests(MiscIndexedParamBehaviorTests,instrinsic_test_list)
 
 
+@unittest.skipUnless(numpy_available, "NumPy is not available")
+class TestArrayStorageParam(unittest.TestCase):
+
+    def test_bad_storage(self):
+        with self.assertRaisesRegexp(ValueError, "must be 'dict' or 'array'"):
+            Param([1, 2], storage='list')
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2], ordered=False)
+        with self.assertRaisesRegexp(ValueError, "finite, ordered set"):
+            m.p = Param(m.I, storage='array')
+
+    def test_immutable(self):
+        m = ConcreteModel()
+        m.p = Param([3, 1, 2], initialize={3: 5, 2: 7}, storage='array')
+        self.assertFalse(m.p.is_reference())
+        self.assertEqual(len(m.p), 2)
+        self.assertEqual(m.p[3], 5)
+        self.assertEqual(list(m.p), [3, 2])
+        self.assertNotIn(1, m.p)
+        self.assertEqual(m.p.extract_values(), {3: 5, 2: 7})
+        with self.assertRaisesRegexp(ValueError, "value is undefined"):
+            m.p[1]
+        np.testing.assert_array_equal(m.p.get_value_array(), [5, np.nan, 7])
+        with self.assertRaises(ValueError):
+            m.p.get_value_array()[0] = 1
+        with self.assertRaisesRegexp(TypeError, "immutable parameter"):
+            m.p[3] = 1
+
+    def test_default(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2, 3], initialize={2: 4}, default=1, storage='array')
+        self.assertEqual(len(m.p), 3)
+        self.assertEqual([m.p[i] for i in m.p], [1, 4, 1])
+
+    def test_scalar_init(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2, 3], initialize=2, within=NonNegativeReals,
+                    storage='array')
+        np.testing.assert_array_equal(m.p.get_value_array(), [2, 2, 2])
+        with self.assertRaisesRegexp(ValueError, "not in parameter domain"):
+            m.q = Param([1, 2, 3], initialize=-2, within=NonNegativeReals,
+                        storage='array')
+
+    def test_product_index(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=['a', 'b'])
+        m.J = Set(initialize=[1, 2, 3])
+        data = np.arange(6.0).reshape(2, 3)
+        m.p = Param(m.I, m.J, initialize=data, storage='array')
+        self.assertEqual(m.p['b', 1], 3)
+        self.assertEqual(m.p['a', 3], 2)
+        self.assertEqual(len(m.p), 6)
+        np.testing.assert_array_equal(
+            m.p.get_value_array().reshape(2, 3), data)
+        with self.assertRaisesRegexp(ValueError, "array of 5 values"):
+            m.q = Param(m.I, m.J, initialize=np.zeros(5), storage='array')
+
+    def test_nan_is_undefined(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        data = np.array([1.0, np.nan, 3.0])
+        m.p = Param([1, 2, 3], initialize=data, storage='array')
+        self.assertEqual(len(m.p), 2)
+        self.assertEqual(list(m.p), [1, 3])
+        self.assertNotIn(2, m.p)
+        with self.assertRaisesRegexp(ValueError, "value is undefined"):
+            m.p[2]
+        m.r = Param([1, 2, 3], initialize=data, default=5, storage='array')
+        self.assertEqual(len(m.r), 3)
+        self.assertEqual(m.r[2], 5)
+        e = m.r[2]*m.x[2]
+        self.assertEqual(e.arg(0), 5)
+        m.q = Param([1, 2], mutable=True, initialize=1, storage='array')
+        q1 = m.q[1]
+        m.q.store_values(np.array([np.nan, 2.0]), check=False)
+        self.assertEqual(len(m.q), 1)
+        self.assertNotIn(1, m.q)
+        m.q[1] = 4
+        self.assertIs(m.q[1], q1)
+        self.assertEqual(value(q1), 4)
+
+    def test_nan_domain_validation(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        data = np.array([1., np.nan, 3.])
+        m.p = Param(m.I, storage='array', initialize=data,
+                    within=NonNegativeReals, default=0)
+        self.assertEqual(len(m.p), 3)
+        self.assertEqual([m.p[i] for i in m.I], [1, 0, 3])
+        with self.assertRaisesRegexp(ValueError, r"q\[1\] = '1.5'"):
+            m.q = Param(m.I, storage='array', within=Integers,
+                        initialize=np.array([1.5, np.nan, 3.]))
+        checked = []
+        def _validate(m, v, i):
+            checked.append(i)
+            return v > 0
+        m.r = Param(m.I, storage='array', initialize=data,
+                    within=Integers, validate=_validate)
+        self.assertEqual(checked, [1, 3])
+        self.assertEqual(len(m.r), 2)
+
+    def test_mutable(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.p = Param([1, 2], mutable=True, initialize=1, storage='array')
+        e = m.p[1]*m.x
+        self.assertIs(m.p[1], m.p[1])
+        m.p[1] = 3
+        self.assertEqual(value(e.arg(0)), 3)
+        m.p.store_values(np.array([5.0, 6.0]))
+        self.assertEqual(value(m.p[1]), 5)
+        self.assertEqual(value(e.arg(0)), 5)
+        m.p.get_value_array()[1] = 8
+        self.assertEqual(value(m.p[2]), 8)
+        m.p.store_values(2)
+        self.assertEqual(m.p.extract_values(), {1: 2, 2: 2})
+        with self.assertRaisesRegexp(ValueError, "can only hold numeric"):
+            m.p[1] = 'a'
+
+    def test_mutable_no_value(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2], mutable=True, storage='array')
+        self.assertEqual(len(m.p), 0)
+        with self.assertRaisesRegexp(ValueError, "invalid value"):
+            value(m.p[1])
+        self.assertEqual(len(m.p), 1)
+        m.p[1] = 4
+        self.assertEqual(value(m.p[1]), 4)
+
+    def test_store_values_validation(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2, 3], mutable=True, within=Integers,
+                    initialize=0, storage='array')
+        with self.assertRaisesRegexp(ValueError, r"p\[2\] = '1.5'"):
+            m.p.store_values(np.array([1, 1.5, 2]))
+        m.q = Param([1, 2], mutable=True, initialize=0, storage='array',
+                    validate=lambda m, v, i: v < 10)
+        with self.assertRaisesRegexp(ValueError, "failed parameter validation"):
+            m.q.store_values(np.array([1, 11]))
+        m.q.store_values(np.array([1, 11]), check=False)
+        self.assertEqual(value(m.q[2]), 11)
+
+    def test_clone(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2], mutable=True, initialize={1: 1, 2: 2},
+                    storage='array')
+        i = m.clone()
+        i.p[1] = 5
+        self.assertEqual(value(m.p[1]), 1)
+        self.assertEqual(value(i.p[1]), 5)
+        self.assertIs(i.p[1].parent_component(), i.p)
+
+
 if __name__ == "__main__":
     unittest.main()
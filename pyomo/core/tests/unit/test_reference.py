@@ -12,6 +12,7 @@
 #
 
 import os
+import pickle
 from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
@@ -140,6 +141,49 @@ class TestReferenceDict(unittest.TestCase):
              ((2,11), m.b[2,4].x[8,11])]
         )
 
+    def test_compiled_lookup(self):
+        m = self.m
+        rd = _ReferenceDict(m.b[:,4].x[8,:])
+        self.assertIsNone(rd._plan.levels)
+        self.assertIs(rd[1,10], m.b[1,4].x[8,10])
+        self.assertEqual(len(rd._plan.levels), 3)
+        self.assertEqual(rd._plan.wildcard_count, 2)
+        self.assertIs(rd[(1,),(10,)], m.b[1,4].x[8,10])
+        self.assertIs(rd.get((2,11)), m.b[2,4].x[8,11])
+        self.assertIsNone(rd.get((2,12)))
+        self.assertNotIn((1,10,1), rd)
+
+        rd = _ReferenceDict(m.b[:,:].component('y')[:])
+        self.assertIs(rd[2,5,7], m.b[2,5].y[7])
+        self.assertEqual(len(rd._plan.levels), 4)
+
+        rd = _ReferenceDict(m.c[...])
+        self.assertIs(rd[2], m.c[2])
+        self.assertEqual(len(rd._plan.levels), 1)
+
+        # Slices that can not be compiled fall back on the slice iterator
+        m.jagged_set = Set(initialize=[1,(2,3)], dimen=None)
+        m.jb = Block(m.jagged_set)
+        m.jb[1].x = Var([1,2,3])
+        rd = _ReferenceDict(m.jb[...].x[:])
+        self.assertIs(rd[1,2], m.jb[1].x[2])
+        self.assertEqual(rd._plan.levels, ())
+
+    def test_compiled_lookup_sparse(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], dense=False)
+        rd = _ReferenceDict(m.x[:])
+        self.assertNotIn(1, rd)
+        self.assertEqual(len(m.x), 0)
+        # __getitem__ still creates missing (sparse) members
+        self.assertIs(rd[1], m.x[1])
+        self.assertIn(1, rd)
+        self.assertNotIn(2, rd)
+        del m.x[1]
+        self.assertNotIn(1, rd)
+        with self.assertRaises(KeyError):
+            rd[4]
+
     def test_nested_assignment(self):
         m = self.m
 
@@ -804,6 +848,23 @@ class TestReference(unittest.TestCase):
                 KeyError, "Index '1' is not valid for indexed component 'r'"):
             m.r[1] = m.x
 
+    def test_clone_reference(self):
+        m = ConcreteModel()
+        m.b = Block([1,2])
+        for i in m.b:
+            m.b[i].x = Var([3,4])
+        m.r = Reference(m.b[:].x[:])
+        self.assertIs(m.r[1,3], m.b[1].x[3])
+
+        i = m.clone()
+        self.assertIsNot(i.r._data._plan, m.r._data._plan)
+        self.assertIs(i.r[2,4], i.b[2].x[4])
+        self.assertEqual(list(i.r.values()), list(i.b[:].x[:]))
+
+        i = pickle.loads(pickle.dumps(m))
+        self.assertIs(i.r[2,4], i.b[2].x[4])
+        self.assertEqual(list(i.r.keys()), [(1,3), (1,4), (2,3), (2,4)])
+
     def test_is_reference(self):
         m = ConcreteModel()
         m.v0 = Var()
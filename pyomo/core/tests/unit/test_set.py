@@ -3082,6 +3082,15 @@ J : Size=1, Index=None, Ordered=False
                 "SetProduct_OrderedSet"):
             x.ord((3,4))
 
+        self.assertEqual(x.strides(), (2, 1))
+        for i, v in enumerate(x):
+            self.assertEqual(x.offset(v), i)
+        self.assertEqual(x.offset(((1,),5)), 3)
+        with self.assertRaisesRegexp(
+                IndexError, "Cannot identify position of \(3, 4\) in Set "
+                "SetProduct_OrderedSet"):
+            x.offset((3,4))
+
         self.assertEqual(x[1], (3,6))
         self.assertEqual(x[2], (3,5))
         self.assertEqual(x[3], (1,6))
@@ -3170,6 +3179,8 @@ J : Size=1, Index=None, Ordered=False
         self.assertEqual(x.ord((1, (2, 3), 5)), 6)
         self.assertEqual(x.ord((1, 2, 3, 3)), 4)
         self.assertEqual(x.ord((1, 2, 3, 5)), 6)
+        self.assertEqual(x.offset((1, 2, 3, 5)), 5)
+        self.assertEqual(x.strides(), (6, 3, 1))
 
         x = SetOf([1]).cross(NonDim, NonDim2, SetOf([0,1]))
 
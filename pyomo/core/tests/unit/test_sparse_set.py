@@ -0,0 +1,152 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pickle
+
+import pyutilib.th as unittest
+
+from pyomo.common.dependencies import (
+    numpy as np, numpy_available, pandas as pd, pandas_available
+)
+from pyomo.environ import ConcreteModel, Param, SparseSet, Var
+
+_data = [('p1', 'a', 1), ('p2', 'a', 1), ('p1', 'b', 2), ('p1', 'a', 1),
+         ('p2', 'c', 3), ('p1', 'b', 3)]
+_members = [('p1', 'a', 1), ('p2', 'a', 1), ('p1', 'b', 2), ('p2', 'c', 3),
+            ('p1', 'b', 3)]
+
+
+@unittest.skipUnless(numpy_available, "NumPy is not available")
+class TestSparseSet(unittest.TestCase):
+
+    def test_tuples(self):
+        m = ConcreteModel()
+        m.S = SparseSet(initialize=_data)
+        self.assertEqual(m.S.dimen, 3)
+        self.assertEqual(len(m.S), 5)
+        self.assertEqual(list(m.S), _members)
+        self.assertTrue(m.S.isordered())
+        self.assertIn(('p1', 'b', 2), m.S)
+        self.assertNotIn(('p1', 'b', 1), m.S)
+        self.assertNotIn(('p3', 'b', 2), m.S)
+        self.assertNotIn(('p1', 'b'), m.S)
+        self.assertEqual(m.S.ord(('p2', 'c', 3)), 4)
+        self.assertEqual(m.S[2], ('p2', 'a', 1))
+        self.assertEqual(m.S[-1], ('p1', 'b', 3))
+        with self.assertRaisesRegexp(IndexError, "S index out of range"):
+            m.S[6]
+        with self.assertRaisesRegexp(ValueError, r"S.ord\(x\): x not in S"):
+            m.S.ord(('p1', 'b', 1))
+
+    def test_scalars(self):
+        m = ConcreteModel()
+        m.S = SparseSet(initialize=[3, 1, 2, 1])
+        self.assertEqual(m.S.dimen, 1)
+        self.assertEqual(list(m.S), [3, 1, 2])
+        self.assertIn(2, m.S)
+        self.assertIn((2,), m.S)
+        self.assertEqual(m.S.ord(2), 3)
+
+    def test_mixed_types(self):
+        m = ConcreteModel()
+        m.S = SparseSet(initialize=[(1, 'a'), ('1', 'a')])
+        self.assertEqual(list(m.S), [(1, 'a'), ('1', 'a')])
+        self.assertEqual(m.S.ord(('1', 'a')), 2)
+        self.assertEqual(m.S.isin([('1', 'a'), (1, 1)]).tolist(),
+                         [True, False])
+
+    def test_array(self):
+        m = ConcreteModel()
+        m.S = SparseSet(initialize=np.array([[1, 2], [3, 4], [1, 2]]))
+        self.assertEqual(list(m.S), [(1, 2), (3, 4)])
+        self.assertIs(type(m.S.first()[0]), int)
+
+    @unittest.skipUnless(pandas_available, "pandas is not available")
+    def test_dataframe(self):
+        df = pd.DataFrame({'plant': ['p1', 'p2', 'p1'],
+                           'period': [1, 1, 2]})
+        m = ConcreteModel()
+        m.S = SparseSet(initialize=df)
+        self.assertEqual(list(m.S), [('p1', 1), ('p2', 1), ('p1', 2)])
+        self.assertEqual(m.S.isin(df).tolist(), [True]*3)
+
+    def test_empty(self):
+        m = ConcreteModel()
+        with self.assertRaisesRegexp(ValueError, "dimen argument is required"):
+            m.S = SparseSet()
+        m.T = SparseSet(dimen=2)
+        self.assertEqual(len(m.T), 0)
+        self.assertEqual(list(m.T), [])
+        self.assertEqual(m.T.isin([(1, 2)]).tolist(), [False])
+
+    def test_dimen(self):
+        m = ConcreteModel()
+        with self.assertRaisesRegexp(ValueError, "same dimension"):
+            m.S = SparseSet(initialize=[(1, 2), (1, 2, 3)])
+        with self.assertRaisesRegexp(ValueError, r"dimension 2 \(expected 3\)"):
+            m.T = SparseSet(initialize=[(1, 2)], dimen=3)
+
+    def test_slicing(self):
+        m = ConcreteModel()
+        m.S = SparseSet(initialize=_data)
+        self.assertEqual(m.S['p1', :, :],
+                         [('p1', 'a', 1), ('p1', 'b', 2), ('p1', 'b', 3)])
+        self.assertEqual(m.S['p1', 'b', :], [('p1', 'b', 2), ('p1', 'b', 3)])
+        self.assertEqual(m.S[:, 'a', :], [('p1', 'a', 1), ('p2', 'a', 1)])
+        self.assertEqual(m.S[..., 3], [('p2', 'c', 3), ('p1', 'b', 3)])
+        self.assertEqual(m.S['p3', :, :], [])
+        self.assertEqual(m.S[:, :, :], _members)
+        with self.assertRaisesRegexp(IndexError, "does not have 3 dimensions"):
+            m.S['p1', :]
+
+    def test_isin(self):
+        m = ConcreteModel()
+        m.S = SparseSet(initialize=_data)
+        self.assertEqual(
+            m.S.isin([('p1', 'a', 1), ('p3', 'a', 1), ('p2', 'c', 3),
+                      ('p1', 'c', 3)]).tolist(),
+            [True, False, True, False])
+        self.assertEqual(
+            m.S.isin(np.array([['p1', 'b', 2], ['p1', 'b', 4]],
+                              dtype=object)).tolist(),
+            [True, False])
+        with self.assertRaisesRegexp(ValueError, r"dimension 2 \(expected 3\)"):
+            m.S.isin([(1, 2)])
+
+    def test_columns(self):
+        m = ConcreteModel()
+        m.S = SparseSet(initialize=_data)
+        cols = m.S.columns()
+        self.assertEqual(len(cols), 3)
+        self.assertEqual(cols[0].tolist(), ['p1', 'p2', 'p1', 'p2', 'p1'])
+        self.assertEqual(cols[2].tolist(), [1, 1, 2, 3, 3])
+
+    def test_indexing(self):
+        m = ConcreteModel()
+        m.S = SparseSet(initialize=_data)
+        m.x = Var(m.S, initialize=1)
+        self.assertEqual(len(m.x), 5)
+        self.assertEqual(m.x['p2', 'c', 3].value, 1)
+        with self.assertRaises(KeyError):
+            m.x['p2', 'c', 1]
+        m.p = Param(m.S, initialize=np.arange(5.0), storage='array')
+        self.assertEqual(m.p['p2', 'c', 3], 3)
+
+    def test_pickle(self):
+        m = ConcreteModel()
+        m.S = SparseSet(initialize=_data)
+        i = pickle.loads(pickle.dumps(m))
+        self.assertEqual(list(i.S), _members)
+        i = m.clone()
+        self.assertEqual(i.S['p1', 'b', :], [('p1', 'b', 2), ('p1', 'b', 3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
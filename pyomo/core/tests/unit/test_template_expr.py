@@ -9,19 +9,26 @@
 #  ___________________________________________________________________________
 #
 
+import logging
+
 import pyutilib.th as unittest
+from six import StringIO
 
 from pyomo.environ import (
     ConcreteModel, AbstractModel, RangeSet, Param, Var, Set, value,
-    Integers,
+    Integers, Constraint, Expression, exp, inequality,
 )
 import pyomo.core.expr.current as EXPR
+from pyomo.common.log import LoggingIntercept
 from pyomo.core.expr.template_expr import (
     IndexTemplate,
     TemplateExpressionError,
     _GetItemIndexer,
     resolve_template,
     templatize_constraint,
+    templatize_rule,
+    compile_template,
+    template_rule_values,
     substitute_template_expression,
     substitute_getitem_with_param,
     substitute_template_with_value,
@@ -657,5 +664,124 @@ class TestTemplateSubstitution(unittest.TestCase):
             str(E),
             'dxdt[5,2]  ==  5.0*x[5,2]**2 + y**2' )
 
+class TestTemplatizedConstruction(unittest.TestCase):
+    def _model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(5)
+        m.J = RangeSet(3)
+        m.x = Var(m.I, initialize=1)
+        m.y = Var(m.I, m.J)
+        m.z = Var(m.J)
+        m.p = Param(m.I, initialize=lambda m, i: i % 2)
+        m.q = Param(m.J, initialize=lambda m, j: j+1, mutable=True)
+        return m
+
+    def _check(self, m, rule, index_set):
+        # The templatized component matches the one built by calling
+        # the rule for every index
+        m.c_rule = Constraint(index_set, rule=rule)
+        m.c_tmpl = Constraint(index_set, rule=rule, templatize=True)
+        self.assertEqual(list(m.c_rule), list(m.c_tmpl))
+        for idx in m.c_rule:
+            self.assertEqual(m.c_rule[idx].expr.to_string(verbose=True),
+                             m.c_tmpl[idx].expr.to_string(verbose=True))
+        m.del_component(m.c_rule)
+        m.del_component(m.c_tmpl)
+
+    def test_compile_template(self):
+        m = self._model()
+        template, indices = templatize_rule(
+            m, lambda m, i: sum(m.q[j]*m.y[i, j] for j in m.J)
+            + 2*m.x[i] + m.p[i] <= exp(m.x[i]), m.I)
+        f = compile_template(template, indices)
+        self.assertEqual(
+            str(f(1)), "q[1]*y[1,1] + q[2]*y[1,2] + q[3]*y[1,3] + 2*x[1] + 1"
+            "  <=  exp(x[1])")
+        # As with operator overloading, "+ 0" is dropped
+        self.assertEqual(
+            str(f(2)), "q[1]*y[2,1] + q[2]*y[2,2] + q[3]*y[2,3] + 2*x[2]"
+            "  <=  exp(x[2])")
+        # terms that do not depend on the index are shared
+        template, indices = templatize_rule(
+            m, lambda m, i: m.x[i] + exp(m.z[1]), m.I)
+        f = compile_template(template, indices)
+        self.assertIs(f(1).arg(1), f(2).arg(1))
+
+    def test_equivalent_to_rule(self):
+        m = self._model()
+        self._check(m, lambda m, i: m.x[i] <= 5, m.I)
+        self._check(m, lambda m, i: 2*m.x[i] + m.p[i]*m.x[i] == m.p[i], m.I)
+        self._check(m, lambda m, i: sum(m.q[j]*m.y[i, j] for j in m.J)
+                    - m.x[i]/(1+m.x[i])**2 >= 0, m.I)
+        self._check(m, lambda m, i, j: m.y[i, j] - m.z[j]*m.p[i] == 0,
+                    m.I*m.J)
+        self._check(m, lambda m, i: inequality(
+            0, exp(m.x[i]) - m.x[i], 10), m.I)
+        self._check(m, lambda m, i: (0, m.x[i] + 1, m.p[i] + 1), m.I)
+
+    def test_fallback(self):
+        m = self._model()
+        # branching on the index raises an exception when templatizing
+        def rule(m, i):
+            if i == 1:
+                return m.x[i] >= 0
+            return m.x[i] >= m.x[i-1]
+        self._check(m, rule, m.I)
+        # ... or returns a different expression (only detected by
+        # verifying the first and last members)
+        odd = set([1, 5])
+        self._check(m, lambda m, i: m.x[i] >= (1 if i in odd else 0), m.I)
+        # explicit loops
+        def rule(m, i):
+            ans = 0
+            for j in m.J:
+                ans += m.y[i, j]
+            return ans == 1
+        self._check(m, rule, m.I)
+        # Constraint.Skip
+        self._check(
+            m, lambda m, i: Constraint.Skip if i > 2 else m.x[i] == 1, m.I)
+
+    def test_fallback_logging(self):
+        m = self._model()
+        def rule(m, i):
+            if i == 1:
+                return m.x[i] >= 0
+            return m.x[i] >= m.x[i-1]
+        # The process-wide logging.disable() level (and the level of
+        # the pyomo.core logger) is left alone
+        level = logging.getLogger('pyomo.core').level
+        logging.disable(logging.INFO)
+        try:
+            list(template_rule_values(m, rule, m.I))
+            self.assertEqual(logging.root.manager.disable, logging.INFO)
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual(logging.getLogger('pyomo.core').level, level)
+        # ... and the fallback is reported once the template is abandoned
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.core', logging.DEBUG):
+            list(template_rule_values(m, rule, m.I))
+        self.assertIn("Rule 'rule' could not be converted to a template",
+                      output.getvalue())
+
+    def test_template_rule_values(self):
+        m = self._model()
+        rule = lambda m, i: m.x[i]**2
+        self.assertEqual(
+            [(i, str(e)) for i, e in template_rule_values(m, rule, m.I)],
+            [(i, 'x[%s]**2' % i) for i in m.I])
+        self.assertEqual(list(template_rule_values(m, rule, [])), [])
+
+    def test_expression(self):
+        m = self._model()
+        m.e = Expression(m.I, rule=lambda m, i: m.x[i]**2 + m.p[i],
+                         templatize=True)
+        self.assertEqual(str(m.e[1].expr), 'x[1]**2 + 1')
+        self.assertEqual(str(m.e[2].expr), 'x[2]**2')
+        for i in m.I:
+            self.assertEqual(value(m.e[i]), 1 + i % 2)
+
+
 if __name__ == "__main__":
     unittest.main()
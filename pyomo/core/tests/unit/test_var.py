@@ -20,6 +20,7 @@ currdir = dirname(abspath(__file__))+os.sep
 
 import pyutilib.th as unittest
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.core.base import IntegerSet
 from pyomo.environ import AbstractModel, ConcreteModel, Set, Param, Var, VarList, RangeSet, Suffix, Expression, NonPositiveReals, PositiveReals, Reals, RealSet, NonNegativeReals, Integers, Binary, value
 
@@ -1369,5 +1370,136 @@ class MiscVarTests(unittest.TestCase):
         model.x = Var(model.C)
 
 
+@unittest.skipUnless(numpy_available, "NumPy is not available")
+class TestArrayStorageVar(unittest.TestCase):
+
+    def test_bad_storage(self):
+        with self.assertRaisesRegexp(ValueError, "must be 'dict' or 'array'"):
+            Var([1, 2], storage='list')
+
+    def test_dense(self):
+        m = ConcreteModel()
+        m.x = Var([3, 1, 2], initialize=1, bounds=(0, 5), storage='array')
+        self.assertEqual(len(m.x), 3)
+        self.assertEqual(m.x[1].value, 1)
+        self.assertEqual(m.x[1].lb, 0)
+        self.assertEqual(m.x[1].ub, 5)
+        self.assertFalse(m.x[1].fixed)
+        self.assertFalse(m.x[1].stale)
+        self.assertIs(m.x[1].domain, Reals)
+        m.x[1].value = None
+        self.assertIsNone(m.x[1].value)
+        self.assertEqual(m.x.get_values(), {3: 1, 1: None, 2: 1})
+        np.testing.assert_array_equal(m.x.get_value_array(),
+                                      [1, np.nan, 1])
+
+    def test_default_values(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], domain=NonNegativeReals, storage='array')
+        self.assertIsNone(m.x[1].value)
+        self.assertEqual(m.x[1].lb, 0)
+        self.assertIsNone(m.x[1].ub)
+        self.assertTrue(m.x[1].stale)
+        m.x[1].setub(4)
+        self.assertEqual(m.x[1].ub, 4)
+        self.assertIsNone(m.x[2].ub)
+        m.x[2].domain = Binary
+        self.assertEqual(m.x[2].ub, 1)
+        self.assertIs(m.x[1].domain, NonNegativeReals)
+        with self.assertRaisesRegexp(ValueError, "not in domain"):
+            m.x[2].set_value(2)
+
+    def test_bulk_operations(self):
+        m = ConcreteModel()
+        m.x = Var(range(4), storage='array')
+        m.x.set_values(np.arange(4.0))
+        self.assertEqual(m.x.get_values(), {0: 0, 1: 1, 2: 2, 3: 3})
+        self.assertFalse(m.x[2].stale)
+        m.x.set_values({1: 5})
+        self.assertEqual(m.x[1].value, 5)
+        m.x.fix()
+        self.assertTrue(all(v.fixed for v in m.x.values()))
+        m.x[2].unfix()
+        self.assertEqual(m.x.get_values(include_fixed_values=False), {2: 2})
+        m.x.fix(7)
+        self.assertEqual(m.x.get_values(), {0: 7, 1: 7, 2: 7, 3: 7})
+        m.x.unfix()
+        self.assertFalse(any(v.fixed for v in m.x.values()))
+        m.x.setlb(-1)
+        m.x.setub(None)
+        self.assertEqual([v.lb for v in m.x.values()], [-1]*4)
+        self.assertEqual([v.ub for v in m.x.values()], [None]*4)
+        m.x.flag_as_stale()
+        self.assertTrue(m.x[0].stale)
+        with self.assertRaisesRegexp(ValueError, "sequence of 2 values"):
+            m.x.set_values([1, 2])
+
+    def test_set_values_validation(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], domain=Integers, storage='array')
+        with self.assertRaisesRegexp(ValueError, "not in domain"):
+            m.x.set_values([1, 1.5])
+        m.x.set_values([1, None])
+        self.assertEqual(m.x.get_values(), {1: 1, 2: None})
+
+    def test_mutable_bounds(self):
+        m = ConcreteModel()
+        m.p = Param(initialize=3, mutable=True)
+        m.x = Var([1, 2], storage='array')
+        m.x[1].setub(m.p)
+        self.assertEqual(m.x[1].ub, 3)
+        m.p = 4
+        self.assertEqual(m.x[1].ub, 4)
+        m.x.setub(2)
+        self.assertEqual(m.x[1].ub, 2)
+
+    def test_sparse(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], dense=False, initialize=2, storage='array')
+        self.assertEqual(len(m.x), 0)
+        m.x[3].setlb(1)
+        m.x[1].value = 4
+        self.assertEqual(len(m.x), 2)
+        self.assertEqual(m.x[3].lb, 1)
+        self.assertEqual(m.x.get_values(), {1: 4, 3: 2})
+        np.testing.assert_array_equal(m.x.get_value_array(), [4, 2])
+        m.x.fix()
+        self.assertTrue(m.x[1].fixed)
+
+    def test_sparse_get_values(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3, 4], dense=False, storage='array')
+        # Members added out of order (the offsets are not sorted)
+        m.x[4] = 1
+        m.x[2] = 3
+        self.assertEqual(list(m.x.keys()), [2, 4])
+        self.assertEqual(m.x.get_values(), {2: 3, 4: 1})
+        m.x[4].fix()
+        self.assertEqual(m.x.get_values(include_fixed_values=False),
+                         {2: 3})
+        m.x.set_values([5, 6])
+        self.assertEqual(m.x.get_values(), {2: 5, 4: 6})
+        np.testing.assert_array_equal(m.x.get_value_array(), [5, 6])
+
+    def test_expressions(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], initialize=2, storage='array')
+        e = m.x[1] + 3*m.x[2]
+        self.assertEqual(value(e), 8)
+        from pyomo.repn import generate_standard_repn
+        repn = generate_standard_repn(e)
+        self.assertEqual(repn.linear_coefs, (1, 3))
+        self.assertIs(repn.linear_vars[0], m.x[1])
+
+    def test_clone(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], initialize=2, storage='array')
+        i = m.clone()
+        i.x[1].value = 3
+        self.assertEqual(m.x[1].value, 2)
+        self.assertEqual(i.x.get_values(), {1: 3, 2: 2})
+        self.assertIs(i.x[1].parent_component(), i.x)
+
+
 if __name__ == "__main__":
     unittest.main()
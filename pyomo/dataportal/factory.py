@@ -41,6 +41,8 @@ class DataManagerFactoryClass(Factory):
         if _name is None:
             return self
         _name=str(_name)
+        if _name in self._lazy:
+            self._load(_name)
         if _name in self._cls:
             dm = self._cls[_name](**kwds)
             if not dm.available():
@@ -28,24 +28,31 @@ _packages = [
     'pyomo.core',
     'pyomo.opt',
     'pyomo.dataportal',
-    'pyomo.duality',
     'pyomo.checker',
     'pyomo.repn',
-    'pyomo.pysp',
-    'pyomo.neos',
     'pyomo.solvers',
+    'pyomo.scripting',
+]
+#
+# These packages only contain plugins that are registered with a
+# factory (e.g., transformations and solvers).  They are imported when
+# one of their plugins is first used (see pyomo.environ.plugin_registry).
+#
+_lazy_packages = [
+    'pyomo.duality',
+    'pyomo.neos',
     'pyomo.gdp',
     'pyomo.mpec',
     'pyomo.dae',
     'pyomo.bilevel',
-    'pyomo.scripting',
     'pyomo.network',
 ]
 #
 #
 # These packages also contain plugins that need to be loaded, but
 # we silently ignore any import errors because these
-# packages are optional and/or under development.
+# packages are optional and/or under development.  They are also
+# imported when one of their plugins is first used.
 #
 _optional_packages = {
     'pyomo.contrib.example',
@@ -59,45 +66,52 @@ _optional_packages = {
     'pyomo.contrib.petsc',
     'pyomo.contrib.preprocessing',
     'pyomo.contrib.pynumero',
+    'pyomo.contrib.solve_cache',
     'pyomo.contrib.trustregion',
     'pyomo.contrib.community_detection',
 }
 
 
+def _import_package(package, optional=False):
+    pname = package + '.plugins'
+    try:
+        _do_import(pname)
+    except ImportError:
+        if optional:
+            return
+        exctype, err, tb = _sys.exc_info()  # BUG?
+        import traceback
+        msg = "pyomo.environ failed to import %s:\nOriginal %s: %s\n" \
+              "Traceback:\n%s" \
+              % (pname, exctype.__name__, err,
+                 ''.join(traceback.format_tb(tb)),)
+        # clear local variables to remove circular references
+        exctype = err = tb = None
+        # TODO: Should this just log an error and re-raise the
+        # original exception?
+        raise ImportError(msg)
+
+    pkg = _sys.modules[pname]
+    pkg.load()
+
+
 def _import_packages():
+    from pyomo.environ.plugin_registry import register_lazy_plugins
     #
     # Import required packages
     #
     for _package in _packages:
-        pname = _package + '.plugins'
-        try:
-            _do_import(pname)
-        except ImportError:
-            exctype, err, tb = _sys.exc_info()  # BUG?
-            import traceback
-            msg = "pyomo.environ failed to import %s:\nOriginal %s: %s\n" \
-                  "Traceback:\n%s" \
-                  % (pname, exctype.__name__, err,
-                     ''.join(traceback.format_tb(tb)),)
-            # clear local variables to remove circular references
-            exctype = err = tb = None
-            # TODO: Should this just log an error and re-raise the
-            # original exception?
-            raise ImportError(msg)
-
-        pkg = _sys.modules[pname]
-        pkg.load()
+        _import_package(_package)
     #
-    # Import optional packages
+    # Declare the plugins in the other packages.  Packages that are
+    # not in the registry are imported now.
     #
-    for _package in _optional_packages:
-        pname = _package + '.plugins'
-        try:
-            _do_import(pname)
-        except ImportError:
-            continue
-        pkg = _sys.modules[pname]
-        pkg.load()
+    for _package in _lazy_packages:
+        if not register_lazy_plugins(_package, _import_package):
+            _import_package(_package)
+    for _package in sorted(_optional_packages):
+        if not register_lazy_plugins(_package, _import_package, True):
+            _import_package(_package, True)
 
 
 _import_packages()
@@ -139,7 +153,7 @@ from pyomo.core import (numvalue, numeric_expr, boolean_value,
                              AlphaNumericTextLabeler, NameLabeler, ShortNameLabeler, 
                              name, Component, ComponentUID, BuildAction, 
                              BuildCheck, Set, SetOf, simple_set_rule, RangeSet,
-                             Param, Var, VarList, SimpleVar, 
+                             SparseSet, Param, Var, VarList, SimpleVar, 
                              BooleanVar, BooleanVarList, SimpleBooleanVar, 
                              logical_expr, simple_constraint_rule,
                              simple_constraintlist_rule, ConstraintList,
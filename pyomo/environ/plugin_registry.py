@@ -0,0 +1,318 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""The plugins of the packages that pyomo.environ imports on first use.
+
+For each of these packages, the registry lists the names that the
+package registers with the Pyomo factories, so that the factories know
+the names without importing the package.  The registry is generated
+with::
+
+    python -c "from pyomo.environ.plugin_registry import main; main()"
+
+which imports the packages and prints the registry.
+"""
+
+import importlib
+from functools import partial
+
+# The module that defines each factory
+_factories = {
+    'DataManagerFactory': 'pyomo.dataportal.factory',
+    'DownloadFactory': 'pyomo.common.download',
+    'ExtensionBuilderFactory': 'pyomo.common.extensions',
+    'ModelComponentFactory': 'pyomo.core.base.plugin',
+    'ReaderFactory': 'pyomo.opt.base.results',
+    'SolverFactory': 'pyomo.opt.base.solvers',
+    'SolverManagerFactory': 'pyomo.opt.parallel.async_solver',
+    'TransformationFactory': 'pyomo.core.base.plugin',
+    'WriterFactory': 'pyomo.opt.base.problem',
+}
+
+# {package: [(factory, name, doc)]}
+lazy_plugins = {
+    'pyomo.bilevel': [
+        ('ModelComponentFactory',
+         'SubModel',
+         'A submodel in a bilevel program'),
+        ('SolverFactory',
+         'bilevel_blp_global',
+         'Global solver for continuous bilevel linear problems'),
+        ('SolverFactory',
+         'bilevel_blp_local',
+         'Local solver for continuous bilevel linear problems'),
+        ('SolverFactory',
+         'bilevel_bqp',
+         'Global solver for bilevel quadratic problems'),
+        ('SolverFactory',
+         'bilevel_ld',
+         'Solver for bilevel problems using linear duality'),
+        ('TransformationFactory',
+         'bilevel.linear_dual',
+         'Dualize a SubModel block'),
+        ('TransformationFactory',
+         'bilevel.linear_mpec',
+         'Generate a linear MPEC from the optimality conditions of the '
+         'submodel'),
+    ],
+    'pyomo.contrib.community_detection': [],
+    'pyomo.contrib.example': [
+        ('TransformationFactory',
+         'contrib.example.xfrm',
+         'An example of a transformation in a pyomo.contrib package'),
+    ],
+    'pyomo.contrib.fme': [
+        ('TransformationFactory',
+         'contrib.fourier_motzkin_elimination',
+         'Project out specified (continuous) variables from a linear model.'),
+    ],
+    'pyomo.contrib.gdp_bounds': [
+        ('TransformationFactory',
+         'contrib.compute_disj_var_bounds',
+         'Compute disjunctive bounds in a given model.'),
+    ],
+    'pyomo.contrib.gdpbb': [
+        ('SolverFactory', 'gdpbb', 'Branch and Bound based GDP Solver'),
+    ],
+    'pyomo.contrib.gdpopt': [
+        ('SolverFactory',
+         'gdpopt',
+         'The GDPopt decomposition-based Generalized Disjunctive Programming '
+         '(GDP) solver'),
+    ],
+    'pyomo.contrib.mcpp': [
+        ('DownloadFactory', 'mcpp', None),
+        ('ExtensionBuilderFactory', 'mcpp', None),
+    ],
+    'pyomo.contrib.mindtpy': [
+        ('SolverFactory',
+         'mindtpy',
+         'MindtPy: Mixed-Integer Nonlinear Decomposition Toolbox in Pyomo'),
+    ],
+    'pyomo.contrib.multistart': [
+        ('SolverFactory', 'multistart', 'MultiStart solver for NLPs'),
+    ],
+    'pyomo.contrib.preprocessing': [
+        ('TransformationFactory',
+         'contrib.aggregate_vars',
+         'Aggregate model variables that are linked by equality constraints.'),
+        ('TransformationFactory',
+         'contrib.constraints_to_var_bounds',
+         'Change constraints to be a bound on the variable.'),
+        ('TransformationFactory',
+         'contrib.deactivate_trivial_constraints',
+         'Deactivate trivial constraints.'),
+        ('TransformationFactory',
+         'contrib.detect_fixed_vars',
+         'Detect variables that are de-facto fixed but not considered fixed.'),
+        ('TransformationFactory',
+         'contrib.induced_linearity',
+         'Reformulate nonlinear constraints with induced linearity.'),
+        ('TransformationFactory',
+         'contrib.init_vars_midpoint',
+         'Initialize non-fixed variables to the midpoint of their bounds.'),
+        ('TransformationFactory',
+         'contrib.init_vars_zero',
+         'Initialize non-fixed variables to zero.'),
+        ('TransformationFactory',
+         'contrib.integer_to_binary',
+         'Reformulate integer variables into binary variables.'),
+        ('TransformationFactory',
+         'contrib.propagate_eq_var_bounds',
+         'Propagate variable bounds for equalities of type x = y.'),
+        ('TransformationFactory',
+         'contrib.propagate_fixed_vars',
+         'Propagate variable fixing for equalities of type x = y.'),
+        ('TransformationFactory',
+         'contrib.propagate_zero_sum',
+         'Propagate fixed-to-zero for sums of only positive (or negative) '
+         'vars.'),
+        ('TransformationFactory',
+         'contrib.remove_zero_terms',
+         'Remove terms 0 * var in constraints'),
+        ('TransformationFactory',
+         'contrib.strip_var_bounds',
+         'Strip bounds from varaibles.'),
+        ('TransformationFactory',
+         'core.tighten_constraints_from_vars',
+         'Tightens upper and lower bound on linear constraints.'),
+    ],
+    'pyomo.contrib.pynumero': [
+        ('ExtensionBuilderFactory', 'pynumero', None),
+        ('SolverFactory',
+         'cyipopt',
+         'Cyipopt: direct python bindings to the Ipopt NLP solver'),
+    ],
+    'pyomo.contrib.solve_cache': [
+        ('SolverFactory',
+         'solve_cache',
+         'Solver wrapper that reuses the results of identical solves'),
+    ],
+    'pyomo.contrib.trustregion': [
+        ('DownloadFactory', 'gjh', None),
+        ('SolverFactory', 'contrib.gjh', 'Interface to the AMPL GJH "solver"'),
+        ('SolverFactory',
+         'trustregion',
+         'Trust region filter method for black box/glass box optimization'),
+    ],
+    'pyomo.dae': [
+        ('ModelComponentFactory',
+         'ContinuousSet',
+         'A bounded continuous numerical range optionally containing discrete '
+         'points of interest.'),
+        ('ModelComponentFactory',
+         'DerivativeVar',
+         'Derivative of a Var in a DAE model.'),
+        ('ModelComponentFactory',
+         'Integral',
+         'Integral Expression in a DAE model.'),
+        ('TransformationFactory',
+         'dae.collocation',
+         'Discretizes a DAE model using orthogonal collocation over finite '
+         'elements transforming the model into an NLP.'),
+        ('TransformationFactory',
+         'dae.finite_difference',
+         'Discretizes a DAE model using a finite difference method '
+         'transforming the model into an NLP.'),
+    ],
+    'pyomo.duality': [
+        ('TransformationFactory',
+         'duality.linear_dual',
+         'Dualize a linear model'),
+    ],
+    'pyomo.gdp': [
+        ('ModelComponentFactory', 'Disjunct', 'Disjunctive blocks.'),
+        ('ModelComponentFactory', 'Disjunction', 'Disjunction expressions.'),
+        ('TransformationFactory',
+         'gdp.bigm',
+         'Relax disjunctive model using big-M terms.'),
+        ('TransformationFactory',
+         'gdp.bilinear',
+         'Creates a disjunctive model where bilinear terms are replaced with '
+         'disjunctive expressions.'),
+        ('TransformationFactory',
+         'gdp.chull',
+         "Deprecated name for the hull reformulation. Please use 'gdp.hull'."),
+        ('TransformationFactory',
+         'gdp.cuttingplane',
+         'Relaxes a linear disjunctive model by adding cuts from convex hull '
+         'to Big-M reformulation.'),
+        ('TransformationFactory',
+         'gdp.fix_disjuncts',
+         'Fix disjuncts to their current Boolean values.'),
+        ('TransformationFactory',
+         'gdp.hull',
+         'Relax disjunctive model by forming the hull reformulation.'),
+        ('TransformationFactory',
+         'gdp.reclassify',
+         'Reclassify Disjuncts to Blocks.'),
+    ],
+    'pyomo.mpec': [
+        ('ModelComponentFactory',
+         'Complementarity',
+         'Complementarity conditions.'),
+        ('ModelComponentFactory',
+         'ComplementarityList',
+         'A list of complementarity conditions.'),
+        ('SolverFactory', 'mpec_minlp', 'MPEC solver transforms to a MINLP'),
+        ('SolverFactory',
+         'mpec_nlp',
+         'MPEC solver that optimizes a nonlinear transformation'),
+        ('SolverFactory', 'path', 'Nonlinear MCP solver'),
+        ('TransformationFactory',
+         'mpec.nl',
+         'Transform a MPEC into a form suitable for the NL writer'),
+        ('TransformationFactory',
+         'mpec.simple_disjunction',
+         'Disjunctive transformations of complementarity conditions when all '
+         'variables are non-negative'),
+        ('TransformationFactory',
+         'mpec.simple_nonlinear',
+         'Nonlinear transformations of complementarity conditions when all '
+         'variables are non-negative'),
+        ('TransformationFactory',
+         'mpec.standard_form',
+         'Standard reformulation of complementarity condition'),
+    ],
+    'pyomo.neos': [
+        ('SolverFactory', '_neos', 'Interface for solvers hosted on NEOS'),
+        ('SolverManagerFactory',
+         'neos',
+         'Asynchronously execute solvers on the NEOS server'),
+    ],
+    'pyomo.network': [
+        ('ModelComponentFactory',
+         'Arc',
+         'Component used for connecting two Ports.'),
+        ('ModelComponentFactory',
+         'Port',
+         'A bundle of variables that can be connected to other ports.'),
+        ('TransformationFactory',
+         'network.expand_arcs',
+         'Expand all Arcs in the model to simple constraints'),
+    ],
+}
+
+
+def _get_factory(name):
+    return getattr(importlib.import_module(_factories[name]), name)
+
+
+def register_lazy_plugins(package, load, optional=False):
+    """Declare the plugins of a package with the factories
+
+    The plugins are loaded by calling ``load(package, optional)``.
+    Returns False if the package is not in the registry.
+    """
+    plugins = lazy_plugins.get(package, None)
+    if plugins is None:
+        return False
+    fcn = partial(load, package, optional)
+    for factory, name, doc in plugins:
+        _get_factory(factory).register_lazy(name, fcn, doc)
+    return True
+
+
+def generate_registry():
+    """Import the packages and return the plugins that each registers
+
+    Plugins are assigned to the package that defines them.
+    """
+    import sys
+    import pyomo.environ as environ
+    packages = [(p, False) for p in environ._lazy_packages] \
+        + [(p, True) for p in sorted(environ._optional_packages)]
+    for package, optional in packages:
+        environ._import_package(package, optional)
+    ans = dict((p, []) for p, optional in packages
+               if p + '.plugins' in sys.modules)
+    for fname in sorted(_factories):
+        factory = _get_factory(fname)
+        for name in sorted(factory._cls):
+            module = getattr(factory._cls[name], '__module__', None) or ''
+            for package in ans:
+                if module == package or module.startswith(package + '.'):
+                    ans[package].append((fname, name, factory._doc[name]))
+    return ans
+
+
+def main():
+    import pprint
+    print("lazy_plugins = {")
+    for package, plugins in sorted(generate_registry().items()):
+        if not plugins:
+            print("    %r: []," % (package,))
+            continue
+        print("    %r: [" % (package,))
+        for plugin in plugins:
+            print("        %s," % (pprint.pformat(plugin, width=71).replace(
+                '\n', '\n        '),))
+        print("    ],")
+    print("}")
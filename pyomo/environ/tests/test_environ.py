@@ -78,6 +78,30 @@ def collect_import_time(module):
         return data[0]
 
 
+_check_lazy_plugins = """
+import sys
+import pyomo.environ
+from pyomo.environ.plugin_registry import lazy_plugins, _factories, _get_factory
+declared = {}
+for fname in _factories:
+    factory = _get_factory(fname)
+    declared[fname] = dict((name, factory.doc(name)) for name in factory)
+for package, plugins in lazy_plugins.items():
+    for fname, name, doc in plugins:
+        factory = _get_factory(fname)
+        if name in factory._lazy:
+            factory._load(name)
+rc = 0
+for fname in _factories:
+    factory = _get_factory(fname)
+    for name in factory._cls:
+        if declared[fname].get(name, 0) != factory.doc(name):
+            print("%s: %s is not declared in the registry" % (fname, name))
+            rc = 1
+sys.exit(rc)
+"""
+
+
 class TestPyomoEnviron(unittest.TestCase):
 
     def test_not_auto_imported(self):
@@ -90,6 +114,28 @@ class TestPyomoEnviron(unittest.TestCase):
                       "pyomo.environ and it should not.")
 
 
+    def test_lazy_plugins(self):
+        # Loading the packages that pyomo.environ registers lazily must
+        # not register any names that the registry did not declare
+        rc = subprocess.call([sys.executable, '-c', _check_lazy_plugins])
+        if rc:
+            self.fail("The plugin registry in pyomo.environ.plugin_registry "
+                      "is out of date (see the output above)")
+
+    def test_lazy_plugin_load(self):
+        from pyomo.environ import TransformationFactory, ModelComponentFactory
+        self.assertIn('gdp.bigm', TransformationFactory)
+        self.assertIn('gdp.bigm', list(TransformationFactory))
+        self.assertEqual(TransformationFactory.doc('gdp.bigm'),
+                         'Relax disjunctive model using big-M terms.')
+        from pyomo.gdp.plugins.bigm import BigM_Transformation
+        self.assertIsInstance(TransformationFactory('gdp.bigm'),
+                              BigM_Transformation)
+        from pyomo.dae import ContinuousSet
+        self.assertIs(ModelComponentFactory.get_class('ContinuousSet'),
+                      ContinuousSet)
+
+
     @unittest.skipIf(sys.version_info[:2] < (3,7),
                      "Import timing introduced in python 3.7")
     def test_tpl_import_time(self):
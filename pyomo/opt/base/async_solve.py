@@ -0,0 +1,251 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# The asyncio implementation of OptSolver.solve_async().  This module
+# uses Python 3.5 syntax, and is only imported when solve_async() is
+# called.
+#
+
+import asyncio
+import functools
+import logging
+import shlex
+import sys
+import threading
+import time
+
+from pyomo.common.collections import Bunch
+from pyomo.common.errors import ApplicationError
+from pyomo.common.tempfiles import TempfileManager
+
+from six import string_types
+
+logger = logging.getLogger('pyomo.opt')
+
+# The TempfileManager keeps a single stack of temporary file contexts,
+# so the steps of concurrent solves that use it (writing the problem
+# and reading the results) are run one at a time.  The contexts pushed
+# by a solve are set aside while the solver runs.
+_tempfile_lock = threading.Lock()
+
+
+async def solve_async(solver, *args, **kwds):
+    """Run solver.solve() in a thread of the event loop's executor"""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(_solve, solver, args, kwds))
+
+
+def _solve(solver, args, kwds):
+    # Only hold the lock in the _presolve() and _postsolve() steps of
+    # solve(), so that the solver itself runs concurrently
+    presolve = solver._presolve
+    postsolve = solver._postsolve
+    tempfiles = []
+
+    def _locked_presolve(*args, **kwds):
+        tempfiles[:] = _presolve(solver, presolve, args, kwds)
+
+    def _locked_postsolve():
+        contexts = list(tempfiles)
+        tempfiles[:] = []
+        return _postsolve(solver, postsolve, contexts)
+
+    solver._presolve = _locked_presolve
+    solver._postsolve = _locked_postsolve
+    try:
+        return solver.solve(*args, **kwds)
+    finally:
+        del solver._presolve
+        del solver._postsolve
+        if tempfiles:
+            # The solve failed between _presolve() and _postsolve()
+            _release_tempfiles(tempfiles, not solver._keepfiles)
+
+
+async def system_call_solve_async(solver, *args, **kwds):
+    """Solve a problem with a SystemCallSolver without blocking
+
+    This follows OptSolver.solve(): the problem is written and the
+    results are read in a thread of the event loop's executor, and the
+    solver executable is run as an asyncio subprocess.  If the
+    coroutine is cancelled (or the solver exceeds the 'timelimit'),
+    the solver process is killed.
+    """
+    loop = asyncio.get_event_loop()
+
+    solver.available(exception_flag=True)
+    _model = solver._get_solve_model(args, kwds)
+    orig_options = solver._push_ephemeral_options(kwds)
+    try:
+        tempfiles = await loop.run_in_executor(
+            None, functools.partial(
+                _presolve, solver, solver._presolve, args, kwds))
+        try:
+            if not _model is None:
+                solver._initialize_callbacks(_model)
+            _status = await _apply_solver(solver)
+            if hasattr(solver, '_transformation_data'):
+                del solver._transformation_data
+            solver._check_solver_status(_status)
+        except BaseException:
+            # Includes asyncio.CancelledError
+            await loop.run_in_executor(
+                None, functools.partial(_release_tempfiles, tempfiles,
+                                        not solver._keepfiles))
+            raise
+        result = await loop.run_in_executor(
+            None, functools.partial(
+                _postsolve, solver, solver._postsolve, tempfiles))
+        solver._load_solve_results(_model, result)
+    finally:
+        solver.options = orig_options
+
+    return result
+
+
+def _presolve(solver, presolve, args, kwds):
+    # The solver _presolve() starts one or more TempfileManager
+    # contexts (e.g., CBC pushes a context for the warm-start file
+    # before SystemCallSolver._presolve() pushes its own).  They are
+    # set aside until the results are read, so that other solves can
+    # use the TempfileManager in the meantime.
+    with _tempfile_lock:
+        depth = len(TempfileManager._tempfiles)
+        try:
+            presolve(*args, **kwds)
+        except:
+            _pop_tempfiles(depth, not solver._keepfiles)
+            raise
+        return _pop_tempfiles(depth, False)
+
+
+def _postsolve(solver, postsolve, tempfiles):
+    with _tempfile_lock:
+        depth = len(TempfileManager._tempfiles)
+        _push_tempfiles(tempfiles)
+        try:
+            return postsolve()
+        finally:
+            # Release any context the solver _postsolve() did not pop
+            _pop_tempfiles(depth, not solver._keepfiles)
+
+
+def _release_tempfiles(tempfiles, remove):
+    with _tempfile_lock:
+        depth = len(TempfileManager._tempfiles)
+        _push_tempfiles(tempfiles)
+        _pop_tempfiles(depth, remove)
+
+
+def _push_tempfiles(tempfiles):
+    for files in tempfiles:
+        TempfileManager.push()
+        for fname in files:
+            TempfileManager.add_tempfile(fname, exists=False)
+
+
+def _pop_tempfiles(depth, remove):
+    """Pop the TempfileManager contexts above depth, returning the
+    list of their files (from the bottom of the stack up)"""
+    tempfiles = []
+    while len(TempfileManager._tempfiles) > depth:
+        tempfiles.append(TempfileManager.pop(remove=remove))
+    tempfiles.reverse()
+    return tempfiles
+
+
+async def _apply_solver(solver):
+    # display the log/solver file names prior to execution (as in
+    # SystemCallSolver._apply_solver)
+    if solver._keepfiles:
+        if solver._log_file is not None:
+            print("Solver log file: '%s'" % solver._log_file)
+        if solver._soln_file is not None:
+            print("Solver solution file: '%s'" % solver._soln_file)
+        if solver._problem_files is not []:
+            print("Solver problem files: %s" % str(solver._problem_files))
+
+    sys.stdout.flush()
+    if solver._streamed_command is not None:
+        streamed_command = solver._streamed_command
+        solver._streamed_command = None
+        loop = asyncio.get_event_loop()
+        try:
+            solver._rc, solver._log = await loop.run_in_executor(
+                None, streamed_command.wait)
+        except asyncio.CancelledError:
+            streamed_command.abort()
+            raise
+        solver._last_solve_time = time.time() - solver._last_solve_time
+    else:
+        solver._rc, solver._log = await _execute_command(
+            solver, solver._command)
+    sys.stdout.flush()
+    return Bunch(rc=solver._rc, log=solver._log)
+
+
+async def _execute_command(solver, command):
+    if __debug__ and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running %s", command.cmd)
+
+    cmd = command.cmd
+    if isinstance(cmd, string_types):
+        cmd = shlex.split(cmd)
+    script = command.script if 'script' in command else None
+
+    start_time = time.time()
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=None if script is None else asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=command.env)
+    except OSError:
+        err = sys.exc_info()[1]
+        msg = 'Could not execute the command: %s\tError message: %s'
+        raise ApplicationError(msg % (command.cmd, err))
+
+    timelimit = solver._timelimit
+    if timelimit is not None:
+        timelimit += max(1, 0.01*timelimit)
+    output = []
+    try:
+        rc = await asyncio.wait_for(
+            _communicate(proc, script, solver._tee, output), timelimit)
+    except asyncio.TimeoutError:
+        proc.kill()
+        rc = await proc.wait()
+    except asyncio.CancelledError:
+        proc.kill()
+        await proc.wait()
+        raise
+    sys.stdout.flush()
+
+    solver._last_solve_time = time.time() - start_time
+
+    return [rc, ''.join(output)]
+
+
+async def _communicate(proc, script, tee, output):
+    if script is not None:
+        proc.stdin.write(script.encode())
+        await proc.stdin.drain()
+        proc.stdin.close()
+    while True:
+        line = await proc.stdout.readline()
+        if not line:
+            break
+        line = line.decode(errors='replace')
+        output.append(line)
+        if tee:
+            sys.stdout.write(line)
+    return await proc.wait()
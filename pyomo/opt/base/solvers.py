@@ -153,6 +153,8 @@ class SolverFactoryClass(Factory):
             subsolver = None
         opt = None
         try:
+            if _name in self._lazy:
+                self._load(_name)
             if _name in self._cls:
                 opt = self._cls[_name](**kwds)
             else:
@@ -516,10 +518,73 @@ class OptSolver(object):
         """ Solve the problem """
 
         self.available(exception_flag=True)
+        _model = self._get_solve_model(args, kwds)
+
         #
-        # If the inputs are models, then validate that they have been
-        # constructed! Collect suffix names to try and import from solution.
+        # Handle ephemeral solvers options here. These
+        # will override whatever is currently in the options
+        # dictionary, but we will reset these options to
+        # their original value at the end of this method.
         #
+        orig_options = self._push_ephemeral_options(kwds)
+        try:
+
+            # we're good to go.
+            initial_time = time.time()
+
+            self._presolve(*args, **kwds)
+
+            presolve_completion_time = time.time()
+            if self._report_timing:
+                print("      %6.2f seconds required for presolve" % (presolve_completion_time - initial_time))
+
+            if not _model is None:
+                self._initialize_callbacks(_model)
+
+            _status = self._apply_solver()
+            if hasattr(self, '_transformation_data'):
+                del self._transformation_data
+            self._check_solver_status(_status)
+            solve_completion_time = time.time()
+            if self._report_timing:
+                print("      %6.2f seconds required for solver" % (solve_completion_time - presolve_completion_time))
+
+            result = self._postsolve()
+            self._load_solve_results(_model, result)
+            postsolve_completion_time = time.time()
+
+            if self._report_timing:
+                print("      %6.2f seconds required for postsolve"
+                      % (postsolve_completion_time - solve_completion_time))
+
+        finally:
+            #
+            # Reset the options dict
+            #
+            self.options = orig_options
+
+        return result
+
+    def solve_async(self, *args, **kwds):
+        """Return a coroutine that solves the problem (Python 3.5+)
+
+        This takes the same arguments as :py:meth:`solve`, and is
+        used as ``results = await opt.solve_async(model)``.  By
+        default, the solve runs in a thread of the event loop's
+        executor (and is not interrupted if the coroutine is
+        cancelled); shell-command solvers run the solver executable
+        as an asyncio subprocess instead.  Concurrent solves must use
+        separate solver objects.
+        """
+        from pyomo.opt.base.async_solve import solve_async
+        return solve_async(self, *args, **kwds)
+
+    def _get_solve_model(self, args, kwds):
+        """
+        Return the model being solved (or None).  If the inputs are
+        models, then validate that they have been constructed, and add
+        the names of their import suffixes to kwds['suffixes'].
+        """
         from pyomo.core.base.block import _BlockData
         import pyomo.core.base.suffix
         from pyomo.core.kernel.block import IBlock
@@ -552,14 +617,13 @@ class OptSolver(object):
                     for name in model_suffixes:
                         if name not in kwds_suffixes:
                             kwds_suffixes.append(name)
+        return _model
 
-        #
-        # Handle ephemeral solvers options here. These
-        # will override whatever is currently in the options
-        # dictionary, but we will reset these options to
-        # their original value at the end of this method.
-        #
-
+    def _push_ephemeral_options(self, kwds):
+        """
+        Replace the options with a copy updated with the 'options' and
+        'options_string' keywords, and return the original options.
+        """
         orig_options = self.options
 
         self.options = Options()
@@ -567,90 +631,63 @@ class OptSolver(object):
         self.options.update(kwds.pop('options', {}))
         self.options.update(
             self._options_string_to_dict(kwds.pop('options_string', '')))
-        try:
-
-            # we're good to go.
-            initial_time = time.time()
-
-            self._presolve(*args, **kwds)
-
-            presolve_completion_time = time.time()
-            if self._report_timing:
-                print("      %6.2f seconds required for presolve" % (presolve_completion_time - initial_time))
-
-            if not _model is None:
-                self._initialize_callbacks(_model)
-
-            _status = self._apply_solver()
-            if hasattr(self, '_transformation_data'):
-                del self._transformation_data
-            if not hasattr(_status, 'rc'):
-                logger.warning(
-                    "Solver (%s) did not return a solver status code.\n"
-                    "This is indicative of an internal solver plugin error.\n"
-                    "Please report this to the Pyomo developers." )
-            elif _status.rc:
+        return orig_options
+
+    def _check_solver_status(self, _status):
+        """Raise an ApplicationError if the solver did not exit normally"""
+        if not hasattr(_status, 'rc'):
+            logger.warning(
+                "Solver (%s) did not return a solver status code.\n"
+                "This is indicative of an internal solver plugin error.\n"
+                "Please report this to the Pyomo developers." )
+        elif _status.rc:
+            logger.error(
+                "Solver (%s) returned non-zero return code (%s)"
+                % (self.name, _status.rc,))
+            if self._tee:
                 logger.error(
-                    "Solver (%s) returned non-zero return code (%s)"
-                    % (self.name, _status.rc,))
-                if self._tee:
-                    logger.error(
-                        "See the solver log above for diagnostic information." )
-                elif hasattr(_status, 'log') and _status.log:
-                    logger.error("Solver log:\n" + str(_status.log))
-                raise ApplicationError(
-                    "Solver (%s) did not exit normally" % self.name)
-            solve_completion_time = time.time()
-            if self._report_timing:
-                print("      %6.2f seconds required for solver" % (solve_completion_time - presolve_completion_time))
+                    "See the solver log above for diagnostic information." )
+            elif hasattr(_status, 'log') and _status.log:
+                logger.error("Solver log:\n" + str(_status.log))
+            raise ApplicationError(
+                "Solver (%s) did not exit normally" % self.name)
 
-            result = self._postsolve()
-            result._smap_id = self._smap_id
-            result._smap = None
-            if _model:
-                if isinstance(_model, IBlock):
-                    if len(result.solution) == 1:
-                        result.solution(0).symbol_map = \
-                            getattr(_model, "._symbol_maps")[result._smap_id]
-                        result.solution(0).default_variable_value = \
-                            self._default_variable_value
-                        if self._load_solutions:
-                            _model.load_solution(result.solution(0))
-                    else:
-                        assert len(result.solution) == 0
-                    # see the hack in the write method
-                    # we don't want this to stick around on the model
-                    # after the solve
-                    assert len(getattr(_model, "._symbol_maps")) == 1
-                    delattr(_model, "._symbol_maps")
-                    del result._smap_id
-                    if self._load_solutions and \
-                       (len(result.solution) == 0):
-                        logger.error("No solution is available")
-                else:
+    def _load_solve_results(self, _model, result):
+        """Tag the results with the symbol map, and load the solution"""
+        from pyomo.core.kernel.block import IBlock
+        result._smap_id = self._smap_id
+        result._smap = None
+        if _model:
+            if isinstance(_model, IBlock):
+                if len(result.solution) == 1:
+                    result.solution(0).symbol_map = \
+                        getattr(_model, "._symbol_maps")[result._smap_id]
+                    result.solution(0).default_variable_value = \
+                        self._default_variable_value
                     if self._load_solutions:
-                        _model.solutions.load_from(
-                            result,
-                            select=self._select_index,
-                            default_variable_value=self._default_variable_value)
-                        result._smap_id = None
-                        result.solution.clear()
-                    else:
-                        result._smap = _model.solutions.symbol_map[self._smap_id]
-                        _model.solutions.delete_symbol_map(self._smap_id)
-            postsolve_completion_time = time.time()
-
-            if self._report_timing:
-                print("      %6.2f seconds required for postsolve"
-                      % (postsolve_completion_time - solve_completion_time))
-
-        finally:
-            #
-            # Reset the options dict
-            #
-            self.options = orig_options
-
-        return result
+                        _model.load_solution(result.solution(0))
+                else:
+                    assert len(result.solution) == 0
+                # see the hack in the write method
+                # we don't want this to stick around on the model
+                # after the solve
+                assert len(getattr(_model, "._symbol_maps")) == 1
+                delattr(_model, "._symbol_maps")
+                del result._smap_id
+                if self._load_solutions and \
+                   (len(result.solution) == 0):
+                    logger.error("No solution is available")
+            else:
+                if self._load_solutions:
+                    _model.solutions.load_from(
+                        result,
+                        select=self._select_index,
+                        default_variable_value=self._default_variable_value)
+                    result._smap_id = None
+                    result.solution.clear()
+                else:
+                    result._smap = _model.solutions.symbol_map[self._smap_id]
+                    _model.solutions.delete_symbol_map(self._smap_id)
 
     def _presolve(self, *args, **kwds):
 
@@ -12,7 +12,9 @@
 # Class for reading an AMPL *.sol file
 #
 
+import os
 import re
+import struct
 
 import pyutilib.misc
 
@@ -22,6 +24,9 @@ from pyomo.opt import (SolverResults,
                        SolutionStatus,
                        SolverStatus,
                        TerminationCondition)
+from pyomo.opt.results.columnar import (IndexLabels, SolutionColumns,
+                                        as_column)
+from pyomo.common.dependencies import numpy, numpy_available
 
 from six.moves import xrange
 
@@ -40,12 +45,20 @@ class ResultsReader_sol(results.AbstractResultsReader):
 
     def __call__(self, filename, res=None, soln=None, suffixes=[]):
         """
-        Parse a *.sol file
+        Parse a *.sol file (either in text or binary format)
         """
+        binary = _is_binary_sol(filename)
         try:
+            if binary:
+                with open(filename,"rb") as f:
+                    return self._load_binary(f, res, soln, suffixes)
             with open(filename,"r") as f:
                 return self._load(f, res, soln, suffixes)
-        except ValueError as e:
+        except (ValueError, struct.error) as e:
+            if binary:
+                raise ValueError(
+                    "Error reading binary SOL file '%s': %s."
+                    % (filename, str(e)))
             with open(filename,"r") as f:
                 fdata = f.read()
             raise ValueError(
@@ -108,6 +121,67 @@ class ResultsReader_sol(results.AbstractResultsReader):
                 raise ValueError("expected two numbers in objno line, "
                                  "but found '%s'" % (line))
             objno = [int(t[1]), int(t[2])]
+        return self._store(res, soln, suffixes, msg, m, n, x, y, objno,
+                           _read_text_suffixes(fin, suffixes))
+
+    def _load_binary(self, fin, res, soln, suffixes):
+        #
+        # Binary SOL files (as written by ASL's write_sol when the
+        # problem was read from a binary NL file) contain the same
+        # information as the text files, as a sequence of Fortran-style
+        # unformatted records (a 4-byte length, the data, and the
+        # length again) in native byte order:
+        #
+        #   - the solver message
+        #   - the options: nopts, the options, then the number of
+        #     constraints, duals, variables and primals (and vbtol, a
+        #     double, if nopts > 4)
+        #   - the duals and primals (doubles; omitted when empty)
+        #   - "objno" and the solve_result_num (2 ints; optional)
+        #   - for each suffix: a record with the kind, the number of
+        #     values, and the lengths of the name and table, followed
+        #     by records for the name, the table (if any) and the
+        #     values (pairs of an int index and a double or int value)
+        #
+        if res is None:
+            res = SolverResults()
+        msg = _read_record(fin)
+        if msg is None:
+            raise ValueError("no solver message found")
+        msg = msg.decode('ascii', 'replace')
+        opts = _read_record(fin)
+        if opts is None or len(opts) < 4:
+            raise ValueError("no Options record found")
+        nopts = struct.unpack('=i', opts[:4])[0]
+        need_vbtol = False
+        if nopts > 4:
+            nopts -= 2
+            need_vbtol = True
+        z = list(struct.unpack('=%di' % (nopts + 4), opts[4:4*(nopts + 5)]))
+        if need_vbtol:
+            z += struct.unpack('=d', opts[4*(nopts + 5):4*(nopts + 5) + 8])
+        n = z[nopts + 3] # variables
+        m = z[nopts + 1] # constraints
+        y = _read_values(fin, m) if m else []
+        x = _read_values(fin, n) if n else []
+        objno = [0,0]
+        data = _read_record(fin)
+        if data is not None:
+            if len(data) != 8:
+                raise ValueError("expected two numbers in the objno record")
+            objno = list(struct.unpack('=2i', data))
+        return self._store(res, soln, suffixes, msg, m, n, x, y, objno,
+                           _read_binary_suffixes(fin, suffixes))
+
+    def _store(self, res, soln, suffixes, msg, m, n, x, y, objno,
+               suffix_records):
+        """Populate the results object
+
+        suffix_records is an iterator over the (kind, name, values)
+        of the suffixes to store (the values are (index, value)
+        pairs), and may end with a (None, message) pair for any text
+        that follows the suffixes.
+        """
         res.solver.message = msg.strip()
         res.solver.message = res.solver.message.replace("\n","; ")
         res.solver.message = pyutilib.misc.yaml_fix(res.solver.message)
@@ -166,90 +240,64 @@ class ResultsReader_sol(results.AbstractResultsReader):
             soln.status_description = objno_message
             soln.message = msg.strip()
             soln.message = res.solver.message.replace("\n","; ")
+            # The variable values and duals are stored as columns
+            # (unless a solution with entries was passed in)
             soln_variable = soln.variable
-            i = 0
-            for var_value in x:
-                soln_variable["v"+str(i)] = {"Value" : var_value}
-                i = i + 1
+            if len(soln_variable) == 0:
+                soln_variable = SolutionColumns(IndexLabels("v", len(x)))
+                soln_variable.add_column("Value", as_column(x))
+                soln.variable = soln_variable
+            else:
+                i = 0
+                for var_value in x:
+                    soln_variable["v"+str(i)] = {"Value" : var_value}
+                    i = i + 1
             soln_constraint = soln.constraint
-            if any(re.match(suf,"dual") for suf in suffixes):
+            extract_duals = any(re.match(suf,"dual") for suf in suffixes)
+            if len(soln_constraint) == 0:
+                soln_constraint = SolutionColumns(IndexLabels("c", len(y)))
+                if extract_duals:
+                    soln_constraint.add_column("Dual", as_column(y))
+                soln.constraint = soln_constraint
+            elif extract_duals:
                 for i in xrange(0,len(y)):
                     soln_constraint["c"+str(i)] = {"Dual" : y[i]}
 
             ### Read suffixes ###
-            line = fin.readline()
-            while line:
-                line = line.strip()
-                if line == "":
-                    continue
-                line = line.split()
-                if line[0] != 'suffix':
-                    # We assume this is the start of a
-                    # section like kestrel_option, which
-                    # comes after all suffixes.
-                    remaining = ""
-                    line = fin.readline()
-                    while line:
-                        remaining += line.strip()+"; "
-                        line = fin.readline()
-                    res.solver.message += remaining
+            for record in suffix_records:
+                if record[0] is None:
+                    # Text after the suffixes (e.g., kestrel_option)
+                    res.solver.message += record[1]
                     break
-                unmasked_kind = int(line[1])
+                unmasked_kind, suffix_name, values = record
                 kind = unmasked_kind & 3 # 0-var, 1-con, 2-obj, 3-prob
                 convert_function = int
                 if (unmasked_kind & 4) == 4:
                     convert_function = float
-                nvalues = int(line[2])
-                # namelen = int(line[3])
-                # tablen = int(line[4])
-                tabline = int(line[5])
-                suffix_name = fin.readline().strip()
-                if any(re.match(suf,suffix_name) for suf in suffixes):
-                    # ignore translation of the table number to string value for now,
-                    # this information can be obtained from the solver documentation
-                    for n in xrange(tabline):
-                        fin.readline()
-                    if kind == 0: # Var
-                        for cnt in xrange(nvalues):
-                            suf_line = fin.readline().split()
-                            key = "v"+suf_line[0]
-                            if key not in soln_variable:
-                                soln_variable[key] = {}
-                            soln_variable[key][suffix_name] = \
-                                convert_function(suf_line[1])
-                    elif kind == 1: # Con
-                        for cnt in xrange(nvalues):
-                            suf_line = fin.readline().split()
-                            key = "c"+suf_line[0]
-                            if key not in soln_constraint:
-                                soln_constraint[key] = {}
-                            # GH: About the comment below: This makes for a
-                            # confusing results object and more confusing tests.
-                            # We should not muck with the names of suffixes
-                            # coming out of the sol file.
-                            #
-                            #   convert the first letter of the suffix name to upper case,
-                            #   mainly for pretty-print / output purposes. these are lower-cased
-                            #   when loaded into real suffixes, so it is largely redundant.
-                            translated_suffix_name = suffix_name[0].upper() + suffix_name[1:]
-                            soln_constraint[key][translated_suffix_name] = \
-                                convert_function(suf_line[1])
-                    elif kind == 2: # Obj
-                        for cnt in xrange(nvalues):
-                            suf_line = fin.readline().split()
-                            soln.objective.setdefault("o"+suf_line[0],{})[suffix_name] = \
-                                convert_function(suf_line[1])
-                    elif kind == 3: # Prob
-                        # Skip problem kind suffixes for now. Not sure the
-                        # best place to put them in the results object
-                        for cnt in xrange(nvalues):
-                            suf_line = fin.readline().split()
-                            soln.problem[suffix_name] = convert_function(suf_line[1])
-                else:
-                    # do not store the suffix in the solution object
-                    for cnt in xrange(nvalues):
-                        fin.readline()
-                line = fin.readline()
+                if kind == 0: # Var
+                    _store_suffix(soln_variable, "v", suffix_name,
+                                  values, convert_function)
+                elif kind == 1: # Con
+                    # GH: About the comment below: This makes for a
+                    # confusing results object and more confusing tests.
+                    # We should not muck with the names of suffixes
+                    # coming out of the sol file.
+                    #
+                    #   convert the first letter of the suffix name to upper case,
+                    #   mainly for pretty-print / output purposes. these are lower-cased
+                    #   when loaded into real suffixes, so it is largely redundant.
+                    translated_suffix_name = suffix_name[0].upper() + suffix_name[1:]
+                    _store_suffix(soln_constraint, "c", translated_suffix_name,
+                                  values, convert_function)
+                elif kind == 2: # Obj
+                    for idx, val in values:
+                        soln.objective.setdefault("o"+str(idx),{})[suffix_name] = \
+                            convert_function(val)
+                elif kind == 3: # Prob
+                    # Skip problem kind suffixes for now. Not sure the
+                    # best place to put them in the results object
+                    for idx, val in values:
+                        soln.problem[suffix_name] = convert_function(val)
 
         #
         # This is a bit of a hack to accommodate PICO.  If
@@ -262,3 +310,126 @@ class ResultsReader_sol(results.AbstractResultsReader):
         res.problem.number_of_variables = n
         res.problem.number_of_objectives = 1
         return res
+
+
+def _store_suffix(entries, prefix, name, values, convert_function):
+    """Store the (index, value) pairs of a variable or constraint suffix"""
+    if isinstance(entries, SolutionColumns) and \
+       not entries.is_materialized():
+        positions = [int(idx) for idx, val in values]
+        n = len(entries.labels)
+        if all(0 <= i < n for i in positions):
+            entries.add_sparse_column(
+                name, positions,
+                [convert_function(val) for idx, val in values])
+            return
+    for idx, val in values:
+        key = prefix+str(idx)
+        if key not in entries:
+            entries[key] = {}
+        entries[key][name] = convert_function(val)
+
+
+def _is_binary_sol(filename):
+    """Return True if the file starts with a complete binary record"""
+    try:
+        size = os.path.getsize(filename)
+        with open(filename, "rb") as f:
+            head = f.read(4)
+            if len(head) < 4:
+                return False
+            length = struct.unpack('=i', head)[0]
+            if length < 0 or length + 8 > size:
+                return False
+            f.seek(length + 4)
+            return f.read(4) == head
+    except (IOError, OSError):
+        return False
+
+
+def _read_record(fin):
+    """Read a record of a binary SOL file (None at the end of the file)"""
+    head = fin.read(4)
+    if not head:
+        return None
+    length = struct.unpack('=i', head)[0]
+    data = fin.read(length)
+    if len(data) != length or fin.read(4) != head:
+        raise ValueError("truncated or corrupt record")
+    return data
+
+
+def _read_values(fin, n):
+    data = _read_record(fin)
+    if data is None:
+        raise ValueError("missing solution values")
+    if len(data) != 8*n:
+        raise ValueError("expected %d values, but found %d bytes"
+                         % (n, len(data)))
+    if numpy_available:
+        return numpy.frombuffer(data, dtype='=f8').copy()
+    return list(struct.unpack('=%dd' % n, data))
+
+
+def _read_text_suffixes(fin, suffixes):
+    line = fin.readline()
+    while line:
+        line = line.strip()
+        if line == "":
+            continue
+        line = line.split()
+        if line[0] != 'suffix':
+            # We assume this is the start of a
+            # section like kestrel_option, which
+            # comes after all suffixes.
+            remaining = ""
+            line = fin.readline()
+            while line:
+                remaining += line.strip()+"; "
+                line = fin.readline()
+            yield None, remaining
+            return
+        unmasked_kind = int(line[1])
+        nvalues = int(line[2])
+        # namelen = int(line[3])
+        # tablen = int(line[4])
+        tabline = int(line[5])
+        suffix_name = fin.readline().strip()
+        if any(re.match(suf,suffix_name) for suf in suffixes):
+            # ignore translation of the table number to string value for now,
+            # this information can be obtained from the solver documentation
+            for i in xrange(tabline):
+                fin.readline()
+            values = []
+            for cnt in xrange(nvalues):
+                suf_line = fin.readline().split()
+                values.append((suf_line[0], suf_line[1]))
+            yield unmasked_kind, suffix_name, values
+        else:
+            # do not store the suffix in the solution object
+            for cnt in xrange(nvalues):
+                fin.readline()
+        line = fin.readline()
+
+
+def _read_binary_suffixes(fin, suffixes):
+    while True:
+        data = _read_record(fin)
+        if data is None:
+            return
+        unmasked_kind, nvalues, namelen, tablen = struct.unpack('=4i', data)
+        suffix_name = _read_record(fin)[:namelen].decode('ascii')
+        if tablen:
+            # the table is not translated (as for text files)
+            _read_record(fin)
+        data = _read_record(fin)
+        if not any(re.match(suf,suffix_name) for suf in suffixes):
+            continue
+        item = '=id' if unmasked_kind & 4 else '=ii'
+        size = struct.calcsize(item)
+        if len(data) != nvalues*size:
+            raise ValueError("invalid values record for suffix '%s'"
+                             % (suffix_name,))
+        values = [struct.unpack(item, data[i*size:(i+1)*size])
+                  for i in xrange(nvalues)]
+        yield unmasked_kind, suffix_name, values
@@ -17,4 +17,5 @@ from pyomo.opt.results.solver import SolverStatus, TerminationCondition, \
     check_optimal_termination, assert_optimal_termination
 from pyomo.opt.results.problem import ProblemSense
 from pyomo.opt.results.solution import SolutionStatus, Solution
+from pyomo.opt.results.columnar import IndexLabels, SolutionColumns
 from pyomo.opt.results.results_ import SolverResults
@@ -0,0 +1,257 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['IndexLabels', 'SolutionColumns']
+
+from six.moves import xrange
+
+from pyomo.common.dependencies import numpy, numpy_available
+
+
+class IndexLabels(object):
+    """The sequence of labels prefix+"0", prefix+"1", ...
+
+    This is how the NL and SOL files label variables ("v%d") and
+    constraints ("c%d"); the label strings are only generated when
+    they are needed.
+    """
+
+    __slots__ = ('prefix', 'n')
+
+    def __init__(self, prefix, n):
+        self.prefix = prefix
+        self.n = n
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.n
+        if i < 0 or i >= self.n:
+            raise IndexError("label index out of range")
+        return self.prefix + str(i)
+
+    def __iter__(self):
+        prefix = self.prefix
+        for i in xrange(self.n):
+            yield prefix + str(i)
+
+
+def as_column(values):
+    """Return a column (a NumPy array of floats, if NumPy is available)"""
+    if numpy_available:
+        return numpy.array(values, dtype=float)
+    return list(values)
+
+
+class SolutionColumns(dict):
+    """The entries of a solution (e.g., the variables) stored as columns
+
+    Solution entries are normally stored as a dict mapping each label
+    to a dict of values (e.g., ``{'v0': {'Value': 1.0, 'Rc': 0.0}}``).
+    For large solutions, this object stores the same information as a
+    sequence of labels and one column (a NumPy array, if NumPy is
+    available) per value name, aligned with the labels.  Values that
+    are only given for some of the entries (e.g., solver suffixes) are
+    stored as sparse columns mapping label positions to values.
+
+    This is a dict: the first time it is used as one, the nested dicts
+    are built from the columns (and the columns are discarded).  Code
+    that knows about the columnar layout (e.g., the solution loader)
+    can use :py:meth:`iter_entries`, :py:attr:`labels` and
+    :py:meth:`column` to avoid that.
+    """
+
+    def __init__(self, labels, columns=None):
+        dict.__init__(self)
+        self._labels = labels
+        self._columns = []
+        self._sparse = []
+        self._materialized = False
+        if columns is not None:
+            for name, values in columns:
+                self.add_column(name, values)
+
+    @property
+    def labels(self):
+        """The labels of the entries, in column order"""
+        return self._labels
+
+    def is_materialized(self):
+        """True if the nested dicts have been built"""
+        return self._materialized
+
+    def add_column(self, name, values):
+        """Add a value for every entry"""
+        if self._materialized:
+            for label, val in zip(self._labels, values):
+                self.setdefault(label, {})[name] = val
+            return
+        if len(values) != len(self._labels):
+            raise ValueError(
+                "Column '%s' has %d values, but there are %d labels"
+                % (name, len(values), len(self._labels)))
+        self._columns.append((name, values))
+
+    def add_sparse_column(self, name, positions, values):
+        """Add a value for the entries at the given label positions"""
+        if self._materialized:
+            labels = self._labels
+            for i, val in zip(positions, values):
+                dict.setdefault(self, labels[i], {})[name] = val
+            return
+        self._sparse.append((name, dict(zip(positions, values))))
+
+    def column(self, name):
+        """Return the (dense) column with the given name, or None"""
+        if not self._materialized:
+            for _name, values in self._columns:
+                if _name == name:
+                    return values
+        return None
+
+    def iter_entries(self):
+        """Iterate over the (label, values) pairs without materializing"""
+        if self._materialized:
+            for item in dict.items(self):
+                yield item
+            return
+        columns = [(name, _as_list(values))
+                   for name, values in self._columns]
+        sparse = self._sparse
+        for i, label in enumerate(self._labels):
+            entry = {}
+            for name, values in columns:
+                entry[name] = values[i]
+            for name, values in sparse:
+                if i in values:
+                    entry[name] = values[i]
+            if entry:
+                yield label, entry
+
+    def materialize(self):
+        """Build the nested dicts from the columns"""
+        if self._materialized:
+            return
+        for label, entry in self.iter_entries():
+            dict.__setitem__(self, label, entry)
+        self._materialized = True
+        self._columns = None
+        self._sparse = None
+
+    #
+    # The dict API (which materializes the nested dicts)
+    #
+
+    def __getitem__(self, key):
+        self.materialize()
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, val):
+        self.materialize()
+        dict.__setitem__(self, key, val)
+
+    def __delitem__(self, key):
+        self.materialize()
+        dict.__delitem__(self, key)
+
+    def __contains__(self, key):
+        self.materialize()
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self.materialize()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self.materialize()
+        return dict.__len__(self)
+
+    def __eq__(self, other):
+        self.materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self.materialize()
+        return dict.__ne__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self.materialize()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        self.materialize()
+        return (dict, (list(dict.items(self)),))
+
+    def keys(self):
+        self.materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self.materialize()
+        return dict.values(self)
+
+    def items(self):
+        self.materialize()
+        return dict.items(self)
+
+    def get(self, key, default=None):
+        self.materialize()
+        return dict.get(self, key, default)
+
+    def setdefault(self, key, default=None):
+        self.materialize()
+        return dict.setdefault(self, key, default)
+
+    def pop(self, *args):
+        self.materialize()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self.materialize()
+        return dict.popitem(self)
+
+    def update(self, *args, **kwds):
+        self.materialize()
+        dict.update(self, *args, **kwds)
+
+    def clear(self):
+        self.materialize()
+        dict.clear(self)
+
+    def copy(self):
+        self.materialize()
+        return dict(dict.items(self))
+
+    # Python 2 dict API
+    def iterkeys(self):
+        self.materialize()
+        return iter(dict.keys(self))
+
+    def itervalues(self):
+        self.materialize()
+        return iter(dict.values(self))
+
+    def iteritems(self):
+        self.materialize()
+        return iter(dict.items(self))
+
+    def has_key(self, key):
+        return self.__contains__(key)
+
+
+def _as_list(values):
+    # Convert NumPy columns to Python floats
+    if hasattr(values, 'tolist'):
+        return values.tolist()
+    return values
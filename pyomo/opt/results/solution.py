@@ -19,6 +19,7 @@ from six import iterkeys, iteritems
 from six.moves import xrange
 import enum
 from pyomo.opt.results.container import MapContainer, ListContainer, ignore
+from pyomo.opt.results.columnar import SolutionColumns
 from pyomo.common.collections import Bunch
 
 default_print_options = Bunch(schema=False,
@@ -100,6 +101,16 @@ class Solution(MapContainer):
             self.objective = tmp_
         MapContainer.load(self, repn)
 
+    def _repn_(self, option):
+        repn = MapContainer._repn_(self, option)
+        if repn is ignore:
+            return repn
+        # Columnar entries are represented by (plain) nested dicts
+        for key in repn:
+            if isinstance(repn[key], SolutionColumns):
+                repn[key] = repn[key].copy()
+        return repn
+
     def pprint(self, ostream, option, from_list=False, prefix="", repn=None):
         #
         # the following is specialized logic for handling variable and
@@ -111,7 +122,7 @@ class Solution(MapContainer):
             if not key in repn or key == 'Problem':
                 continue
             item = dict.__getitem__(self,key)
-            if not type(item.value) is dict:
+            if not isinstance(item.value, dict):
                 #
                 # Do a normal print
                 #
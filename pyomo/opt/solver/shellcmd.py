@@ -10,16 +10,21 @@
 
 __all__ = ['SystemCallSolver']
 
+import errno
 import os
 import sys
 import time
 import logging
+import subprocess
+import threading
 
 from pyomo.common.errors import ApplicationError
 from pyomo.common.collections import Bunch
 from pyomo.common.tempfiles import TempfileManager
 from pyutilib.subprocess import run
 
+from six import string_types
+
 import pyomo.common
 from pyomo.opt.base import ResultsFormat
 from pyomo.opt.base.solvers import OptSolver
@@ -28,6 +33,100 @@ from pyomo.opt.results import SolverStatus, SolverResults
 logger = logging.getLogger('pyomo.opt')
 
 
+class _StreamedCommand(object):
+    """A solver process that is launched before its problem files are
+    written
+
+    The problem files are named pipes: the solver reads the problem
+    while it is being written, so writing and solving overlap and the
+    problem never hits the disk.  The solver output is collected (and
+    echoed if tee is True) by a monitor thread.
+
+    The constructor waits for the solver to open every pipe (and raises
+    an ApplicationError if it exits first), and then holds a write
+    descriptor on each pipe until :py:meth:`close_pipes` is called.
+    The writer's own open() therefore never blocks, and the solver
+    does not see the end of a file before the writer is done.
+    """
+
+    def __init__(self, command, problem_files, timelimit, tee):
+        self._executable = command.cmd[0]
+        self._tee = tee
+        self._output = []
+        self.rc = None
+        self._proc = subprocess.Popen(
+            command.cmd,
+            stdin=subprocess.PIPE if 'script' in command else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=command.env,
+            universal_newlines=True)
+        if 'script' in command:
+            self._proc.stdin.write(command.script)
+            self._proc.stdin.close()
+        self._timer = None
+        if timelimit is not None:
+            self._timer = threading.Timer(
+                timelimit + max(1, 0.01*timelimit), self._proc.kill)
+            self._timer.daemon = True
+            self._timer.start()
+        self._monitor = threading.Thread(target=self._run)
+        self._monitor.daemon = True
+        self._monitor.start()
+        self._pipes = []
+        for fname in problem_files:
+            self._pipes.append(self._open_pipe(fname))
+
+    def _run(self):
+        for line in iter(self._proc.stdout.readline, ''):
+            self._output.append(line)
+            if self._tee:
+                sys.stdout.write(line)
+        self._proc.stdout.close()
+        self.rc = self._proc.wait()
+
+    def _open_pipe(self, fname):
+        # Opening the write end of a pipe in non-blocking mode fails
+        # (with ENXIO) until a reader has opened it
+        delay = 0.001
+        while True:
+            try:
+                return os.open(fname, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError as e:
+                if e.errno != errno.ENXIO:
+                    self.abort()
+                    raise
+            if self._proc.poll() is not None:
+                rc, log = self.wait()
+                raise ApplicationError(
+                    "Solver (%s) exited with return code %s before "
+                    "opening the problem file '%s'\nSolver log:\n%s"
+                    % (self._executable, rc, fname, log))
+            time.sleep(delay)
+            delay = min(2*delay, 0.1)
+
+    def close_pipes(self):
+        """Release the pipes (once the problem files are written)"""
+        for fd in self._pipes:
+            os.close(fd)
+        self._pipes = []
+
+    def wait(self):
+        """Wait for the solver to exit and return [rc, log]"""
+        self.close_pipes()
+        self._monitor.join()
+        if self._timer is not None:
+            self._timer.cancel()
+        sys.stdout.flush()
+        return [self.rc, ''.join(self._output)]
+
+    def abort(self):
+        """Kill the solver and return [rc, log]"""
+        if self._proc.poll() is None:
+            self._proc.kill()
+        return self.wait()
+
+
 class SystemCallSolver(OptSolver):
     """ A generic command line solver """
 
@@ -46,6 +145,8 @@ class SystemCallSolver(OptSolver):
         # a solver plugin may not report execution time.
         self._last_solve_time = None
         self._define_signal_handlers = None
+        self._stream_input = False
+        self._streamed_command = None
 
         if executable is not None:
             self.set_executable(name=executable, validate=validate)
@@ -124,6 +225,14 @@ class SystemCallSolver(OptSolver):
         """
         raise NotImplementedError       #pragma:nocover
 
+    def _stream_input_supported(self, problem_format):
+        """
+        Returns True if the solver can read problem files of the given
+        format from named pipes (i.e., it opens them once and reads
+        them sequentially).
+        """
+        return False
+
     def process_logfile(self):
         """
         Process the logfile for information about the optimization process.
@@ -185,6 +294,17 @@ class SystemCallSolver(OptSolver):
         """
         raise NotImplementedError
 
+    def solve_async(self, *args, **kwds):
+        """Return a coroutine that solves the problem (Python 3.5+)
+
+        The solver executable is run as an asyncio subprocess, which
+        is killed if the coroutine is cancelled or the 'timelimit' is
+        exceeded.  The problem file is written and the results are
+        read in a thread of the event loop's executor.
+        """
+        from pyomo.opt.base.async_solve import system_call_solve_async
+        return system_call_solve_async(self, *args, **kwds)
+
     def _presolve(self, *args, **kwds):
         """
         Peform presolves.
@@ -193,6 +313,10 @@ class SystemCallSolver(OptSolver):
 
         self._keepfiles = kwds.pop("keepfiles", False)
         self._define_signal_handlers = kwds.pop('use_signal_handling',None)
+        # Stream the problem to the solver through named pipes while it
+        # is being written (ignored if the problem is already a file)
+        self._stream_input = kwds.pop("stream_input", False)
+        self._streamed_command = None
 
         OptSolver._presolve(self, *args, **kwds)
 
@@ -204,10 +328,14 @@ class SystemCallSolver(OptSolver):
                 msg = 'Solver failed to locate input problem file: %s'
                 raise ValueError(msg % filename)
         #
-        # Create command line
+        # Create command line (unless the solver is already running)
         #
+        if self._streamed_command is None:
+            self._create_command(self._problem_files)
+
+    def _create_command(self, problem_files):
         self._command = self.create_command_line(
-            self.executable(), self._problem_files)
+            self.executable(), problem_files)
 
         self._log_file=self._command.log_file
         #
@@ -220,6 +348,54 @@ class SystemCallSolver(OptSolver):
            os.path.exists(self._soln_file):
             os.remove(self._soln_file)
 
+    def _convert_problem(self,
+                         args,
+                         problem_format,
+                         valid_problem_formats,
+                         **kwds):
+        if not self._stream_input or not len(args) or \
+           isinstance(args[0], string_types):
+            return OptSolver._convert_problem(
+                self, args, problem_format, valid_problem_formats, **kwds)
+        if not hasattr(os, 'mkfifo'):
+            raise ValueError(
+                "Solver=%s: stream_input requires named pipes, which are "
+                "not supported on this platform" % (self.name,))
+        if not self._stream_input_supported(problem_format):
+            raise ValueError(
+                "Solver=%s does not support stream_input for problem "
+                "format '%s'" % (self.name, problem_format))
+        kwds['stream_input'] = self._start_streamed_command
+        try:
+            ans = OptSolver._convert_problem(
+                self, args, problem_format, valid_problem_formats, **kwds)
+            if self._streamed_command is not None:
+                self._streamed_command.close_pipes()
+            return ans
+        except:
+            if self._streamed_command is not None:
+                rc, log = self._streamed_command.abort()
+                self._streamed_command = None
+                if log:
+                    logger.error("Solver log:\n" + log)
+            raise
+
+    def _start_streamed_command(self, problem_files):
+        """
+        Launch the solver on the problem files (named pipes) before
+        they are written.
+        """
+        if self._results_format is None:
+            self._results_format = \
+                self._default_results_format(self._problem_format)
+        self._create_command(problem_files)
+        if __debug__ and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running %s", self._command.cmd)
+        sys.stdout.flush()
+        self._last_solve_time = time.time()
+        self._streamed_command = _StreamedCommand(
+            self._command, problem_files, self._timelimit, self._tee)
+
     def _apply_solver(self):
         if pyomo.common.Executable('timer'):
             self._timer = pyomo.common.Executable('timer').path()
@@ -240,7 +416,12 @@ class SystemCallSolver(OptSolver):
                 print("Solver problem files: %s" % str(self._problem_files))
 
         sys.stdout.flush()
-        self._rc, self._log = self._execute_command(self._command)
+        if self._streamed_command is not None:
+            self._rc, self._log = self._streamed_command.wait()
+            self._streamed_command = None
+            self._last_solve_time = time.time() - self._last_solve_time
+        else:
+            self._rc, self._log = self._execute_command(self._command)
         sys.stdout.flush()
         return Bunch(rc=self._rc, log=self._log)
 
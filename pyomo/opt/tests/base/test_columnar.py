@@ -0,0 +1,107 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for pyomo.opt.results.columnar
+#
+
+import os
+import pickle
+from os.path import abspath, dirname
+currdir = dirname(abspath(__file__))+os.sep
+
+import pyutilib.th as unittest
+
+import pyomo.opt
+from pyomo.opt.results import (IndexLabels,
+                               SolutionColumns,
+                               Solution)
+
+
+class TestSolutionColumns(unittest.TestCase):
+
+    def _columns(self):
+        soln = SolutionColumns(IndexLabels("v", 3))
+        soln.add_column("Value", [1.0, 2.0, 3.0])
+        soln.add_sparse_column("Rc", [2, 0], [0.5, -0.5])
+        return soln
+
+    def test_labels(self):
+        labels = IndexLabels("c", 3)
+        self.assertEqual(len(labels), 3)
+        self.assertEqual(list(labels), ["c0", "c1", "c2"])
+        self.assertEqual(labels[1], "c1")
+        self.assertEqual(labels[-1], "c2")
+        with self.assertRaises(IndexError):
+            labels[3]
+
+    def test_bad_column(self):
+        soln = SolutionColumns(["x", "y"])
+        with self.assertRaisesRegexp(ValueError, "has 3 values"):
+            soln.add_column("Value", [1, 2, 3])
+
+    def test_iter_entries(self):
+        soln = self._columns()
+        self.assertEqual(
+            list(soln.iter_entries()),
+            [("v0", {"Value": 1.0, "Rc": -0.5}),
+             ("v1", {"Value": 2.0}),
+             ("v2", {"Value": 3.0, "Rc": 0.5})])
+        self.assertFalse(soln.is_materialized())
+        self.assertEqual(list(soln.column("Value")), [1.0, 2.0, 3.0])
+        self.assertIs(soln.column("Rc"), None)
+
+    def test_materialize(self):
+        soln = self._columns()
+        self.assertEqual(len(soln), 3)
+        self.assertTrue(soln.is_materialized())
+        self.assertEqual(soln, {"v0": {"Value": 1.0, "Rc": -0.5},
+                                "v1": {"Value": 2.0},
+                                "v2": {"Value": 3.0, "Rc": 0.5}})
+        self.assertIs(soln.column("Value"), None)
+        soln["v3"] = {"Value": 4.0}
+        self.assertEqual(dict(soln.iter_entries())["v3"], {"Value": 4.0})
+
+    def test_sparse_only(self):
+        soln = SolutionColumns(IndexLabels("v", 4))
+        soln.add_sparse_column("iis", [1, 3], [1, 1])
+        self.assertEqual(list(soln.iter_entries()),
+                         [("v1", {"iis": 1}), ("v3", {"iis": 1})])
+        self.assertEqual(sorted(soln.keys()), ["v1", "v3"])
+
+    def test_pickle(self):
+        soln = self._columns()
+        ans = pickle.loads(pickle.dumps(soln))
+        self.assertIs(type(ans), dict)
+        self.assertEqual(ans, soln)
+
+    def test_pprint(self):
+        soln = Solution()
+        soln.variable = self._columns()
+        ref = Solution()
+        ref.variable = {"v0": {"Value": 1.0, "Rc": -0.5},
+                        "v1": {"Value": 2.0},
+                        "v2": {"Value": 3.0, "Rc": 0.5}}
+        self.assertEqual(str(soln), str(ref))
+
+    def test_sol_reader(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            results = reader(currdir+"test4_sol.sol", suffixes=["dual"])
+        soln = results.solution(0)
+        self.assertIsInstance(soln.variable, SolutionColumns)
+        self.assertIsInstance(soln.constraint, SolutionColumns)
+        entries = list(soln.variable.iter_entries())
+        self.assertFalse(soln.variable.is_materialized())
+        self.assertEqual(dict(entries), soln.variable)
+        for label, entry in entries:
+            self.assertIs(type(entry["Value"]), float)
+
+
+if __name__ == "__main__":
+    unittest.main()
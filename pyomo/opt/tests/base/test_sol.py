@@ -12,6 +12,7 @@
 #
 
 import os
+import struct
 from os.path import abspath, dirname
 pyomodir = dirname(abspath(__file__))+os.sep+".."+os.sep+".."+os.sep
 currdir = dirname(abspath(__file__))+os.sep
@@ -28,6 +29,11 @@ from pyomo.opt import (TerminationCondition,
 
 old_tempdir = TempfileManager.tempdir
 
+def _record(fmt, *args):
+    data = struct.pack('='+fmt, *args)
+    return struct.pack('=i', len(data)) + data + struct.pack('=i', len(data))
+
+
 class Test(unittest.TestCase):
 
     @classmethod
@@ -144,5 +150,45 @@ class Test(unittest.TestCase):
             self.assertEqual(m.iis[m.v1], 1)
             self.assertEqual(m.iis[m.c0], 4)
 
+    def test_binary(self):
+        # The binary equivalent of conopt_optimal.sol
+        msg = (b"CONOPT 3.17A: Optimal; objective 1\n"
+               b"4 iterations; evals: nf = 2, ng = 0, nc = 2, nJ = 0, "
+               b"nH = 0, nHv = 0\n")
+        fname = TempfileManager.create_tempfile(suffix='.sol')
+        with open(fname, 'wb') as FILE:
+            FILE.write(_record('%ds' % len(msg), msg))
+            FILE.write(_record('8i', 3, 1, 1, 0, 1, 1, 1, 1))
+            FILE.write(_record('d', 1.0))
+            FILE.write(_record('d', 1.0))
+            FILE.write(_record('2i', 0, 0))
+            for kind in (0, 1):
+                FILE.write(_record('4i', kind, 1, 7, 0))
+                FILE.write(_record('7s', b'sstatus'))
+                FILE.write(_record('2i', 0, 1 + 2*kind))
+            # a float suffix that is not requested
+            FILE.write(_record('4i', 4, 1, 4, 0))
+            FILE.write(_record('4s', b'down'))
+            FILE.write(_record('id', 0, 0.5))
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            text = reader(currdir+"conopt_optimal.sol",
+                          suffixes=['dual', 'sstatus'])
+            binary = reader(fname, suffixes=['dual', 'sstatus'])
+        self.assertEqual(str(binary), str(text))
+        self.assertEqual(binary.solver.termination_condition,
+                         TerminationCondition.optimal)
+        soln = binary.solution(0)
+        self.assertEqual(soln.variable['v0'], {'Value': 1.0, 'sstatus': 1})
+        self.assertEqual(soln.constraint['c0'], {'Dual': 1.0, 'Sstatus': 3})
+
+        # A truncated file
+        with open(fname, 'rb') as FILE:
+            data = FILE.read()
+        with open(fname, 'wb') as FILE:
+            FILE.write(data[:-6])
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            with self.assertRaisesRegex(ValueError, "binary SOL file"):
+                reader(fname, suffixes=['down'])
+
 if __name__ == "__main__":
     unittest.main()
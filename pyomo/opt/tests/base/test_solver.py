@@ -12,6 +12,7 @@
 #
 
 import os
+import stat
 from os.path import abspath, dirname
 pyomodir = dirname(abspath(__file__))+"/../.."
 currdir = dirname(abspath(__file__))+os.sep
@@ -20,6 +21,11 @@ import pyutilib.th as unittest
 from pyomo.common.tempfiles import TempfileManager
 
 import pyomo.opt
+from pyomo.common import Executable
+from pyomo.common.collections import Bunch
+from pyomo.common.errors import ApplicationError
+from pyomo.opt.solver.shellcmd import SystemCallSolver
+from pyomo.environ import ConcreteModel, Var, Objective, Constraint
 
 old_tempdir = TempfileManager.tempdir
 
@@ -32,6 +38,38 @@ class TestSolver1(pyomo.opt.OptSolver):
         pyomo.opt.OptSolver.__init__(self,**kwds)
 
 
+class CatSolver(SystemCallSolver):
+    """A "solver" that echoes the LP file it is given"""
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'cat'
+        SystemCallSolver.__init__(self, **kwds)
+        self._valid_problem_formats = [pyomo.opt.ProblemFormat.cpxlp]
+        self.set_problem_format(pyomo.opt.ProblemFormat.cpxlp)
+        self._results_format = pyomo.opt.ResultsFormat.soln
+        self.problem_files = None
+
+    def _default_executable(self):
+        return Executable('cat').path()
+
+    def _stream_input_supported(self, problem_format):
+        return True
+
+    def create_command_line(self, executable, problem_files):
+        self.problem_files = [
+            (fname, stat.S_ISFIFO(os.stat(fname).st_mode))
+            for fname in problem_files]
+        return Bunch(cmd=[executable, problem_files[0]],
+                     log_file=None, env=None)
+
+
+class TrueSolver(CatSolver):
+    """A "solver" that exits without reading the LP file"""
+
+    def _default_executable(self):
+        return Executable('true').path()
+
+
 class OptSolverDebug(unittest.TestCase):
 
     def setUp(self):
@@ -123,5 +161,58 @@ class OptSolverDebug(unittest.TestCase):
         self.assertEqual(opt.results_format(), 'b')
 
 
+@unittest.skipIf(not hasattr(os, 'mkfifo'),
+                 "test only applies to platforms with named pipes")
+@unittest.skipIf(not Executable('cat'),
+                 "the cat executable is not available")
+class TestStreamInput(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.tempdir = currdir
+        self.model = ConcreteModel()
+        self.model.x = Var(bounds=(0, 1))
+        self.model.o = Objective(expr=self.model.x)
+        self.model.c = Constraint(expr=self.model.x >= 0.5)
+
+    def tearDown(self):
+        TempfileManager.clear_tempfiles()
+        TempfileManager.tempdir = old_tempdir
+
+    def test_stream_input(self):
+        opt = CatSolver()
+        opt.solve(self.model, stream_input=True, load_solutions=False)
+        self.assertEqual(len(opt.problem_files), 1)
+        fname, is_fifo = opt.problem_files[0]
+        self.assertTrue(is_fifo)
+        self.assertFalse(os.path.exists(fname))
+        self.assertIn("min \n", opt._log)
+        self.assertIn("end", opt._log)
+
+    def test_no_stream_input(self):
+        opt = CatSolver()
+        opt.solve(self.model, load_solutions=False)
+        fname, is_fifo = opt.problem_files[0]
+        self.assertFalse(is_fifo)
+        self.assertIn("min \n", opt._log)
+
+    @unittest.skipIf(not Executable('true'),
+                     "the true executable is not available")
+    def test_stream_input_solver_exits(self):
+        # The solver exits before the problem is written
+        opt = TrueSolver()
+        with self.assertRaisesRegex(
+                ApplicationError, "exited with return code 0 before "
+                "opening the problem file"):
+            opt.solve(self.model, stream_input=True,
+                      linear_matrix_repn=True)
+
+    def test_stream_input_not_supported(self):
+        opt = CatSolver()
+        opt._stream_input_supported = lambda problem_format: False
+        with self.assertRaisesRegex(ValueError,
+                                    "does not support stream_input"):
+            opt.solve(self.model, stream_input=True)
+
+
 if __name__ == "__main__":
     unittest.main()
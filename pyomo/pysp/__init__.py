@@ -42,3 +42,8 @@ import pyomo.pysp.solvers
 import pyomo.pysp.benders
 
 PluginGlobals.pop_env()
+
+# The PySP plugins are loaded when pyomo.pysp is imported (instead of
+# by pyomo.environ), as they are only used by PySP
+from pyomo.pysp.plugins import load as _load_plugins
+_load_plugins()
@@ -10,3 +10,4 @@
 
 from pyomo.repn.standard_repn import StandardRepn, generate_standard_repn
 from pyomo.repn.standard_aux import compute_standard_repn
+from pyomo.repn.linear_matrix import LinearMatrixRepn, generate_linear_matrix_repn
@@ -0,0 +1,392 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Compile the linear part of a model directly into sparse matrix form.
+
+For purely linear models, building a :class:`StandardRepn` for every
+constraint (through the general-purpose :func:`generate_standard_repn`)
+dominates the time spent writing LP / MPS files.  The
+:func:`generate_linear_matrix_repn` function walks every active
+constraint body (and the active objective) once with a specialized
+linear-only walker and emits the constraint matrix in compressed sparse
+row (CSR) form, together with the row bounds, the objective
+coefficients, and the ordered lists of variables and constraints.
+
+The LP and MPS writers write the rows directly from the CSR arrays.
+Consumers that still expect :class:`StandardRepn` objects can retrieve
+an equivalent representation for any row through
+:meth:`LinearMatrixRepn.standard_repn`.
+"""
+
+__all__ = ['LinearMatrixRepn', 'generate_linear_matrix_repn']
+
+from six.moves import zip, xrange
+
+from pyomo.common.dependencies import scipy
+from pyomo.core.base import Constraint, Objective, ComponentMap
+from pyomo.core.base.component import ComponentData
+from pyomo.core.expr.numvalue import native_numeric_types, value
+from pyomo.core.expr.numeric_expr import (
+    SumExpressionBase, SumExpression, MonomialTermExpression, LinearExpression,
+    NegationExpression, ProductExpression, DivisionExpression,
+)
+from pyomo.repn.standard_repn import StandardRepn
+
+
+class LinearMatrixRepn(object):
+    """The constraint matrix and vectors of a linear model
+
+    Attributes:
+        variables (list): the (unfixed) variables, in the order of the
+            matrix columns (order of first appearance)
+        constraints (list): the constraint data objects, in the order
+            of the matrix rows.  Constraints with neither a lower nor
+            an upper bound are omitted.
+        indptr, indices, data (list): the constraint matrix in
+            compressed sparse row (CSR) format
+        constant (list): the constant term of each constraint body
+        lower, upper (list): the row bounds, with the body constant
+            already moved to the right-hand side (None if the row is
+            unbounded in that direction)
+        objective: the active objective data object (or None)
+        obj_indices, obj_data (list): the sparse objective coefficients
+        obj_constant: the objective constant
+        sense: the objective sense (or None if there is no objective)
+        nonlinear_constraints (list): the constraints that were left
+            out of the matrix because they are nonlinear (only when
+            generated with ``skip_nonlinear=True``)
+    """
+
+    def __init__(self):
+        self.variables = []
+        self.constraints = []
+        self.indptr = [0]
+        self.indices = []
+        self.data = []
+        self.constant = []
+        self.lower = []
+        self.upper = []
+        self.objective = None
+        self.obj_indices = []
+        self.obj_data = []
+        self.obj_constant = 0
+        self.sense = None
+        self.nonlinear_constraints = []
+        self._row = ComponentMap()
+
+    @property
+    def shape(self):
+        return len(self.constraints), len(self.variables)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def row_index(self, con):
+        """Return the row of a constraint (None if it is not in the matrix)"""
+        return self._row.get(con, None)
+
+    def row(self, i):
+        """Return the ``(indices, data)`` of the nonzeros in row ``i``"""
+        start, end = self.indptr[i], self.indptr[i+1]
+        return self.indices[start:end], self.data[start:end]
+
+    def coo(self):
+        """Return the constraint matrix as ``(rows, cols, data)`` lists"""
+        rows = []
+        indptr = self.indptr
+        for i in xrange(len(self.constraints)):
+            rows.extend([i]*(indptr[i+1] - indptr[i]))
+        return rows, list(self.indices), list(self.data)
+
+    def tocsr(self):
+        """Return the constraint matrix as a :class:`scipy.sparse.csr_matrix`"""
+        return scipy.sparse.csr_matrix(
+            (self.data, self.indices, self.indptr), shape=self.shape)
+
+    def tocoo(self):
+        """Return the constraint matrix as a :class:`scipy.sparse.coo_matrix`"""
+        rows, cols, data = self.coo()
+        return scipy.sparse.coo_matrix((data, (rows, cols)), shape=self.shape)
+
+    def standard_repn(self, component):
+        """Return a :class:`StandardRepn` for a constraint or the objective
+
+        Returns None if the component is not part of this matrix.
+        """
+        if component is self.objective and component is not None:
+            return self._make_repn(
+                self.obj_constant, self.obj_indices, self.obj_data)
+        i = self._row.get(component, None)
+        if i is None:
+            return None
+        indices, data = self.row(i)
+        return self._make_repn(self.constant[i], indices, data)
+
+    def _make_repn(self, constant, indices, data):
+        repn = StandardRepn()
+        repn.constant = constant
+        variables = self.variables
+        repn.linear_vars = tuple(variables[j] for j in indices)
+        repn.linear_coefs = tuple(data)
+        return repn
+
+
+def generate_linear_matrix_repn(block, active=True, sort=False,
+                                descend_into=True, skip_nonlinear=False,
+                                objective=True):
+    """Compile the constraints and objective of a linear model into a
+    :class:`LinearMatrixRepn`
+
+    If skip_nonlinear is True, nonlinear constraints are left out of the
+    matrix (and listed in ``nonlinear_constraints``) instead of raising
+    an exception.  If objective is False, the objective is not compiled.
+
+    Raises:
+        ValueError: if any constraint body or the objective contains
+            nonlinear (including quadratic) terms, or if there is more
+            than one active objective
+    """
+    ans = LinearMatrixRepn()
+    col = {}
+
+    if objective:
+        objectives = list(block.component_data_objects(
+            Objective, active=active, sort=sort, descend_into=descend_into))
+    else:
+        objectives = ()
+    if len(objectives) > 1:
+        raise ValueError(
+            "Cannot generate a linear matrix representation for model '%s': "
+            "more than one active objective (%s)"
+            % (block.name, ', '.join(o.name for o in objectives)))
+    if objectives:
+        obj = ans.objective = objectives[0]
+        ans.sense = obj.sense
+        ans.obj_constant = _collect_linear(
+            obj.expr, obj, col, ans.variables, ans.obj_indices, ans.obj_data)
+
+    indptr = ans.indptr
+    indices = ans.indices
+    data = ans.data
+    for con in block.component_data_objects(
+            Constraint, active=active, sort=sort, descend_into=descend_into):
+        has_lb = con.has_lb()
+        has_ub = con.has_ub()
+        if not (has_lb or has_ub):
+            continue
+        if con._linear_canonical_form:
+            const = _collect_canonical(
+                con.canonical_form(), col, ans.variables, indices, data)
+        elif skip_nonlinear:
+            nnz = len(data)
+            try:
+                const = _collect_linear(
+                    con.body, con, col, ans.variables, indices, data)
+            except _NonlinearTermError:
+                del indices[nnz:]
+                del data[nnz:]
+                ans.nonlinear_constraints.append(con)
+                continue
+        else:
+            const = _collect_linear(
+                con.body, con, col, ans.variables, indices, data)
+        ans._row[con] = len(ans.constraints)
+        ans.constraints.append(con)
+        indptr.append(len(data))
+        ans.constant.append(const)
+        ans.lower.append(value(con.lower) - const if has_lb else None)
+        ans.upper.append(value(con.upper) - const if has_ub else None)
+    return ans
+
+
+def _append_row(cols, vals, indices, data):
+    # Merge duplicates and drop zeros (as generate_standard_repn does)
+    if len(set(cols)) == len(cols) and 0 not in vals:
+        indices.extend(cols)
+        data.extend(vals)
+        return
+    coefs = {}
+    order = []
+    for j, c in zip(cols, vals):
+        if j in coefs:
+            coefs[j] += c
+        else:
+            coefs[j] = c
+            order.append(j)
+    for j in order:
+        c = coefs[j]
+        if c:
+            indices.append(j)
+            data.append(c)
+
+
+def _collect_canonical(repn, col, variables, indices, data):
+    cols = []
+    vals = []
+    for c, v in zip(repn.linear_coefs, repn.linear_vars):
+        j = col.get(id(v), None)
+        if j is None:
+            j = col[id(v)] = len(variables)
+            variables.append(v)
+        cols.append(j)
+        vals.append(value(c))
+    _append_row(cols, vals, indices, data)
+    return value(repn.constant)
+
+
+# The classes of the variables seen by _collect_linear (used by its
+# fast path for sums)
+_variable_classes = set()
+
+
+class _NonlinearTermError(ValueError):
+    pass
+
+
+def _nonlinear(node, owner):
+    return _NonlinearTermError(
+        "Cannot generate a linear matrix representation: %s '%s' "
+        "contains the nonlinear term '%s'"
+        % (owner.ctype.__name__ if isinstance(owner, ComponentData)
+           else 'expression', owner.name, node))
+
+
+def _collect_linear(expr, owner, col, variables, indices, data):
+    """Append the linear terms of expr to (indices, data) and return the
+    constant term"""
+    # the column and coefficient of each term (duplicates are merged
+    # by _append_row)
+    cols = []
+    vals = []
+    const = 0
+
+    # Note: the handling of variables and monomials is inlined (here
+    # and in the sum loops below), as this is the hot loop for large
+    # linear models.
+    if expr.__class__ is SumExpression:
+        # Fast path for the most common body: a sum of variables and
+        # monomials with constant coefficients
+        cols_append = cols.append
+        vals_append = vals.append
+        col_get = col.get
+        args = expr.args
+        for i, arg in enumerate(args):
+            if arg.__class__ is MonomialTermExpression:
+                c, v = arg._args_
+                if c.__class__ not in native_numeric_types:
+                    break
+            elif arg.__class__ in _variable_classes:
+                c, v = 1, arg
+            else:
+                break
+            if v.fixed:
+                break
+            j = col_get(id(v), None)
+            if j is None:
+                j = col[id(v)] = len(variables)
+                variables.append(v)
+            cols_append(j)
+            vals_append(c)
+        else:
+            i = len(args)
+        # Walk the remaining terms (in order) with the general loop
+        stack = [(arg, 1) for arg in reversed(args[i:])]
+    else:
+        stack = [(expr, 1)]
+    while stack:
+        node, mult = stack.pop()
+        if node.__class__ in native_numeric_types:
+            const += mult*node
+            continue
+        if not mult:
+            continue
+        if not node.is_potentially_variable():
+            const += mult*value(node)
+            continue
+        if not node.is_expression_type():
+            # A variable
+            _variable_classes.add(node.__class__)
+            if node.fixed:
+                const += mult*value(node)
+                continue
+            j = col.get(id(node), None)
+            if j is None:
+                j = col[id(node)] = len(variables)
+                variables.append(node)
+            cols.append(j)
+            vals.append(mult)
+            continue
+        if node.is_named_expression_type():
+            stack.append((node.expr, mult))
+            continue
+
+        if isinstance(node, SumExpressionBase):
+            nonlinear_args = []
+            for arg in node.args:
+                if arg.__class__ is MonomialTermExpression:
+                    c, v = arg._args_
+                    if c.__class__ not in native_numeric_types:
+                        c = value(c)
+                    if v.fixed:
+                        const += mult*c*value(v)
+                        continue
+                    c *= mult
+                elif arg.__class__ in native_numeric_types:
+                    const += mult*arg
+                    continue
+                elif not arg.is_expression_type() \
+                     and arg.is_potentially_variable():
+                    _variable_classes.add(arg.__class__)
+                    if arg.fixed:
+                        const += mult*value(arg)
+                        continue
+                    c, v = mult, arg
+                else:
+                    nonlinear_args.append(arg)
+                    continue
+                j = col.get(id(v), None)
+                if j is None:
+                    j = col[id(v)] = len(variables)
+                    variables.append(v)
+                cols.append(j)
+                vals.append(c)
+            # Push in reverse so that terms are visited in order
+            for arg in reversed(nonlinear_args):
+                stack.append((arg, mult))
+        elif node.__class__ is MonomialTermExpression:
+            stack.append((node._args_[1], mult*value(node._args_[0])))
+        elif isinstance(node, LinearExpression):
+            const += mult*value(node.constant)
+            for c, v in zip(node.linear_coefs, node.linear_vars):
+                stack.append((v, mult*value(c)))
+        elif isinstance(node, NegationExpression):
+            stack.append((node.args[0], -mult))
+        elif isinstance(node, ProductExpression):
+            lhs, rhs = node.args
+            if lhs.__class__ in native_numeric_types or lhs.is_fixed():
+                stack.append((rhs, mult*value(lhs)))
+            elif rhs.__class__ in native_numeric_types or rhs.is_fixed():
+                stack.append((lhs, mult*value(rhs)))
+            else:
+                raise _nonlinear(node, owner)
+        elif isinstance(node, DivisionExpression):
+            num, den = node.args
+            if den.__class__ in native_numeric_types or den.is_fixed():
+                stack.append((num, mult/float(value(den))))
+            else:
+                raise _nonlinear(node, owner)
+        elif node.is_fixed():
+            const += mult*value(node)
+        else:
+            raise _nonlinear(node, owner)
+
+    _append_row(cols, vals, indices, data)
+    return const
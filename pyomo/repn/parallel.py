@@ -0,0 +1,181 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Generate StandardRepn objects for a model in a pool of processes.
+
+The active constraints (and objectives) are split into contiguous
+chunks of the writer's iteration order, and each chunk is processed by
+a worker forked from the current process (so the model does not need
+to be pickled).  Workers send back the repns in a compact form in which
+variables are identified by their ``id()`` in the parent process; the
+parent then rebuilds the :class:`StandardRepn` objects.  As the repns
+are identical to the ones the serial writers would generate, the
+resulting files are identical as well.
+
+Only repns with linear and quadratic terms can be transferred between
+processes: components whose repn has a general nonlinear part (or that
+reference variables that are not declared on the model) are omitted
+from the result, and the caller is expected to generate those serially.
+Workers check the polynomial degree of each body first, so they do not
+generate the repns of nonlinear components only to throw them away.
+"""
+
+__all__ = ['generate_standard_repns']
+
+import os
+import multiprocessing
+
+from six.moves import xrange
+
+from pyomo.core.base import (Constraint, Objective, Var,
+                             ComponentMap)
+from pyomo.core.expr.numvalue import native_numeric_types
+from pyomo.repn.standard_repn import StandardRepn, generate_standard_repn
+
+# State shared with the forked worker processes
+_fork_state = {}
+
+
+def generate_standard_repns(model, processes, quadratic=True,
+                            chunksize=None, sort=False):
+    """Generate the repns of all active constraints and objectives of a
+    model using a pool of worker processes
+
+    Constraints with neither a lower nor an upper bound, constraints in
+    linear canonical form, and components on blocks that set
+    ``_gen_con_repn`` / ``_gen_obj_repn`` to False are skipped (matching
+    the LP, MPS and NL writers).
+
+    Args:
+        model: the model (block) to process
+        processes (int): the number of worker processes
+        quadratic (bool): passed to :func:`generate_standard_repn`
+        chunksize (int): the number of components sent to a worker in
+            each task (default: enough for 4 tasks per process)
+        sort: passed to ``component_data_objects`` (this only affects
+            how the work is partitioned)
+
+    Returns:
+        ComponentMap: the repn of every component that could be
+        generated in parallel.  Missing components must be processed
+        serially by the caller.
+    """
+    ans = ComponentMap()
+    components = []
+    for block in model.block_data_objects(active=True, sort=sort):
+        if getattr(block, "_gen_obj_repn", True):
+            components.extend(block.component_data_objects(
+                Objective, active=True, sort=sort, descend_into=False))
+        if getattr(block, "_gen_con_repn", True):
+            for con in block.component_data_objects(
+                    Constraint, active=True, sort=sort, descend_into=False):
+                if con._linear_canonical_form:
+                    continue
+                if con.has_lb() or con.has_ub():
+                    components.append(con)
+    if not components:
+        return ans
+
+    if processes is True:
+        processes = multiprocessing.cpu_count()
+    processes = min(int(processes), len(components))
+    if processes < 2 or not hasattr(os, 'fork'):
+        # Not worth (or not possible) to start a pool
+        for comp in components:
+            ans[comp] = _generate(comp, quadratic)
+        return ans
+
+    if chunksize is None:
+        chunksize = max(1, -(-len(components) // (4*processes)))
+    chunks = [(i, min(i+chunksize, len(components)))
+              for i in xrange(0, len(components), chunksize)]
+
+    var_map = dict((id(v), v) for v in model.component_data_objects(
+        Var, descend_into=True))
+
+    _fork_state['components'] = components
+    _fork_state['var_ids'] = var_map
+    _fork_state['quadratic'] = quadratic
+    try:
+        if hasattr(multiprocessing, 'get_context'):
+            pool = multiprocessing.get_context('fork').Pool(processes)
+        else:
+            pool = multiprocessing.Pool(processes)
+        try:
+            results = pool.map(_process_chunk, chunks)
+        finally:
+            pool.terminate()
+            pool.join()
+    finally:
+        _fork_state.clear()
+
+    for (start, end), encoded in zip(chunks, results):
+        for comp, data in zip(components[start:end], encoded):
+            if data is not None:
+                ans[comp] = _decode(data, var_map)
+    return ans
+
+
+def _body(comp):
+    expr = getattr(comp, 'body', None)
+    if expr is None:
+        expr = comp.expr
+    return expr
+
+
+def _generate(comp, quadratic):
+    return generate_standard_repn(_body(comp), quadratic=quadratic)
+
+
+def _process_chunk(bounds):
+    components = _fork_state['components']
+    quadratic = _fork_state['quadratic']
+    var_ids = _fork_state['var_ids']
+    max_degree = 2 if quadratic else 1
+    ans = []
+    for comp in components[bounds[0]:bounds[1]]:
+        expr = _body(comp)
+        if expr.__class__ not in native_numeric_types:
+            # The repn of a nonlinear body cannot be sent back (and
+            # will be generated by the caller)
+            degree = expr.polynomial_degree()
+            if degree is None or degree > max_degree:
+                ans.append(None)
+                continue
+        ans.append(_encode(
+            generate_standard_repn(expr, quadratic=quadratic), var_ids))
+    return ans
+
+
+def _encode(repn, var_ids):
+    if repn.nonlinear_expr is not None:
+        return None
+    lin_ids = tuple(id(v) for v in repn.linear_vars)
+    quad_ids = tuple((id(v1), id(v2)) for v1, v2 in repn.quadratic_vars)
+    for i in lin_ids:
+        if i not in var_ids:
+            return None
+    for i, j in quad_ids:
+        if i not in var_ids or j not in var_ids:
+            return None
+    return (repn.constant, tuple(repn.linear_coefs), lin_ids,
+            tuple(repn.quadratic_coefs), quad_ids)
+
+
+def _decode(data, var_map):
+    constant, lin_coefs, lin_ids, quad_coefs, quad_ids = data
+    repn = StandardRepn()
+    repn.constant = constant
+    repn.linear_coefs = lin_coefs
+    repn.linear_vars = tuple(var_map[i] for i in lin_ids)
+    repn.quadratic_coefs = quad_coefs
+    repn.quadratic_vars = tuple((var_map[i], var_map[j])
+                                for i, j in quad_ids)
+    return repn
@@ -9,3 +9,4 @@
 #  ___________________________________________________________________________
 
 from pyomo.repn.plugins.ampl.ampl_ import ProblemWriter_nl
+from pyomo.repn.plugins.ampl.incremental import IncrementalNLWriter
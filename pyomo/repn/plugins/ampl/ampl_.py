@@ -23,6 +23,8 @@ import itertools
 import logging
 import operator
 import os
+import struct
+import sys
 import time
 
 from pyutilib.math.util import isclose
@@ -36,14 +38,16 @@ from pyomo.core.expr.numvalue import (NumericConstant,
                                       is_fixed)
 from pyomo.core.base import SymbolMap, NameLabeler, _ExpressionData, SortComponents, var, param, Var, ExternalFunction, ComponentMap, Objective, Constraint, SOSConstraint, Suffix
 import pyomo.core.base.suffix
+from pyomo.core.expr.cse import CommonSubexpressions
 from pyomo.repn.standard_repn import generate_standard_repn
+from pyomo.repn.parallel import generate_standard_repns
 
 import pyomo.core.kernel.suffix
 from pyomo.core.kernel.block import IBlock
 from pyomo.core.kernel.expression import IIdentityExpression
 from pyomo.core.kernel.variable import IVariable
 
-from six import itervalues, iteritems
+from six import itervalues, iteritems, StringIO, BytesIO
 from six.moves import xrange, zip
 
 logger = logging.getLogger('pyomo.core')
@@ -132,6 +136,119 @@ def _build_op_template():
 
 
 
+class _BinaryNLTemplate(object):
+    """A text NL format string translated to the binary ("b") NL format
+
+    In binary NL files, everything after the (text) header is written
+    in native byte order: segment and expression keys (the leading
+    letter, or the bound type digit of "r" and "b" lines) are single
+    characters, integers are 4-byte ints, reals are 8-byte doubles, and
+    strings are written as their length (int) followed by their
+    characters.  Whitespace and line breaks are dropped.
+
+    Supported fields are ``%d`` (int), ``%r`` (real), ``%s`` (string),
+    ``h%d:%s`` (a string expression argument: the length is already
+    given, so the characters are written as-is) and integer literals.
+    As with the text format, ``%d`` arguments are truncated to ints.
+    """
+
+    def __init__(self, template):
+        # list of (struct.Struct, items) or (string kind, None)
+        self._parts = []
+        fmt = '='
+        items = []
+        for i, token in enumerate(template.split()):
+            if token[0].isalpha() or (i == 0 and token[0].isdigit()):
+                fmt += 'c'
+                items.append(token[0].encode('ascii'))
+                token = token[1:]
+            if not token:
+                continue
+            if token == '%d':
+                fmt += 'i'
+                items.append(int)
+            elif token == '%r':
+                fmt += 'd'
+                items.append(float)
+            elif token in ('%s', '%d:%s'):
+                if token == '%d:%s':
+                    fmt += 'i'
+                    items.append(int)
+                self._parts.append((struct.Struct(fmt), items))
+                self._parts.append((token, None))
+                fmt = '='
+                items = []
+            else:
+                fmt += 'i'
+                items.append(int(token))
+        if items:
+            self._parts.append((struct.Struct(fmt), items))
+        # Templates without fields are just bytes
+        self.constant = None
+        if len(self._parts) == 1 and int not in items \
+           and float not in items:
+            self.constant = self._parts[0][0].pack(*items)
+
+    def __mod__(self, args):
+        if args.__class__ is not tuple:
+            args = (args,)
+        ans = []
+        i = 0
+        for part, items in self._parts:
+            if items is None:
+                s = args[i]
+                i += 1
+                if s.__class__ is not bytes:
+                    s = s.encode('utf-8')
+                if part == '%s':
+                    ans.append(struct.pack('=i', len(s)))
+                ans.append(s)
+                continue
+            vals = []
+            for item in items:
+                if item is int or item is float:
+                    vals.append(item(args[i]))
+                    i += 1
+                else:
+                    vals.append(item)
+            ans.append(part.pack(*vals))
+        return b''.join(ans)
+
+
+_binary_nl_templates = {}
+
+def _binary_nl_format(template):
+    """Return the binary equivalent of a text NL template"""
+    ans = _binary_nl_templates.get(template, None)
+    if ans is None:
+        ans = _BinaryNLTemplate(template)
+        if ans.constant is not None:
+            ans = ans.constant
+        _binary_nl_templates[template] = ans
+    return ans
+
+def _text_nl_format(template):
+    return template
+
+
+class _BinaryNLFile(object):
+    """Wrap a binary file so that the (text) NL header can be written
+    to it along with the binary segments"""
+
+    def __init__(self, ostream):
+        self._ostream = ostream
+        self.name = ostream.name
+
+    def write(self, data):
+        if data.__class__ is not bytes:
+            data = data.encode('ascii')
+        self._ostream.write(data)
+
+    def writelines(self, lines):
+        for data in lines:
+            self.write(data)
+
+
 def _get_bound(exp):
     if exp is None:
         return None
@@ -180,7 +297,11 @@ class ModelSOS(object):
                 self.ids.append(idx)
                 self.vals.append(val)
 
-        def genfilelines(self):
+        def genfilelines(self, nl_format=None):
+            if nl_format is not None:
+                base_line = nl_format("%d %d\n")
+                return [base_line % (idx, val)
+                        for idx, val in zip(self.ids,self.vals) if val != 0]
             base_line = "{0} {1}\n"
             return [base_line.format(idx, val)
                     for idx, val in zip(self.ids,self.vals) if val != 0]
@@ -265,6 +386,18 @@ class ProblemWriter_nl(AbstractProblemWriter):
         self._ampl_obj_id = {}
         self._OUTPUT = None
         self._varID_map = None
+        self._cse = None
+        self._cse_top = None
+        self._defined_var_id = None
+        # Hooks used by IncrementalNLWriter: a function returning the
+        # repn for a constraint / objective, and a cache of the text
+        # written for nonlinear constraint and objective expressions.
+        self._precomputed_repn = None
+        self._segment_cache = None
+        self._symbolic_solver_labels = False
+        self._nl_comments = False
+        self._nl_format = _text_nl_format
+        self._binary_nl = False
 
     def __call__(self,
                  model,
@@ -320,6 +453,21 @@ class ProblemWriter_nl(AbstractProblemWriter):
         include_all_variable_bounds = \
             io_options.pop("include_all_variable_bounds", False)
 
+        # If True, structurally identical nonlinear subexpressions that
+        # are used more than once are written a single time as NL
+        # "defined variables" and referenced from the constraint and
+        # objective expressions.
+        common_subexpressions = \
+            io_options.pop("common_subexpressions", False)
+
+        # Generate the repns of the active constraints in a pool of
+        # this many worker processes (True: one per CPU)
+        parallel_repn = io_options.pop("parallel_repn", None)
+
+        # Write the binary ("b") NL format instead of the text ("g")
+        # format.  NL comments are never written to binary files.
+        binary_nl = io_options.pop("binary_nl", False)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_nl passed unrecognized io_options:\n\t" +
@@ -332,6 +480,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
         # symbolic_solver_labels determines whether or not to
         # include "nl comments" (the equivalent AMPL functionality
         # is "option nl_comments 1").
+        nl_comments = symbolic_solver_labels and not binary_nl
+        if binary_nl:
+            nl_format = _binary_nl_format
+        else:
+            nl_format = _text_nl_format
         self._op_string = {}
         for optype in _op_template:
             template_str = _op_template[optype]
@@ -339,28 +492,42 @@ class ProblemWriter_nl(AbstractProblemWriter):
             if type(template_str) is tuple:
                 op_strings = []
                 for i in xrange(len(template_str)):
-                    if symbolic_solver_labels:
-                        op_strings.append(template_str[i].format(C=comment_str[i]))
+                    if nl_comments:
+                        op_strings.append(nl_format(
+                            template_str[i].format(C=comment_str[i])))
                     else:
-                        op_strings.append(template_str[i].format(C=""))
+                        op_strings.append(nl_format(
+                            template_str[i].format(C="")))
                 self._op_string[optype] = tuple(op_strings)
             else:
-                if symbolic_solver_labels:
-                    self._op_string[optype] = template_str.format(C=comment_str)
+                if nl_comments:
+                    self._op_string[optype] = nl_format(
+                        template_str.format(C=comment_str))
                 else:
-                    self._op_string[optype] = template_str.format(C="")
+                    self._op_string[optype] = nl_format(
+                        template_str.format(C=""))
 
         # making these attributes so they do not need to be
         # passed into _print_nonlinear_terms_NL
         self._symbolic_solver_labels = symbolic_solver_labels
+        self._nl_comments = nl_comments
+        self._nl_format = nl_format
+        self._binary_nl = binary_nl
         self._output_fixed_variable_bounds = output_fixed_variable_bounds
         # Speeds up calling name on every component when
         # writing .row and .col files (when symbolic_solver_labels is True)
         self._name_labeler = NameLabeler()
 
+        precomputed_repn = self._precomputed_repn
+        if parallel_repn and precomputed_repn is None:
+            precomputed_repn = generate_standard_repns(
+                model, parallel_repn, quadratic=False).get
+
         # Pause the GC for the duration of this method
         with PauseGC() as pgc:
-            with open(filename,"w") as f:
+            with open(filename, "wb" if binary_nl else "w") as f:
+                if binary_nl:
+                    f = _BinaryNLFile(f)
                 self._OUTPUT = f
                 symbol_map = self._print_model_NL(
                     model,
@@ -368,15 +535,23 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     show_section_timing=show_section_timing,
                     skip_trivial_constraints=skip_trivial_constraints,
                     file_determinism=file_determinism,
-                    include_all_variable_bounds=include_all_variable_bounds)
+                    include_all_variable_bounds=include_all_variable_bounds,
+                    common_subexpressions=common_subexpressions,
+                    precomputed_repn=precomputed_repn)
 
         self._symbolic_solver_labels = False
+        self._nl_comments = False
+        self._nl_format = _text_nl_format
+        self._binary_nl = False
         self._output_fixed_variable_bounds = False
         self._name_labeler = None
 
         self._OUTPUT = None
         self._varID_map = None
         self._op_string = None
+        self._cse = None
+        self._cse_top = None
+        self._defined_var_id = None
         return filename, symbol_map
 
     def _print_quad_term(self, v1, v2):
@@ -430,9 +605,46 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 OUTPUT.write(coef_term_str % (coef))
             self._print_quad_term(v1, v2)
 
+    def _print_repn_nonlinear_NL(self, wrapped_repn, segment_cache=None):
+        repn = wrapped_repn.repn
+        if segment_cache is not None:
+            # The text is valid as long as the repn has not been
+            # regenerated and its variables have the same NL indices
+            self_ampl_var_id = self.ampl_var_id
+            key = tuple((var_ID, self_ampl_var_id[var_ID])
+                        for var_ID in wrapped_repn.nonlinear_vars)
+            cached = segment_cache.get(id(repn), None)
+            if cached is not None and cached[0] is repn and cached[1] == key:
+                self._OUTPUT.write(cached[2])
+                return
+            OUTPUT = self._OUTPUT
+            self._OUTPUT = BytesIO() if self._binary_nl else StringIO()
+            try:
+                self._print_repn_nonlinear_NL(wrapped_repn)
+                text = self._OUTPUT.getvalue()
+            finally:
+                self._OUTPUT = OUTPUT
+            segment_cache[id(repn)] = (repn, key, text)
+            OUTPUT.write(text)
+        elif repn.nonlinear_expr is not None:
+            assert not repn.is_quadratic()
+            self._print_nonlinear_terms_NL(repn.nonlinear_expr)
+        else:
+            assert repn.is_quadratic()
+            self._print_standard_quadratic_NL(
+                repn.quadratic_vars, repn.quadratic_coefs)
+
     def _print_nonlinear_terms_NL(self, exp):
         OUTPUT = self._OUTPUT
         exp_type = type(exp)
+        if self._cse is not None and exp is not self._cse_top:
+            # References to common subexpressions are written as
+            # references to the corresponding defined variable
+            cid = self._cse.canonical_id(exp)
+            if cid in self._defined_var_id:
+                OUTPUT.write(self._nl_format("v%d\n")
+                             % (self._defined_var_id[cid],))
+                return
         # JDS: check list first so that after this, we know that exp
         # must be some form of NumericValue
         if exp_type is list:
@@ -552,7 +764,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     return
                 fun_str, string_arg_str = \
                     self._op_string[EXPR.ExternalFunctionExpression]
-                if not self._symbolic_solver_labels:
+                if not self._nl_comments:
                     OUTPUT.write(fun_str
                                  % (self.external_byFcn[exp._fcn._function][1],
                                     exp.nargs()))
@@ -641,7 +853,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
         elif isinstance(exp, (var._VarData, IVariable)) and \
              (not exp.is_fixed()):
             #(self._output_fixed_variable_bounds or
-            if not self._symbolic_solver_labels:
+            if not self._nl_comments:
                 OUTPUT.write(self._op_string[var._VarData]
                              % (self.ampl_var_id[self._varID_map[id(exp)]]))
             else:
@@ -667,10 +879,14 @@ class ProblemWriter_nl(AbstractProblemWriter):
                         show_section_timing=False,
                         skip_trivial_constraints=False,
                         file_determinism=1,
-                        include_all_variable_bounds=False):
+                        include_all_variable_bounds=False,
+                        common_subexpressions=False,
+                        precomputed_repn=None):
 
         output_fixed_variable_bounds = self._output_fixed_variable_bounds
         symbolic_solver_labels = self._symbolic_solver_labels
+        nl_comments = self._nl_comments
+        nl_format = self._nl_format
 
         sorter = SortComponents.unsorted
         if file_determinism >= 1:
@@ -837,8 +1053,12 @@ class ProblemWriter_nl(AbstractProblemWriter):
                         max_rowname_len = len(objname)
 
                 if gen_obj_repn:
-                    repn = generate_standard_repn(active_objective.expr,
-                                                  quadratic=False)
+                    repn = None
+                    if precomputed_repn is not None:
+                        repn = precomputed_repn(active_objective)
+                    if repn is None:
+                        repn = generate_standard_repn(active_objective.expr,
+                                                      quadratic=False)
                     block_repn[active_objective] = repn
                     linear_vars = repn.linear_vars
                     nonlinear_vars = repn.nonlinear_vars
@@ -955,8 +1175,12 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     nonlinear_vars = repn.nonlinear_vars
                 else:
                     if gen_con_repn:
-                        repn = generate_standard_repn(constraint_data.body,
-                                                      quadratic=False)
+                        repn = None
+                        if precomputed_repn is not None:
+                            repn = precomputed_repn(constraint_data)
+                        if repn is None:
+                            repn = generate_standard_repn(
+                                constraint_data.body, quadratic=False)
                         block_repn[constraint_data] = repn
                         linear_vars = repn.linear_vars
                         nonlinear_vars = repn.nonlinear_vars
@@ -1034,7 +1258,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 if not _type is None:
                     _vid = self_varID_map[_vid]+1
                     constraint_bounds_dict[con_ID] = \
-                        "5 {0} {1}\n".format(_type, _vid)
+                        nl_format("5 %d %d\n") % (_type, _vid)
                     if _type == 1 or _type == 2:
                         n_single_sided_ineq += 1
                     elif _type == 3:
@@ -1049,17 +1273,20 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     if L == U:
                         if L is None:
                             # No constraint on body
-                            constraint_bounds_dict[con_ID] = "3\n"
+                            constraint_bounds_dict[con_ID] = \
+                                nl_format("3\n")
                             n_unbounded += 1
                         else:
                             constraint_bounds_dict[con_ID] = \
-                                "4 %r\n" % (L-offset)
+                                nl_format("4 %r\n") % (L-offset)
                             n_equals += 1
                     elif L is None:
-                        constraint_bounds_dict[con_ID] = "1 %r\n" % (U-offset)
+                        constraint_bounds_dict[con_ID] = \
+                            nl_format("1 %r\n") % (U-offset)
                         n_single_sided_ineq += 1
                     elif U is None:
-                        constraint_bounds_dict[con_ID] = "2 %r\n" % (L-offset)
+                        constraint_bounds_dict[con_ID] = \
+                            nl_format("2 %r\n") % (L-offset)
                         n_single_sided_ineq += 1
                     elif (L > U):
                         msg = 'Constraint {0}: lower bound greater than upper' \
@@ -1068,7 +1295,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                                                     str(L), str(U)))
                     else:
                         constraint_bounds_dict[con_ID] = \
-                            "0 %r %r\n" % (L-offset, U-offset)
+                            nl_format("0 %r %r\n") % (L-offset, U-offset)
                         # double sided inequality
                         # both are not none and they are valid
                         n_ranges += 1
@@ -1207,6 +1434,46 @@ class ProblemWriter_nl(AbstractProblemWriter):
             subsection_timer.report("Partition variable types")
             subsection_timer.reset()
 
+        #
+        # Identify common subexpressions (written as defined variables)
+        #
+        defined_var_list = []
+        n_common_exprs = {1: 0, 2: 0, 3: 0}
+        if common_subexpressions:
+            cse = self._cse = CommonSubexpressions()
+            # usage flags: 1 = constraints, 2 = objectives
+            roots = []
+            for obj_ID, (obj, wrapped_repn) in iteritems(Objectives_dict):
+                if wrapped_repn.repn.nonlinear_expr is not None:
+                    roots.append(
+                        (cse.add(wrapped_repn.repn.nonlinear_expr), 2))
+            for con_ID in nonlin_con_order_list:
+                wrapped_repn = Constraints_dict[con_ID][1]
+                if wrapped_repn.repn.nonlinear_expr is not None:
+                    roots.append(
+                        (cse.add(wrapped_repn.repn.nonlinear_expr), 1))
+            usage = cse.propagate(roots)
+            # The ASL expects the defined variables used in both
+            # constraints and objectives first, followed by those only
+            # used in constraints, and then those only used in
+            # objectives.  Within each group, the (post-order)
+            # canonical ids guarantee that defined variables are
+            # defined before they are referenced.
+            _group = {3: 0, 1: 1, 2: 2}
+            defined_var_list = sorted(
+                (cid for cid in cse.shared()
+                 if not cse.representative(cid).is_fixed()),
+                key=lambda cid: (_group[usage[cid]], cid))
+            self._defined_var_id = dict(
+                (cid, len(full_var_list) + i)
+                for i, cid in enumerate(defined_var_list))
+            for cid in defined_var_list:
+                n_common_exprs[usage[cid]] += 1
+
+            if show_section_timing:
+                subsection_timer.report("Identify common subexpressions")
+                subsection_timer.reset()
+
 #        end_time = time.clock()
 #        print (end_time - start_time)
 
@@ -1234,7 +1501,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # LINE 1
         #
-        OUTPUT.write("g3 1 1 0\t# problem {0}\n".format(model.name))
+        OUTPUT.write("{0}3 1 1 0\t# problem {1}\n".format(
+            'b' if self._binary_nl else 'g', model.name))
         #
         # LINE 2
         #
@@ -1272,8 +1540,13 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # LINE 6
         #
-        OUTPUT.write(" 0 {0} 0 1\t# linear network variables; functions; "
-                     "arith, flags\n".format(len(self.external_byFcn)))
+        # The arithmetic kind (byte order) only matters for binary files
+        # (1: little-endian IEEE, 2: big-endian IEEE)
+        arith = 0
+        if self._binary_nl:
+            arith = 1 if sys.byteorder == 'little' else 2
+        OUTPUT.write(" 0 {0} {1} 1\t# linear network variables; functions; "
+                     "arith, flags\n".format(len(self.external_byFcn), arith))
         #
         # LINE 7
         #
@@ -1303,7 +1576,10 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # LINE 10
         #
-        OUTPUT.write(" 0 0 0 0 0\t# common exprs: b,c,o,c1,o1\n")
+        OUTPUT.write(" {0} {1} {2} 0 0\t# common exprs: b,c,o,c1,o1\n".format(
+            n_common_exprs[3],
+            n_common_exprs[1],
+            n_common_exprs[2]))
 
 #        end_time = time.clock()
 #        print (end_time - start_time)
@@ -1317,7 +1593,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         for fcn, fid in sorted(itervalues(self.external_byFcn),
                                key=operator.itemgetter(1)):
-            OUTPUT.write("F%d 1 -1 %s\n" % (fid, fcn._function))
+            OUTPUT.write(nl_format("F%d 1 -1 %s\n") % (fid, fcn._function))
 
         #
         # "S" lines
@@ -1345,8 +1621,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
         sosconstraint_sosno_vals = set(var_sosno_suffix.vals)
 
         # Translate the rest of the Pyomo Suffix components
-        suffix_header_line = "S{0} {1} {2}\n"
-        suffix_line = "{0} {1!r}\n"
+        suffix_header_line = nl_format("S%d %d %s\n")
+        suffix_line = nl_format("%d %r\n")
+        int_suffix_line = suffix_line
+        if self._binary_nl:
+            int_suffix_line = nl_format("%d %d\n")
         var_tag = 0
         con_tag = 1
         obj_tag = 2
@@ -1368,10 +1647,12 @@ class ProblemWriter_nl(AbstractProblemWriter):
         if not ('sosno' in suffix_dict):
             # We still need to write out the SOSConstraint suffixes
             # even though these may have not been "declared" on the model
-            s_lines = var_sosno_suffix.genfilelines()
+            s_lines = var_sosno_suffix.genfilelines(
+                nl_format if self._binary_nl else None)
             len_s_lines = len(s_lines)
             if len_s_lines > 0:
-                OUTPUT.write(suffix_header_line.format(var_tag,len_s_lines,'sosno'))
+                OUTPUT.write(suffix_header_line
+                             % (var_tag, len_s_lines, 'sosno'))
                 OUTPUT.writelines(s_lines)
         else:
             # I am choosing not to allow a user to mix the use of the Pyomo
@@ -1395,10 +1676,12 @@ class ProblemWriter_nl(AbstractProblemWriter):
         if not ('ref' in suffix_dict):
             # We still need to write out the SOSConstraint suffixes
             # even though these may have not been "declared" on the model
-            s_lines = var_ref_suffix.genfilelines()
+            s_lines = var_ref_suffix.genfilelines(
+                nl_format if self._binary_nl else None)
             len_s_lines = len(s_lines)
             if len_s_lines > 0:
-                OUTPUT.write(suffix_header_line.format(var_tag,len_s_lines,'ref'))
+                OUTPUT.write(suffix_header_line
+                             % (var_tag, len_s_lines, 'ref'))
                 OUTPUT.writelines(s_lines)
         else:
             # see reason (1) in the paragraph above for why we raise this
@@ -1435,8 +1718,10 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 # The NL file format has a special section for dual initializations
                 continue
             float_tag = 0
+            s_line = int_suffix_line
             if datatypes.pop() == Suffix.FLOAT:
                 float_tag = 4
+                s_line = suffix_line
 
             var_s_lines = []
             con_s_lines = []
@@ -1464,26 +1749,26 @@ class ProblemWriter_nl(AbstractProblemWriter):
 
             ################## vars
             if len(var_s_lines) > 0:
-                OUTPUT.write(suffix_header_line.format(var_tag | float_tag,
-                                                       len(var_s_lines),
-                                                       suffix_name))
-                OUTPUT.writelines(suffix_line.format(*_l)
+                OUTPUT.write(suffix_header_line % (var_tag | float_tag,
+                                                   len(var_s_lines),
+                                                   suffix_name))
+                OUTPUT.writelines(s_line % _l
                                   for _l in sorted(var_s_lines,
                                                    key=operator.itemgetter(0)))
             ################## constraints
             if len(con_s_lines) > 0:
-                OUTPUT.write(suffix_header_line.format(con_tag | float_tag,
-                                                       len(con_s_lines),
-                                                       suffix_name))
-                OUTPUT.writelines(suffix_line.format(*_l)
+                OUTPUT.write(suffix_header_line % (con_tag | float_tag,
+                                                   len(con_s_lines),
+                                                   suffix_name))
+                OUTPUT.writelines(s_line % _l
                                   for _l in sorted(con_s_lines,
                                                    key=operator.itemgetter(0)))
             ################## objectives
             if len(obj_s_lines) > 0:
-                OUTPUT.write(suffix_header_line.format(obj_tag | float_tag,
-                                                       len(obj_s_lines),
-                                                       suffix_name))
-                OUTPUT.writelines(suffix_line.format(*_l)
+                OUTPUT.write(suffix_header_line % (obj_tag | float_tag,
+                                                   len(obj_s_lines),
+                                                   suffix_name))
+                OUTPUT.writelines(s_line % _l
                                   for _l in sorted(obj_s_lines,
                                                    key=operator.itemgetter(0)))
             ################## problems (in this case the one problem)
@@ -1493,15 +1778,35 @@ class ProblemWriter_nl(AbstractProblemWriter):
                         "ProblemWriter_nl: Collected multiple values for Suffix %s "
                         "referencing model %s. This is likely a bug."
                         % (suffix_name, model.name))
-                OUTPUT.write(suffix_header_line.format(prob_tag | float_tag,
-                                                       len(mod_s_lines),
-                                                       suffix_name))
-                OUTPUT.writelines(suffix_line.format(*_l)
+                OUTPUT.write(suffix_header_line % (prob_tag | float_tag,
+                                                   len(mod_s_lines),
+                                                   suffix_name))
+                OUTPUT.writelines(s_line % _l
                                   for _l in sorted(mod_s_lines,
                                                    key=operator.itemgetter(0)))
 
         del modelSOS
 
+        #
+        # "V" lines
+        #
+        for cid in defined_var_list:
+            if nl_comments:
+                OUTPUT.write("V%d 0 0\t#common subexpression\n"
+                             % (self._defined_var_id[cid],))
+            else:
+                OUTPUT.write(nl_format("V%d 0 0\n")
+                             % (self._defined_var_id[cid],))
+            self._cse_top = self._cse.representative(cid)
+            self._print_nonlinear_terms_NL(self._cse_top)
+        self._cse_top = None
+
+        # The text of the nonlinear expressions can only be reused if
+        # it cannot reference defined variables or external functions
+        segment_cache = self._segment_cache
+        if self._cse is not None or self.external_byFcn:
+            segment_cache = None
+
         #
         # "C" lines
         #
@@ -1517,22 +1822,15 @@ class ProblemWriter_nl(AbstractProblemWriter):
         for con_ID in nonlin_con_order_list:
             con_data, wrapped_repn = Constraints_dict[con_ID]
             row_id = self_ampl_con_id[con_ID]
-            OUTPUT.write("C%d" % (row_id))
             if symbolic_solver_labels:
                 lbl = name_labeler(con_data)
-                OUTPUT.write("\t#%s" % (lbl))
                 rowf.write(lbl+"\n")
-            OUTPUT.write("\n")
-
-            if wrapped_repn.repn.nonlinear_expr is not None:
-                assert not wrapped_repn.repn.is_quadratic()
-                self._print_nonlinear_terms_NL(
-                    wrapped_repn.repn.nonlinear_expr)
+            if nl_comments:
+                OUTPUT.write("C%d\t#%s\n" % (row_id, lbl))
             else:
-                assert wrapped_repn.repn.is_quadratic()
-                self._print_standard_quadratic_NL(
-                    wrapped_repn.repn.quadratic_vars,
-                    wrapped_repn.repn.quadratic_coefs)
+                OUTPUT.write(nl_format("C%d\n") % (row_id))
+
+            self._print_repn_nonlinear_NL(wrapped_repn, segment_cache)
 
             for var_ID in set(wrapped_repn.linear_vars).union(
                     wrapped_repn.nonlinear_vars):
@@ -1544,13 +1842,14 @@ class ProblemWriter_nl(AbstractProblemWriter):
             con_vars = set(wrapped_repn.linear_vars)
             for var_ID in con_vars:
                 cu[self_ampl_var_id[var_ID]] += 1
-            OUTPUT.write("C%d" % (row_id))
             if symbolic_solver_labels:
                 lbl = name_labeler(con_data)
-                OUTPUT.write("\t#%s" % (lbl))
                 rowf.write(lbl+"\n")
-            OUTPUT.write("\n")
-            OUTPUT.write("n0\n")
+            if nl_comments:
+                OUTPUT.write("C%d\t#%s\n" % (row_id, lbl))
+            else:
+                OUTPUT.write(nl_format("C%d\n") % (row_id))
+            OUTPUT.write(self._op_string[NumericConstant] % (0))
 
         if show_section_timing:
             subsection_timer.report("Write NL header and suffix lines")
@@ -1565,12 +1864,15 @@ class ProblemWriter_nl(AbstractProblemWriter):
             if not obj.is_minimizing():
                 k = 1
 
-            OUTPUT.write("O%d %d" % (self_ampl_obj_id[obj_ID], k))
             if symbolic_solver_labels:
                 lbl = name_labeler(obj)
-                OUTPUT.write("\t#%s" % (lbl))
                 rowf.write(lbl+"\n")
-            OUTPUT.write("\n")
+            if nl_comments:
+                OUTPUT.write("O%d %d\t#%s\n"
+                             % (self_ampl_obj_id[obj_ID], k, lbl))
+            else:
+                OUTPUT.write(nl_format("O%d %d\n")
+                             % (self_ampl_obj_id[obj_ID], k))
 
             if wrapped_repn.repn.is_linear():
                 OUTPUT.write(self._op_string[NumericConstant]
@@ -1581,15 +1883,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     OUTPUT.write(binary_sum_str)
                     OUTPUT.write(self._op_string[NumericConstant]
                                  % (wrapped_repn.repn.constant))
-                if wrapped_repn.repn.nonlinear_expr is not None:
-                    assert not wrapped_repn.repn.is_quadratic()
-                    self._print_nonlinear_terms_NL(
-                        wrapped_repn.repn.nonlinear_expr)
-                else:
-                    assert wrapped_repn.repn.is_quadratic()
-                    self._print_standard_quadratic_NL(
-                        wrapped_repn.repn.quadratic_vars,
-                        wrapped_repn.repn.quadratic_coefs)
+                self._print_repn_nonlinear_NL(wrapped_repn, segment_cache)
 
         if symbolic_solver_labels:
             rowf.close()
@@ -1620,11 +1914,12 @@ class ProblemWriter_nl(AbstractProblemWriter):
                         pass
 
             if len(s_lines) > 0:
-                OUTPUT.write("d%d" % (len(s_lines)))
-                if symbolic_solver_labels:
-                    OUTPUT.write("\t# dual initial guess")
-                OUTPUT.write("\n")
-                OUTPUT.writelines(suffix_line.format(*_l)
+                if nl_comments:
+                    OUTPUT.write("d%d\t# dual initial guess\n"
+                                 % (len(s_lines)))
+                else:
+                    OUTPUT.write(nl_format("d%d\n") % (len(s_lines)))
+                OUTPUT.writelines(suffix_line % _l
                                   for _l in sorted(s_lines,
                                                    key=operator.itemgetter(0)))
 
@@ -1634,10 +1929,16 @@ class ProblemWriter_nl(AbstractProblemWriter):
         # variable initialization
         var_bound_list = []
         x_init_list = []
+        x_init_line = nl_format("%d %r\n")
+        lb_ub_line = nl_format("0 %r %r\n")
+        ub_line = nl_format("1 %r\n")
+        lb_line = nl_format("2 %r\n")
+        free_line = nl_format("3\n")
+        fixed_line = nl_format("4 %r\n")
         for ampl_var_id, var_ID in enumerate(full_var_list):
             var = Vars_dict[var_ID]
             if var.value is not None:
-                x_init_list.append("%d %r\n" % (ampl_var_id, var.value))
+                x_init_list.append(x_init_line % (ampl_var_id, var.value))
             if var.fixed:
                 if not output_fixed_variable_bounds:
                     raise ValueError(
@@ -1660,20 +1961,20 @@ class ProblemWriter_nl(AbstractProblemWriter):
             if L is not None:
                 if U is not None:
                     if L == U:
-                        var_bound_list.append("4 %r\n" % (L))
+                        var_bound_list.append(fixed_line % (L))
                     else:
-                        var_bound_list.append("0 %r %r\n" % (L, U))
+                        var_bound_list.append(lb_ub_line % (L, U))
                 else:
-                    var_bound_list.append("2 %r\n" % (L))
+                    var_bound_list.append(lb_line % (L))
             elif U is not None:
-                var_bound_list.append("1 %r\n" % (U))
+                var_bound_list.append(ub_line % (U))
             else:
-                var_bound_list.append("3\n")
+                var_bound_list.append(free_line)
 
-        OUTPUT.write("x%d" % (len(x_init_list)))
-        if symbolic_solver_labels:
-            OUTPUT.write("\t# initial guess")
-        OUTPUT.write("\n")
+        if nl_comments:
+            OUTPUT.write("x%d\t# initial guess\n" % (len(x_init_list)))
+        else:
+            OUTPUT.write(nl_format("x%d\n") % (len(x_init_list)))
         OUTPUT.writelines(x_init_list)
         del x_init_list
 
@@ -1684,11 +1985,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # "r" lines
         #
-        OUTPUT.write("r")
-        if symbolic_solver_labels:
-            OUTPUT.write("\t#%d ranges (rhs's)"
+        if nl_comments:
+            OUTPUT.write("r\t#%d ranges (rhs's)\n"
                          % (len(nonlin_con_order_list) + len(lin_con_order_list)))
-        OUTPUT.write("\n")
+        else:
+            OUTPUT.write(nl_format("r\n"))
         # *NOTE: This iteration follows the assignment of the ampl_con_id
         OUTPUT.writelines(constraint_bounds_dict[con_ID]
                           for con_ID in itertools.chain(nonlin_con_order_list,
@@ -1701,11 +2002,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # "b" lines
         #
-        OUTPUT.write("b")
-        if symbolic_solver_labels:
-            OUTPUT.write("\t#%d bounds (on variables)"
+        if nl_comments:
+            OUTPUT.write("b\t#%d bounds (on variables)\n"
                          % (len(var_bound_list)))
-        OUTPUT.write("\n")
+        else:
+            OUTPUT.write(nl_format("b\n"))
         OUTPUT.writelines(var_bound_list)
         del var_bound_list
 
@@ -1718,14 +2019,16 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         ktot = 0
         n1 = len(full_var_list) - 1
-        OUTPUT.write("k%d" % (n1))
-        if symbolic_solver_labels:
-            OUTPUT.write("\t#intermediate Jacobian column lengths")
-        OUTPUT.write("\n")
+        if nl_comments:
+            OUTPUT.write("k%d\t#intermediate Jacobian column lengths\n"
+                         % (n1))
+        else:
+            OUTPUT.write(nl_format("k%d\n") % (n1))
         ktot = 0
+        k_line = nl_format("%d\n")
         for i in xrange(n1):
             ktot += cu[i]
-            OUTPUT.write("%d\n"%(ktot))
+            OUTPUT.write(k_line % (ktot))
         del cu
 
         if show_section_timing:
@@ -1735,6 +2038,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # "J" lines
         #
+        J_header_line = nl_format("J%d %d\n")
+        J_line = nl_format("%d %r\n")
         for nc, con_ID in enumerate(itertools.chain(nonlin_con_order_list,
                                                     lin_con_order_list)):
             con_data, wrapped_repn = Constraints_dict[con_ID]
@@ -1746,17 +2051,17 @@ class ProblemWriter_nl(AbstractProblemWriter):
                                        for var_ID, coef in
                                        zip(wrapped_repn.linear_vars,
                                            wrapped_repn.repn.linear_coefs))
-                    OUTPUT.write("J%d %d\n"%(nc, numlinear_vars))
+                    OUTPUT.write(J_header_line % (nc, numlinear_vars))
                     OUTPUT.writelines(
-                        "%d %r\n" % (self_ampl_var_id[con_var],
-                                     linear_dict[con_var])
+                        J_line % (self_ampl_var_id[con_var],
+                                  linear_dict[con_var])
                         for con_var in sorted(linear_dict.keys()))
             elif numlinear_vars == 0:
                 nl_con_vars = \
                     sorted(wrapped_repn.nonlinear_vars)
-                OUTPUT.write("J%d %d\n"%(nc, numnonlinear_vars))
+                OUTPUT.write(J_header_line % (nc, numnonlinear_vars))
                 OUTPUT.writelines(
-                    "%d 0\n"%(self_ampl_var_id[con_var])
+                    J_line % (self_ampl_var_id[con_var], 0)
                     for con_var in nl_con_vars)
             else:
                 con_vars = set(wrapped_repn.nonlinear_vars)
@@ -1768,13 +2073,13 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     (var_ID, coef) for var_ID, coef in
                     zip(wrapped_repn.linear_vars,
                         wrapped_repn.repn.linear_coefs))
-                OUTPUT.write("J%d %d\n"%(nc, len(con_vars)))
+                OUTPUT.write(J_header_line % (nc, len(con_vars)))
                 OUTPUT.writelines(
-                    "%d %r\n" % (self_ampl_var_id[con_var],
-                                 linear_dict[con_var])
+                    J_line % (self_ampl_var_id[con_var],
+                              linear_dict[con_var])
                     for con_var in sorted(linear_dict.keys()))
                 OUTPUT.writelines(
-                    "%d 0\n"%(self_ampl_var_id[con_var])
+                    J_line % (self_ampl_var_id[con_var], 0)
                     for con_var in nl_con_vars)
 
 
@@ -1785,6 +2090,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # "G" lines
         #
+        G_header_line = nl_format("G%d %d\n")
+        G_line = nl_format("%d %r\n")
         for obj_ID, (obj, wrapped_repn) in \
                iteritems(Objectives_dict):
 
@@ -1798,11 +2105,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     grad_entries[self_ampl_var_id[obj_var]] = 0
             len_ge = len(grad_entries)
             if len_ge > 0:
-                OUTPUT.write("G%d %d\n" % (self_ampl_obj_id[obj_ID],
-                                           len_ge))
+                OUTPUT.write(G_header_line % (self_ampl_obj_id[obj_ID],
+                                              len_ge))
                 for var_ID in sorted(grad_entries.keys()):
-                    OUTPUT.write("%d %r\n" % (var_ID,
-                                              grad_entries[var_ID]))
+                    OUTPUT.write(G_line % (var_ID,
+                                           grad_entries[var_ID]))
 
         if show_section_timing:
             subsection_timer.report("Write G lines")
@@ -0,0 +1,169 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+#
+# An NL writer that reuses the work done in previous writes of the
+# same model
+#
+
+__all__ = ['IncrementalNLWriter']
+
+from six.moves import zip
+
+from pyomo.core.expr.numvalue import native_types
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.core.base import ComponentMap
+from pyomo.repn.standard_repn import generate_standard_repn
+from pyomo.repn.plugins.ampl.ampl_ import ProblemWriter_nl
+
+# Marker for variables that were not fixed
+_free = object()
+
+
+class IncrementalNLWriter(ProblemWriter_nl):
+    """An NL writer for models that are written repeatedly
+
+    Algorithms that solve a sequence of closely related problems
+    (decomposition, rolling horizon, etc.) often write the same model
+    many times, changing only variable bounds, fixed variable values or
+    a few mutable parameters between writes.  This writer remembers the
+    repn of every constraint and objective from the previous call,
+    together with the state of the variables, mutable parameters and
+    named expressions it depends on, and only regenerates the repns
+    whose dependencies changed.  The text of the nonlinear constraint
+    and objective expressions is cached as well, and spliced into the
+    new file when neither the repn nor the NL indices of its variables
+    changed.
+
+    The resulting file is identical to the one written by
+    :class:`ProblemWriter_nl`.  The writer is bound to the last model it
+    wrote: writing a different model (or changing
+    ``symbolic_solver_labels`` or ``binary_nl``) discards the cache.  The
+    ``parallel_repn`` option is ignored.
+
+    Example::
+
+        writer = IncrementalNLWriter()
+        for t in horizon:
+            update_model(model, t)
+            fname, symbol_map = writer(model, 'model.nl', lambda x: True, {})
+    """
+
+    def __init__(self):
+        ProblemWriter_nl.__init__(self)
+        self._precomputed_repn = self._get_repn
+        self.reset()
+
+    def reset(self):
+        """Discard all cached information"""
+        self._model = None
+        self._settings = None
+        # component -> (expr, vars, params, named expressions, state, repn)
+        self._repn_cache = ComponentMap()
+        self._segment_cache = {}
+        self._seen = set()
+        # Statistics for the most recent write
+        self.n_reused = 0
+        self.n_generated = 0
+
+    def __call__(self, model, filename, solver_capability, io_options):
+        settings = (bool(io_options.get('symbolic_solver_labels', False)),
+                    bool(io_options.get('binary_nl', False)))
+        if model is not self._model or settings != self._settings:
+            self.reset()
+            self._model = model
+            self._settings = settings
+        self.n_reused = 0
+        self.n_generated = 0
+        self._seen = set()
+        try:
+            return ProblemWriter_nl.__call__(
+                self, model, filename, solver_capability, io_options)
+        finally:
+            # Forget the components (and text) that were not written
+            for comp in list(self._repn_cache):
+                if id(comp) not in self._seen:
+                    del self._repn_cache[comp]
+            live = set(id(entry[-1]) for entry in self._repn_cache.values())
+            for key in list(self._segment_cache):
+                if key not in live:
+                    del self._segment_cache[key]
+            self._seen = set()
+
+    def _get_repn(self, comp):
+        self._seen.add(id(comp))
+        expr = getattr(comp, 'body', None)
+        if expr is None:
+            expr = comp.expr
+        entry = self._repn_cache.get(comp, None)
+        if entry is not None and entry[0] is expr and _unchanged(entry):
+            self.n_reused += 1
+            return entry[-1]
+        self.n_generated += 1
+        vars_, params, named = _collect_leaves(expr)
+        repn = generate_standard_repn(expr, quadratic=False)
+        self._repn_cache[comp] = (expr, vars_, params, named,
+                                  _leaf_state(vars_, params, named), repn)
+        return repn
+
+
+def _collect_leaves(expr):
+    """Return the variables, mutable parameters and named expressions
+    referenced by an expression"""
+    vars_ = []
+    params = []
+    named = []
+    seen = set()
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if node.__class__ in native_types or id(node) in seen:
+            continue
+        seen.add(id(node))
+        if node.is_expression_type():
+            if node.is_named_expression_type():
+                named.append(node)
+            if isinstance(node, LinearExpression):
+                # LinearExpression (e.g., from quicksum or sum_product)
+                # keeps its terms outside of args
+                stack.append(node.constant)
+                stack.extend(node.linear_coefs)
+                stack.extend(node.linear_vars)
+            else:
+                stack.extend(node.args)
+        elif node.is_variable_type():
+            vars_.append(node)
+        elif not node.is_constant():
+            params.append(node)
+    return vars_, params, named
+
+
+def _leaf_state(vars_, params, named):
+    return ([v.value if v.fixed else _free for v in vars_],
+            [p.value for p in params],
+            [e.expr for e in named])
+
+
+def _unchanged(entry):
+    _, vars_, params, named, (var_state, param_state, named_state), _ \
+        = entry
+    for v, old in zip(vars_, var_state):
+        if v.fixed:
+            if old is _free or v.value != old:
+                return False
+        elif old is not _free:
+            return False
+    for p, old in zip(params, param_state):
+        if p.value != old:
+            return False
+    for e, old in zip(named, named_state):
+        if e.expr is not old:
+            return False
+    return True
@@ -26,6 +26,8 @@ from pyomo.core.base import \
      SOSConstraint, Objective,
      ComponentMap, is_fixed)
 from pyomo.repn import generate_standard_repn
+from pyomo.repn.linear_matrix import generate_linear_matrix_repn
+from pyomo.repn.parallel import generate_standard_repns
 
 logger = logging.getLogger('pyomo.core')
 
@@ -126,11 +128,36 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         force_objective_constant = \
             io_options.pop("force_objective_constant", False)
 
+        # Compile linear models into a LinearMatrixRepn (instead of
+        # generating a StandardRepn per constraint).  Either True or a
+        # previously compiled LinearMatrixRepn for this model.
+        linear_matrix_repn = \
+            io_options.pop("linear_matrix_repn", False)
+
+        # Generate the repns of the active constraints in a pool of
+        # this many worker processes (True: one per CPU)
+        parallel_repn = io_options.pop("parallel_repn", None)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_cpxlp passed unrecognized io_options:\n\t" +
                 "\n\t".join("%s = %s" % (k,v) for k,v in iteritems(io_options)))
 
+        # A function returning the (precomputed) repn for a constraint
+        # or objective, or None if it must be generated by the writer
+        precomputed_repn = None
+        if linear_matrix_repn is True:
+            try:
+                linear_matrix_repn = generate_linear_matrix_repn(model)
+            except ValueError:
+                # Not a linear model: fall back on generate_standard_repn
+                linear_matrix_repn = None
+        elif not linear_matrix_repn:
+            linear_matrix_repn = None
+        if linear_matrix_repn is None and parallel_repn:
+            precomputed_repn = generate_standard_repns(
+                model, parallel_repn).get
+
         if symbolic_solver_labels and (labeler is not None):
             raise ValueError("ProblemWriter_cpxlp: Using both the "
                              "'symbolic_solver_labels' and 'labeler' "
@@ -169,7 +196,9 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     column_order=column_order,
                     skip_trivial_constraints=skip_trivial_constraints,
                     force_objective_constant=force_objective_constant,
-                    include_all_variable_bounds=include_all_variable_bounds)
+                    include_all_variable_bounds=include_all_variable_bounds,
+                    precomputed_repn=precomputed_repn,
+                    linear_matrix_repn=linear_matrix_repn)
 
         self._referenced_variable_ids.clear()
 
@@ -333,6 +362,47 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         #
         return x.constant
 
+    def _matrix_row_printer(self,
+                            matrix,
+                            variable_symbol_dictionary,
+                            column_order):
+        """
+        Return a function that returns the body of a row of a
+        LinearMatrixRepn as a string in LP format (or None if the row
+        is empty).  The rows are written directly from the CSR arrays,
+        with the columns in the same order as _print_expr_canonical.
+        """
+        linear_coef_string_template = self.linear_coef_string_template
+        referenced_variable_ids = self._referenced_variable_ids
+        variables = matrix.variables
+        var_ids = [id(var) for var in variables]
+        names = [variable_symbol_dictionary[var_id] for var_id in var_ids]
+        if column_order is None:
+            # Rank the columns by their names (once for all rows)
+            rank = [0]*len(names)
+            for i, j in enumerate(sorted(range(len(names)),
+                                         key=names.__getitem__)):
+                rank[j] = i
+        else:
+            rank = [column_order.get(var) for var in variables]
+        indptr = matrix.indptr
+        indices = matrix.indices
+        data = matrix.data
+
+        def print_row(i):
+            start, end = indptr[i], indptr[i+1]
+            if start == end:
+                return None
+            cols = indices[start:end]
+            body = []
+            for _, j, coef in sorted(zip([rank[j] for j in cols],
+                                         cols,
+                                         data[start:end])):
+                referenced_variable_ids[var_ids[j]] = variables[j]
+                body.append(linear_coef_string_template % (coef, names[j]))
+            return ''.join(body)
+        return print_row
+
     def printSOS(self,
                  symbol_map,
                  labeler,
@@ -385,7 +455,9 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                         column_order=None,
                         skip_trivial_constraints=False,
                         force_objective_constant=False,
-                        include_all_variable_bounds=False):
+                        include_all_variable_bounds=False,
+                        precomputed_repn=None,
+                        linear_matrix_repn=None):
 
         eq_string_template = self.eq_string_template
         leq_string_template = self.leq_string_template
@@ -509,7 +581,13 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     output.append("max \n")
 
                 if gen_obj_repn:
-                    repn = generate_standard_repn(objective_data.expr)
+                    repn = None
+                    if linear_matrix_repn is not None:
+                        repn = linear_matrix_repn.standard_repn(objective_data)
+                    elif precomputed_repn is not None:
+                        repn = precomputed_repn(objective_data)
+                    if repn is None:
+                        repn = generate_standard_repn(objective_data.expr)
                     block_repn[objective_data] = repn
                 else:
                     repn = block_repn[objective_data]
@@ -566,6 +644,17 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
 
         supports_quadratic_constraint = solver_capability('quadratic_constraint')
 
+        # The rows of the LinearMatrixRepn are yielded as their (int)
+        # row index, and written directly from the matrix
+        if linear_matrix_repn is not None:
+            matrix_row_index = linear_matrix_repn.row_index
+            matrix_lower = linear_matrix_repn.lower
+            matrix_upper = linear_matrix_repn.upper
+            print_matrix_row = self._matrix_row_printer(
+                linear_matrix_repn,
+                variable_symbol_dictionary,
+                column_order)
+
         def constraint_generator():
             for block in all_blocks:
 
@@ -582,12 +671,24 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                         sort=sortOrder,
                         descend_into=False):
 
+                    # (The matrix only holds the rows that have a bound)
+                    if gen_con_repn and linear_matrix_repn is not None:
+                        row = matrix_row_index(constraint_data)
+                        if row is not None:
+                            yield constraint_data, row
+                            continue
+
                     if (not constraint_data.has_lb()) and \
                        (not constraint_data.has_ub()):
                         assert not constraint_data.equality
                         continue # non-binding, so skip
 
-                    if constraint_data._linear_canonical_form:
+                    repn = None
+                    if gen_con_repn and precomputed_repn is not None:
+                        repn = precomputed_repn(constraint_data)
+                    if repn is not None:
+                        block_repn[constraint_data] = repn
+                    elif constraint_data._linear_canonical_form:
                         repn = constraint_data.canonical_form()
                     elif gen_con_repn:
                         repn = generate_standard_repn(constraint_data.body)
@@ -610,6 +711,58 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         for constraint_data, repn in yield_all_constraints():
             have_nontrivial = True
 
+            if repn.__class__ is int:
+                #
+                # Write a row of the LinearMatrixRepn (the bounds
+                # already have the body constant moved to the rhs)
+                #
+                body = print_matrix_row(repn)
+                if body is None:
+                    if skip_trivial_constraints:
+                        continue
+                    body = self.linear_coef_string_template \
+                           % (0, 'ONE_VAR_CONSTANT')
+                con_symbol = create_symbol_func(
+                    symbol_map, constraint_data, labeler)
+                lb = matrix_lower[repn]
+                ub = matrix_upper[repn]
+                if constraint_data.equality:
+                    label = 'c_e_%s_' % con_symbol
+                    alias_symbol_func(symbol_map, constraint_data, label)
+                    output.append(label)
+                    output.append(':\n')
+                    output.append(body)
+                    output.append(eq_string_template
+                                      % (_no_negative_zero(lb)))
+                    output.append("\n")
+                else:
+                    if lb is not None:
+                        if ub is not None:
+                            label = 'r_l_%s_' % con_symbol
+                        else:
+                            label = 'c_l_%s_' % con_symbol
+                        alias_symbol_func(symbol_map, constraint_data, label)
+                        output.append(label)
+                        output.append(':\n')
+                        output.append(body)
+                        output.append(geq_string_template
+                                          % (_no_negative_zero(lb)))
+                    if ub is not None:
+                        if lb is not None:
+                            label = 'r_u_%s_' % con_symbol
+                        else:
+                            label = 'c_u_%s_' % con_symbol
+                        alias_symbol_func(symbol_map, constraint_data, label)
+                        output.append(label)
+                        output.append(':\n')
+                        output.append(body)
+                        output.append(leq_string_template
+                                          % (_no_negative_zero(ub)))
+                if len(output) > 1024:
+                    output_file.write( "".join(output) )
+                    output = []
+                continue
+
             degree = repn.polynomial_degree()
 
             #
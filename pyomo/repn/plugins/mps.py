@@ -27,6 +27,8 @@ from pyomo.core.base import \
      SOSConstraint, Objective,
      ComponentMap, is_fixed)
 from pyomo.repn import generate_standard_repn
+from pyomo.repn.linear_matrix import generate_linear_matrix_repn
+from pyomo.repn.parallel import generate_standard_repns
 
 logger = logging.getLogger('pyomo.core')
 
@@ -127,11 +129,36 @@ class ProblemWriter_mps(AbstractProblemWriter):
         skip_objective_sense = \
             io_options.pop("skip_objective_sense", False)
 
+        # Compile linear models into a LinearMatrixRepn (instead of
+        # generating a StandardRepn per constraint).  Either True or a
+        # previously compiled LinearMatrixRepn for this model.
+        linear_matrix_repn = \
+            io_options.pop("linear_matrix_repn", False)
+
+        # Generate the repns of the active constraints in a pool of
+        # this many worker processes (True: one per CPU)
+        parallel_repn = io_options.pop("parallel_repn", None)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_mps passed unrecognized io_options:\n\t" +
                 "\n\t".join("%s = %s" % (k,v) for k,v in iteritems(io_options)))
 
+        # A function returning the (precomputed) repn for a constraint
+        # or objective, or None if it must be generated by the writer
+        precomputed_repn = None
+        if linear_matrix_repn is True:
+            try:
+                linear_matrix_repn = generate_linear_matrix_repn(model)
+            except ValueError:
+                # Not a linear model: fall back on generate_standard_repn
+                linear_matrix_repn = None
+        elif not linear_matrix_repn:
+            linear_matrix_repn = None
+        if linear_matrix_repn is None and parallel_repn:
+            precomputed_repn = generate_standard_repns(
+                model, parallel_repn).get
+
         if symbolic_solver_labels and (labeler is not None):
             raise ValueError("ProblemWriter_mps: Using both the "
                              "'symbolic_solver_labels' and 'labeler' "
@@ -168,7 +195,9 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     skip_trivial_constraints=skip_trivial_constraints,
                     force_objective_constant=force_objective_constant,
                     include_all_variable_bounds=include_all_variable_bounds,
-                    skip_objective_sense=skip_objective_sense)
+                    skip_objective_sense=skip_objective_sense,
+                    precomputed_repn=precomputed_repn,
+                    linear_matrix_repn=linear_matrix_repn)
 
         self._referenced_variable_ids.clear()
 
@@ -206,6 +235,35 @@ class ProblemWriter_mps(AbstractProblemWriter):
         #
         return repn.constant
 
+    def _matrix_row_extractor(self,
+                              matrix,
+                              column_data,
+                              variable_to_column):
+        """
+        Return a function that adds the coefficients of a row of a
+        LinearMatrixRepn to the column data (under the given row label)
+        and returns the number of nonzeros in the row.  The coefficients
+        are copied directly from the CSR arrays.  If the row label is
+        None, only the number of nonzeros is returned.
+        """
+        referenced_variable_ids = self._referenced_variable_ids
+        variables = matrix.variables
+        var_ids = [id(var) for var in variables]
+        columns = [column_data[variable_to_column[var]] for var in variables]
+        indptr = matrix.indptr
+        indices = matrix.indices
+        data = matrix.data
+
+        def extract_row(i, row_label):
+            start, end = indptr[i], indptr[i+1]
+            if row_label is not None:
+                for k in xrange(start, end):
+                    j = indices[k]
+                    referenced_variable_ids[var_ids[j]] = variables[j]
+                    columns[j].append((row_label, data[k]))
+            return end - start
+        return extract_row
+
     def _printSOS(self,
                   symbol_map,
                   labeler,
@@ -262,7 +320,9 @@ class ProblemWriter_mps(AbstractProblemWriter):
                          skip_trivial_constraints=False,
                          force_objective_constant=False,
                          include_all_variable_bounds=False,
-                         skip_objective_sense=False):
+                         skip_objective_sense=False,
+                         precomputed_repn=None,
+                         linear_matrix_repn=None):
 
         symbol_map = SymbolMap()
         variable_symbol_map = SymbolMap()
@@ -381,8 +441,14 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 output_file.write(" N  %s\n" % (objective_label))
 
                 if gen_obj_repn:
-                    repn = \
-                        generate_standard_repn(objective_data.expr)
+                    repn = None
+                    if linear_matrix_repn is not None:
+                        repn = linear_matrix_repn.standard_repn(objective_data)
+                    elif precomputed_repn is not None:
+                        repn = precomputed_repn(objective_data)
+                    if repn is None:
+                        repn = \
+                            generate_standard_repn(objective_data.expr)
                     block_repn[objective_data] = repn
                 else:
                     repn = block_repn[objective_data]
@@ -415,6 +481,16 @@ class ProblemWriter_mps(AbstractProblemWriter):
         assert objective_label is not None
 
         # Constraints
+
+        # The rows of the LinearMatrixRepn are yielded as their (int)
+        # row index, and copied directly from the matrix into the columns
+        if linear_matrix_repn is not None:
+            matrix_row_index = linear_matrix_repn.row_index
+            matrix_lower = linear_matrix_repn.lower
+            matrix_upper = linear_matrix_repn.upper
+            extract_matrix_row = self._matrix_row_extractor(
+                linear_matrix_repn, column_data, variable_to_column)
+
         def constraint_generator():
             for block in all_blocks:
 
@@ -432,12 +508,24 @@ class ProblemWriter_mps(AbstractProblemWriter):
                         sort=sortOrder,
                         descend_into=False):
 
+                    # (The matrix only holds the rows that have a bound)
+                    if gen_con_repn and linear_matrix_repn is not None:
+                        row = matrix_row_index(constraint_data)
+                        if row is not None:
+                            yield constraint_data, row
+                            continue
+
                     if (not constraint_data.has_lb()) and \
                        (not constraint_data.has_ub()):
                         assert not constraint_data.equality
                         continue # non-binding, so skip
 
-                    if constraint_data._linear_canonical_form:
+                    repn = None
+                    if gen_con_repn and precomputed_repn is not None:
+                        repn = precomputed_repn(constraint_data)
+                    if repn is not None:
+                        block_repn[constraint_data] = repn
+                    elif constraint_data._linear_canonical_form:
                         repn = constraint_data.canonical_form()
                     elif gen_con_repn:
                         repn = generate_standard_repn(constraint_data.body)
@@ -458,6 +546,46 @@ class ProblemWriter_mps(AbstractProblemWriter):
 
         for constraint_data, repn in yield_all_constraints():
 
+            if repn.__class__ is int:
+                #
+                # A row of the LinearMatrixRepn (the bounds already
+                # have the body constant moved to the rhs)
+                #
+                if skip_trivial_constraints and \
+                   not extract_matrix_row(repn, None):
+                    continue
+                con_symbol = create_symbol_func(symbol_map,
+                                                constraint_data,
+                                                labeler)
+                lb = matrix_lower[repn]
+                ub = matrix_upper[repn]
+                if constraint_data.equality:
+                    label = 'c_e_' + con_symbol + '_'
+                    alias_symbol_func(symbol_map, constraint_data, label)
+                    output_file.write(" E  %s\n" % (label))
+                    extract_matrix_row(repn, label)
+                    rhs_data.append((label, _no_negative_zero(lb)))
+                else:
+                    if lb is not None:
+                        if ub is not None:
+                            label = 'r_l_' + con_symbol + '_'
+                        else:
+                            label = 'c_l_' + con_symbol + '_'
+                        alias_symbol_func(symbol_map, constraint_data, label)
+                        output_file.write(" G  %s\n" % (label))
+                        extract_matrix_row(repn, label)
+                        rhs_data.append((label, _no_negative_zero(lb)))
+                    if ub is not None:
+                        if lb is not None:
+                            label = 'r_u_' + con_symbol + '_'
+                        else:
+                            label = 'c_u_' + con_symbol + '_'
+                        alias_symbol_func(symbol_map, constraint_data, label)
+                        output_file.write(" L  %s\n" % (label))
+                        extract_matrix_row(repn, label)
+                        rhs_data.append((label, _no_negative_zero(ub)))
+                continue
+
             degree = repn.polynomial_degree()
 
             # Write constraint
@@ -31,6 +31,7 @@ from pyomo.core.base.expression import SimpleExpression, _GeneralExpressionData
 from pyomo.core.base.var import (SimpleVar,
                                  Var,
                                  _GeneralVarData,
+                                 _ArrayVarData,
                                  value)
 from pyomo.core.base.numvalue import (NumericConstant,
                                       native_numeric_types)
@@ -927,6 +928,7 @@ _repn_collectors = {
     #parameter               : _collect_linear_const,
     NumericConstant                             : _collect_const,
     _GeneralVarData                             : _collect_var,
+    _ArrayVarData                               : _collect_var,
     SimpleVar                                   : _collect_var,
     Var                                         : _collect_var,
     variable                                    : _collect_var,
@@ -1324,6 +1326,7 @@ _linear_repn_collectors = {
     ##param.Param             : _collect_linear_const,
     ##parameter               : _collect_linear_const,
     _GeneralVarData                             : _linear_collect_var,
+    _ArrayVarData                               : _linear_collect_var,
     SimpleVar                                   : _linear_collect_var,
     Var                                         : _linear_collect_var,
     variable                                    : _linear_collect_var,
@@ -0,0 +1,220 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Test the binary ("b") NL format
+#
+
+import struct
+import sys
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.environ import (
+    ConcreteModel, Var, Constraint, Objective, Suffix, SOSConstraint,
+    Binary, exp, sin, maximize, inequality,
+)
+from pyomo.repn.plugins.ampl.ampl_ import _binary_nl_format
+
+_binary_ops = (0, 1, 2, 3, 5, 21, 22, 23, 24)
+
+
+class _Decoder(object):
+    """Translate the body of a binary NL file to the equivalent text
+    NL lines (without comments)"""
+
+    def __init__(self, data, n_var, n_con):
+        self.data = data
+        self.pos = 0
+        self.n_var = n_var
+        self.n_con = n_con
+        self.lines = []
+
+    def get(self, fmt):
+        ans = struct.unpack_from('='+fmt, self.data, self.pos)
+        self.pos += struct.calcsize('='+fmt)
+        return ans
+
+    def key(self):
+        return self.get('c')[0].decode('ascii')
+
+    def pairs(self, n, val='d'):
+        for i in range(n):
+            self.lines.append("%d %r" % self.get('i'+val))
+
+    def bounds(self, n):
+        for i in range(n):
+            kind = self.key()
+            if kind in '124':
+                self.lines.append("%s %r" % (kind, self.get('d')[0]))
+            elif kind == '0':
+                self.lines.append("0 %r %r" % self.get('dd'))
+            elif kind == '5':
+                self.lines.append("5 %d %d" % self.get('ii'))
+            else:
+                self.lines.append(kind)
+
+    def expr(self):
+        key = self.key()
+        if key == 'n':
+            self.lines.append("n%r" % self.get('d'))
+        elif key == 'v':
+            self.lines.append("v%d" % self.get('i'))
+        elif key == 'o':
+            op = self.get('i')[0]
+            self.lines.append("o%d" % op)
+            if op == 54:
+                n = self.get('i')[0]
+                self.lines.append("%d" % n)
+            else:
+                n = 2 if op in _binary_ops else 3 if op == 35 else 1
+            for i in range(n):
+                self.expr()
+        else:
+            raise ValueError("unexpected expression key %r" % key)
+
+    def decode(self):
+        while self.pos < len(self.data):
+            key = self.key()
+            if key == 'S':
+                kind, n = self.get('ii')
+                namelen = self.get('i')[0]
+                name = self.get('%ds' % namelen)[0].decode('ascii')
+                self.lines.append("S%d %d %s" % (kind, n, name))
+                self.pairs(n, 'd' if kind & 4 else 'i')
+            elif key in 'CV':
+                args = self.get('iii' if key == 'V' else 'i')
+                self.lines.append(key + ' '.join(str(a) for a in args))
+                self.expr()
+            elif key == 'O':
+                self.lines.append("O%d %d" % self.get('ii'))
+                self.expr()
+            elif key in 'dx':
+                n = self.get('i')[0]
+                self.lines.append("%s%d" % (key, n))
+                self.pairs(n)
+            elif key in 'rb':
+                self.lines.append(key)
+                self.bounds(self.n_con if key == 'r' else self.n_var)
+            elif key == 'k':
+                n = self.get('i')[0]
+                self.lines.append("k%d" % n)
+                self.lines.extend("%d" % k for k in self.get('%di' % n))
+            elif key in 'JG':
+                i, n = self.get('ii')
+                self.lines.append("%s%d %d" % (key, i, n))
+                self.pairs(n)
+            else:
+                raise ValueError("unexpected segment key %r" % key)
+        return self.lines
+
+
+def _normalize(lines):
+    # Compare numbers by value (the text file writes ints as ints)
+    ans = []
+    for line in lines:
+        tokens = []
+        for token in line.split():
+            try:
+                tokens.append(float(token))
+            except ValueError:
+                try:
+                    tokens.append((token[0], float(token[1:])))
+                except ValueError:
+                    tokens.append(token)
+        ans.append(tokens)
+    return ans
+
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3], bounds=(0, 4), initialize=1.5)
+    m.y = Var(within=Binary)
+    m.z = Var()
+    m.o = Objective(expr=m.x[1]**2 + exp(m.x[2]) + 3*m.y + 2,
+                    sense=maximize)
+    m.c1 = Constraint(expr=m.x[1] + m.x[2]*m.y >= 1)
+    m.c2 = Constraint(expr=m.x[1] + m.y == 1)
+    m.c3 = Constraint(expr=inequality(-1, sin(m.x[3]) - m.z, 2))
+    m.c4 = Constraint(expr=m.z + m.x[2] <= 5)
+    m.sos = SOSConstraint(var=m.x, sos=1)
+    m.ints = Suffix(direction=Suffix.EXPORT, datatype=Suffix.INT)
+    m.ints[m.c1] = 2
+    m.floats = Suffix(direction=Suffix.EXPORT)
+    m.floats[m.x[2]] = 0.5
+    m.floats[m.o] = -1.25
+    m.dual = Suffix(direction=Suffix.EXPORT)
+    m.dual[m.c2] = 3.0
+    return m
+
+
+class TestBinaryNL(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+
+    def tearDown(self):
+        TempfileManager.pop()
+
+    def _write(self, m, **io_options):
+        fname = TempfileManager.create_tempfile(suffix='.nl')
+        m.write(fname, format='nl', io_options=io_options)
+        with open(fname, 'rb') as FILE:
+            return FILE.read()
+
+    def test_template(self):
+        self.assertEqual(_binary_nl_format("r\n"), b'r')
+        self.assertEqual(_binary_nl_format("o54\n%d\n") % 3,
+                         struct.pack('=cii', b'o', 54, 3))
+        self.assertEqual(_binary_nl_format("0 %r %r\n") % (1, 2.5),
+                         struct.pack('=cdd', b'0', 1, 2.5))
+        self.assertEqual(_binary_nl_format("F%d 1 -1 %s\n") % (0, 'gsl'),
+                         struct.pack('=ciiii3s', b'F', 0, 1, -1, 3, b'gsl'))
+        self.assertEqual(_binary_nl_format("h%d:%s\n") % (2, 'ab'),
+                         struct.pack('=ci2s', b'h', 2, b'ab'))
+
+    def test_matches_text(self):
+        m = _model()
+        text = self._write(m).decode('ascii').splitlines()
+        binary = self._write(m, binary_nl=True)
+        header = binary.split(b'\n', 10)
+        body = header.pop()
+        header = [line.decode('ascii') for line in header]
+        self.assertEqual(header[0][0], 'b')
+        self.assertEqual(header[0][1:], text[0][1:])
+        arith = '1' if sys.byteorder == 'little' else '2'
+        self.assertEqual(header[5].split()[2], arith)
+        for i in (1, 2, 3, 4, 6, 7, 8, 9):
+            self.assertEqual(header[i], text[i])
+        n_var, n_con = (int(t) for t in header[1].split()[:2])
+        lines = _Decoder(body, n_var, n_con).decode()
+        self.assertEqual(_normalize(lines), _normalize(text[10:]))
+
+    def test_no_comments(self):
+        # NL comments are never written to binary files, but the
+        # .row/.col files are
+        m = _model()
+        fname = TempfileManager.create_tempfile(suffix='.nl')
+        m.write(fname, format='nl', io_options=dict(
+            binary_nl=True, symbolic_solver_labels=True))
+        with open(fname, 'rb') as FILE:
+            labeled = FILE.read()
+        # (only the max name lengths in the header differ)
+        self.assertEqual(labeled.split(b'\n', 10)[10],
+                         self._write(m, binary_nl=True).split(b'\n', 10)[10])
+        with open(fname[:-3]+'.row') as FILE:
+            self.assertEqual(FILE.read().split(),
+                             ['c1', 'c3', 'c2', 'c4', 'o'])
+        TempfileManager.add_tempfile(fname[:-3]+'.row', exists=True)
+        TempfileManager.add_tempfile(fname[:-3]+'.col', exists=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
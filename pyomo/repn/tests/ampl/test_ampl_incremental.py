@@ -0,0 +1,129 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.environ import (
+    ConcreteModel, Var, Param, Expression, Constraint, Objective, RangeSet,
+    exp, sin, quicksum, sum_product,
+)
+from pyomo.repn.plugins.ampl import ProblemWriter_nl, IncrementalNLWriter
+
+
+def _model():
+    m = ConcreteModel()
+    m.I = RangeSet(6)
+    m.x = Var(m.I, bounds=(0, 4), initialize=1)
+    m.y = Var(initialize=2)
+    m.p = Param(m.I, mutable=True, initialize=lambda m, i: i)
+    m.e = Expression(expr=m.x[1]*m.x[2])
+    m.o = Objective(expr=sum(m.x[i]**2 for i in m.I) + m.e)
+    m.c = Constraint(m.I, rule=lambda m, i: exp(m.p[i]*m.x[i]) + m.y <= 10)
+    m.d = Constraint(expr=sin(m.e) + m.x[3] == 0)
+    m.l = Constraint(expr=sum(m.p[i]*m.x[i] for i in m.I) >= 1)
+    return m
+
+
+class TestIncrementalNLWriter(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+
+    def tearDown(self):
+        TempfileManager.pop(remove=True)
+
+    def _write(self, writer, m, symbolic=True):
+        fname = TempfileManager.create_tempfile(suffix='.nl')
+        writer(m, fname, lambda x: True,
+               {'symbolic_solver_labels': symbolic})
+        with open(fname) as FILE:
+            return FILE.read()
+
+    def _check(self, writer, m, generated):
+        self.assertEqual(self._write(writer, m),
+                         self._write(ProblemWriter_nl(), m))
+        self.assertEqual(writer.n_generated, generated)
+        self.assertEqual(writer.n_reused, 9 - generated)
+
+    def test_incremental_writes(self):
+        m = _model()
+        writer = IncrementalNLWriter()
+        self._check(writer, m, 9)
+        # Nothing changed
+        self._check(writer, m, 0)
+        # Bounds and initial values are not part of the repns
+        m.x[4].setub(3)
+        m.x[5].value = 2.5
+        m.c[2].set_value(exp(m.p[2]*m.x[2]) + m.y <= 12)
+        self._check(writer, m, 1)
+        # A mutable parameter used by c[3] and l
+        m.p[3] = 7
+        self._check(writer, m, 2)
+        # Fixing a variable changes the NL variable indices: the cached
+        # nonlinear text is regenerated, but the repns are still valid
+        m.x[6].fix(1)
+        self._check(writer, m, 3)
+        m.x[6].value = 2
+        self._check(writer, m, 3)
+        m.x[6].unfix()
+        self._check(writer, m, 3)
+        # Changing a named expression affects o and d
+        m.e.expr = m.x[1] + m.x[2]
+        self._check(writer, m, 2)
+        # Deactivated constraints are forgotten
+        m.c[1].deactivate()
+        self.assertEqual(self._write(writer, m),
+                         self._write(ProblemWriter_nl(), m))
+        self.assertEqual(writer.n_reused, 8)
+        self.assertEqual(len(writer._repn_cache), 8)
+
+    def test_linear_expression(self):
+        # quicksum and sum_product generate LinearExpression objects
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.x = Var(m.I, bounds=(0, 4), initialize=1)
+        m.p = Param(m.I, mutable=True, initialize=2)
+        m.o = Objective(expr=quicksum(m.x[i] for i in m.I))
+        m.c = Constraint(expr=quicksum(m.p[i]*m.x[i] for i in m.I) >= 1)
+        m.d = Constraint(expr=sum_product(m.p, m.x) <= 10)
+        writer = IncrementalNLWriter()
+        self.assertEqual(self._write(writer, m),
+                         self._write(ProblemWriter_nl(), m))
+        self.assertEqual(writer.n_generated, 3)
+        m.p[2] = 5
+        self.assertEqual(self._write(writer, m),
+                         self._write(ProblemWriter_nl(), m))
+        self.assertEqual(writer.n_generated, 2)
+        m.x[1].fix(3)
+        self.assertEqual(self._write(writer, m),
+                         self._write(ProblemWriter_nl(), m))
+        self.assertEqual(writer.n_generated, 3)
+
+    def test_reset(self):
+        m = _model()
+        writer = IncrementalNLWriter()
+        self._write(writer, m)
+        self._write(writer, m)
+        self.assertEqual(writer.n_generated, 0)
+        # Changing the labels discards the cache
+        self.assertEqual(self._write(writer, m, symbolic=False),
+                         self._write(ProblemWriter_nl(), m, symbolic=False))
+        self.assertEqual(writer.n_generated, 9)
+        # So does writing a different model
+        self._write(writer, _model(), symbolic=False)
+        self.assertEqual(writer.n_generated, 9)
+        writer.reset()
+        self._write(writer, m, symbolic=False)
+        self.assertEqual(writer.n_generated, 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
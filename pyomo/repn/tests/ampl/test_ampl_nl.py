@@ -16,7 +16,7 @@ import os
 import pyutilib.th as unittest
 
 from pyomo.common.getGSL import find_GSL
-from pyomo.environ import ConcreteModel, Var, Constraint, Objective, Param, Block, ExternalFunction, value
+from pyomo.environ import ConcreteModel, Var, Constraint, Objective, Param, Block, ExternalFunction, value, exp, log
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 
@@ -186,6 +186,39 @@ class TestNLWriter(unittest.TestCase):
             delete=True)
         self._cleanup(test_fname)
 
+    def test_common_subexpressions(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], initialize=1, bounds=(0.1, 5))
+        m.c = Param([1, 2, 3], initialize={1: 1, 2: 2, 3: 3})
+        def rule(m, i):
+            return exp(sum(m.c[j]*m.x[j]**2 for j in m.x)/10) \
+                + m.x[i]**2 <= 10 + i
+        m.con = Constraint([1, 2, 3], rule=rule)
+        m.obj = Objective(
+            expr=log(sum(m.c[j]*m.x[j]**2 for j in m.x)) - m.x[1])
+
+        baseline_fname, test_fname = self._get_fnames()
+        self._cleanup(test_fname)
+        m.write(test_fname, format='nl',
+                io_options={'symbolic_solver_labels': True,
+                            'common_subexpressions': True})
+        self.assertFileEqualsBaseline(
+            test_fname,
+            baseline_fname,
+            delete=True)
+        self._cleanup(test_fname)
+
+        # Subexpressions whose variables are all fixed are not
+        # written as defined variables
+        m.x.fix()
+        m.write(test_fname, format='nl',
+                io_options={'common_subexpressions': True})
+        with open(test_fname) as f:
+            nl = f.read()
+        self.assertIn(" 0 0 0 0 0\t# common exprs: b,c,o,c1,o1", nl)
+        self.assertNotIn("\nV", nl)
+        self._cleanup(test_fname)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,185 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import itertools
+import os
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.common.dependencies import scipy_available
+from pyomo.environ import (
+    ConcreteModel, Var, Param, Expression, Constraint, Objective, Block,
+    ComponentMap, maximize, value, inequality,
+)
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.repn import generate_standard_repn
+from pyomo.repn.linear_matrix import (
+    LinearMatrixRepn, generate_linear_matrix_repn,
+)
+
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3], bounds=(-10, 10))
+    m.y = Var(initialize=2)
+    m.y.fix()
+    m.p = Param(mutable=True, initialize=3)
+    m.e = Expression(expr=2*m.x[1] - m.x[3]/4)
+    m.o = Objective(expr=m.p*m.x[1] + m.y*m.x[2] + 5 - m.e, sense=maximize)
+    m.c1 = Constraint(expr=0*m.x[1] + 2*m.x[1] - m.x[1] + m.y*m.x[2]
+                      + 3 + m.y <= 10)
+    m.c2 = Constraint(expr=inequality(-1, -(m.x[3] - m.e)*m.p, 4))
+    m.c3 = Constraint(expr=LinearExpression(
+        constant=1, linear_coefs=[m.p, 2], linear_vars=[m.x[2], m.y]) == 2)
+    m.c4 = Constraint(expr=m.x[1] - m.x[1] >= 0)
+    m.b = Block()
+    m.b.c5 = Constraint(expr=(m.x[2] + m.x[3])*(1 + m.y)/2 >= m.x[1])
+    m.b.c6 = Constraint(expr=m.x[1] + m.x[2] >= -100)
+    m.b.c6.deactivate()
+    return m
+
+
+def _as_map(repn):
+    return ComponentMap(
+        (v, value(c)) for v, c in zip(repn.linear_vars, repn.linear_coefs))
+
+
+class TestLinearMatrixRepn(unittest.TestCase):
+
+    def test_matches_standard_repn(self):
+        m = _model()
+        lmr = generate_linear_matrix_repn(m)
+        self.assertIsInstance(lmr, LinearMatrixRepn)
+        self.assertEqual(lmr.constraints, [m.c1, m.c2, m.c3, m.c4, m.b.c5])
+        self.assertEqual(lmr.variables, [m.x[1], m.x[2], m.x[3]])
+        self.assertEqual(lmr.shape, (5, 3))
+        self.assertIs(lmr.objective, m.o)
+        self.assertEqual(lmr.sense, maximize)
+        for comp, expr in [(m.o, m.o.expr)] + [
+                (c, c.body) for c in lmr.constraints]:
+            ref = generate_standard_repn(expr)
+            repn = lmr.standard_repn(comp)
+            self.assertAlmostEqual(repn.constant, value(ref.constant))
+            ref_map = _as_map(ref)
+            repn_map = _as_map(repn)
+            self.assertEqual(len(repn_map), len(ref_map))
+            for v, c in ref_map.items():
+                self.assertAlmostEqual(repn_map[v], c)
+        # x[1] - x[1] leaves an empty row
+        self.assertEqual(lmr.row(3), ([], []))
+        self.assertEqual(lmr.row_index(m.c3), 2)
+        self.assertIsNone(lmr.row_index(m.b.c6))
+        self.assertIsNone(lmr.standard_repn(m.b.c6))
+
+    def test_bounds(self):
+        m = _model()
+        lmr = generate_linear_matrix_repn(m)
+        # c1: x[1] + 2*x[2] + 5 <= 10
+        self.assertEqual(lmr.constant[0], 5)
+        self.assertEqual(lmr.lower[0], None)
+        self.assertEqual(lmr.upper[0], 5)
+        self.assertEqual(lmr.lower[1], -1)
+        self.assertEqual(lmr.upper[1], 4)
+        # c3: 3*x[2] + 5 == 2
+        self.assertEqual(lmr.lower[2], -3)
+        self.assertEqual(lmr.upper[2], -3)
+        self.assertEqual(lmr.obj_constant, 5)
+
+    def test_sparse_formats(self):
+        m = _model()
+        lmr = generate_linear_matrix_repn(m)
+        self.assertEqual(lmr.indptr, [0, 2, 4, 5, 5, 8])
+        self.assertEqual(lmr.nnz, 8)
+        rows, cols, data = lmr.coo()
+        self.assertEqual(rows, [0, 0, 1, 1, 2, 4, 4, 4])
+        self.assertEqual(cols, lmr.indices)
+        self.assertEqual(data, lmr.data)
+        if scipy_available:
+            A = lmr.tocsr().toarray()
+            self.assertEqual(A.shape, (5, 3))
+            self.assertEqual(A[0].tolist(), [1, 2, 0])
+            self.assertEqual((lmr.tocoo().toarray() == A).all(), True)
+
+    def test_nonlinear(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.o = Objective(expr=m.x)
+        m.c = Constraint(expr=m.x + m.x*m.y <= 1)
+        with self.assertRaisesRegex(
+                ValueError, "Constraint 'c' contains the nonlinear term"):
+            generate_linear_matrix_repn(m)
+        m.y.fix(2)
+        lmr = generate_linear_matrix_repn(m)
+        self.assertEqual(lmr.data, [3])
+        m.o2 = Objective(expr=m.x/m.y)
+        with self.assertRaisesRegex(
+                ValueError, "more than one active objective"):
+            generate_linear_matrix_repn(m)
+
+    def test_skip_nonlinear(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.o = Objective(expr=m.x*m.y)
+        m.c1 = Constraint(expr=m.x + 2*m.y <= 1)
+        m.c2 = Constraint(expr=m.x + m.x*m.y <= 1)
+        m.c3 = Constraint(expr=3*m.y - m.x == 2)
+        lmr = generate_linear_matrix_repn(
+            m, skip_nonlinear=True, objective=False)
+        self.assertEqual(lmr.constraints, [m.c1, m.c3])
+        self.assertEqual(lmr.nonlinear_constraints, [m.c2])
+        self.assertEqual(lmr.indptr, [0, 2, 4])
+        self.assertEqual(lmr.data, [1, 2, 3, -1])
+        self.assertIs(lmr.objective, None)
+        self.assertIs(lmr.row_index(m.c2), None)
+        self.assertEqual(lmr.row_index(m.c3), 1)
+
+    def _write(self, m, fmt, **io_options):
+        fname = TempfileManager.create_tempfile(suffix='.'+fmt)
+        m.write(fname, format=fmt, io_options=dict(
+            symbolic_solver_labels=True, **io_options))
+        with open(fname) as FILE:
+            return FILE.read()
+
+    def test_writers(self):
+        m = _model()
+        # a constraint using the canonical-form fast path
+        m.b.c7 = Constraint(expr=m.x[3] <= 7)
+        m.b.c7._linear_canonical_form = True
+        m.b.c7.canonical_form = lambda: generate_standard_repn(m.b.c7.body)
+        TempfileManager.push()
+        try:
+            column_order = ComponentMap(
+                (v, -i) for i, v in enumerate(m.x.values()))
+            column_order[m.y] = 1
+            for fmt, opts in itertools.product(
+                    ('lp', 'mps'),
+                    ({}, {'skip_trivial_constraints': True},
+                     {'column_order': column_order})):
+                ref = self._write(m, fmt, **opts)
+                self.assertEqual(
+                    self._write(m, fmt, linear_matrix_repn=True, **opts), ref)
+                lmr = generate_linear_matrix_repn(m)
+                self.assertEqual(
+                    self._write(m, fmt, linear_matrix_repn=lmr, **opts), ref)
+            # Nonlinear models fall back on generate_standard_repn
+            m.q = Constraint(expr=m.x[1]**2 <= 1)
+            ref = self._write(m, 'lp')
+            self.assertIn('x(1) ^ 2', ref)
+            self.assertEqual(
+                self._write(m, 'lp', linear_matrix_repn=True), ref)
+        finally:
+            TempfileManager.pop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.environ import (
+    ConcreteModel, Var, Param, Constraint, Objective, Block, RangeSet,
+    exp,
+)
+from pyomo.repn import generate_standard_repn
+from pyomo.repn import parallel
+from pyomo.repn.parallel import generate_standard_repns
+
+
+def _model(nonlinear=True):
+    m = ConcreteModel()
+    m.I = RangeSet(20)
+    m.x = Var(m.I, bounds=(-1, 1))
+    m.p = Param(m.I, mutable=True, initialize=lambda m, i: i % 3)
+    m.o = Objective(expr=sum(m.p[i]*m.x[i] for i in m.I) + m.x[1]*m.x[2])
+    m.c = Constraint(m.I, rule=lambda m, i: (
+        -5, sum((i+j) % 4*m.x[j] for j in m.I if j != i) + 2, 5))
+    m.b = Block()
+    m.b.y = Var(initialize=2)
+    m.b.c = Constraint(m.I, rule=lambda b, i: m.x[i]**2 + b.y*m.x[i] <= 4)
+    if nonlinear:
+        m.b.nl = Constraint(expr=exp(m.x[1]) + m.x[2] == 1)
+    # an unbounded row and a deactivated block are not written
+    m.unbounded = Constraint(expr=(None, m.x[3], None))
+    m.d = Block()
+    m.d.c = Constraint(expr=m.x[4] >= 0)
+    m.d.deactivate()
+    return m
+
+
+@unittest.skipUnless(hasattr(os, 'fork'),
+                     "parallel repn generation requires fork()")
+class TestParallelRepn(unittest.TestCase):
+
+    def test_generate_standard_repns(self):
+        m = _model()
+        repns = generate_standard_repns(m, 3, chunksize=7)
+        # The nonlinear constraint must be generated serially
+        self.assertNotIn(m.b.nl, repns)
+        self.assertNotIn(m.unbounded, repns)
+        self.assertNotIn(m.d.c, repns)
+        self.assertEqual(len(repns), 41)
+        for comp, repn in repns.items():
+            ref = generate_standard_repn(
+                comp.expr if comp is m.o else comp.body)
+            self.assertEqual(repn.constant, ref.constant)
+            self.assertEqual(repn.linear_coefs, ref.linear_coefs)
+            self.assertEqual(
+                [id(v) for v in repn.linear_vars],
+                [id(v) for v in ref.linear_vars])
+            self.assertEqual(repn.quadratic_coefs, ref.quadratic_coefs)
+            self.assertEqual(
+                [(id(a), id(b)) for a, b in repn.quadratic_vars],
+                [(id(a), id(b)) for a, b in ref.quadratic_vars])
+            self.assertIsNone(repn.nonlinear_expr)
+
+    def test_external_variable(self):
+        m = _model(nonlinear=False)
+        other = ConcreteModel()
+        other.z = Var()
+        m.ext = Constraint(expr=m.x[1] + other.z <= 1)
+        repns = generate_standard_repns(m, 2)
+        self.assertNotIn(m.ext, repns)
+        self.assertIn(m.c[1], repns)
+
+    def test_workers_skip_nonlinear(self):
+        # Workers do not generate the repns they cannot send back
+        m = _model()
+        components = [m.o] + list(m.c.values()) + list(m.b.c.values()) \
+                     + [m.b.nl]
+        generated = []
+        def _generate_standard_repn(expr, **kwds):
+            generated.append(expr)
+            return generate_standard_repn(expr, **kwds)
+        orig = parallel.generate_standard_repn
+        parallel.generate_standard_repn = _generate_standard_repn
+        parallel._fork_state.update(
+            components=components, quadratic=False,
+            var_ids=dict((id(v), v) for v in m.component_data_objects(Var)))
+        try:
+            encoded = parallel._process_chunk((0, len(components)))
+        finally:
+            parallel._fork_state.clear()
+            parallel.generate_standard_repn = orig
+        # Only the linear constraints are generated (the objective and
+        # m.b.c are quadratic)
+        self.assertEqual([e is not None for e in encoded],
+                         [False] + [True]*20 + [False]*21)
+        self.assertEqual(len(generated), 20)
+
+    def test_serial(self):
+        m = _model()
+        repns = generate_standard_repns(m, 1, quadratic=False)
+        # Without a pool, every repn is generated
+        self.assertEqual(len(repns), 42)
+        self.assertIsNotNone(repns[m.b.nl].nonlinear_expr)
+
+    def _write(self, m, fmt, **io_options):
+        fname = TempfileManager.create_tempfile(suffix='.'+fmt)
+        m.write(fname, format=fmt, io_options=dict(
+            symbolic_solver_labels=True, **io_options))
+        with open(fname) as FILE:
+            return FILE.read()
+
+    def test_writers(self):
+        TempfileManager.push()
+        try:
+            for fmt, nonlinear in (('lp', False), ('mps', False),
+                                   ('nl', True)):
+                m = _model(nonlinear)
+                ref = self._write(m, fmt)
+                self.assertEqual(
+                    self._write(m, fmt, parallel_repn=3), ref)
+                self.assertEqual(
+                    self._write(m, fmt, parallel_repn=True), ref)
+        finally:
+            TempfileManager.pop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,6 +40,15 @@ class PyomoMIPConverter(object):
 
         return False
 
+    def _create_problem_file(self, suffix, instance, stream_input):
+        """Create the problem file, which is a named pipe if the
+        problem is streamed to the solver as it is written"""
+        if stream_input is None or instance is None:
+            return TempfileManager.create_tempfile(suffix=suffix)
+        problem_filename = TempfileManager.create_tempfifo(suffix=suffix)
+        stream_input((problem_filename,))
+        return problem_filename
+
     def apply(self, *args, **kwds):
         """
         Generate a NL or LP file from Pyomo, and then do subsequent
@@ -49,6 +58,9 @@ class PyomoMIPConverter(object):
         import pyomo.scripting.convert
 
         capabilities = kwds.pop("capabilities", None)
+        # a callback that launches the solver on the problem files
+        # (which are then named pipes) before they are written
+        stream_input = kwds.pop("stream_input", None)
 
         # all non-consumed keywords are assumed to be options
         # that should be passed to the writer.
@@ -69,8 +81,8 @@ class PyomoMIPConverter(object):
             instance = args[2]
 
         if args[1] == ProblemFormat.cpxlp:
-            problem_filename = TempfileManager.\
-                               create_tempfile(suffix = '.pyomo.lp')
+            problem_filename = self._create_problem_file(
+                '.pyomo.lp', instance, stream_input)
             if instance is not None:
                 if isinstance(instance, IBlock):
                     symbol_map_id = instance.write(
@@ -115,8 +127,8 @@ class PyomoMIPConverter(object):
                 return (problem_filename,),symbol_map
 
         elif args[1] == ProblemFormat.bar:
-            problem_filename = TempfileManager.\
-                               create_tempfile(suffix = '.pyomo.bar')
+            problem_filename = self._create_problem_file(
+                '.pyomo.bar', instance, stream_input)
             if instance is not None:
                 if isinstance(instance, IBlock):
                     symbol_map_id = instance.write(
@@ -161,8 +173,8 @@ class PyomoMIPConverter(object):
 
         elif args[1] in [ProblemFormat.mps, ProblemFormat.nl]:
             if args[1] == ProblemFormat.nl:
-                problem_filename = TempfileManager.\
-                                   create_tempfile(suffix = '.pyomo.nl')
+                problem_filename = self._create_problem_file(
+                    '.pyomo.nl', instance, stream_input)
                 if io_options.get("symbolic_solver_labels", False):
                     TempfileManager.add_tempfile(
                         problem_filename[:-3]+".row",
@@ -172,8 +184,8 @@ class PyomoMIPConverter(object):
                         exists=False)
             else:
                 assert args[1] == ProblemFormat.mps
-                problem_filename = TempfileManager.\
-                                   create_tempfile(suffix = '.pyomo.mps')
+                problem_filename = self._create_problem_file(
+                    '.pyomo.mps', instance, stream_input)
             if instance is not None:
                 if isinstance(instance, IBlock):
                     symbol_map_id = instance.write(
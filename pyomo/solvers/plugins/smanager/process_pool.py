@@ -0,0 +1,325 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ("SolverManager_ProcessPool",)
+
+import os
+import time
+import traceback
+import multiprocessing
+
+from six.moves import queue
+import six
+
+from pyomo.common.collections import Bunch
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.opt.base import OptSolver, SolverFactory
+from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.parallel.manager import (ActionManagerError,
+                                        ActionHandle,
+                                        ActionStatus)
+from pyomo.opt.parallel.async_solver import (AsynchronousSolverManager,
+                                             SolverManagerFactory)
+from pyomo.core.base import Block
+import pyomo.core.base.suffix
+
+from pyomo.core.kernel.block import IBlock
+
+
+def _solve_task(data):
+    """Solve a problem in a worker process
+
+    This is the local equivalent of the pyro_mip_server worker: the
+    problem is either the text of a problem file written by the
+    manager, or the original (file name) arguments to solve().
+    Returns a (status, payload) tuple, where the payload is the
+    results object or the formatted traceback of the failure.
+    """
+    try:
+        # Make sure the solver plugins are registered (this is a no-op
+        # for workers that were forked from the manager process)
+        import pyomo.environ
+
+        time_start = time.time()
+        with TempfileManager.push():
+            with SolverFactory(data.opt, **data.solver_kwds) as opt:
+                if opt is None:
+                    raise ValueError(
+                        "Problem constructing solver `%s'" % (data.opt,))
+                if data.problem_format is not None:
+                    opt.set_problem_format(data.problem_format)
+                for key, value in six.iteritems(data.solver_options):
+                    setattr(opt.options, key, value)
+
+                kwds = data.kwds
+                args = data.args
+                if data.file is not None:
+                    problem_filename_suffix = os.path.split(data.filename)[1]
+                    temp_problem_filename = TempfileManager.create_tempfile(
+                        suffix="."+problem_filename_suffix)
+                    with open(temp_problem_filename, 'w') as f:
+                        f.write(data.file)
+                    args = (temp_problem_filename,)
+                    if data.warmstart_file is not None:
+                        warmstart_filename_suffix = \
+                            os.path.split(data.warmstart_filename)[1]
+                        temp_warmstart_filename = \
+                            TempfileManager.create_tempfile(
+                                suffix="."+warmstart_filename_suffix)
+                        with open(temp_warmstart_filename, 'w') as f:
+                            f.write(data.warmstart_file)
+                        kwds['warmstart_file'] = temp_warmstart_filename
+
+                results = opt.solve(*args, **kwds)
+        results.pyomo_solve_time = time.time()-time_start
+        return ('done', results)
+    except:
+        return ('error', traceback.format_exc())
+
+
+@SolverManagerFactory.register(
+    'processpool',
+    doc="Execute solvers concurrently in a pool of local processes")
+class SolverManager_ProcessPool(AsynchronousSolverManager):
+    """A solver manager that runs solvers in local worker processes
+
+    This is the local alternative to the 'pyro' solver manager (and
+    it follows the same protocol): when a model is queued, the
+    problem file is written by this process and its contents are
+    shipped to a worker, which runs the solver and sends back the
+    results.  Problem files (i.e., file names) can also be queued
+    directly.  Results are returned through the usual
+    queue()/wait_any()/wait_all() API, in the order in which the
+    solves complete.
+
+    Keyword Arguments
+    -----------------
+    max_workers: int
+        The number of worker processes (defaults to the number of
+        CPUs).  The pool is started when the first solve is queued,
+        and is stopped by :py:meth:`shutdown` (or when leaving a
+        ``with`` block).
+    """
+
+    def __init__(self, *args, **kwds):
+        self._max_workers = kwds.pop('max_workers', None)
+        self._pool = None
+        super(SolverManager_ProcessPool, self).__init__(*args, **kwds)
+
+    def clear(self):
+        """Clear manager state"""
+        super(SolverManager_ProcessPool, self).clear()
+        # Solves that are still running report to the old queue, and
+        # are discarded
+        self._done = queue.Queue()
+        self._pending = set()
+        self._opt_data = {}
+        self._args = {}
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __exit__(self, t, v, traceback):
+        self.shutdown()
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(processes=self._max_workers)
+        return self._pool
+
+    def _get_task_data(self, ah, *args, **kwds):
+
+        opt = kwds.pop('solver', kwds.pop('opt', None))
+        if opt is None:
+            raise ActionManagerError(
+                "No solver passed to %s, use keyword option 'solver'"
+                % (type(self).__name__) )
+        #
+        # The worker constructs its own solver, so it needs the same
+        # constructor arguments (e.g., solver_io) as this one
+        #
+        if isinstance(opt, six.string_types):
+            opt_name = opt
+            solver_kwds = {'solver_io': kwds.pop('solver_io', None)}
+            if 'executable' in kwds:
+                solver_kwds['executable'] = kwds.pop('executable')
+            opt = SolverFactory(opt_name, **solver_kwds)
+        else:
+            opt_name = opt.type
+            solver_kwds = {}
+            if isinstance(opt, SystemCallSolver) and \
+               (opt._user_executable is not None):
+                solver_kwds['executable'] = opt._user_executable
+
+        #
+        # Handle ephemeral solvers options here (as in OptSolver.solve())
+        #
+        solver_options = {}
+        for key in opt.options:
+            solver_options[key] = opt.options[key]
+        solver_options.update(kwds.pop('options', {}))
+        solver_options.update(
+            OptSolver._options_string_to_dict(kwds.pop('options_string', '')))
+
+        if isinstance(opt, OptSolver):
+            problem_format = opt._problem_format
+        else:
+            problem_format = None
+
+        data = Bunch(opt=opt_name,
+                     solver_kwds=solver_kwds,
+                     problem_format=problem_format,
+                     args=args,
+                     file=None,
+                     filename=None,
+                     warmstart_file=None,
+                     warmstart_filename=None,
+                     kwds=kwds,
+                     solver_options=solver_options)
+
+        if not any(isinstance(arg, (Block, IBlock)) for arg in args):
+            # Pre-written problem files are solved directly by the worker
+            self._opt_data[ah.id] = None
+            return data
+
+        #
+        # The following block of code is taken from the OptSolver.solve()
+        # method, which we do not directly invoke with this interface
+        #
+        for arg in args:
+            if isinstance(arg, Block):
+                if not arg.is_constructed():
+                    raise RuntimeError(
+                        "Attempting to solve model=%s with unconstructed "
+                        "component(s)" % (arg.name))
+                # import suffixes must be on the top-level model
+                model_suffixes = list(
+                    name for (name,comp) in pyomo.core.base.suffix.\
+                    active_import_suffix_generator(arg))
+            elif isinstance(arg, IBlock):
+                model_suffixes = list(
+                    comp.storage_key for comp in pyomo.core.base.suffix.\
+                    import_suffix_generator(arg,
+                                            active=True,
+                                            descend_into=False))
+            else:
+                continue
+            if len(model_suffixes) > 0:
+                kwds_suffixes = kwds.setdefault('suffixes',[])
+                for name in model_suffixes:
+                    if name not in kwds_suffixes:
+                        kwds_suffixes.append(name)
+
+        #
+        # Write the problem file here, ignoring the availability of the
+        # solver (the worker does that check).  The file is not
+        # streamed, because the solver runs in the worker.
+        #
+        presolve_kwds = dict(kwds)
+        presolve_kwds['available'] = True
+        presolve_kwds.pop('stream_input', None)
+        opt._presolve(*args, **presolve_kwds)
+        with open(opt._problem_files[0], 'r') as f:
+            data.file = f.read()
+        data.filename = opt._problem_files[0]
+        if getattr(opt, "_warm_start_solve", False) and \
+           (opt._warm_start_file_name is not None):
+            data.warmstart_filename = opt._warm_start_file_name
+            with open(data.warmstart_filename, 'r') as f:
+                data.warmstart_file = f.read()
+        if isinstance(opt, SystemCallSolver):
+            # Release the temporary files created by the presolve
+            TempfileManager.pop(remove=not opt._keepfiles)
+
+        data.args = ()
+
+        self._opt_data[ah.id] = (opt._smap_id,
+                                 opt._load_solutions,
+                                 opt._select_index,
+                                 opt._default_variable_value)
+        self._args[ah.id] = args
+        return data
+
+    #
+    # Abstract Methods
+    #
+
+    def _perform_queue(self, ah, *args, **kwds):
+        """
+        Perform the queue operation.  This method returns the ActionHandle,
+        and the ActionHandle status indicates whether the queue was successful.
+        """
+        data = self._get_task_data(ah, *args, **kwds)
+        done = self._done
+        callbacks = {'callback': lambda result: done.put((ah.id, result))}
+        if six.PY3:
+            # The pool reports the tasks whose arguments (or results)
+            # could not be pickled through the error callback.  Without
+            # it, nothing would ever be put on the queue for them.
+            callbacks['error_callback'] = lambda e: done.put(
+                (ah.id, ('error', "%s: %s" % (type(e).__name__, e))))
+        self._pending.add(ah.id)
+        self._get_pool().apply_async(_solve_task, (data,), **callbacks)
+        return ah
+
+    def _perform_wait_any(self):
+        """
+        Perform the wait_any operation.  This method returns an
+        ActionHandle with the results of waiting.  If None is returned
+        then the ActionManager assumes that it can call this method again.
+        Note that an ActionHandle can be returned with a dummy value,
+        to indicate an error.
+        """
+        if not self._pending:
+            return ActionHandle(error=True,
+                                explanation=("No queued evaluations available "
+                                             "in the 'processpool' solver "
+                                             "manager"))
+        ah_id, (status, results) = self._done.get()
+        self._pending.discard(ah_id)
+        ah = self.event_handle[ah_id]
+        opt_data = self._opt_data.pop(ah_id)
+        args = self._args.pop(ah_id, None)
+
+        if status != 'done':
+            ah.status = ActionStatus.error
+            raise ActionManagerError(
+                "Worker process reported a processing error "
+                "for task with id=%s. Reason: \n%s" % (ah_id, results))
+
+        ah.status = ActionStatus.done
+        if opt_data is not None:
+            (smap_id,
+             load_solutions,
+             select_index,
+             default_variable_value) = opt_data
+
+            # Tag the results object with the symbol map id.
+            results._smap_id = smap_id
+
+            if isinstance(args[0], Block):
+                _model = args[0]
+                if load_solutions:
+                    _model.solutions.load_from(
+                        results,
+                        select=select_index,
+                        default_variable_value=default_variable_value)
+                    results._smap_id = None
+                    results.solution.clear()
+                else:
+                    results._smap = _model.solutions.symbol_map[smap_id]
+                    _model.solutions.delete_symbol_map(smap_id)
+
+        self.results[ah_id] = results
+        return ah
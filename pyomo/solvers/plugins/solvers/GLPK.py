@@ -20,6 +20,7 @@ from pyomo.common import Executable
 from pyomo.common.collections import Bunch, Options
 from pyomo.opt import SolverFactory, OptSolver, ProblemFormat, ResultsFormat, SolverResults, TerminationCondition, SolutionStatus, ProblemSense
 from pyomo.opt.base.solvers import _extract_version
+from pyomo.opt.results.columnar import SolutionColumns, as_column
 from pyomo.opt.solver import SystemCallSolver
 
 from six import iteritems, string_types
@@ -142,6 +143,10 @@ class GLPKSHELL(SystemCallSolver):
     def _default_results_format(self, prob_format):
         return ResultsFormat.soln
 
+    def _stream_input_supported(self, problem_format):
+        # glpsol reads LP and MPS files in a single sequential pass
+        return problem_format in (ProblemFormat.cpxlp, ProblemFormat.mps)
+
     def _default_executable(self):
         executable = Executable('glpsol')
         if not executable:
@@ -407,6 +412,9 @@ class GLPKSHELL(SystemCallSolver):
                     extract_reduced_costs = True
 
             range_duals = {}
+            var_names = []
+            var_values = []
+            var_rcs = []
             while True:
                 row = next(reader)
                 if len(row) == 0:
@@ -434,11 +442,10 @@ class GLPKSHELL(SystemCallSolver):
                     vname = variable_names[int(cid)]
                     if 'ONE_VAR_CONSTANT' == vname:
                         continue
-                    cprim = float(cprim)
-                    if extract_reduced_costs is False:
-                        soln.variable[vname] = {"Value" : cprim}
-                    else:
-                        soln.variable[vname] = {"Value" : cprim, "Rc" : float(cdual)}
+                    var_names.append(vname)
+                    var_values.append(float(cprim))
+                    if extract_reduced_costs:
+                        var_rcs.append(float(cdual))
 
                 elif rtype == 'e':
                     break
@@ -449,6 +456,11 @@ class GLPKSHELL(SystemCallSolver):
                 else:
                     raise ValueError("Unexpected row type: "+rtype)
 
+            soln.variable = SolutionColumns(var_names)
+            soln.variable.add_column("Value", as_column(var_values))
+            if extract_reduced_costs:
+                soln.variable.add_column("Rc", as_column(var_rcs))
+
             # For the range constraints, supply only the dual with the largest
             # magnitude (at least one should always be numerically zero)
             scon = soln.Constraint
@@ -500,6 +512,8 @@ class GLPKSHELL(SystemCallSolver):
             # less 'arbitrary', as in the yaml key 'f'.  Weird
             soln.objective[obj_name] = {'Value': obj_val}
 
+            var_names = []
+            var_values = []
             while True:
                 row = next(reader)
                 if len(row) == 0:
@@ -514,7 +528,8 @@ class GLPKSHELL(SystemCallSolver):
                     vname = variable_names[int(cid)]
                     if 'ONE_VAR_CONSTANT' == vname:
                         continue
-                    soln.variable[vname] = {"Value" : float(cval)}
+                    var_names.append(vname)
+                    var_values.append(float(cval))
 
                 elif rtype == 'e':
                     break
@@ -524,3 +539,6 @@ class GLPKSHELL(SystemCallSolver):
 
                 else:
                     raise ValueError("Unexpected row type: "+rtype)
+
+            soln.variable = SolutionColumns(var_names)
+            soln.variable.add_column("Value", as_column(var_values))
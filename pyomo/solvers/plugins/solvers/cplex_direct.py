@@ -382,6 +382,11 @@ class CPLEXDirect(DirectSolver):
             self._add_var(var, var_data)
         var_data.store_in_cplex()
 
+        if self._bulk_load:
+            bulk_loaded = self._add_linear_rows(block)
+        else:
+            bulk_loaded = ()
+
         lin_con_data = _LinearConstraintData(self._solver_model)
         for sub_block in block.block_data_objects(descend_into=True, active=True):
             for con in sub_block.component_data_objects(
@@ -393,6 +398,8 @@ class CPLEXDirect(DirectSolver):
                 if not con.has_lb() and not con.has_ub():
                     assert not con.equality
                     continue  # non-binding, so skip
+                if con in bulk_loaded:
+                    continue
 
                 self._add_constraint(con, lin_con_data)
 
@@ -551,6 +558,54 @@ class CPLEXDirect(DirectSolver):
             raise ValueError('Variable domain type is not recognized for {0}'.format(var.domain))
         return vtype
 
+    def _bulk_load_capable(self):
+        return True
+
+    def _add_linear_matrix(self, matrix, rows, names):
+        # All of the rows are added with a single call
+        solver_vars = [self._pyomo_var_to_solver_var_map[v]
+                       for v in matrix.variables]
+        indptr = matrix.indptr
+        indices = matrix.indices
+        data = matrix.data
+        lower = matrix.lower
+        upper = matrix.upper
+        lin_expr = []
+        senses = []
+        rhs = []
+        range_values = []
+        for i in rows:
+            start, end = indptr[i], indptr[i+1]
+            lin_expr.append([[solver_vars[j] for j in indices[start:end]],
+                             [float(coef) for coef in data[start:end]]])
+            con = matrix.constraints[i]
+            lb = lower[i]
+            ub = upper[i]
+            range_ = 0.0
+            if con.equality:
+                senses.append("E")
+                rhs.append(lb)
+            elif lb is not None and ub is not None:
+                senses.append("R")
+                rhs.append(ub)
+                range_ = lb - ub
+                self._range_constraints.add(con)
+            elif lb is not None:
+                senses.append("G")
+                rhs.append(lb)
+            else:
+                senses.append("L")
+                rhs.append(ub)
+            range_values.append(range_)
+        self._solver_model.linear_constraints.add(
+            lin_expr=lin_expr,
+            senses=senses,
+            rhs=rhs,
+            range_values=range_values,
+            names=names,
+        )
+        return names
+
     def _set_objective(self, obj):
         if self._objective is not None:
             for var in self._vars_referenced_by_obj:
@@ -71,6 +71,31 @@ class CPLEXPersistent(PersistentSolver, CPLEXDirect):
     def _warm_start(self):
         CPLEXDirect._warm_start(self)
 
+    def _update_linear_constraints(self, updates):
+        coefs = []
+        rhs = []
+        range_values = []
+        for con, coef_changes, constant in updates:
+            conname = self._pyomo_con_to_solver_con_map[con]
+            for var, coef in coef_changes:
+                coefs.append(
+                    (conname, self._pyomo_var_to_solver_var_map[var], coef))
+            if con in self._range_constraints:
+                lb = value(con.lower)
+                ub = value(con.upper)
+                rhs.append((conname, ub - constant))
+                range_values.append((conname, lb - ub))
+            elif con.has_lb():
+                rhs.append((conname, value(con.lower) - constant))
+            else:
+                rhs.append((conname, value(con.upper) - constant))
+        linear_constraints = self._solver_model.linear_constraints
+        if coefs:
+            linear_constraints.set_coefficients(coefs)
+        linear_constraints.set_rhs(rhs)
+        if range_values:
+            linear_constraints.set_range_values(range_values)
+
     def update_var(self, var):
         """Update a single variable in the solver's model.
 
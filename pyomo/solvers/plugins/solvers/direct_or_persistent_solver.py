@@ -13,6 +13,8 @@ from pyomo.core.base.block import Block, _BlockData
 from pyomo.core.kernel.block import IBlock
 from pyomo.opt.base.solvers import OptSolver
 from pyomo.core.base import SymbolMap, NumericLabeler, TextLabeler
+from pyomo.core.expr.numvalue import is_fixed
+from pyomo.repn.linear_matrix import generate_linear_matrix_repn
 import pyomo.common
 from pyomo.common.errors import ApplicationError
 from pyomo.common.collections import ComponentMap, ComponentSet, Options
@@ -89,6 +91,11 @@ class DirectOrPersistentSolver(OptSolver):
         This is useful for catching bugs. Ordinarily a fixed variable should appear as a constant value in the
         solver constraints. If True, then the error will not be raised."""
 
+        self._bulk_load = False
+        """A bool. If True, then the linear constraints are compiled into a sparse matrix and added to the solver
+        model in bulk (see pyomo.repn.linear_matrix). Nonlinear constraints are still added one at a time. This
+        is only supported by interfaces that implement _add_linear_matrix."""
+
         self._python_api_exists = False
         """A bool indicating whether or not the python api is available for the specified solver."""
 
@@ -180,6 +187,10 @@ class DirectOrPersistentSolver(OptSolver):
         self._skip_trivial_constraints = kwds.pop('skip_trivial_constraints', self._skip_trivial_constraints)
         self._output_fixed_variable_bounds = kwds.pop('output_fixed_variable_bounds',
                                                       self._output_fixed_variable_bounds)
+        self._bulk_load = kwds.pop('bulk_load', self._bulk_load)
+        if self._bulk_load and not self._bulk_load_capable():
+            raise ValueError("The {0} solver interface does not support "
+                             "bulk_load".format(self.name))
         self._pyomo_var_to_solver_var_map = ComponentMap()
         self._solver_var_to_pyomo_var_map = dict()
         self._pyomo_con_to_solver_con_map = dict()
@@ -205,6 +216,11 @@ class DirectOrPersistentSolver(OptSolver):
                 sort=True):
             self._add_var(var)
 
+        if self._bulk_load:
+            bulk_loaded = self._add_linear_rows(block)
+        else:
+            bulk_loaded = ()
+
         for sub_block in block.block_data_objects(descend_into=True,
                                                   active=True):
             for con in sub_block.component_data_objects(
@@ -216,6 +232,8 @@ class DirectOrPersistentSolver(OptSolver):
                    (not con.has_ub()):
                     assert not con.equality
                     continue  # non-binding, so skip
+                if con in bulk_loaded:
+                    continue
                 self._add_constraint(con)
 
             for con in sub_block.component_data_objects(
@@ -236,6 +254,60 @@ class DirectOrPersistentSolver(OptSolver):
                                      "support multiple objectives.")
                 self._set_objective(obj)
 
+    def _bulk_load_capable(self):
+        """True if the interface implements _add_linear_matrix"""
+        return False
+
+    def _add_linear_rows(self, block):
+        """Add the linear constraints of a block to the solver model in bulk
+
+        Returns the set of constraints that were handled (the nonlinear
+        constraints are left to _add_constraint).
+        """
+        matrix = generate_linear_matrix_repn(
+            block, sort=True, skip_nonlinear=True, objective=False)
+        constraints = matrix.constraints
+        indptr = matrix.indptr
+        rows = []
+        for i, con in enumerate(constraints):
+            if self._skip_trivial_constraints and indptr[i] == indptr[i+1]:
+                continue
+            if con.has_lb() and not is_fixed(con.lower):
+                raise ValueError("Lower bound of constraint {0} "
+                                 "is not constant.".format(con))
+            if con.has_ub() and not is_fixed(con.upper):
+                raise ValueError("Upper bound of constraint {0} "
+                                 "is not constant.".format(con))
+            rows.append(i)
+
+        if rows:
+            names = [self._symbol_map.getSymbol(constraints[i], self._labeler)
+                     for i in rows]
+            solver_cons = self._add_linear_matrix(matrix, rows, names)
+            variables = matrix.variables
+            indices = matrix.indices
+            for i, solver_con in zip(rows, solver_cons):
+                con = constraints[i]
+                referenced_vars = ComponentSet(
+                    variables[j] for j in indices[indptr[i]:indptr[i+1]])
+                for var in referenced_vars:
+                    self._referenced_variables[var] += 1
+                self._vars_referenced_by_con[con] = referenced_vars
+                self._pyomo_con_to_solver_con_map[con] = solver_con
+                self._solver_con_to_pyomo_con_map[solver_con] = con
+        return ComponentSet(constraints)
+
+    """ This method should be implemented by subclasses that support bulk_load."""
+    def _add_linear_matrix(self, matrix, rows, names):
+        """Add rows of a LinearMatrixRepn to the solver model
+
+        The row bounds in the matrix already include the constant terms
+        of the constraint bodies. Returns the solver constraints, in the
+        same order as rows.
+        """
+        raise NotImplementedError("This method should be implemented "
+                                  "by subclasses")
+
     """ This method should be implemented by subclasses."""
     def _set_objective(self, obj):
         raise NotImplementedError("This method should be implemented "
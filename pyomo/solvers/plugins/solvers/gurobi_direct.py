@@ -386,6 +386,48 @@ class GurobiDirect(DirectSolver):
             raise ValueError('Variable domain type is not recognized for {0}'.format(var.domain))
         return vtype
 
+    def _bulk_load_capable(self):
+        return True
+
+    def _add_linear_matrix(self, matrix, rows, names):
+        # Build the rows directly from the sparse matrix (there is no
+        # StandardRepn to convert)
+        GRB = self._gurobipy.GRB
+        LinExpr = self._gurobipy.LinExpr
+        solver_vars = [self._pyomo_var_to_solver_var_map[v]
+                       for v in matrix.variables]
+        indptr = matrix.indptr
+        indices = matrix.indices
+        data = matrix.data
+        lower = matrix.lower
+        upper = matrix.upper
+        gurobipy_cons = []
+        for i, conname in zip(rows, names):
+            start, end = indptr[i], indptr[i+1]
+            gurobi_expr = LinExpr(data[start:end],
+                                  [solver_vars[j] for j in indices[start:end]])
+            con = matrix.constraints[i]
+            lb = lower[i]
+            ub = upper[i]
+            if con.equality:
+                gurobipy_con = self._solver_model.addConstr(
+                    lhs=gurobi_expr, sense=GRB.EQUAL, rhs=lb, name=conname)
+            elif lb is not None and ub is not None:
+                gurobipy_con = self._solver_model.addRange(
+                    gurobi_expr, lb, ub, name=conname)
+                self._range_constraints.add(con)
+            elif lb is not None:
+                gurobipy_con = self._solver_model.addConstr(
+                    lhs=gurobi_expr, sense=GRB.GREATER_EQUAL, rhs=lb,
+                    name=conname)
+            else:
+                gurobipy_con = self._solver_model.addConstr(
+                    lhs=gurobi_expr, sense=GRB.LESS_EQUAL, rhs=ub,
+                    name=conname)
+            gurobipy_cons.append(gurobipy_con)
+        self._needs_updated = True
+        return gurobipy_cons
+
     def _set_objective(self, obj):
         if self._objective is not None:
             for var in self._vars_referenced_by_obj:
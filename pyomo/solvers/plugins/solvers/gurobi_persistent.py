@@ -92,6 +92,29 @@ class GurobiPersistent(PersistentSolver, GurobiDirect):
     def _warm_start(self):
         GurobiDirect._warm_start(self)
 
+    def _update_linear_constraints(self, updates):
+        # range constraints are modeled with an auxiliary variable,
+        # so they are rebuilt instead
+        rebuild = []
+        if self._needs_updated:
+            self._update()
+        for con, coef_changes, constant in updates:
+            if con in self._range_constraints:
+                rebuild.append((con, coef_changes, constant))
+                continue
+            gurobipy_con = self._pyomo_con_to_solver_con_map[con]
+            for var, coef in coef_changes:
+                self._solver_model.chgCoeff(
+                    gurobipy_con, self._pyomo_var_to_solver_var_map[var], coef)
+            if con.has_lb():
+                rhs = value(con.lower)
+            else:
+                rhs = value(con.upper)
+            gurobipy_con.setAttr('RHS', rhs - constant)
+        self._needs_updated = True
+        if rebuild:
+            PersistentSolver._update_linear_constraints(self, rebuild)
+
     def update_var(self, var):
         """Update a single variable in the solver's model.
 
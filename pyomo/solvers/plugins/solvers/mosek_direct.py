@@ -355,7 +355,8 @@ class MOSEKDirect(DirectSolver):
             qcsubi = tuple(itertools.chain.from_iterable(q_is))
             qcsubj = tuple(itertools.chain.from_iterable(q_js))
             qcval = tuple(itertools.chain.from_iterable(q_vals))
-            qcsubk = tuple(i*len(q_is[i - con_num]) for i in sub)
+            qcsubk = tuple(i for i in sub
+                           for _ in range(len(q_is[i - con_num])))
             self._solver_model.appendcons(num_lq)
             self._solver_model.putarowlist(sub, ptrb, ptre, asubs, avals)
             self._solver_model.putqcon(qcsubk, qcsubi, qcsubj, qcval)
@@ -395,6 +396,33 @@ class MOSEKDirect(DirectSolver):
                 for v in cone_members[i]:
                     self._referenced_variables[v] += 1
 
+    def _bulk_load_capable(self):
+        return True
+
+    def _add_linear_matrix(self, matrix, rows, names):
+        solver_vars = [self._pyomo_var_to_solver_var_map[v]
+                       for v in matrix.variables]
+        indptr = matrix.indptr
+        indices = matrix.indices
+        num_lq = len(rows)
+        con_num = self._solver_model.getnumcon()
+        sub = range(con_num, con_num + num_lq)
+        ptrb = tuple(indptr[i] for i in rows)
+        ptre = tuple(indptr[i+1] for i in rows)
+        asubs = tuple(solver_vars[j] for j in indices)
+        lbs = tuple(-inf if matrix.lower[i] is None else matrix.lower[i]
+                    for i in rows)
+        ubs = tuple(inf if matrix.upper[i] is None else matrix.upper[i]
+                    for i in rows)
+        fxs = tuple(matrix.constraints[i].equality for i in rows)
+        bound_types = tuple(map(self._mosek_bounds, lbs, ubs, fxs))
+        self._solver_model.appendcons(num_lq)
+        self._solver_model.putarowlist(sub, ptrb, ptre, asubs, matrix.data)
+        self._solver_model.putconboundlist(sub, bound_types, lbs, ubs)
+        for i, s_n in zip(sub, names):
+            self._solver_model.putconname(i, s_n)
+        return sub
+
     def _set_objective(self, obj):
         if self._objective is not None:
             for var in self._vars_referenced_by_obj:
@@ -443,6 +471,10 @@ class MOSEKDirect(DirectSolver):
             descend_into=True, active=True,
             sort=True))
         self._add_vars(var_seq)
+        if self._bulk_load:
+            bulk_loaded = self._add_linear_rows(block)
+        else:
+            bulk_loaded = ()
         for sub_block in block.block_data_objects(descend_into=True,
                                                   active=True):
             con_list = []
@@ -455,6 +487,8 @@ class MOSEKDirect(DirectSolver):
                    (not con.has_ub()):
                     assert not con.equality
                     continue  # non-binding, so skip
+                if con in bulk_loaded:
+                    continue
                 con_list.append(con)
             self._add_constraints(con_list)
 
@@ -13,14 +13,19 @@ from pyomo.core.base.block import _BlockData
 from pyomo.core.kernel.block import IBlock
 from pyomo.core.base.suffix import active_import_suffix_generator
 from pyomo.core.kernel.suffix import import_suffix_generator
-from pyomo.core.expr.numvalue import native_numeric_types, value
-from pyomo.core.expr.visitor import evaluate_expression
+from pyomo.core.expr.numvalue import (native_numeric_types, native_types,
+                                      value)
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.core.expr.visitor import (evaluate_expression,
+                                     identify_variables)
 from pyomo.core.base.constraint import Constraint
 from pyomo.core.base.var import Var
 from pyomo.core.base.sos import SOSConstraint
+from pyomo.core.base.objective import Objective
+from pyomo.repn import generate_standard_repn
 
 from pyomo.common.errors import ApplicationError
-from pyomo.common.collections import Options
+from pyomo.common.collections import ComponentMap, ComponentSet, Options
 
 import time
 import logging
@@ -35,13 +40,65 @@ def _convert_to_const(val):
     else:
         return value(val)
 
+def _repn_key(repn):
+    """A hashable summary of what a standard repn sends to the solver"""
+    return (repn.constant,
+            tuple(id(v) for v in repn.linear_vars),
+            tuple(repn.linear_coefs),
+            tuple((id(x), id(y)) for x, y in repn.quadratic_vars),
+            tuple(repn.quadratic_coefs),
+            repn.nonlinear_expr is None)
+
+def _identify_mutable_parameters(expr):
+    """Yield the mutable parameters in an expression
+
+    Unlike identify_mutable_parameters(), this descends into the
+    coefficients of LinearExpressions (e.g., from quicksum or
+    sum_product).
+    """
+    seen = set()
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if node.__class__ in native_types or id(node) in seen:
+            continue
+        seen.add(id(node))
+        if node.is_expression_type():
+            if isinstance(node, LinearExpression):
+                stack.append(node.constant)
+                stack.extend(node.linear_coefs)
+            else:
+                stack.extend(node.args)
+        elif not node.is_variable_type() and not node.is_constant():
+            yield node
+
+def _is_volatile(expr):
+    """True if the solver form of an expression can change without the
+    expression itself being replaced (i.e., it contains mutable
+    parameters or fixed variables)"""
+    if expr.__class__ in native_numeric_types:
+        return False
+    for p in _identify_mutable_parameters(expr):
+        return True
+    for v in identify_variables(expr, include_fixed=True):
+        if v.fixed:
+            return True
+    return False
+
+def _bound_value(has_bound, bound):
+    if has_bound:
+        return value(bound)
+    return None
+
 class PersistentSolver(DirectOrPersistentSolver):
     """
     A base class for persistent solvers. Direct solver interfaces do not use any file io.
     Rather, they interface directly with the python bindings for the specific solver. Persistent solver interfaces
     are similar except that they "remember" their model. Thus, persistent solver interfaces allow incremental changes
     to the solver model (e.g., the gurobi python model or the cplex python model). Note that users are responsible
-    for notifying the persistent solver interfaces when changes are made to the corresponding pyomo model.
+    for notifying the persistent solver interfaces when changes are made to the corresponding pyomo model,
+    either by calling the individual add/remove/update methods or, if the instance was set with
+    track_changes=True, by calling sync_model().
 
     Keyword Arguments
     -----------------
@@ -55,6 +112,9 @@ class PersistentSolver(DirectOrPersistentSolver):
         Dictionary of solver options
     """
 
+    # True if set_instance was called with track_changes=True
+    _track_changes = False
+
     def _presolve(self, **kwds):
         DirectOrPersistentSolver._presolve(self, **kwds)
 
@@ -81,7 +141,24 @@ class PersistentSolver(DirectOrPersistentSolver):
             If False then an error will be raised if a fixed variable is used in one of the solver constraints.
             This is useful for catching bugs. Ordinarily a fixed variable should appear as a constant value in the
             solver constraints. If True, then the error will not be raised.
+        bulk_load: bool
+            If True, the linear constraints are compiled into a sparse matrix and added to the solver in bulk
+            (for the interfaces that support it). Nonlinear constraints are still added one at a time.
+        track_changes: bool
+            If True, then the state of the model components is recorded as they are added to the solver so
+            that sync_model() can find the changes made to the model since then, and the constraints that depend
+            on each mutable parameter are indexed for update_params().
         """
+        self._track_changes = kwds.pop('track_changes', False)
+        self._var_snapshots = ComponentMap()
+        self._con_snapshots = ComponentMap()
+        self._sos_snapshots = ComponentMap()
+        self._obj_snapshot = None
+        # mutable parameter -> the constraints (and objective) that
+        # depend on it, and the parameter value they were last
+        # updated for
+        self._param_index = ComponentMap()
+        self._param_values = ComponentMap()
         return self._set_instance(model, kwds)
 
     def add_block(self, block):
@@ -216,9 +293,18 @@ class PersistentSolver(DirectOrPersistentSolver):
         if len(constraints) != len(coefficients):
             raise RuntimeError('The list of constraints and the list of coefficents '
                                'be of equal length')
+        pyomo_constraints = constraints
         obj_coef, constraints, coefficients = self._add_and_collect_column_data(
                 var, obj_coef, constraints, coefficients)
         self._add_column(var, obj_coef, constraints, coefficients)
+        if self._track_changes:
+            # the constraint and objective expressions were extended
+            # in place, so the solver already matches them
+            self._var_snapshots[var] = self._var_snapshot(var)
+            for con in pyomo_constraints:
+                self._con_snapshots[con] = self._con_snapshot(con)
+            if self._objective is not None:
+                self._obj_snapshot = self._objective_snapshot(self._objective)
 
     """ This method should be implemented by subclasses."""
     def _add_column(self, var, obj_coef, constraints, coefficients):
@@ -313,6 +399,8 @@ class PersistentSolver(DirectOrPersistentSolver):
         #    return
         solver_con = self._pyomo_con_to_solver_con_map[con]
         self._remove_constraint(solver_con)
+        if self._track_changes:
+            self._con_snapshots.pop(con, None)
         self._symbol_map.removeSymbol(con)
         self._labeler.remove_obj(con)
         for var in self._vars_referenced_by_con[con]:
@@ -340,6 +428,8 @@ class PersistentSolver(DirectOrPersistentSolver):
         #    return
         solver_con = self._pyomo_con_to_solver_con_map[con]
         self._remove_sos_constraint(solver_con)
+        if self._track_changes:
+            self._sos_snapshots.pop(con, None)
         self._symbol_map.removeSymbol(con)
         self._labeler.remove_obj(con)
         for var in self._vars_referenced_by_con[con]:
@@ -370,6 +460,8 @@ class PersistentSolver(DirectOrPersistentSolver):
                              'objective or one or more constraints')
         solver_var = self._pyomo_var_to_solver_var_map[var]
         self._remove_var(solver_var)
+        if self._track_changes:
+            self._var_snapshots.pop(var, None)
         self._symbol_map.removeSymbol(var)
         self._labeler.remove_obj(var)
         del self._referenced_variables[var]
@@ -388,6 +480,344 @@ class PersistentSolver(DirectOrPersistentSolver):
         """
         raise NotImplementedError('This method should be implemented by subclasses.')
 
+    def sync_model(self):
+        """Synchronize the solver's model with the Pyomo model.
+
+        This finds the changes made to the Pyomo model since the
+        components were added to the solver (or since the last call to
+        sync_model) and only passes those changes to the solver: added and
+        removed (or deactivated) variables, constraints and SOS
+        constraints, constraints whose expression, bounds or mutable
+        parameter values changed, variables whose bounds, domain or
+        fixed status changed, and changes to the objective.
+
+        The instance must have been set with track_changes=True.
+        """
+        if self._pyomo_model is None:
+            raise RuntimeError('You must call set_instance before calling sync_model.')
+        if not self._track_changes:
+            raise RuntimeError('sync_model requires the instance to be set with '
+                               'set_instance(model, track_changes=True).')
+        model = self._pyomo_model
+
+        current_vars = list(model.component_data_objects(
+            ctype=Var, descend_into=True, active=True, sort=True))
+        current_cons = []
+        current_sos = []
+        current_obj = None
+        for sub_block in model.block_data_objects(descend_into=True,
+                                                  active=True):
+            for con in sub_block.component_data_objects(
+                    ctype=Constraint, descend_into=False,
+                    active=True, sort=True):
+                if (not con.has_lb()) and \
+                   (not con.has_ub()):
+                    assert not con.equality
+                    continue  # non-binding, so skip
+                current_cons.append(con)
+            for con in sub_block.component_data_objects(
+                    ctype=SOSConstraint, descend_into=False,
+                    active=True, sort=True):
+                current_sos.append(con)
+            for obj in sub_block.component_data_objects(
+                    ctype=Objective, descend_into=False, active=True):
+                if current_obj is not None:
+                    raise ValueError("Solver interface does not "
+                                     "support multiple objectives.")
+                current_obj = obj
+
+        # Remove the constraints that were removed or modified
+        con_snapshots = self._con_snapshots
+        keep = ComponentMap((con, None) for con in current_cons)
+        new_cons = []
+        for con in current_cons:
+            snap = con_snapshots.get(con, None)
+            if snap is None:
+                new_cons.append(con)
+            elif self._con_changed(con, snap):
+                self._remove_tracked_constraint(con)
+                new_cons.append(con)
+        for con in [con for con in con_snapshots if con not in keep]:
+            self._remove_tracked_constraint(con)
+
+        sos_snapshots = self._sos_snapshots
+        keep = ComponentMap((con, None) for con in current_sos)
+        new_sos = []
+        for con in current_sos:
+            snap = sos_snapshots.get(con, None)
+            if snap is None:
+                new_sos.append(con)
+            elif snap != self._sos_snapshot(con):
+                self.remove_sos_constraint(con)
+                new_sos.append(con)
+        for con in [con for con in sos_snapshots if con not in keep]:
+            self.remove_sos_constraint(con)
+
+        # Add the new variables and update the modified ones
+        var_snapshots = self._var_snapshots
+        for var in current_vars:
+            snap = var_snapshots.get(var, None)
+            if snap is None:
+                self._add_var(var)
+            else:
+                new_snap = self._var_snapshot(var)
+                if snap != new_snap:
+                    self.update_var(var)
+                    var_snapshots[var] = new_snap
+
+        for con in new_cons:
+            self._add_constraint(con)
+        for con in new_sos:
+            self._add_sos_constraint(con)
+
+        if current_obj is not None and (
+                self._obj_snapshot is None or
+                self._objective_changed(current_obj, self._obj_snapshot)):
+            self._set_objective(current_obj)
+
+        # Remove the variables that are no longer in the model
+        if len(var_snapshots) > len(current_vars):
+            keep = ComponentMap((var, None) for var in current_vars)
+            for var in [var for var in var_snapshots if var not in keep]:
+                self.remove_var(var)
+
+    def update_params(self):
+        """Update the solver's model for changes in mutable parameter values.
+
+        Only the constraints (and the objective) that depend on a
+        parameter whose value changed since the last update are
+        re-evaluated.  Linear constraints whose variables did not
+        change have their coefficients and right-hand sides changed in
+        place (in one batch, for solvers that support it); other
+        affected constraints are rebuilt.
+
+        The instance must have been set with track_changes=True.
+        """
+        if self._pyomo_model is None:
+            raise RuntimeError('You must call set_instance before calling update_params.')
+        if not self._track_changes:
+            raise RuntimeError('update_params requires the instance to be set with '
+                               'set_instance(model, track_changes=True).')
+        param_index = self._param_index
+        param_values = self._param_values
+        changed = [p for p, val in param_values.items() if value(p) != val]
+        if not changed:
+            return
+
+        con_snapshots = self._con_snapshots
+        affected = ComponentMap()
+        for p in changed:
+            param_values[p] = value(p)
+            # drop the components that were removed from the solver
+            comps = ComponentSet(
+                comp for comp in param_index[p]
+                if comp in con_snapshots or comp is self._objective)
+            param_index[p] = comps
+            for comp in comps:
+                affected[comp] = None
+
+        updates = []
+        for comp in affected:
+            if comp is self._objective:
+                if self._objective_changed(comp, self._obj_snapshot):
+                    self._set_objective(comp)
+                continue
+            update = self._linear_constraint_update(comp)
+            if update is None:
+                continue
+            elif update is False:
+                self.remove_constraint(comp)
+                self._add_constraint(comp)
+            else:
+                updates.append(update)
+        if updates:
+            self._update_linear_constraints(updates)
+
+    def _linear_constraint_update(self, con):
+        """Return the (con, coefficient changes, constant) to update a
+        linear constraint in place, None if the constraint did not
+        change, or False if it has to be rebuilt"""
+        body, key, lb, ub, equality = self._con_snapshots[con]
+        if con._linear_canonical_form:
+            repn = con.canonical_form()
+        elif con.body is not body:
+            return False
+        else:
+            repn = generate_standard_repn(body, quadratic=True)
+        new_key = _repn_key(repn)
+        new_lb = _bound_value(con.has_lb(), con.lower)
+        new_ub = _bound_value(con.has_ub(), con.upper)
+        if key == new_key and lb == new_lb and ub == new_ub:
+            return None
+        if key[1] != new_key[1] or key[3] or new_key[3] \
+           or not new_key[5] \
+           or (lb is None) != (new_lb is None) \
+           or (ub is None) != (new_ub is None) \
+           or equality != con.equality:
+            return False
+        coef_changes = [(v, c) for v, c, old in
+                        zip(repn.linear_vars, repn.linear_coefs, key[2])
+                        if c != old]
+        self._con_snapshots[con] = (body, new_key, new_lb, new_ub, equality)
+        return con, coef_changes, repn.constant
+
+    def _update_linear_constraints(self, updates):
+        """Change linear constraints in the solver's model in place.
+
+        updates is a list of (con, coef_changes, constant) tuples, where
+        coef_changes is a list of (var, coef) pairs and constant is the
+        new constant term of the constraint body.  Interfaces that can
+        change coefficients and right-hand sides should override this;
+        by default, the constraints are rebuilt.
+        """
+        for con, coef_changes, constant in updates:
+            self.remove_constraint(con)
+            self._add_constraint(con)
+
+    def _remove_tracked_constraint(self, con):
+        if con in self._pyomo_con_to_solver_con_map:
+            self.remove_constraint(con)
+        else:
+            # the constraint was skipped (e.g., it was trivial)
+            del self._con_snapshots[con]
+
+    def _add_var(self, var, *args, **kwds):
+        ans = super(PersistentSolver, self)._add_var(var, *args, **kwds)
+        if self._track_changes:
+            self._var_snapshots[var] = self._var_snapshot(var)
+        return ans
+
+    def _add_constraint(self, con, *args, **kwds):
+        ans = super(PersistentSolver, self)._add_constraint(
+            con, *args, **kwds)
+        if self._track_changes and con.active:
+            self._con_snapshots[con] = self._con_snapshot(con)
+        return ans
+
+    # Interfaces that add components in bulk (e.g., MOSEK) do not go
+    # through _add_var and _add_constraint
+    def _add_vars(self, var_seq):
+        ans = super(PersistentSolver, self)._add_vars(var_seq)
+        if self._track_changes:
+            for var in var_seq:
+                self._var_snapshots[var] = self._var_snapshot(var)
+        return ans
+
+    def _add_constraints(self, con_seq):
+        ans = super(PersistentSolver, self)._add_constraints(con_seq)
+        if self._track_changes:
+            for con in con_seq:
+                if con.active:
+                    self._con_snapshots[con] = self._con_snapshot(con)
+        return ans
+
+    def _add_linear_rows(self, block):
+        ans = super(PersistentSolver, self)._add_linear_rows(block)
+        if self._track_changes:
+            for con in ans:
+                self._con_snapshots[con] = self._con_snapshot(con)
+        return ans
+
+    def _add_sos_constraint(self, con, *args, **kwds):
+        ans = super(PersistentSolver, self)._add_sos_constraint(
+            con, *args, **kwds)
+        if self._track_changes and con.active:
+            self._sos_snapshots[con] = self._sos_snapshot(con)
+        return ans
+
+    def _set_objective(self, obj):
+        ans = super(PersistentSolver, self)._set_objective(obj)
+        if self._track_changes:
+            self._obj_snapshot = self._objective_snapshot(obj)
+        return ans
+
+    #
+    # Snapshots of the state of the model components when they were
+    # passed to the solver (used by sync_model)
+    #
+
+    def _var_snapshot(self, var):
+        fixed = var.is_fixed()
+        return (fixed,
+                var.value if fixed else None,
+                _bound_value(var.has_lb(), var.lb),
+                _bound_value(var.has_ub(), var.ub),
+                var.is_binary(),
+                var.is_integer())
+
+    def _expr_key(self, expr):
+        return _repn_key(generate_standard_repn(expr, quadratic=True))
+
+    def _index_params(self, comp, exprs):
+        param_index = self._param_index
+        param_values = self._param_values
+        found = False
+        for expr in exprs:
+            if expr is None or expr.__class__ in native_numeric_types:
+                continue
+            for p in _identify_mutable_parameters(expr):
+                if p not in param_index:
+                    param_index[p] = ComponentSet()
+                    param_values[p] = value(p)
+                param_index[p].add(comp)
+                found = True
+        return found
+
+    def _con_snapshot(self, con):
+        has_params = self._index_params(con, (con.body, con.lower, con.upper))
+        # Expressions are compared by identity unless the solver form
+        # can change in place (or the constraint depends on mutable
+        # parameters), in which case the repn is compared.
+        if con._linear_canonical_form:
+            body = None
+            key = _repn_key(con.canonical_form())
+        else:
+            body = con.body
+            key = None
+            if has_params or _is_volatile(body):
+                key = self._expr_key(body)
+        return (body,
+                key,
+                _bound_value(con.has_lb(), con.lower),
+                _bound_value(con.has_ub(), con.upper),
+                con.equality)
+
+    def _con_changed(self, con, snap):
+        body, key, lb, ub, equality = snap
+        if con._linear_canonical_form:
+            if key != _repn_key(con.canonical_form()):
+                return True
+        elif con.body is not body:
+            return True
+        elif key is not None and key != self._expr_key(body):
+            return True
+        return (lb != _bound_value(con.has_lb(), con.lower)) or \
+            (ub != _bound_value(con.has_ub(), con.upper)) or \
+            (equality != con.equality)
+
+    def _sos_snapshot(self, con):
+        if hasattr(con, 'get_items'):
+            # aml sos constraint
+            sos_items = con.get_items()
+        else:
+            # kernel sos constraint
+            sos_items = con.items()
+        return (con.level, tuple((id(v), w) for v, w in sos_items))
+
+    def _objective_snapshot(self, obj):
+        expr = obj.expr
+        self._index_params(obj, (expr,))
+        key = None
+        if _is_volatile(expr):
+            key = self._expr_key(expr)
+        return (obj, expr, key, obj.sense)
+
+    def _objective_changed(self, obj, snap):
+        _obj, expr, key, sense = snap
+        if obj is not _obj or obj.expr is not expr or obj.sense != sense:
+            return True
+        return key is not None and key != self._expr_key(expr)
+
     def solve(self, *args, **kwds):
         """
         Solve the model.
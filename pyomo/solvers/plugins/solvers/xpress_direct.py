@@ -369,6 +369,47 @@ class XpressDirect(DirectSolver):
             raise ValueError('Variable domain type is not recognized for {0}'.format(var.domain))
         return vartype
     
+    def _bulk_load_capable(self):
+        return True
+
+    def _add_linear_matrix(self, matrix, rows, names):
+        # NOTE: xpress's python interface only allows for expresions
+        #       with native numeric types
+        xpress = self._xpress
+        solver_vars = [self._pyomo_var_to_solver_var_map[v]
+                       for v in matrix.variables]
+        indptr = matrix.indptr
+        indices = matrix.indices
+        data = matrix.data
+        lower = matrix.lower
+        upper = matrix.upper
+        xpress_cons = []
+        for i, conname in zip(rows, names):
+            start, end = indptr[i], indptr[i+1]
+            xpress_expr = xpress.Sum(
+                float(data[k])*solver_vars[indices[k]]
+                for k in range(start, end))
+            con = matrix.constraints[i]
+            lb = lower[i]
+            ub = upper[i]
+            if con.equality:
+                xpress_con = xpress.constraint(
+                    body=xpress_expr, sense=xpress.eq, rhs=lb, name=conname)
+            elif lb is not None and ub is not None:
+                xpress_con = xpress.constraint(
+                    body=xpress_expr, sense=xpress.range, lb=lb, ub=ub,
+                    name=conname)
+                self._range_constraints.add(xpress_con)
+            elif lb is not None:
+                xpress_con = xpress.constraint(
+                    body=xpress_expr, sense=xpress.geq, rhs=lb, name=conname)
+            else:
+                xpress_con = xpress.constraint(
+                    body=xpress_expr, sense=xpress.leq, rhs=ub, name=conname)
+            xpress_cons.append(xpress_con)
+        self._solver_model.addConstraint(xpress_cons)
+        return xpress_cons
+
     def _set_objective(self, obj):
         if self._objective is not None:
             for var in self._vars_referenced_by_obj:
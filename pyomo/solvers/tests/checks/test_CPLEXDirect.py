@@ -15,7 +15,7 @@ import pyutilib.th as unittest
 from pyomo.environ import (ConcreteModel, AbstractModel, Var, Objective,
                            Block, Constraint, Suffix, NonNegativeIntegers,
                            NonNegativeReals, Integers, Binary, is_fixed,
-                           value)
+                           inequality, value)
 from pyomo.opt import SolverFactory, TerminationCondition, SolutionStatus
 from pyomo.solvers.plugins.solvers.cplex_direct import (_CplexExpr,
                                                         _LinearConstraintData,
@@ -590,5 +590,59 @@ class TestLoadVars(unittest.TestCase):
         self.assertAlmostEqual(value(self._model.Y), 0.8)
 
 
+@unittest.skipIf(not cplexpy_available, "The 'cplex' python bindings are not available")
+class TestBulkLoad(unittest.TestCase):
+    def _build_model(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], bounds=(-10, 10))
+        m.y = Var(within=NonNegativeReals)
+        m.obj = Objective(
+            expr=sum((m.x[i] - 2*i)**2 for i in m.x) + m.y)
+        m.c1 = Constraint(expr=m.x[1] + 2*m.x[2] >= 1)
+        m.c2 = Constraint(expr=m.x[2] - m.x[3] + 1 <= 3)
+        m.q1 = Constraint(expr=m.x[1]**2 + m.x[2]**2 <= 8)
+        m.c3 = Constraint(expr=m.x[1] + m.x[3] == 2)
+        m.c4 = Constraint(expr=inequality(-1, m.x[1] - m.x[2], 1))
+        m.q2 = Constraint(expr=m.y >= m.x[3]**2 - 4)
+        m.c5 = Constraint(expr=2*m.y + m.x[1] >= 0)
+        return m
+
+    def _solve(self, m, bulk_load):
+        opt = SolverFactory('cplex_direct')
+        results = opt.solve(m, bulk_load=bulk_load,
+                            symbolic_solver_labels=True)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        linear_constraints = opt._solver_model.linear_constraints
+        rows = dict(
+            (name, (sorted(zip(row.ind, row.val)), sense, rhs, range_))
+            for name, row, sense, rhs, range_ in zip(
+                linear_constraints.get_names(),
+                linear_constraints.get_rows(),
+                linear_constraints.get_senses(),
+                linear_constraints.get_rhs(),
+                linear_constraints.get_range_values()))
+        quadratic_constraints = sorted(
+            opt._solver_model.quadratic_constraints.get_names())
+        solution = [m.x[i].value for i in m.x] + [m.y.value, value(m.obj)]
+        return rows, quadratic_constraints, solution
+
+    def test_bulk_load_matches_per_constraint(self):
+        m = self._build_model()
+        rows, quadratic_constraints, solution = self._solve(m, False)
+        self.assertEqual(sorted(rows), ['c1', 'c2', 'c3', 'c4', 'c5'])
+        self.assertEqual(quadratic_constraints, ['q1', 'q2'])
+
+        for i in m.x:
+            m.x[i].value = None
+        m.y.value = None
+        bulk_rows, bulk_quadratic_constraints, bulk_solution = \
+            self._solve(m, True)
+        self.assertEqual(bulk_rows, rows)
+        self.assertEqual(bulk_quadratic_constraints, quadratic_constraints)
+        for val, bulk_val in zip(solution, bulk_solution):
+            self.assertAlmostEqual(val, bulk_val, delta=diff_tol)
+
+
 if __name__ == "__main__":
     unittest.main()
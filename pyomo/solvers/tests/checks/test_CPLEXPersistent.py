@@ -11,7 +11,7 @@
 import pyutilib.th as unittest
 
 import pyomo.environ
-from pyomo.core import (ConcreteModel, Var, Objective,
+from pyomo.core import (ConcreteModel, Var, Objective, Param,
                         Constraint, NonNegativeReals)
 from pyomo.opt import SolverFactory
 
@@ -113,3 +113,165 @@ class TestQuadraticObjective(unittest.TestCase):
         opt.add_var(m.y)
         # var already in solver model
         self.assertRaises(RuntimeError, opt.add_column, m, m.y, -2, [m.c], [1])
+
+
+@unittest.skipIf(not cplexpy_available, "The 'cplex' python bindings are not available")
+class TestUpdateParams(unittest.TestCase):
+    def _build_model(self):
+        m = ConcreteModel()
+        m.a = Param(mutable=True, initialize=2)
+        m.b = Param(mutable=True, initialize=1)
+        m.lo = Param(mutable=True, initialize=-5)
+        m.hi = Param(mutable=True, initialize=5)
+        m.x = Var(bounds=(-10, 10))
+        m.y = Var(bounds=(-10, 10))
+        m.obj = Objective(expr=m.x ** 2 + (m.y - 8) ** 2)
+        m.c1 = Constraint(expr=m.y >= m.a * m.x + m.b)
+        m.c2 = Constraint(expr=m.y >= -m.x + m.b)
+        m.c3 = Constraint(expr=(m.lo, m.x + m.y, m.hi))
+        return m
+
+    def _fresh_solve(self, m):
+        opt = SolverFactory('cplex_persistent')
+        opt.set_instance(m)
+        opt.solve()
+        return m.x.value, m.y.value
+
+    def _check_against_fresh_solve(self, m, opt):
+        opt.solve()
+        x, y = m.x.value, m.y.value
+        fresh_x, fresh_y = self._fresh_solve(m)
+        self.assertAlmostEqual(x, fresh_x, places=4)
+        self.assertAlmostEqual(y, fresh_y, places=4)
+
+    def test_update_params_coefficients(self):
+        m = self._build_model()
+        opt = SolverFactory('cplex_persistent')
+        opt.set_instance(m, track_changes=True)
+        c1 = opt._pyomo_con_to_solver_con_map[m.c1]
+        x = opt._pyomo_var_to_solver_var_map[m.x]
+        self._check_against_fresh_solve(m, opt)
+
+        m.a.value = -3
+        opt.update_params()
+        # the constraint was changed in place
+        self.assertIs(opt._pyomo_con_to_solver_con_map[m.c1], c1)
+        self.assertAlmostEqual(abs(
+            opt._solver_model.linear_constraints.get_coefficients(c1, x)), 3)
+        self._check_against_fresh_solve(m, opt)
+
+    def test_update_params_rhs(self):
+        m = self._build_model()
+        opt = SolverFactory('cplex_persistent')
+        opt.set_instance(m, track_changes=True)
+        cons = dict((c, opt._pyomo_con_to_solver_con_map[c])
+                    for c in (m.c1, m.c2))
+        self._check_against_fresh_solve(m, opt)
+
+        m.b.value = 4
+        opt.update_params()
+        linear_constraints = opt._solver_model.linear_constraints
+        for c, cplex_con in cons.items():
+            self.assertIs(opt._pyomo_con_to_solver_con_map[c], cplex_con)
+            self.assertAlmostEqual(
+                abs(linear_constraints.get_rhs(cplex_con)), 4)
+        self._check_against_fresh_solve(m, opt)
+
+    def test_update_params_range_bounds(self):
+        m = self._build_model()
+        opt = SolverFactory('cplex_persistent')
+        opt.set_instance(m, track_changes=True)
+        c3 = opt._pyomo_con_to_solver_con_map[m.c3]
+        self._check_against_fresh_solve(m, opt)
+
+        m.lo.value = -1
+        m.hi.value = 2
+        opt.update_params()
+        self.assertIs(opt._pyomo_con_to_solver_con_map[m.c3], c3)
+        linear_constraints = opt._solver_model.linear_constraints
+        self.assertAlmostEqual(linear_constraints.get_rhs(c3), 2)
+        self.assertAlmostEqual(linear_constraints.get_range_values(c3), -3)
+        self._check_against_fresh_solve(m, opt)
+        self.assertAlmostEqual(m.x.value + m.y.value, 2, places=4)
+
+    def test_update_params_all(self):
+        m = self._build_model()
+        opt = SolverFactory('cplex_persistent')
+        opt.set_instance(m, track_changes=True)
+        self._check_against_fresh_solve(m, opt)
+
+        m.a.value = 1
+        m.b.value = 2
+        m.lo.value = 0
+        m.hi.value = 3
+        opt.update_params()
+        self._check_against_fresh_solve(m, opt)
+
+
+@unittest.skipIf(not cplexpy_available, "The 'cplex' python bindings are not available")
+class TestSyncModel(unittest.TestCase):
+    def _num_vars_and_cons(self, opt):
+        return (opt._solver_model.variables.get_num(),
+                opt._solver_model.linear_constraints.get_num())
+
+    def _check_against_fresh_solve(self, m, opt):
+        opt.solve()
+        solution = [v.value for v in m.component_data_objects(Var)]
+        fresh_opt = SolverFactory('cplex_persistent')
+        fresh_opt.set_instance(m)
+        fresh_opt.solve()
+        for val, fresh_val in zip(
+                solution, [v.value for v in m.component_data_objects(Var)]):
+            self.assertAlmostEqual(val, fresh_val, places=4)
+
+    def test_sync_model(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=1)
+        m.x = Var(bounds=(-10, 10))
+        m.y = Var()
+        m.obj = Objective(expr=m.x**2 + m.y**2)
+        m.c1 = Constraint(expr=m.y >= 2*m.x + m.p)
+
+        opt = SolverFactory('cplex_persistent')
+        opt.set_instance(m, track_changes=True)
+        self._check_against_fresh_solve(m, opt)
+
+        # added constraint and variable
+        m.z = Var(bounds=(0, None))
+        m.c2 = Constraint(expr=m.y >= -m.x + m.z)
+        opt.sync_model()
+        self.assertEqual(self._num_vars_and_cons(opt), (3, 2))
+        self._check_against_fresh_solve(m, opt)
+
+        # mutable parameter in a constraint
+        m.p.value = 2
+        opt.sync_model()
+        self._check_against_fresh_solve(m, opt)
+        self.assertAlmostEqual(m.y.value, 2*m.x.value + 2, places=4)
+
+        # variable bounds and fixing
+        m.x.setlb(1)
+        m.z.fix(5)
+        opt.sync_model()
+        self._check_against_fresh_solve(m, opt)
+        self.assertAlmostEqual(m.x.value, 1, places=4)
+        self.assertAlmostEqual(m.y.value, 4, places=4)
+
+        # objective
+        m.obj.expr = m.x + m.y
+        opt.sync_model()
+        self._check_against_fresh_solve(m, opt)
+
+        # removed constraint and variable
+        m.obj.expr = m.x**2 + m.y**2
+        m.del_component(m.c2)
+        m.del_component(m.z)
+        opt.sync_model()
+        self.assertEqual(self._num_vars_and_cons(opt), (2, 1))
+        self._check_against_fresh_solve(m, opt)
+
+        # deactivated constraint
+        m.c1.deactivate()
+        opt.sync_model()
+        self.assertEqual(self._num_vars_and_cons(opt), (2, 0))
+        self._check_against_fresh_solve(m, opt)
@@ -143,6 +143,48 @@ class MOSEKDirectTests(unittest.TestCase):
         self.assertEqual(results.solution.status,
                          SolutionStatus.optimal)
 
+    def test_bulk_load_matches_per_constraint(self):
+
+        def build_model():
+            m = pyo.ConcreteModel()
+            m.x = pyo.Var([1, 2, 3], bounds=(-10, 10))
+            m.y = pyo.Var(within=pyo.NonNegativeReals)
+            m.obj = pyo.Objective(
+                expr=sum((m.x[i] - 2*i)**2 for i in m.x) + m.y)
+            m.c1 = pyo.Constraint(expr=m.x[1] + 2*m.x[2] >= 1)
+            m.c2 = pyo.Constraint(expr=m.x[2] - m.x[3] + 1 <= 3)
+            m.q1 = pyo.Constraint(expr=m.x[1]**2 + m.x[2]**2 <= 8)
+            m.c3 = pyo.Constraint(expr=m.x[1] + m.x[3] == 2)
+            m.c4 = pyo.Constraint(
+                expr=pyo.inequality(-1, m.x[1] - m.x[2], 1))
+            m.q2 = pyo.Constraint(expr=m.y >= m.x[3]**2 - 4)
+            m.c5 = pyo.Constraint(expr=2*m.y + m.x[1] >= 0)
+            return m
+
+        def solve(bulk_load):
+            m = build_model()
+            opt = pyo.SolverFactory("mosek_direct")
+            results = opt.solve(m, bulk_load=bulk_load)
+            self.assertEqual(results.solution.status,
+                             SolutionStatus.optimal)
+            task = opt._solver_model
+            self.assertEqual(task.getnumcon(), 7)
+            rows = {}
+            for con in m.component_data_objects(pyo.Constraint):
+                i = opt._pyomo_con_to_solver_con_map[con]
+                rows[con.name] = (task.getconbound(i),
+                                  task.getarownumnz(i),
+                                  task.getnumqconknz(i))
+            solution = [m.x[i].value for i in m.x]
+            solution += [m.y.value, pyo.value(m.obj)]
+            return rows, solution
+
+        rows, solution = solve(False)
+        bulk_rows, bulk_solution = solve(True)
+        self.assertEqual(bulk_rows, rows)
+        for val, bulk_val in zip(solution, bulk_solution):
+            self.assertAlmostEqual(val, bulk_val, delta=diff_tol)
+
     def test_conic(self):
 
         model = pmo.block()
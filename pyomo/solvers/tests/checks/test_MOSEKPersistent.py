@@ -165,6 +165,72 @@ class MOSEKPersistentTests(unittest.TestCase):
         self.assertAlmostEqual(m.x.value, int_sol_to_get[0], places=1)
         self.assertAlmostEqual(m.y.value, int_sol_to_get[1], places=1)
 
+    def test_sync_model(self):
+
+        def check_against_fresh_solve():
+            opt.solve()
+            solution = [v.value for v in m.component_data_objects(pyo.Var)]
+            fresh_opt = pyo.SolverFactory('mosek_persistent')
+            fresh_opt.set_instance(m)
+            fresh_opt.solve()
+            fresh_solution = [v.value
+                              for v in m.component_data_objects(pyo.Var)]
+            for val, fresh_val in zip(solution, fresh_solution):
+                self.assertAlmostEqual(val, fresh_val, delta=diff_tol)
+
+        m = pyo.ConcreteModel()
+        m.p = pyo.Param(mutable=True, initialize=1)
+        m.x = pyo.Var(bounds=(-10, 10))
+        m.y = pyo.Var()
+        m.obj = pyo.Objective(expr=m.x**2 + m.y**2)
+        m.c1 = pyo.Constraint(expr=m.y >= 2*m.x + m.p)
+
+        opt = pyo.SolverFactory('mosek_persistent')
+        opt.set_instance(m, track_changes=True)
+        check_against_fresh_solve()
+
+        # added constraint and variable
+        m.z = pyo.Var(bounds=(0, None))
+        m.c2 = pyo.Constraint(expr=m.y >= -m.x + m.z)
+        opt.sync_model()
+        self.assertEqual(opt._solver_model.getnumvar(), 3)
+        self.assertEqual(opt._solver_model.getnumcon(), 2)
+        check_against_fresh_solve()
+
+        # mutable parameter in a constraint
+        m.p.value = 2
+        opt.sync_model()
+        check_against_fresh_solve()
+        self.assertAlmostEqual(m.y.value, 2*m.x.value + 2, delta=diff_tol)
+
+        # variable bounds and fixing
+        m.x.setlb(1)
+        m.z.fix(5)
+        opt.sync_model()
+        check_against_fresh_solve()
+        self.assertAlmostEqual(m.x.value, 1, delta=diff_tol)
+        self.assertAlmostEqual(m.y.value, 4, delta=diff_tol)
+
+        # objective
+        m.obj.expr = m.x + m.y
+        opt.sync_model()
+        check_against_fresh_solve()
+
+        # removed constraint and variable
+        m.obj.expr = m.x**2 + m.y**2
+        m.del_component(m.c2)
+        m.del_component(m.z)
+        opt.sync_model()
+        self.assertEqual(opt._solver_model.getnumvar(), 2)
+        self.assertEqual(opt._solver_model.getnumcon(), 1)
+        check_against_fresh_solve()
+
+        # deactivated constraint
+        m.c1.deactivate()
+        opt.sync_model()
+        self.assertEqual(opt._solver_model.getnumcon(), 0)
+        check_against_fresh_solve()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -256,6 +256,209 @@ class TestGurobiPersistent(unittest.TestCase):
         opt.update()
         self.assertEqual(opt._solver_model.getAttr('NumVars'), 1)
 
+    @unittest.skipIf(not gurobipy_available, "gurobipy is not available")
+    def test_bulk_load(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(bounds=(-10, 10))
+        m.y = pyo.Var()
+        m.obj = pyo.Objective(expr=m.x**2 + m.y**2)
+        m.c1 = pyo.Constraint(expr=m.y >= 2*m.x + 1)
+        m.c2 = pyo.Constraint(expr=pyo.inequality(-5, m.x + m.y, 5))
+        m.c3 = pyo.Constraint(expr=m.x**2 <= 50)
+
+        opt = pyo.SolverFactory('gurobi_persistent')
+        opt.set_instance(m, bulk_load=True)
+        self.assertEqual(opt.get_model_attr('NumConstrs'), 2)
+        self.assertEqual(opt.get_model_attr('NumQConstrs'), 1)
+        self.assertEqual(len(opt._vars_referenced_by_con[m.c1]), 2)
+
+        opt.solve()
+        self.assertAlmostEqual(m.x.value, -0.4)
+        self.assertAlmostEqual(m.y.value, 0.2)
+
+        opt.remove_constraint(m.c1)
+        opt.solve()
+        self.assertAlmostEqual(m.x.value, 0)
+        self.assertAlmostEqual(m.y.value, 0)
+
+    @unittest.skipIf(not gurobipy_available, "gurobipy is not available")
+    def test_sync_model(self):
+        m = pyo.ConcreteModel()
+        m.p = pyo.Param(mutable=True, initialize=1)
+        m.x = pyo.Var(bounds=(-10, 10))
+        m.y = pyo.Var()
+        m.obj = pyo.Objective(expr=m.x**2 + m.y**2)
+        m.c1 = pyo.Constraint(expr=m.y >= 2*m.x + m.p)
+
+        opt = pyo.SolverFactory('gurobi_persistent')
+        opt.set_instance(m, track_changes=True)
+        c1 = opt._pyomo_con_to_solver_con_map[m.c1]
+
+        # nothing changed
+        opt.sync_model()
+        self.assertIs(opt._pyomo_con_to_solver_con_map[m.c1], c1)
+
+        # added constraint and variable
+        m.z = pyo.Var(bounds=(0, None))
+        m.c2 = pyo.Constraint(expr=m.y >= -m.x + m.z)
+        opt.sync_model()
+        self.assertIs(opt._pyomo_con_to_solver_con_map[m.c1], c1)
+        self.assertEqual(opt.get_model_attr('NumVars'), 3)
+        self.assertEqual(opt.get_model_attr('NumConstrs'), 2)
+
+        # mutable parameter in a constraint
+        m.p.value = 2
+        opt.sync_model()
+        self.assertIsNot(opt._pyomo_con_to_solver_con_map[m.c1], c1)
+        opt.solve()
+        self.assertAlmostEqual(m.y.value, 2*m.x.value + 2)
+
+        # variable bounds and fixing
+        m.x.setlb(1)
+        m.z.fix(5)
+        opt.sync_model()
+        self.assertEqual(opt.get_var_attr(m.x, 'LB'), 1)
+        self.assertEqual(opt.get_var_attr(m.z, 'LB'), 5)
+        self.assertEqual(opt.get_var_attr(m.z, 'UB'), 5)
+        opt.solve()
+        self.assertAlmostEqual(m.x.value, 1)
+        self.assertAlmostEqual(m.y.value, 4)
+
+        # objective
+        m.obj.expr = m.x + m.y
+        opt.sync_model()
+        opt.solve()
+        self.assertAlmostEqual(m.x.value, 1)
+        self.assertAlmostEqual(m.y.value, 4)
+
+        # removed constraint and variable
+        m.obj.expr = m.x**2 + m.y**2
+        m.del_component(m.c2)
+        m.del_component(m.z)
+        opt.sync_model()
+        self.assertEqual(opt.get_model_attr('NumVars'), 2)
+        self.assertEqual(opt.get_model_attr('NumConstrs'), 1)
+
+        # deactivated constraint
+        m.c1.deactivate()
+        opt.sync_model()
+        self.assertEqual(opt.get_model_attr('NumConstrs'), 0)
+
+    @unittest.skipIf(not gurobipy_available, "gurobipy is not available")
+    def test_sync_model_linear_expression(self):
+        # quicksum generates a LinearExpression
+        m = pyo.ConcreteModel()
+        m.p = pyo.Param([1, 2], mutable=True, initialize=1)
+        m.x = pyo.Var([1, 2], bounds=(0, 10))
+        m.obj = pyo.Objective(expr=m.x[1] + m.x[2])
+        m.c = pyo.Constraint(
+            expr=pyo.quicksum(m.p[i]*m.x[i] for i in m.x) >= 4)
+
+        opt = pyo.SolverFactory('gurobi_persistent')
+        opt.set_instance(m, track_changes=True)
+        c = opt._pyomo_con_to_solver_con_map[m.c]
+        opt.solve()
+        self.assertAlmostEqual(pyo.value(m.obj), 4)
+
+        m.p[1].value = 4
+        opt.sync_model()
+        self.assertIsNot(opt._pyomo_con_to_solver_con_map[m.c], c)
+        opt.solve()
+        self.assertAlmostEqual(m.x[1].value, 1)
+        self.assertAlmostEqual(m.x[2].value, 0)
+
+    def test_linear_expression_is_volatile(self):
+        from pyomo.solvers.plugins.solvers.persistent_solver import (
+            _is_volatile, _identify_mutable_parameters)
+        m = pyo.ConcreteModel()
+        m.p = pyo.Param([1, 2], mutable=True, initialize=1)
+        m.x = pyo.Var([1, 2])
+        e = pyo.quicksum(m.p[i]*m.x[i] for i in m.x)
+        self.assertEqual(
+            sorted(p.name for p in _identify_mutable_parameters(e)),
+            ['p[1]', 'p[2]'])
+        self.assertTrue(_is_volatile(e))
+        self.assertTrue(_is_volatile(pyo.sum_product(m.p, m.x) + 1))
+        self.assertFalse(_is_volatile(pyo.quicksum(m.x[i] for i in m.x)))
+
+    @unittest.skipIf(not gurobipy_available, "gurobipy is not available")
+    def test_update_params(self):
+        m = pyo.ConcreteModel()
+        m.a = pyo.Param(mutable=True, initialize=2)
+        m.b = pyo.Param(mutable=True, initialize=1)
+        m.x = pyo.Var()
+        m.y = pyo.Var()
+        m.obj = pyo.Objective(expr=m.x**2 + m.y**2)
+        m.c1 = pyo.Constraint(expr=m.y >= m.a*m.x + m.b)
+        m.c2 = pyo.Constraint(expr=m.y >= -m.x + m.b)
+        m.c3 = pyo.Constraint(expr=m.y <= 10)
+
+        opt = pyo.SolverFactory('gurobi_persistent')
+        opt.set_instance(m, track_changes=True)
+        cons = dict((c, opt._pyomo_con_to_solver_con_map[c])
+                    for c in (m.c1, m.c2, m.c3))
+        opt.solve()
+        self.assertAlmostEqual(m.x.value, -0.4)
+        self.assertAlmostEqual(m.y.value, 0.2)
+
+        m.a.value = 1
+        m.b.value = 2
+        opt.update_params()
+        # the constraints were changed in place
+        for c, gurobipy_con in cons.items():
+            self.assertIs(opt._pyomo_con_to_solver_con_map[c], gurobipy_con)
+        opt.update()
+        self.assertAlmostEqual(
+            abs(opt._solver_model.getCoeff(
+                cons[m.c1], opt._pyomo_var_to_solver_var_map[m.x])),
+            1)
+        self.assertAlmostEqual(
+            abs(opt.get_linear_constraint_attr(m.c1, 'RHS')), 2)
+        self.assertAlmostEqual(
+            abs(opt.get_linear_constraint_attr(m.c2, 'RHS')), 2)
+        opt.solve()
+        self.assertAlmostEqual(m.x.value, 0)
+        self.assertAlmostEqual(m.y.value, 2)
+
+    @unittest.skipIf(not gurobipy_available, "gurobipy is not available")
+    def test_update_params_linear_expression(self):
+        # quicksum and sum_product generate LinearExpressions
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(50)
+        m.a = pyo.Param(mutable=True, initialize=1)
+        m.b = pyo.Param(m.I, mutable=True, initialize=1)
+        m.x = pyo.Var(m.I, bounds=(0, 10))
+        m.obj = pyo.Objective(expr=pyo.quicksum(m.x[i] for i in m.I))
+        m.c1 = pyo.Constraint(
+            expr=pyo.quicksum(m.a*m.x[i] for i in m.I) >= 10)
+        m.c2 = pyo.Constraint(expr=pyo.sum_product(m.b, m.x) <= 100)
+
+        opt = pyo.SolverFactory('gurobi_persistent')
+        opt.set_instance(m, track_changes=True)
+        self.assertEqual(list(opt._param_index[m.a]), [m.c1])
+        self.assertEqual(list(opt._param_index[m.b[3]]), [m.c2])
+        c1 = opt._pyomo_con_to_solver_con_map[m.c1]
+        opt.solve()
+        self.assertAlmostEqual(pyo.value(m.obj), 10)
+
+        m.a.value = 2
+        opt.update_params()
+        self.assertIs(opt._pyomo_con_to_solver_con_map[m.c1], c1)
+        opt.update()
+        self.assertAlmostEqual(opt._solver_model.getCoeff(
+            c1, opt._pyomo_var_to_solver_var_map[m.x[3]]), 2)
+        opt.solve()
+        self.assertAlmostEqual(pyo.value(m.obj), 5)
+
+    @unittest.skipIf(not gurobipy_available, "gurobipy is not available")
+    def test_sync_model_requires_tracking(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        opt = pyo.SolverFactory('gurobi_persistent')
+        self.assertRaises(RuntimeError, opt.sync_model)
+        opt.set_instance(m)
+        self.assertRaises(RuntimeError, opt.sync_model)
+
     @unittest.skipIf(not gurobipy_available, "gurobipy is not available")
     def test_linear_constraint_attr(self):
         m = pyo.ConcreteModel()
@@ -0,0 +1,125 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+from os.path import abspath, dirname
+currdir = dirname(abspath(__file__))+os.sep
+
+import pyutilib.th as unittest
+import six
+
+from pyomo.environ import (SolverFactory, SolverManagerFactory,
+                           ConcreteModel, Var, Param, Constraint, Objective,
+                           value)
+from pyomo.opt import TerminationCondition, ProblemFormat
+from pyomo.opt.parallel.manager import (ActionManagerError, ActionStatus,
+                                        ActionHandle)
+from pyomo.solvers.plugins.smanager import process_pool
+
+glpk_available = SolverFactory('glpk').available(exception_flag=False)
+
+
+def _model(rhs):
+    m = ConcreteModel()
+    m.p = Param(initialize=rhs)
+    m.x = Var(bounds=(0, None))
+    m.y = Var(bounds=(0, None))
+    m.c = Constraint(expr=m.x + 2*m.y >= m.p)
+    m.o = Objective(expr=m.x + m.y)
+    return m
+
+
+class TestProcessPool(unittest.TestCase):
+
+    def test_registered(self):
+        self.assertIn('processpool', SolverManagerFactory)
+
+    def test_no_solver(self):
+        with SolverManagerFactory('processpool') as mngr:
+            with self.assertRaises(ActionManagerError):
+                mngr.queue(_model(1))
+
+    def test_nothing_queued(self):
+        with SolverManagerFactory('processpool') as mngr:
+            self.assertTrue(mngr.wait_any().explanation)
+
+    @unittest.skipIf(six.PY2, "Pool.apply_async has no error_callback")
+    def test_unpicklable_task(self):
+        with SolverManagerFactory('processpool', max_workers=1) as mngr:
+            ah = mngr.queue(currdir+'unknown.lp', opt='glpk',
+                            solnfile_hook=lambda x: x)
+            with self.assertRaisesRegex(
+                    ActionManagerError, "processing error for task with "
+                    "id=%s. Reason: \n.*pickle" % (ah.id,)):
+                mngr.wait_any()
+            self.assertEqual(ah.status, ActionStatus.error)
+
+    @unittest.skipIf(not unittest.mock_available, "'mock' is not available")
+    def test_solver_io_sent_to_worker(self):
+        with SolverManagerFactory('processpool') as mngr:
+            data = mngr._get_task_data(ActionHandle(), currdir+'unknown.mps',
+                                       opt='glpk', solver_io='mps')
+        self.assertEqual(data.opt, 'glpk')
+        self.assertEqual(data.solver_kwds, {'solver_io': 'mps'})
+        self.assertEqual(data.problem_format, ProblemFormat.mps)
+        self.assertNotIn('solver_io', data.kwds)
+
+        # The worker constructs the solver with the same arguments
+        with unittest.mock.patch.object(
+                process_pool, 'SolverFactory',
+                wraps=process_pool.SolverFactory) as factory:
+            process_pool._solve_task(data)
+        factory.assert_called_once_with('glpk', solver_io='mps')
+
+    @unittest.skipIf(not glpk_available, "The GLPK solver is not available")
+    def test_solve_instances(self):
+        models = [_model(i) for i in range(1, 7)]
+        with SolverManagerFactory('processpool', max_workers=3) as mngr:
+            handles = {}
+            for m in models:
+                handles[mngr.queue(m, opt='glpk')] = m
+            self.assertEqual(mngr.num_queued(), len(models))
+            mngr.wait_all()
+            self.assertEqual(mngr.num_queued(), 0)
+            for ah, m in handles.items():
+                self.assertEqual(ah.status, ActionStatus.done)
+                results = mngr.get_results(ah)
+                self.assertEqual(results.solver.termination_condition,
+                                 TerminationCondition.optimal)
+                self.assertAlmostEqual(value(m.o), value(m.p)/2.0)
+
+    @unittest.skipIf(not glpk_available, "The GLPK solver is not available")
+    def test_solve_file(self):
+        with SolverManagerFactory('processpool', max_workers=1) as mngr:
+            results = mngr.solve(currdir+os.path.join('..', 'mip', 'test2.lp'),
+                                 opt='glpk')
+        self.assertEqual(len(results.solution), 1)
+
+    @unittest.skipIf(not glpk_available, "The GLPK solver is not available")
+    def test_load_solutions_false(self):
+        m = _model(4)
+        with SolverManagerFactory('processpool', max_workers=1) as mngr:
+            results = mngr.solve(m, opt='glpk', load_solutions=False)
+        self.assertIs(m.x.value, None)
+        m.solutions.load_from(results)
+        self.assertAlmostEqual(value(m.o), 2)
+
+    @unittest.skipIf(not glpk_available, "The GLPK solver is not available")
+    def test_solver_io(self):
+        m = _model(4)
+        with SolverManagerFactory('processpool', max_workers=1) as mngr:
+            results = mngr.solve(m, opt='glpk', solver_io='mps')
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertAlmostEqual(value(m.o), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
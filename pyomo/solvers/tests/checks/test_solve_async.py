@@ -0,0 +1,204 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+import sys
+import threading
+
+import pyutilib.th as unittest
+
+from pyomo.common.collections import Bunch
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.environ import (SolverFactory, ConcreteModel, Var, Constraint,
+                           Objective, value)
+from pyomo.opt import (OptSolver, ProblemFormat, ResultsFormat,
+                       SolverResults, TerminationCondition)
+from pyomo.opt.solver.shellcmd import SystemCallSolver
+
+async_available = sys.version_info >= (3, 5)
+if async_available:
+    import asyncio
+    from pyomo.opt.base.async_solve import _execute_command
+
+glpk_available = SolverFactory('glpk').available(exception_flag=False)
+
+
+class WarmStartSolver(SystemCallSolver):
+    """A "solver" that, like CBC, pushes a TempfileManager context for
+    a warm-start file before the SystemCallSolver context.  The solver
+    process fails if the warm-start file is removed while it runs."""
+
+    def __init__(self, delay, **kwds):
+        kwds['type'] = 'warmstart_test'
+        SystemCallSolver.__init__(self, **kwds)
+        self._valid_problem_formats = [ProblemFormat.cpxlp]
+        self.set_problem_format(ProblemFormat.cpxlp)
+        self._delay = delay
+
+    def _default_executable(self):
+        return sys.executable
+
+    def _presolve(self, *args, **kwds):
+        TempfileManager.push()
+        self.warm_start_file = TempfileManager.create_tempfile(
+            suffix='.soln')
+        SystemCallSolver._presolve(self, *args, **kwds)
+        self._results_format = None
+
+    def create_command_line(self, executable, problem_files):
+        script = ("import os, sys, time; time.sleep(%s); "
+                  "sys.exit(not os.path.exists(%r))"
+                  % (self._delay, self.warm_start_file))
+        return Bunch(cmd=[executable, '-c', script], log_file=None, env=None)
+
+    def _postsolve(self):
+        SystemCallSolver._postsolve(self)
+        TempfileManager.pop(remove=not self._keepfiles)
+        return SolverResults()
+
+
+class BarrierSolver(OptSolver):
+    """An in-process "solver" that waits for another solve to run at
+    the same time"""
+
+    def __init__(self, barrier, **kwds):
+        kwds['type'] = 'barrier_test'
+        OptSolver.__init__(self, **kwds)
+        self._barrier = barrier
+
+    def _presolve(self, *args, **kwds):
+        TempfileManager.push()
+        self._keepfiles = False
+        self.tempfile = TempfileManager.create_tempfile(suffix='.log')
+
+    def _apply_solver(self):
+        self._barrier.wait()
+        self.tempfile_existed = os.path.exists(self.tempfile)
+        return Bunch(rc=0, log=None)
+
+    def _postsolve(self):
+        TempfileManager.pop(remove=True)
+        return SolverResults()
+
+
+@unittest.skipIf(not async_available, "asyncio requires Python 3.5")
+class TestSolveAsync(unittest.TestCase):
+
+    def _run(self, coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def test_execute_command(self):
+        solver = Bunch(_timelimit=None, _tee=False)
+        command = Bunch(cmd=[sys.executable, '-c', 'print("hello")'],
+                        env=None)
+        rc, log = self._run(_execute_command(solver, command))
+        self.assertEqual(rc, 0)
+        self.assertEqual(log.strip(), "hello")
+        self.assertIsNotNone(solver._last_solve_time)
+
+    def test_execute_command_timelimit(self):
+        solver = Bunch(_timelimit=0.1, _tee=False)
+        command = Bunch(
+            cmd=[sys.executable, '-c',
+                 'import time; print("start", flush=True); time.sleep(60)'],
+            env=None)
+        rc, log = self._run(_execute_command(solver, command))
+        self.assertNotEqual(rc, 0)
+        self.assertEqual(log.strip(), "start")
+        self.assertLess(solver._last_solve_time, 30)
+
+    def test_execute_command_cancel(self):
+        solver = Bunch(_timelimit=None, _tee=False)
+        command = Bunch(cmd=[sys.executable, '-c', 'import time; time.sleep(60)'],
+                        env=None)
+
+        async def _cancel():
+            task = asyncio.ensure_future(_execute_command(solver, command))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        self._run(_cancel())
+
+    def test_concurrent_tempfile_contexts(self):
+        # The solve that finishes first must not release the warm-start
+        # file of the other solve
+        problem = TempfileManager.create_tempfile(suffix='.lp')
+        try:
+            with open(problem, 'w') as FILE:
+                FILE.write("\\ empty\n")
+            depth = len(TempfileManager._tempfiles)
+            solvers = [WarmStartSolver(0.1), WarmStartSolver(1)]
+
+            async def _solve_all():
+                return await asyncio.gather(*(
+                    opt.solve_async(problem) for opt in solvers))
+            self._run(_solve_all())
+            self.assertEqual(len(TempfileManager._tempfiles), depth)
+            for opt in solvers:
+                self.assertFalse(os.path.exists(opt.warm_start_file))
+
+            # A cancelled solve releases all of its contexts
+            opt = WarmStartSolver(60)
+
+            async def _cancel():
+                task = asyncio.ensure_future(opt.solve_async(problem))
+                await asyncio.sleep(0.5)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+            self._run(_cancel())
+            self.assertEqual(len(TempfileManager._tempfiles), depth)
+            self.assertFalse(os.path.exists(opt.warm_start_file))
+        finally:
+            TempfileManager.clear_tempfiles()
+
+    def test_concurrent_in_process_solves(self):
+        # Both solves must be able to run at the same time (the
+        # barrier is broken after the timeout otherwise)
+        barrier = threading.Barrier(2, timeout=10)
+        solvers = [BarrierSolver(barrier), BarrierSolver(barrier)]
+        depth = len(TempfileManager._tempfiles)
+
+        async def _solve_all():
+            return await asyncio.gather(*(
+                opt.solve_async() for opt in solvers))
+        self._run(_solve_all())
+        self.assertEqual(len(TempfileManager._tempfiles), depth)
+        for opt in solvers:
+            self.assertTrue(opt.tempfile_existed)
+            self.assertFalse(os.path.exists(opt.tempfile))
+
+    @unittest.skipIf(not glpk_available, "The GLPK solver is not available")
+    def test_concurrent_solves(self):
+        models = []
+        for rhs in range(1, 6):
+            m = ConcreteModel()
+            m.x = Var(bounds=(0, None))
+            m.y = Var(bounds=(0, None))
+            m.c = Constraint(expr=m.x + 2*m.y >= rhs)
+            m.o = Objective(expr=m.x + m.y)
+            models.append(m)
+
+        async def _solve_all():
+            return await asyncio.gather(
+                *(SolverFactory('glpk').solve_async(m) for m in models))
+        for results, m in zip(self._run(_solve_all()), models):
+            self.assertEqual(results.solver.termination_condition,
+                             TerminationCondition.optimal)
+            self.assertAlmostEqual(value(m.o), value(m.c.lower)/2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
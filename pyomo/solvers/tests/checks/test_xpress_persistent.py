@@ -267,3 +267,126 @@ class TestXpressPersistent(unittest.TestCase):
         opt.add_var(m.y)
         # var already in solver model
         self.assertRaises(RuntimeError, opt.add_column, m, m.y, -2, [m.c], [1])
+
+    def _bulk_load_model(self):
+        m = pe.ConcreteModel()
+        m.x = pe.Var([1, 2, 3], bounds=(-10, 10))
+        m.y = pe.Var(within=pe.NonNegativeReals)
+        m.obj = pe.Objective(
+            expr=sum((m.x[i] - 2*i)**2 for i in m.x) + m.y)
+        m.c1 = pe.Constraint(expr=m.x[1] + 2*m.x[2] >= 1)
+        m.c2 = pe.Constraint(expr=m.x[2] - m.x[3] + 1 <= 3)
+        m.q1 = pe.Constraint(expr=m.x[1]**2 + m.x[2]**2 <= 8)
+        m.c3 = pe.Constraint(expr=m.x[1] + m.x[3] == 2)
+        m.c4 = pe.Constraint(expr=pe.inequality(-1, m.x[1] - m.x[2], 1))
+        m.q2 = pe.Constraint(expr=m.y >= m.x[3]**2 - 4)
+        m.c5 = pe.Constraint(expr=2*m.y + m.x[1] >= 0)
+        return m
+
+    def _bulk_load_solve(self, m, bulk_load):
+        opt = pe.SolverFactory('xpress_persistent')
+        opt.set_instance(m, bulk_load=bulk_load)
+        self.assertEqual(opt.get_xpress_attribute('rows'), 7)
+        rows = {}
+        for con in (m.c1, m.c2, m.c3, m.c4, m.c5):
+            idx = opt._solver_model.getIndex(
+                opt._pyomo_con_to_solver_con_map[con])
+            rowtype = []
+            opt._solver_model.getrowtype(rowtype, idx, idx)
+            rhs = []
+            opt._solver_model.getrhs(rhs, idx, idx)
+            rhsrange = []
+            opt._solver_model.getrhsrange(rhsrange, idx, idx)
+            rows[con.name] = (rowtype, rhs, rhsrange, sorted(
+                v.name for v in opt._vars_referenced_by_con[con]))
+        opt.solve()
+        solution = [m.x[i].value for i in m.x] + [m.y.value, pe.value(m.obj)]
+        return opt, rows, solution
+
+    @unittest.skipIf(not xpress_available, "xpress is not available")
+    def test_bulk_load_matches_per_constraint(self):
+        m = self._bulk_load_model()
+        opt, rows, solution = self._bulk_load_solve(m, False)
+        bulk_opt, bulk_rows, bulk_solution = self._bulk_load_solve(m, True)
+        self.assertEqual(bulk_rows, rows)
+        for val, bulk_val in zip(solution, bulk_solution):
+            self.assertAlmostEqual(val, bulk_val, delta=1e-6)
+
+        # bulk loaded and individually added rows can both be removed
+        for _opt in (opt, bulk_opt):
+            _opt.remove_constraint(m.c3)
+            _opt.remove_constraint(m.q1)
+            self.assertEqual(_opt.get_xpress_attribute('rows'), 5)
+        opt.solve()
+        solution = [m.x[i].value for i in m.x] + [m.y.value, pe.value(m.obj)]
+        bulk_opt.solve()
+        bulk_solution = [m.x[i].value for i in m.x] + [m.y.value,
+                                                       pe.value(m.obj)]
+        for val, bulk_val in zip(solution, bulk_solution):
+            self.assertAlmostEqual(val, bulk_val, delta=1e-6)
+
+    def _check_against_fresh_solve(self, m, opt):
+        opt.solve()
+        solution = [v.value for v in m.component_data_objects(pe.Var)]
+        fresh_opt = pe.SolverFactory('xpress_persistent')
+        fresh_opt.set_instance(m)
+        fresh_opt.solve()
+        for val, fresh_val in zip(
+                solution,
+                [v.value for v in m.component_data_objects(pe.Var)]):
+            self.assertAlmostEqual(val, fresh_val, delta=1e-6)
+
+    @unittest.skipIf(not xpress_available, "xpress is not available")
+    def test_sync_model(self):
+        m = pe.ConcreteModel()
+        m.p = pe.Param(mutable=True, initialize=1)
+        m.x = pe.Var(bounds=(-10, 10))
+        m.y = pe.Var()
+        m.obj = pe.Objective(expr=m.x**2 + m.y**2)
+        m.c1 = pe.Constraint(expr=m.y >= 2*m.x + m.p)
+
+        opt = pe.SolverFactory('xpress_persistent')
+        opt.set_instance(m, track_changes=True)
+        self._check_against_fresh_solve(m, opt)
+
+        # added constraint and variable
+        m.z = pe.Var(bounds=(0, None))
+        m.c2 = pe.Constraint(expr=m.y >= -m.x + m.z)
+        opt.sync_model()
+        self.assertEqual(opt.get_xpress_attribute('cols'), 3)
+        self.assertEqual(opt.get_xpress_attribute('rows'), 2)
+        self._check_against_fresh_solve(m, opt)
+
+        # mutable parameter in a constraint
+        m.p.value = 2
+        opt.sync_model()
+        self._check_against_fresh_solve(m, opt)
+        self.assertAlmostEqual(m.y.value, 2*m.x.value + 2, delta=1e-6)
+
+        # variable bounds and fixing
+        m.x.setlb(1)
+        m.z.fix(5)
+        opt.sync_model()
+        self._check_against_fresh_solve(m, opt)
+        self.assertAlmostEqual(m.x.value, 1, delta=1e-6)
+        self.assertAlmostEqual(m.y.value, 4, delta=1e-6)
+
+        # objective
+        m.obj.expr = m.x + m.y
+        opt.sync_model()
+        self._check_against_fresh_solve(m, opt)
+
+        # removed constraint and variable
+        m.obj.expr = m.x**2 + m.y**2
+        m.del_component(m.c2)
+        m.del_component(m.z)
+        opt.sync_model()
+        self.assertEqual(opt.get_xpress_attribute('cols'), 2)
+        self.assertEqual(opt.get_xpress_attribute('rows'), 1)
+        self._check_against_fresh_solve(m, opt)
+
+        # deactivated constraint
+        m.c1.deactivate()
+        opt.sync_model()
+        self.assertEqual(opt.get_xpress_attribute('rows'), 0)
+        self._check_against_fresh_solve(m, opt)
@@ -0,0 +1,67 @@
+#
+# This script compares the time to clone a model with copy.deepcopy
+# (the default Block.clone()) and with Block.clone(share_expressions=True)
+#
+#   python clone_perf.py [-n N] [--trials T]
+#
+
+import argparse
+import gc
+import time
+
+from pyomo.environ import (ConcreteModel, RangeSet, Var, Param, Constraint,
+                           Objective, Block, quicksum, value)
+
+
+def create_model(N):
+    model = ConcreteModel()
+    model.z = Var(initialize=1)
+    model.b = Block()
+    b = model.b
+    b.A = RangeSet(N)
+    b.x = Var(b.A, bounds=(0, 1), initialize=0.5)
+    b.y = Var(b.A, initialize=1)
+    b.p = Param(b.A, mutable=True, initialize=2)
+    b.c = Constraint(b.A, rule=lambda b, i:
+                     b.p[i]*b.x[i] + 2*b.y[i] + b.x[i]**2
+                     + (model.z + 1)**2 <= 10)
+    b.o = Objective(expr=quicksum(b.x[i] + b.y[i] for i in b.A))
+    return model
+
+
+def time_clone(block, trials, **kwds):
+    best = None
+    for i in range(trials):
+        gc.collect()
+        start = time.time()
+        block.clone(**kwds)
+        stop = time.time() - start
+        if best is None or stop < best:
+            best = stop
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', type=int, default=20000,
+                        help="number of variables / constraints")
+    parser.add_argument('--trials', type=int, default=3)
+    args = parser.parse_args()
+
+    start = time.time()
+    model = create_model(args.n)
+    build = time.time() - start
+
+    n = model.b.clone(share_expressions=True)
+    assert value(n.c[1].body) == value(model.b.c[1].body)
+
+    deep = time_clone(model.b, args.trials)
+    share = time_clone(model.b, args.trials, share_expressions=True)
+    print("%-30s %8.3f s" % ("build model", build))
+    print("%-30s %8.3f s" % ("clone()", deep))
+    print("%-30s %8.3f s  (%.1fx)" % ("clone(share_expressions=True)",
+                                       share, deep / share))
+
+
+if __name__ == '__main__':
+    main()
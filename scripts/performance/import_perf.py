@@ -0,0 +1,55 @@
+#
+# This script measures the time to import pyomo.environ (in new
+# Python processes), with the plugins of the packages in the
+# pyomo.environ.plugin_registry loaded on first use (the default) and
+# with all of the plugins loaded
+#
+#   python import_perf.py [--trials T]
+#
+
+import argparse
+import subprocess
+import sys
+
+_import = """
+import time
+start = time.time()
+import pyomo.environ
+%s
+print(time.time() - start)
+"""
+
+_load_all = """
+from pyomo.environ.plugin_registry import lazy_plugins, _get_factory
+for package, plugins in lazy_plugins.items():
+    for factory, name, doc in plugins:
+        if name in _get_factory(factory)._lazy:
+            _get_factory(factory)._load(name)
+"""
+
+
+def time_import(code, trials):
+    times = []
+    for i in range(trials):
+        output = subprocess.check_output([sys.executable, '-c', code])
+        times.append(float(output.decode().strip().splitlines()[-1]))
+    times.sort()
+    return times[0], times[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--trials', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, code in (
+            ("import pyomo.environ", _import % ('',)),
+            ("  + load all plugins", _import % (_load_all,)),
+            ("  + gdp.bigm", _import % (
+                "pyomo.environ.TransformationFactory('gdp.bigm')",))):
+        best, median = time_import(code, args.trials)
+        print("%-25s best %6.3f s  median %6.3f s" % (name, best, median))
+
+
+if __name__ == '__main__':
+    main()
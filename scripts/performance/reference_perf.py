@@ -0,0 +1,94 @@
+#
+# This script measures the time to build, iterate over, and look up
+# the members of Reference components (defined by component slices),
+# compared with direct access to the underlying components
+#
+#   python reference_perf.py [-n N]
+#
+
+import argparse
+import gc
+import time
+
+from pyomo.environ import ConcreteModel, Block, Var, Reference, Set
+from pyomo.dae import ContinuousSet
+from pyomo.dae.flatten import flatten_dae_components
+
+
+def timed(f, *args):
+    gc.collect()
+    start = time.time()
+    f(*args)
+    return time.time() - start
+
+
+def _iterate(comp):
+    for k, v in comp.items():
+        pass
+
+
+def _lookup(comp, keys):
+    for k in keys:
+        comp[k]
+
+
+def _contains(comp, keys):
+    for k in keys:
+        k in comp
+
+
+def compare(name, direct, ref, keys):
+    for op, f, args in (
+            ("iterate", _iterate, ()),
+            ("lookup", _lookup, (keys,)),
+            ("contains", _contains, (keys,))):
+        t_direct = timed(f, direct, *args)
+        t_ref = timed(f, ref, *args)
+        print("%-28s %-9s direct %7.3f s  reference %7.3f s  (%5.1fx)" % (
+            name, op, t_direct, t_ref, t_ref / max(t_direct, 1e-9)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', type=int, default=100000,
+                        help="number of referenced components")
+    args = parser.parse_args()
+    N = args.n
+
+    m = ConcreteModel()
+    m.I = Set(initialize=range(N))
+    m.x = Var(m.I)
+    print("%-38s %7.3f s" % (
+        "Reference(m.x[:])", timed(lambda: Reference(m.x[:]))))
+    compare("m.x[:]", m.x, Reference(m.x[:]), list(m.I))
+
+    m.J = Set(initialize=range(N // 10))
+    m.K = Set(initialize=range(10))
+    m.y = Var(m.J, m.K)
+    keys = list(m.y)
+    print("%-38s %7.3f s" % (
+        "Reference(m.y[:, 3])", timed(lambda: Reference(m.y[:, 3]))))
+    compare("m.y[:, :]", m.y, Reference(m.y[:, :]), keys)
+
+    m.b = Block(m.J)
+    for j in m.J:
+        m.b[j].z = Var(m.K)
+    print("%-38s %7.3f s" % (
+        "Reference(m.b[:].z[:])", timed(lambda: Reference(m.b[:].z[:]))))
+    compare("m.b[:].z[:]", m.y, Reference(m.b[:].z[:]), keys)
+
+    m = ConcreteModel()
+    m.t = ContinuousSet(initialize=range(N // 100))
+    m.S = Set(initialize=range(10))
+
+    def _b(b, t):
+        b.v = Var(m.S)
+        b.w = Var()
+    m.b = Block(m.t, rule=_b)
+    m.u = Var(m.S, m.t)
+    print("%-38s %7.3f s" % ("flatten_dae_components", timed(
+        lambda: flatten_dae_components(m, m.t, Var))))
+
+
+if __name__ == '__main__':
+    main()
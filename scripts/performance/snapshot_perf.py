@@ -0,0 +1,83 @@
+#
+# This script compares the time to store and restore a model with
+# pickle and with the binary snapshots in pyomo.contrib.snapshot
+#
+#   python snapshot_perf.py [-n N]
+#
+
+import argparse
+import gc
+import os
+import pickle
+import tempfile
+import time
+
+from pyomo.contrib.snapshot import read_snapshot, write_snapshot
+from pyomo.environ import (ConcreteModel, RangeSet, Var, Param, Constraint,
+                           Objective, quicksum, value)
+
+
+def c_rule(m, i):
+    return m.p[i]*m.x[i] + 2*m.y[i] + m.x[i]**2 + (m.z + 1)**2 <= 10
+
+
+def create_model(N):
+    model = ConcreteModel()
+    model.z = Var(initialize=1)
+    model.A = RangeSet(N)
+    model.x = Var(model.A, bounds=(0, 1), initialize=0.5)
+    model.y = Var(model.A, initialize=1)
+    model.p = Param(model.A, mutable=True, initialize=2)
+    model.c = Constraint(model.A, rule=c_rule)
+    model.o = Objective(expr=quicksum(model.x[i] + model.y[i]
+                                      for i in model.A))
+    return model
+
+
+def timed(f, *args):
+    gc.collect()
+    start = time.time()
+    ans = f(*args)
+    return time.time() - start, ans
+
+
+def pickle_dump(model, fname):
+    with open(fname, 'wb') as f:
+        pickle.dump(model, f, pickle.HIGHEST_PROTOCOL)
+
+
+def pickle_load(fname):
+    with open(fname, 'rb') as f:
+        return pickle.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', type=int, default=100000,
+                        help="number of variables / constraints")
+    args = parser.parse_args()
+
+    build, model = timed(create_model, args.n)
+    print("%-25s %8.3f s" % ("build model", build))
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for name, dump, load in (
+                ('pickle', pickle_dump, pickle_load),
+                ('snapshot', write_snapshot, read_snapshot)):
+            fname = os.path.join(tmpdir, name)
+            write, _ = timed(dump, model, fname)
+            read, ans = timed(load, fname)
+            assert value(ans.c[args.n].body) == value(model.c[args.n].body)
+            print("%-25s %8.3f s  read %8.3f s  (%.1f MB)" % (
+                name + " write", write, read,
+                os.path.getsize(fname) / 2.**20))
+            del ans
+    finally:
+        for fname in os.listdir(tmpdir):
+            os.remove(os.path.join(tmpdir, fname))
+        os.rmdir(tmpdir)
+
+
+if __name__ == '__main__':
+    main()